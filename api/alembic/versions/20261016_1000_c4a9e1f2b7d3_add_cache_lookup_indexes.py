@@ -0,0 +1,63 @@
+"""add_cache_lookup_indexes
+
+Revision ID: c4a9e1f2b7d3
+Revises: 1255c686f990
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a9e1f2b7d3'
+down_revision: Union[str, None] = '1255c686f990'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Indexed lookup columns for the cache fallbacks (spatial POI search
+    # matching and semantic geocode matching), replacing full table scans
+    op.add_column('cache_entries', sa.Column('geo_cell', sa.Text(), nullable=True))
+    op.add_column('cache_entries', sa.Column('address_tokens', postgresql.ARRAY(sa.Text()), nullable=True))
+
+    # Backfill grid cells of existing POI searches (0.05 degree cells).
+    # Address tokens need the Python normalization rules, so existing geocode
+    # entries only become fuzzy-matchable once they are written again.
+    op.execute(
+        """
+        UPDATE cache_entries
+        SET geo_cell = floor((params->>'latitude')::float / 0.05)::bigint
+                       || ':' ||
+                       floor((params->>'longitude')::float / 0.05)::bigint
+        WHERE operation = 'poi_search'
+        AND params->>'latitude' IS NOT NULL
+        AND params->>'longitude' IS NOT NULL
+        """
+    )
+
+    op.create_index(
+        'idx_cache_operation_geo_cell',
+        'cache_entries',
+        ['operation', 'geo_cell'],
+        unique=False,
+        postgresql_where=sa.text('geo_cell IS NOT NULL'),
+    )
+    op.create_index(
+        'idx_cache_address_tokens',
+        'cache_entries',
+        ['address_tokens'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_where=sa.text('address_tokens IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_cache_address_tokens', table_name='cache_entries')
+    op.drop_index('idx_cache_operation_geo_cell', table_name='cache_entries')
+    op.drop_column('cache_entries', 'address_tokens')
+    op.drop_column('cache_entries', 'geo_cell')
@@ -0,0 +1,35 @@
+"""add map_response_cache table
+
+Revision ID: e7b2d5a9c318
+Revises: c4a9e1f2b7d3
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b2d5a9c318'
+down_revision: Union[str, None] = 'c4a9e1f2b7d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Pre-serialized LinearMapResponse payloads, one per map and geometry format
+    op.create_table('map_response_cache',
+    sa.Column('map_id', sa.UUID(), nullable=False),
+    sa.Column('geometry_format', sa.String(length=20), nullable=False),
+    sa.Column('map_version', sa.DateTime(), nullable=False),
+    sa.Column('etag', sa.String(length=100), nullable=False),
+    sa.Column('payload', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['map_id'], ['maps.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('map_id', 'geometry_format')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('map_response_cache')
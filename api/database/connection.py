@@ -1,8 +1,10 @@
 """
 Database connection configuration using SQLAlchemy 2.0 async.
 """
+import asyncio
+import threading
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -24,6 +26,9 @@ class Base(DeclarativeBase):
 _engine: AsyncEngine | None = None
 _async_session_maker: async_sessionmaker[AsyncSession] | None = None
 
+# Long-lived engine of a background worker thread (see init_worker_engine)
+_worker_local = threading.local()
+
 
 def get_database_url() -> str:
     """Build the async database URL from settings."""
@@ -72,6 +77,75 @@ async def get_standalone_session(engine: AsyncEngine) -> AsyncGenerator[AsyncSes
             raise
 
 
+def init_worker_engine() -> AsyncEngine:
+    """
+    Create the long-lived engine of the calling background worker thread.
+
+    The engine is bound to the thread's current event loop (asyncpg
+    connections can't move between loops). Workers that keep one loop for
+    their whole lifetime, like those of AsyncService.run_async, call this
+    once at startup so every operation they run reuses the same pool.
+    """
+    engine = create_standalone_engine()
+    _worker_local.engine = engine
+    _worker_local.loop = asyncio.get_event_loop()
+    _worker_local.session_maker = async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+    return engine
+
+
+def get_worker_engine() -> Optional[AsyncEngine]:
+    """
+    Get the worker engine usable from the running event loop.
+
+    Returns:
+        The calling thread's worker engine, or None when the thread has none
+        or the running loop is not the one the engine was created on
+    """
+    engine = getattr(_worker_local, "engine", None)
+    if engine is None:
+        return None
+    try:
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    return engine if running_loop is _worker_local.loop else None
+
+
+@asynccontextmanager
+async def get_background_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Async context manager for sessions in background threads and sync wrappers.
+
+    Reuses the worker thread's engine when running on its event loop.
+    Anywhere else (e.g. a one-off asyncio.run) it falls back to a
+    short-lived standalone engine that is disposed on exit.
+
+    Usage:
+        async with get_background_session() as session:
+            repo = MapRepository(session)
+    """
+    if get_worker_engine() is not None:
+        async with _worker_local.session_maker() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+        return
+
+    engine = create_standalone_engine()
+    try:
+        async with get_standalone_session(engine) as session:
+            yield session
+    finally:
+        await engine.dispose()
+
+
 def get_engine() -> AsyncEngine:
     """Get or create the async engine instance."""
     global _engine
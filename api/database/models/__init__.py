@@ -9,6 +9,7 @@ from api.database.models.google_places_cache import GooglePlacesCache
 from api.database.models.impersonation_session import ImpersonationSession
 from api.database.models.map import Map
 from api.database.models.map_poi import MapPOI
+from api.database.models.map_response_cache import MapResponseCache
 from api.database.models.map_segment import MapSegment
 from api.database.models.poi import POI
 from api.database.models.route_segment import RouteSegment
@@ -31,6 +32,7 @@ __all__ = [
     "ImpersonationSession",
     "Map",
     "MapPOI",
+    "MapResponseCache",
     "MapSegment",
     "POI",
     "RouteSegment",
@@ -3,8 +3,10 @@ CacheEntry SQLAlchemy model.
 """
 from datetime import datetime
 
-from sqlalchemy import Index, String, func
-from sqlalchemy.dialects.postgresql import JSONB
+from typing import List, Optional
+
+from sqlalchemy import Index, String, Text, func
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from api.database.connection import Base
@@ -29,10 +31,26 @@ class CacheEntry(Base):
     expires_at: Mapped[datetime] = mapped_column(index=True)
     hit_count: Mapped[int] = mapped_column(default=0)
 
+    # Indexed lookup columns for the cache fallbacks
+    geo_cell: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    address_tokens: Mapped[Optional[List[str]]] = mapped_column(ARRAY(Text), nullable=True)
+
     # Indexes for efficient queries
     __table_args__ = (
         Index("idx_cache_operation_expires", "operation", "expires_at"),
         Index("idx_cache_provider_operation", "provider", "operation"),
+        Index(
+            "idx_cache_operation_geo_cell",
+            "operation",
+            "geo_cell",
+            postgresql_where="geo_cell IS NOT NULL",
+        ),
+        Index(
+            "idx_cache_address_tokens",
+            "address_tokens",
+            postgresql_using="gin",
+            postgresql_where="address_tokens IS NOT NULL",
+        ),
     )
 
     def __repr__(self) -> str:
@@ -0,0 +1,49 @@
+"""
+MapResponseCache SQLAlchemy model.
+
+Stores the serialized LinearMapResponse of a saved map so repeat opens do not
+have to reassemble it from MapPOIs, POIs and MapSegments.
+"""
+from datetime import datetime
+from uuid import UUID as PyUUID
+
+from sqlalchemy import ForeignKey, String, Text, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from api.database.connection import Base
+
+
+class MapResponseCache(Base):
+    """
+    Pre-serialized map response, one row per map and geometry format.
+
+    An entry is only valid for the map version it was built from:
+    Map.updated_at, which writes to the map's POIs also bump, including those
+    made while other maps are generated or enriched. The etag is a hash of
+    the payload, so it changes whenever the served content changes.
+    """
+
+    __tablename__ = "map_response_cache"
+
+    map_id: Mapped[PyUUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("maps.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    # Segment geometry encoding of the payload ('coordinates' or 'polyline6')
+    geometry_format: Mapped[str] = mapped_column(String(20), primary_key=True)
+
+    # Map version (see MapResponseCacheRepository.get_version) the payload was built from
+    map_version: Mapped[datetime] = mapped_column(nullable=False)
+
+    etag: Mapped[str] = mapped_column(String(100), nullable=False)
+    payload: Mapped[str] = mapped_column(Text, nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(default=func.now())
+
+    def __repr__(self) -> str:
+        return (
+            f"<MapResponseCache(map_id={self.map_id}, "
+            f"format='{self.geometry_format}', etag='{self.etag}')>"
+        )
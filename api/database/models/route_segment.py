@@ -6,7 +6,7 @@ Segments are identified by a hash of their start/end coordinates.
 """
 from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, List, Optional, Union
 from uuid import uuid4
 
 from sqlalchemy import Index, String, Text, func
@@ -53,8 +53,10 @@ class RouteSegment(Base):
     road_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     length_km: Mapped[Decimal] = mapped_column(nullable=False)
 
-    # Full geometry as list of [lat, lon] coordinates
-    geometry: Mapped[list] = mapped_column(JSONB, nullable=False)
+    # Full geometry: a list of [lat, lon] coordinates, or an encoded polyline
+    # (precision 6) string, depending on ROUTE_GEOMETRY_STORAGE_FORMAT when it
+    # was stored. Read it with api.utils.polyline.geometry_to_coordinates.
+    geometry: Mapped[Union[list, str]] = mapped_column(JSONB, nullable=False)
 
     # Pre-calculated search points for POI searching
     # Structure: [{"index": 0, "lat": -19.9167, "lon": -43.9345, "distance_from_segment_start_km": 0.0}, ...]
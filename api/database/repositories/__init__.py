@@ -9,6 +9,7 @@ from api.database.repositories.google_places_cache import GooglePlacesCacheRepos
 from api.database.repositories.impersonation_session import ImpersonationSessionRepository
 from api.database.repositories.map import MapRepository
 from api.database.repositories.map_poi import MapPOIRepository
+from api.database.repositories.map_response_cache import MapResponseCacheRepository
 from api.database.repositories.map_segment import MapSegmentRepository
 from api.database.repositories.poi import POIRepository
 from api.database.repositories.route_segment import RouteSegmentRepository
@@ -27,6 +28,7 @@ __all__ = [
     "MapSegmentRepository",
     "POIRepository",
     "MapPOIRepository",
+    "MapResponseCacheRepository",
     "RouteSegmentRepository",
     "SegmentPOIRepository",
     "CacheRepository",
@@ -11,6 +11,10 @@ from api.database.connection import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
 
+# Rows (or ids) per statement in bulk inserts, updates and lookups; keeps the
+# bind parameter count well below the asyncpg limit of 32767 per statement
+BULK_CHUNK_SIZE = 1000
+
 
 class BaseRepository(Generic[ModelType]):
     """Base repository with common database operations."""
@@ -3,13 +3,13 @@ Repository for Google Places Cache operations.
 """
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from typing import Optional
+from typing import Dict, List, Optional
 
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.database.models.google_places_cache import GooglePlacesCache
-from api.database.repositories.base import BaseRepository
+from api.database.repositories.base import BULK_CHUNK_SIZE, BaseRepository
 
 
 class GooglePlacesCacheRepository(BaseRepository[GooglePlacesCache]):
@@ -35,6 +35,36 @@ class GooglePlacesCacheRepository(BaseRepository[GooglePlacesCache]):
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
 
+    async def get_by_osm_ids(
+        self, osm_poi_ids: List[str]
+    ) -> Dict[str, GooglePlacesCache]:
+        """
+        Get cached Google Places data for many OSM POI IDs at once.
+
+        Args:
+            osm_poi_ids: OSM POI identifiers
+
+        Returns:
+            Dict mapping osm_poi_id to its entry; missing and expired
+            entries are left out
+        """
+        unique_ids = list(dict.fromkeys(osm_poi_ids))
+        now = datetime.now(timezone.utc)
+        entries: Dict[str, GooglePlacesCache] = {}
+
+        for start in range(0, len(unique_ids), BULK_CHUNK_SIZE):
+            query = select(GooglePlacesCache).where(
+                GooglePlacesCache.osm_poi_id.in_(
+                    unique_ids[start:start + BULK_CHUNK_SIZE]
+                ),
+                GooglePlacesCache.expires_at > now,
+            )
+            result = await self.session.execute(query)
+            for entry in result.scalars().all():
+                entries[entry.osm_poi_id] = entry
+
+        return entries
+
     async def get_by_osm_id_include_expired(
         self, osm_poi_id: str
     ) -> Optional[GooglePlacesCache]:
@@ -258,6 +258,135 @@ class MapRepository(BaseRepository[Map]):
         rows = result.all()
         return [{"map": row[0], "user_count": row[1]} for row in rows]
 
+    def _listing_query(self, with_origin: bool = False, with_user_count: bool = False):
+        """
+        Build a select of maps with their POI counts.
+
+        Counts come from correlated subqueries (served by the map_id indexes
+        on map_pois and user_maps), so a listing is one query no matter how
+        many POIs each map has.
+
+        Args:
+            with_origin: Also select the start coordinates of the first
+                segment of each map (origin_lat, origin_lon)
+            with_user_count: Also select how many users have each map
+                (user_count)
+
+        Returns:
+            Select of (Map, poi_count[, user_count][, origin_lat, origin_lon])
+        """
+        poi_count = (
+            select(func.count(MapPOI.id))
+            .where(MapPOI.map_id == Map.id)
+            .correlate(Map)
+            .scalar_subquery()
+            .label("poi_count")
+        )
+        columns = [Map, poi_count]
+
+        if with_user_count:
+            columns.append(
+                select(func.count(UserMap.id))
+                .where(UserMap.map_id == Map.id)
+                .correlate(Map)
+                .scalar_subquery()
+                .label("user_count")
+            )
+
+        if with_origin:
+            def first_segment(column):
+                return (
+                    select(column)
+                    .join(MapSegment, MapSegment.segment_id == RouteSegment.id)
+                    .where(MapSegment.map_id == Map.id)
+                    .order_by(MapSegment.sequence_order)
+                    .limit(1)
+                    .correlate(Map)
+                    .scalar_subquery()
+                )
+
+            columns.append(first_segment(RouteSegment.start_lat).label("origin_lat"))
+            columns.append(first_segment(RouteSegment.start_lon).label("origin_lon"))
+
+        return select(*columns)
+
+    @staticmethod
+    def _listing_rows(result) -> List[dict]:
+        """Convert rows of a listing query into dicts keyed by column label."""
+        count_keys = list(result.keys())[1:]
+        return [
+            {"map": row[0], **dict(zip(count_keys, row[1:]))}
+            for row in result.all()
+        ]
+
+    async def get_maps_for_listing(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        location: Optional[str] = None,
+        with_origin: bool = False,
+        with_user_count: bool = False,
+    ) -> List[dict]:
+        """
+        Get maps for browsing with their POI counts in a single query.
+
+        Args:
+            skip: Number of records to skip (ignored when searching by location)
+            limit: Maximum number of records to return
+            location: Optional text matched against origin or destination,
+                like search_by_location
+            with_origin: Also return the start coordinates of each map
+            with_user_count: Also return how many users have each map
+
+        Returns:
+            List of dicts with map and poi_count (plus user_count, and
+            origin_lat and origin_lon, when requested)
+        """
+        query = self._listing_query(with_origin=with_origin, with_user_count=with_user_count)
+
+        if location:
+            search_pattern = f"%{location}%"
+            query = query.where(
+                (Map.origin.ilike(search_pattern))
+                | (Map.destination.ilike(search_pattern))
+            ).limit(limit)
+        else:
+            query = query.order_by(Map.created_at.desc()).offset(skip).limit(limit)
+
+        result = await self.session.execute(query)
+        return self._listing_rows(result)
+
+    async def get_user_maps_for_listing(
+        self,
+        user_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        with_user_count: bool = False,
+    ) -> List[dict]:
+        """
+        Get a user's maps with their POI counts in a single query.
+
+        Args:
+            user_id: User UUID
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            with_user_count: Also return how many users have each map
+
+        Returns:
+            List of dicts with map and poi_count (plus user_count when
+            requested), ordered by when the user added the map (newest first)
+        """
+        query = (
+            self._listing_query(with_user_count=with_user_count)
+            .join(UserMap, UserMap.map_id == Map.id)
+            .where(UserMap.user_id == user_id)
+            .order_by(UserMap.added_at.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await self.session.execute(query)
+        return self._listing_rows(result)
+
     async def count_all_maps(self) -> int:
         """
         Count total number of maps.
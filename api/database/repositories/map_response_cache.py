@@ -0,0 +1,170 @@
+"""
+Repository for the pre-serialized map response cache.
+"""
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy import and_, delete, exists, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.database.models.map import Map
+from api.database.models.map_poi import MapPOI
+from api.database.models.map_response_cache import MapResponseCache
+from api.database.models.user_map import UserMap
+from api.database.repositories.base import BaseRepository
+
+
+class MapResponseCacheRepository(BaseRepository[MapResponseCache]):
+    """Repository for MapResponseCache operations."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize with session."""
+        super().__init__(session, MapResponseCache)
+
+    async def get_current(
+        self,
+        map_id: UUID,
+        geometry_format: str,
+        user_id: Optional[UUID] = None,
+    ) -> Optional[MapResponseCache]:
+        """
+        Get the cached response of the current version of a map.
+
+        One primary-key lookup plus the version check against
+        Map.updated_at: entries built from an older version of the map are
+        treated as missing. POI writes bump the updated_at of every map
+        showing the POI (POIRepository.touch_maps), so changes made while
+        generating or enriching other maps invalidate the entry too.
+
+        Args:
+            map_id: Map UUID
+            geometry_format: Segment geometry encoding of the payload
+            user_id: Optional user ID; if given, the entry is only returned
+                when the map is in the user's collection
+
+        Returns:
+            Cache entry or None if missing, outdated or not accessible
+        """
+        query = (
+            select(MapResponseCache)
+            .join(
+                Map,
+                and_(
+                    Map.id == MapResponseCache.map_id,
+                    MapResponseCache.map_version == Map.updated_at,
+                ),
+            )
+            .where(
+                MapResponseCache.map_id == map_id,
+                MapResponseCache.geometry_format == geometry_format,
+            )
+        )
+        if user_id is not None:
+            query = query.where(
+                exists().where(
+                    UserMap.user_id == user_id,
+                    UserMap.map_id == MapResponseCache.map_id,
+                )
+            )
+
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
+    async def get_version(self, map_id: UUID) -> Optional[datetime]:
+        """
+        Get the current version of a map, to store with a new cache entry.
+
+        Read before assembling the payload, so a POI change committed in
+        between yields a newer version and the entry is rebuilt.
+
+        Args:
+            map_id: Map UUID
+
+        Returns:
+            Map.updated_at, or None if the map does not exist
+        """
+        result = await self.session.execute(
+            select(Map.updated_at).where(Map.id == map_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def upsert(
+        self,
+        map_id: UUID,
+        geometry_format: str,
+        map_version: datetime,
+        etag: str,
+        payload: str,
+    ) -> None:
+        """
+        Insert or replace the cached response of a map.
+
+        Args:
+            map_id: Map UUID
+            geometry_format: Segment geometry encoding of the payload
+            map_version: Map version (see get_version) the payload was built from
+            etag: Entity tag of the payload
+            payload: Serialized LinearMapResponse (JSON)
+        """
+        stmt = insert(MapResponseCache).values(
+            map_id=map_id,
+            geometry_format=geometry_format,
+            map_version=map_version,
+            etag=etag,
+            payload=payload,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                MapResponseCache.map_id,
+                MapResponseCache.geometry_format,
+            ],
+            set_={
+                "map_version": stmt.excluded.map_version,
+                "etag": stmt.excluded.etag,
+                "payload": stmt.excluded.payload,
+                "created_at": func.now(),
+            },
+        )
+        await self.session.execute(stmt)
+        await self.session.flush()
+
+    async def delete_for_map(self, map_id: UUID) -> int:
+        """
+        Delete all cached responses of a map.
+
+        Args:
+            map_id: Map UUID
+
+        Returns:
+            Number of deleted entries
+        """
+        result = await self.session.execute(
+            delete(MapResponseCache).where(MapResponseCache.map_id == map_id)
+        )
+        await self.session.flush()
+        return result.rowcount
+
+    async def delete_for_pois(self, poi_ids: List[UUID]) -> int:
+        """
+        Delete the cached responses of every map that contains any of the POIs.
+
+        Args:
+            poi_ids: POI UUIDs whose data changed
+
+        Returns:
+            Number of deleted entries
+        """
+        if not poi_ids:
+            return 0
+
+        result = await self.session.execute(
+            delete(MapResponseCache).where(
+                MapResponseCache.map_id.in_(
+                    select(MapPOI.map_id).where(MapPOI.poi_id.in_(poi_ids))
+                )
+            )
+        )
+        await self.session.flush()
+        return result.rowcount
@@ -1,14 +1,61 @@
 """
 POI (Point of Interest) repository for database operations.
 """
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Union
 from uuid import UUID
 
-from sqlalchemy import select, and_, or_
+from sqlalchemy import (
+    Select, select, and_, or_, case, cast, column, exists, func, literal, update, values,
+)
+from sqlalchemy.dialects.postgresql import JSONB, insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
+from api.database.models.map import Map
+from api.database.models.map_poi import MapPOI
 from api.database.models.poi import POI
-from api.database.repositories.base import BaseRepository
+from api.database.repositories.base import BULK_CHUNK_SIZE, BaseRepository
+
+# Fields that an upsert fills on an existing POI only when it has no value yet
+_FILL_IF_MISSING_FIELDS = ("rating", "rating_count", "google_maps_uri", "city")
+
+
+def _is_missing(field: str, value) -> bool:
+    """Whether a POI field counts as missing for the fill-if-missing rules."""
+    if field in ("rating", "rating_count"):
+        return value is None
+    return not value
+
+
+def _enrichment_values(provider: str) -> Dict[str, Any]:
+    """
+    SET clauses that add a provider to enriched_by in SQL.
+
+    Merging in the database (instead of writing the list read earlier) keeps
+    enrichments by different providers running at the same time from
+    overwriting each other's marks.
+    """
+    mark = literal([provider], JSONB)
+    already_enriched = POI.enriched_by.contains(mark)
+    return {
+        "enriched_by": case(
+            (already_enriched, POI.enriched_by),
+            else_=func.coalesce(POI.enriched_by, literal([], JSONB)).op("||")(mark),
+        ),
+        "last_enriched_at": case(
+            (already_enriched, POI.last_enriched_at),
+            else_=literal(datetime.utcnow()),
+        ),
+    }
+
+
+def _values_table(name: str, columns: List[str], rows: List[tuple]):
+    """VALUES list typed like the POI columns of the same names."""
+    table = POI.__table__
+    return values(
+        *(column(col, table.c[col].type) for col in columns), name=name
+    ).data(rows)
 
 
 class POIRepository(BaseRepository[POI]):
@@ -208,6 +255,7 @@ class POIRepository(BaseRepository[POI]):
 
             if updated:
                 await self.session.flush()
+                await self.touch_maps([existing.id])
 
             return existing, False
 
@@ -216,6 +264,124 @@ class POIRepository(BaseRepository[POI]):
         await self.create(poi)
         return poi, True
 
+    async def bulk_upsert_by_osm_ids(
+        self, poi_data: List[dict]
+    ) -> Dict[str, UUID]:
+        """
+        Insert or update many POIs by OSM ID with set-based upserts.
+
+        Issues ``INSERT ... ON CONFLICT (osm_id) DO UPDATE ... RETURNING``
+        statements instead of one SELECT per POI. Existing POIs keep their
+        data; rating, rating_count, google_maps_uri and city are only filled
+        in when missing, like get_or_create_by_osm_id does.
+
+        Args:
+            poi_data: List of dicts with 'osm_id' and other POI fields. When an
+                OSM ID repeats, the first entry wins and later ones only fill
+                in missing fields, as consecutive get_or_create calls would.
+
+        Returns:
+            Dict mapping OSM ID -> database POI UUID
+        """
+        # ON CONFLICT DO UPDATE cannot touch the same row twice in one
+        # statement, so duplicates are merged before hitting the database
+        merged: Dict[str, dict] = {}
+        for data in poi_data:
+            osm_id = data.get("osm_id")
+            if not osm_id:
+                continue
+            row = merged.get(osm_id)
+            if row is None:
+                merged[osm_id] = dict(data)
+                continue
+            for field in _FILL_IF_MISSING_FIELDS:
+                if _is_missing(field, row.get(field)) and not _is_missing(field, data.get(field)):
+                    row[field] = data[field]
+
+        if not merged:
+            return {}
+
+        # Multi-row VALUES need the same columns in every row, so rows are
+        # grouped by their field set (normally there is a single group)
+        groups: Dict[tuple, List[dict]] = {}
+        for row in merged.values():
+            groups.setdefault(tuple(sorted(row)), []).append(row)
+
+        ids: Dict[str, UUID] = {}
+        for rows in groups.values():
+            for start in range(0, len(rows), BULK_CHUNK_SIZE):
+                stmt = insert(POI).values(rows[start:start + BULK_CHUNK_SIZE])
+                excluded = stmt.excluded
+                fill = {
+                    "rating": func.coalesce(POI.rating, excluded.rating),
+                    "rating_count": func.coalesce(POI.rating_count, excluded.rating_count),
+                    "google_maps_uri": func.coalesce(
+                        func.nullif(POI.google_maps_uri, ""),
+                        func.nullif(excluded.google_maps_uri, ""),
+                        POI.google_maps_uri,
+                    ),
+                    "city": func.coalesce(
+                        func.nullif(POI.city, ""),
+                        func.nullif(excluded.city, ""),
+                        POI.city,
+                    ),
+                }
+                filled = or_(
+                    and_(POI.rating.is_(None), excluded.rating.is_not(None)),
+                    and_(POI.rating_count.is_(None), excluded.rating_count.is_not(None)),
+                    and_(
+                        func.coalesce(POI.google_maps_uri, "") == "",
+                        func.coalesce(excluded.google_maps_uri, "") != "",
+                    ),
+                    and_(
+                        func.coalesce(POI.city, "") == "",
+                        func.coalesce(excluded.city, "") != "",
+                    ),
+                )
+                # No WHERE on the update: conflicting rows must still come
+                # back through RETURNING. updated_at only moves if a field
+                # was actually filled in.
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[POI.osm_id],
+                    set_={
+                        **fill,
+                        "updated_at": case((filled, func.now()), else_=POI.updated_at),
+                    },
+                ).returning(POI.id, POI.osm_id)
+
+                result = await self.session.execute(stmt)
+                chunk_ids = []
+                for poi_id, osm_id in result.all():
+                    ids[osm_id] = poi_id
+                    chunk_ids.append(poi_id)
+
+                # Only POIs that got a field filled in (updated_at moved)
+                await self.touch_maps(
+                    select(POI.id).where(POI.id.in_(chunk_ids), POI.updated_at == func.now())
+                )
+
+        return ids
+
+    async def touch_maps(self, poi_ids: Union[List[UUID], Select]) -> None:
+        """
+        Move updated_at of every map showing any of the POIs.
+
+        POIs are shared between maps, and cached map responses are only
+        valid for the Map.updated_at they were built from, so writes that
+        change POI data bump the maps that show them.
+
+        Args:
+            poi_ids: POI UUIDs, or a select of POI IDs
+        """
+        if isinstance(poi_ids, list) and not poi_ids:
+            return
+        await self.session.execute(
+            update(Map)
+            .where(Map.id.in_(select(MapPOI.map_id).where(MapPOI.poi_id.in_(poi_ids))))
+            .values(updated_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+
     async def bulk_get_or_create_by_osm_ids(
         self, poi_data: List[dict]
     ) -> List[POI]:
@@ -353,6 +519,7 @@ class POIRepository(BaseRepository[POI]):
 
             if updated:
                 await self.session.flush()
+                await self.touch_maps([existing.id])
 
             return existing, False
 
@@ -490,8 +657,107 @@ class POIRepository(BaseRepository[POI]):
         poi.add_enrichment("here_maps")
 
         await self.session.flush()
+        await self.touch_maps([poi.id])
         return poi
 
+    async def bulk_update_google_places(self, updates: List[Dict[str, Any]]) -> int:
+        """
+        Store Google Places data on many POIs with one UPDATE per chunk.
+
+        Args:
+            updates: Dicts with id, rating, rating_count and google_maps_uri
+
+        Returns:
+            Number of POIs updated
+        """
+        columns = ["id", "rating", "rating_count", "google_maps_uri"]
+        table = POI.__table__
+        updated = 0
+
+        for start in range(0, len(updates), BULK_CHUNK_SIZE):
+            chunk = updates[start:start + BULK_CHUNK_SIZE]
+            data = _values_table(
+                "google_results", columns, [tuple(u[c] for c in columns) for u in chunk]
+            )
+            result = await self.session.execute(
+                update(POI)
+                .where(POI.id == data.c.id)
+                .values(
+                    rating=cast(data.c.rating, table.c.rating.type),
+                    rating_count=cast(data.c.rating_count, table.c.rating_count.type),
+                    google_maps_uri=cast(
+                        data.c.google_maps_uri, table.c.google_maps_uri.type
+                    ),
+                    **_enrichment_values("google_places"),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            updated += result.rowcount
+            await self.touch_maps([u["id"] for u in chunk])
+
+        await self.session.flush()
+        return updated
+
+    async def bulk_update_here_data(self, updates: List[Dict[str, Any]]) -> int:
+        """
+        Store HERE Maps data on many POIs with one UPDATE per chunk.
+
+        Same rules as update_with_here_data: contact info is only filled when
+        missing. A here_id already owned by another POI (or repeated within
+        the batch) is skipped, since here_id is unique.
+
+        Args:
+            updates: Dicts with id, here_id, here_data, phone, website and
+                opening_hours
+
+        Returns:
+            Number of POIs updated
+        """
+        columns = ["id", "here_id", "here_data", "phone", "website", "opening_hours"]
+        table = POI.__table__
+
+        seen_here_ids = set()
+        rows = []
+        for u in updates:
+            if u["here_id"] in seen_here_ids:
+                continue
+            seen_here_ids.add(u["here_id"])
+            rows.append(tuple(u[c] for c in columns))
+
+        other = aliased(POI)
+        updated = 0
+
+        for start in range(0, len(rows), BULK_CHUNK_SIZE):
+            data = _values_table("here_results", columns, rows[start:start + BULK_CHUNK_SIZE])
+            here_id = cast(data.c.here_id, table.c.here_id.type)
+            here_id_taken = exists().where(and_(other.here_id == here_id, other.id != POI.id))
+
+            def fill_if_missing(field: str):
+                return func.coalesce(
+                    func.nullif(table.c[field], ""), cast(data.c[field], table.c[field].type)
+                )
+
+            result = await self.session.execute(
+                update(POI)
+                .where(and_(POI.id == data.c.id, ~here_id_taken))
+                .values(
+                    here_id=here_id,
+                    here_data=cast(data.c.here_data, JSONB),
+                    phone=fill_if_missing("phone"),
+                    website=fill_if_missing("website"),
+                    opening_hours=fill_if_missing("opening_hours"),
+                    **_enrichment_values("here_maps"),
+                )
+                .returning(POI.id)
+                .execution_options(synchronize_session=False)
+            )
+            updated_ids = list(result.scalars().all())
+            updated += len(updated_ids)
+            await self.touch_maps(updated_ids)
+
+        await self.session.flush()
+        return updated
+
     async def get_low_quality_pois(
         self,
         issue_filter: Optional[str] = None,
@@ -765,6 +1031,7 @@ class POIRepository(BaseRepository[POI]):
             .where(POI.id.in_(poi_ids))
             .values(is_disabled=disabled)
         )
+        await self.touch_maps(poi_ids)
         await self.session.flush()
         return result.rowcount
 
@@ -1,15 +1,17 @@
 """
 RouteSegment repository for database operations.
 """
+from collections import Counter
 from typing import Dict, List, Optional
 from uuid import UUID
 
 from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from api.database.models.route_segment import RouteSegment
-from api.database.repositories.base import BaseRepository
+from api.database.repositories.base import BULK_CHUNK_SIZE, BaseRepository
 
 
 class RouteSegmentRepository(BaseRepository[RouteSegment]):
@@ -55,6 +57,38 @@ class RouteSegmentRepository(BaseRepository[RouteSegment]):
         segments = result.scalars().all()
         return {s.segment_hash: s for s in segments}
 
+    async def bulk_create_missing(
+        self, segments: List[dict]
+    ) -> Dict[str, RouteSegment]:
+        """
+        Insert many segments, skipping hashes that already exist.
+
+        Uses ``INSERT ... ON CONFLICT (segment_hash) DO NOTHING RETURNING`` so
+        concurrent generations creating the same segment do not race: the
+        database keeps whichever row landed first and the other insert is
+        silently skipped.
+
+        Args:
+            segments: List of dicts with RouteSegment column values, one per
+                distinct segment_hash
+
+        Returns:
+            Dictionary mapping hash -> RouteSegment for the rows inserted by
+            this call (hashes missing from it already existed)
+        """
+        created: Dict[str, RouteSegment] = {}
+        for start in range(0, len(segments), BULK_CHUNK_SIZE):
+            stmt = (
+                insert(RouteSegment)
+                .values(segments[start:start + BULK_CHUNK_SIZE])
+                .on_conflict_do_nothing(index_elements=[RouteSegment.segment_hash])
+                .returning(RouteSegment)
+            )
+            result = await self.session.scalars(stmt)
+            for segment in result.all():
+                created[segment.segment_hash] = segment
+        return created
+
     async def get_with_pois(self, segment_id: UUID) -> Optional[RouteSegment]:
         """
         Get a segment with its POIs eagerly loaded.
@@ -90,17 +124,26 @@ class RouteSegmentRepository(BaseRepository[RouteSegment]):
         """
         Increment usage count for multiple segments.
 
+        A segment listed several times is incremented once per occurrence.
+        Segments sharing the same increment are updated together, so the
+        usual case (every ID listed once) is a single UPDATE.
+
         Args:
             segment_ids: List of segment UUIDs
         """
         if not segment_ids:
             return
 
-        await self.session.execute(
-            update(RouteSegment)
-            .where(RouteSegment.id.in_(segment_ids))
-            .values(usage_count=RouteSegment.usage_count + 1)
-        )
+        ids_by_increment: Dict[int, List[UUID]] = {}
+        for segment_id, increment in Counter(segment_ids).items():
+            ids_by_increment.setdefault(increment, []).append(segment_id)
+
+        for increment, ids in ids_by_increment.items():
+            await self.session.execute(
+                update(RouteSegment)
+                .where(RouteSegment.id.in_(ids))
+                .values(usage_count=RouteSegment.usage_count + increment)
+            )
         await self.session.flush()
 
     async def find_by_road_name(
@@ -1,7 +1,7 @@
 """
 SegmentPOI repository for database operations.
 """
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from sqlalchemy import select, and_
@@ -56,6 +56,41 @@ class SegmentPOIRepository(BaseRepository[SegmentPOI]):
         )
         return list(result.scalars().all())
 
+    async def get_by_segments_with_pois(
+        self, segment_ids: List[UUID]
+    ) -> Dict[UUID, List[SegmentPOI]]:
+        """
+        Get the POI associations of many segments with POI data eagerly loaded.
+
+        Loads everything with one query (plus the selectin load of the POIs)
+        instead of one get_by_segment_with_pois call per segment.
+
+        Args:
+            segment_ids: Segment UUIDs
+
+        Returns:
+            Dictionary mapping segment ID -> SegmentPOI instances ordered by
+            search point index (segments without POIs map to an empty list)
+        """
+        by_segment: Dict[UUID, List[SegmentPOI]] = {
+            segment_id: [] for segment_id in segment_ids
+        }
+        if not by_segment:
+            return by_segment
+
+        result = await self.session.execute(
+            select(SegmentPOI)
+            .where(SegmentPOI.segment_id.in_(list(by_segment)))
+            .options(selectinload(SegmentPOI.poi))
+            .order_by(SegmentPOI.segment_id, SegmentPOI.search_point_index)
+            # Associations created earlier in this session get their poi
+            # relationship loaded too
+            .execution_options(populate_existing=True)
+        )
+        for segment_poi in result.scalars().all():
+            by_segment[segment_poi.segment_id].append(segment_poi)
+        return by_segment
+
     async def get_by_poi(self, poi_id: UUID) -> List[SegmentPOI]:
         """
         Get all segment associations for a POI.
@@ -1,3 +1,4 @@
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
@@ -57,6 +58,10 @@ async def lifespan(app: FastAPI):
     await log_cleanup_service.start()
     logger.info("🧹 Serviço de limpeza de logs iniciado (execução a cada 24h)")
 
+    # Load the municipality gazetteer (downloading it when missing) off the request path
+    from api.services.municipality_gazetteer import get_municipality_gazetteer
+    get_municipality_gazetteer().load_in_background()
+
     yield
 
     # Shutdown
@@ -69,6 +74,28 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"⚠️ Erro ao encerrar serviço de limpeza de logs: {e}")
 
+    # Let queued and running map generations finish before closing their resources
+    try:
+        from api.providers.settings import get_settings
+        from api.services.async_service import AsyncService
+        dropped = await asyncio.to_thread(
+            AsyncService.shutdown, get_settings().async_shutdown_timeout
+        )
+        if dropped:
+            logger.warning(f"⚠️ {dropped} operações na fila descartadas no encerramento")
+        else:
+            logger.info("⚙️ Operações em segundo plano concluídas")
+    except Exception as e:
+        logger.warning(f"⚠️ Erro ao aguardar operações em segundo plano: {e}")
+
+    # Close the pooled keep-alive connections of the external API providers
+    try:
+        from api.utils.http_client import close_http_clients
+        await close_http_clients()
+        logger.info("🌐 Conexões HTTP dos provedores encerradas")
+    except Exception as e:
+        logger.warning(f"⚠️ Erro ao encerrar conexões HTTP: {e}")
+
     # Flush remaining logs to database before shutdown
     try:
         from api.services.database_log_handler import get_database_log_handler
@@ -110,7 +110,8 @@ class MapSegmentResponse(BaseModel):
     sequence_order: int = Field(..., description="Order of this segment in the map (0, 1, 2, ...)")
     distance_from_origin_km: float = Field(..., description="Cumulative distance from origin to START of this segment (km)")
     length_km: float = Field(..., description="Length of this segment in km")
-    geometry: List[Coordinates] = Field(..., description="Full geometry of the segment as list of coordinates")
+    geometry: Union[List[Coordinates], str] = Field(..., description="Full geometry of the segment: list of coordinates, or an encoded polyline (precision 6) when geometry_format is 'polyline6'")
+    geometry_format: str = Field("coordinates", description="Encoding of geometry: 'coordinates' or 'polyline6'")
     road_name: Optional[str] = Field(None, description="Name of the road in this segment")
     start_lat: float = Field(..., description="Latitude of segment start")
     start_lon: float = Field(..., description="Longitude of segment start")
@@ -193,5 +194,7 @@ class AsyncOperationResponse(BaseModel):
     progress_percent: float = Field(0.0, description="Percentual de progresso (0-100)")
     current_phase: Optional[str] = Field(None, description="Fase atual da operação (ex: geocoding, poi_search)")
     estimated_completion: Optional[datetime] = Field(None, description="Estimativa de conclusão da operação")
+    queue_position: Optional[int] = Field(None, description="Posição na fila de processamento (1 = próxima; ausente quando já em execução)")
+    estimated_start: Optional[datetime] = Field(None, description="Estimativa de início do processamento (quando na fila)")
     result: Optional[Dict[str, Any]] = Field(None, description="Resultado da operação (quando concluída)")
     error: Optional[str] = Field(None, description="Mensagem de erro (quando falha)") 
\ No newline at end of file
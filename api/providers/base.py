@@ -5,15 +5,22 @@ This module defines the core contracts that all geographic data providers must i
 ensuring a consistent API across different provider implementations.
 """
 
+import logging
 from abc import ABC, abstractmethod
 from enum import Enum
 from typing import List, Dict, Optional
+
+import numpy as np
+
 from .models import GeoLocation, Route, POI, POICategory
 
+logger = logging.getLogger(__name__)
+
 
 class ProviderType(Enum):
     """Supported geographic data providers."""
     OSM = "osm"
+    OSM_PBF = "osm_pbf"
     HERE = "here"
     TOMTOM = "tomtom"
     IBGE = "ibge"
@@ -83,6 +90,41 @@ class GeoProvider(ABC):
         """
         pass
     
+    async def calculate_routes_many(
+        self,
+        origin: GeoLocation,
+        destinations: List[GeoLocation],
+    ) -> List[Optional[Route]]:
+        """
+        Calculate routes from one origin to several destinations.
+
+        Providers whose routing API can answer many destinations in one
+        request override this. This default calculates the routes one after
+        another with ``calculate_route``.
+
+        A failure for one destination is logged and yields None for it,
+        so the remaining destinations are still routed.
+
+        Args:
+            origin: Starting location shared by all routes
+            destinations: Ending locations
+
+        Returns:
+            One Route (or None if no route found) per destination,
+            in the same order as ``destinations``
+        """
+        results: List[Optional[Route]] = []
+        for destination in destinations:
+            try:
+                route = await self.calculate_route(origin, destination)
+            except Exception as e:
+                logger.warning(
+                    f"Error calculating route to {destination.latitude},{destination.longitude}: {e}"
+                )
+                route = None
+            results.append(route)
+        return results
+
     @abstractmethod
     async def search_pois(
         self,
@@ -104,7 +146,109 @@ class GeoProvider(ABC):
             List of POI objects found within the search area
         """
         pass
-    
+
+    async def search_pois_many(
+        self,
+        locations: List[GeoLocation],
+        radius: float,
+        categories: List[POICategory],
+        limit: int = 50
+    ) -> List[List[POI]]:
+        """
+        Search for Points of Interest around several locations.
+
+        Providers with a cache override this to resolve all locations with
+        batched cache reads and writes. This default searches the locations
+        one after another with ``search_pois``.
+
+        A failure at one location is logged and yields an empty list for it,
+        so the remaining locations are still searched.
+
+        Args:
+            locations: Center points for the searches
+            radius: Search radius in meters
+            categories: List of POI categories to search for
+            limit: Maximum number of results per location
+
+        Returns:
+            One list of POIs per location, in the same order as ``locations``
+        """
+        results: List[List[POI]] = []
+        for location in locations:
+            try:
+                pois = await self.search_pois(
+                    location=location,
+                    radius=radius,
+                    categories=categories,
+                    limit=limit,
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Error searching POIs at {location.latitude},{location.longitude}: {e}"
+                )
+                pois = []
+            results.append(pois or [])
+        return results
+
+    @property
+    def supports_corridor_search(self) -> bool:
+        """Whether search_pois_along_route is implemented by this provider."""
+        return False
+
+    async def search_pois_along_route(
+        self,
+        route: List[GeoLocation],
+        radius: float,
+        categories: List[POICategory],
+    ) -> List[POI]:
+        """
+        Search for Points of Interest along a route corridor.
+
+        Providers whose API can search around a polyline override this (and
+        supports_corridor_search) so a whole route is covered by a few
+        requests instead of one per search point.
+
+        Args:
+            route: Route points in order
+            radius: Corridor half-width in meters
+            categories: List of POI categories to search for
+
+        Returns:
+            Unique POIs within the corridor, in no particular order
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support corridor POI search"
+        )
+
+    def search_results_mask(
+        self,
+        locations: np.ndarray,
+        pois: List[POI],
+        radius: float,
+        categories: List[POICategory],
+        limit: Optional[int] = None,
+    ) -> np.ndarray:
+        """
+        Tell which POIs a per-point search_pois at each location returns.
+
+        Providers with corridor search implement this with the same rules
+        as their search_pois, so callers can split corridor results among
+        search points exactly as per-point searches would have found them.
+
+        Args:
+            locations: Search centers as an (M, 2) array of (lat, lon)
+            pois: Candidate POIs, without duplicates
+            radius: Search radius in meters
+            categories: POI categories searched
+            limit: Maximum results per location (None for no limit)
+
+        Returns:
+            Boolean array of shape (len(pois), M)
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support corridor POI search"
+        )
+
     @abstractmethod
     async def get_poi_details(self, poi_id: str) -> Optional[POI]:
         """
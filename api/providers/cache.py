@@ -7,25 +7,41 @@ It includes features like semantic matching for geocoding, geospatial
 indexing for POI searches, and configurable TTL policies.
 """
 
+import fnmatch
 import hashlib
 import json
 import os
 import re
 import logging
 import math
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Tuple, Union
 from dataclasses import dataclass, field
 from .base import ProviderType
 
 logger = logging.getLogger(__name__)
 
+# Grid size (in degrees) used to index POI search centers for spatial matching.
+# 0.05° is ~5.5 km of latitude (~4.6 km of longitude at Brazil's southern tip).
+POI_GRID_CELL_DEG = 0.05
+
+# Largest cached POI search radius reused for a search, relative to its own
+# radius. Bounds the distance a matching center can be at, and with it the
+# grid cells read by the spatial fallback.
+POI_MATCH_MAX_RADIUS_RATIO = 2.0
+
+# Minimum Jaccard similarity for two geocoding addresses to be considered equal
+ADDRESS_SIMILARITY_THRESHOLD = 0.7
+
 
 @dataclass
 class CacheKey:
     """Structure for generating consistent cache keys."""
     provider: ProviderType
-    operation: str  # geocode, route, poi_search, poi_details
+    operation: str  # geocode, route, poi_search, poi_tile, poi_details
     params: Dict[str, Any]
     
     def generate_key(self) -> str:
@@ -167,6 +183,138 @@ class CacheEntry:
         )
 
 
+class MemoryCacheTier:
+    """
+    Bounded in-process LRU/TTL tier placed in front of the PostgreSQL cache.
+
+    Holds already-reconstructed values (GeoLocation, Route, POI lists) so a
+    hot key is served without a pool acquire, a JSON parse or Pydantic
+    validation. Entries are evicted least-recently-used first when either
+    the entry count or the estimated size (serialized JSON length) exceeds
+    its limit. Values are shared between callers and must be treated as
+    read-only.
+
+    Thread-safe: the same UnifiedCache is used from several event loops
+    (one per worker thread), so all access goes through a threading.Lock.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        """
+        Initialize the tier.
+
+        Args:
+            max_entries: Maximum number of entries (0 disables the tier)
+            max_bytes: Maximum estimated size of all entries in bytes
+        """
+        self.max_entries = max(0, max_entries)
+        self.max_bytes = max(0, max_bytes)
+        # key -> (value, size_bytes, expires_at monotonic)
+        self._entries: "OrderedDict[str, Tuple[Any, int, float]]" = OrderedDict()
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the tier stores anything at all."""
+        return self.max_entries > 0 and self.max_bytes > 0
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        Look up a key.
+
+        Returns:
+            Tuple (found, value). ``found`` distinguishes a cached empty
+            result (e.g. a POI search with no results) from a miss.
+        """
+        if not self.enabled:
+            return False, None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats['misses'] += 1
+                return False, None
+
+            value, size, expires_at = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self._stats['misses'] += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            return True, value
+
+    def set(self, key: str, value: Any, size_bytes: int, ttl_seconds: float) -> None:
+        """
+        Store a value, evicting least-recently-used entries to fit the limits.
+
+        Args:
+            key: Cache key
+            value: Reconstructed value
+            size_bytes: Estimated size of the value
+            ttl_seconds: Time to live; non-positive values are not stored
+        """
+        if not self.enabled or ttl_seconds <= 0 or size_bytes > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (value, size_bytes, time.monotonic() + ttl_seconds)
+            self._size_bytes += size_bytes
+
+            while (
+                len(self._entries) > self.max_entries
+                or self._size_bytes > self.max_bytes
+            ):
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self._stats['evictions'] += 1
+
+    def invalidate_pattern(self, pattern: str) -> int:
+        """
+        Remove entries whose key matches an fnmatch pattern.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            matching = [key for key in self._entries if fnmatch.fnmatchcase(key, pattern)]
+            for key in matching:
+                self._remove(key)
+        return len(matching)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get tier statistics."""
+        with self._lock:
+            total_requests = self._stats['hits'] + self._stats['misses']
+            hit_rate = (self._stats['hits'] / total_requests * 100) if total_requests > 0 else 0
+            return {
+                'entries': len(self._entries),
+                'size_bytes': self._size_bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'hits': self._stats['hits'],
+                'misses': self._stats['misses'],
+                'evictions': self._stats['evictions'],
+                'hit_rate_percent': round(hit_rate, 2),
+            }
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry; caller must hold the lock."""
+        _, size, _ = self._entries.pop(key)
+        self._size_bytes -= size
+
+
 class UnifiedCache:
     """
     Unified cache system for geographic data backed by PostgreSQL.
@@ -177,6 +325,7 @@ class UnifiedCache:
     3. Configurable TTL per operation type
     4. PostgreSQL storage with connection pooling
     5. Statistics tracking for monitoring
+    6. In-process L1 tier (MemoryCacheTier) serving hot keys without a DB round trip
     """
     
     def __init__(self):
@@ -200,9 +349,18 @@ class UnifiedCache:
             'reverse_geocode': self.settings.geo_cache_ttl_geocode,
             'route': self.settings.geo_cache_ttl_route,
             'poi_search': self.settings.geo_cache_ttl_poi,
+            'poi_tile': self.settings.geo_cache_ttl_poi,
             'poi_details': self.settings.geo_cache_ttl_poi_details,
             'municipalities': 604800,  # 7 days - IBGE data rarely changes
         }
+
+        # In-process L1 tier. Its TTL is capped so that entries invalidated
+        # by another process (which cannot reach this memory) age out quickly.
+        self._l1 = MemoryCacheTier(
+            max_entries=self.settings.geo_cache_l1_max_entries,
+            max_bytes=self.settings.geo_cache_l1_max_bytes,
+        )
+        self._l1_max_ttl = self.settings.geo_cache_l1_max_ttl
     
     async def _get_pool(self):
         """Get or create PostgreSQL connection pool for current event loop."""
@@ -273,69 +431,139 @@ class UnifiedCache:
         Returns:
             Cached data if found, None otherwise
         """
-        # Generate primary key
-        cache_key = CacheKey(provider=provider, operation=operation, params=params)
-        normalized_params = cache_key._normalize_params(params)
-        primary_key = cache_key.generate_key()
-        
-        pool = await self._get_pool()
-        
-        # Try exact match first - simple read
-        row = None
-        
-        try:
-            # Use timeout to acquire connection
-            async with pool.acquire(timeout=10) as conn:
-                row = await conn.fetchrow(
-                    """
-                    SELECT data, params
-                    FROM cache_entries
-                    WHERE key = $1 AND expires_at > NOW()
-                    """,
-                    primary_key
+        results = await self.get_many(provider, operation, [params])
+        return results[0]
+
+    async def get_many(
+        self,
+        provider: ProviderType,
+        operation: str,
+        params_list: List[Dict[str, Any]],
+    ) -> List[Optional[Any]]:
+        """
+        Retrieve several entries of the same operation at once.
+
+        Keys not held in the L1 tier are resolved with a single
+        ``key = ANY(...)`` query. Only the keys still missing after that fall
+        back to semantic (geocode) or spatial (poi_search) matching.
+
+        Args:
+            provider: Provider that would generate this data
+            operation: Operation type (geocode, route, etc.)
+            params_list: Operation parameters, one dict per entry
+
+        Returns:
+            Cached data (or None) for each params dict, in the same order
+        """
+        keys = [
+            CacheKey(provider=provider, operation=operation, params=params).generate_key()
+            for params in params_list
+        ]
+        results: List[Optional[Any]] = [None] * len(keys)
+        found = [False] * len(keys)
+
+        # L1: already-reconstructed values held in process memory.
+        # pending maps each remaining key to the positions that asked for it.
+        pending: Dict[str, List[int]] = {}
+        for i, key in enumerate(keys):
+            in_l1, value = self._l1.get(key)
+            if in_l1:
+                results[i] = self._l1_copy(value)
+                found[i] = True
+            else:
+                pending.setdefault(key, []).append(i)
+
+        if pending:
+            pool = await self._get_pool()
+
+            # Exact matches - one round trip for all keys
+            try:
+                async with pool.acquire(timeout=10) as conn:
+                    rows = await conn.fetch(
+                        """
+                        SELECT key, data,
+                               EXTRACT(EPOCH FROM (expires_at - NOW())) AS ttl_remaining
+                        FROM cache_entries
+                        WHERE key = ANY($1::text[]) AND expires_at > NOW()
+                        """,
+                        list(pending),
+                    )
+            except Exception as e:
+                logger.error(f"❌ get({operation}): Error during cache read: {e}", exc_info=True)
+                # Return misses on cache error, don't fail the operation
+                return results
+
+            for row in rows:
+                value = self._load_into_l1(
+                    row['key'], operation, row['data'], row['ttl_remaining']
                 )
-        except Exception as e:
-            logger.error(f"❌ get({operation}): Error during cache read: {e}", exc_info=True)
-            # Return None on cache error, don't fail the operation
-            return None
-        
-        if row:
-            self._stats['hits'] += 1
-            self._record_hit(operation)
+                for i in pending.pop(row['key']):
+                    results[i] = self._l1_copy(value)
+                    found[i] = True
 
-            # Parse JSONB data
-            data = row['data']
-            if isinstance(data, str):
-                data = json.loads(data)
+            # For geocoding and POI searches, try semantic/spatial matching
+            for key, positions in pending.items():
+                params = params_list[positions[0]]
+                similar_entry = None
+                if operation == "geocode" and "address" in params:
+                    similar_entry = await self._find_similar_geocode(params["address"])
+                elif operation == "poi_search" and all(k in params for k in ['latitude', 'longitude', 'radius']):
+                    similar_entry = await self._find_spatial_poi_match(params)
 
-            # Reconstruct Pydantic models
-            return self._reconstruct_data(data, operation)
+                if similar_entry:
+                    value = self._load_into_l1(key, operation, similar_entry['data'])
+                    for i in positions:
+                        results[i] = self._l1_copy(value)
+                        found[i] = True
 
-        # For geocoding, try semantic matching
-        if operation == "geocode" and "address" in params:
-            similar_entry = await self._find_similar_geocode(params["address"])
-            if similar_entry:
+        for hit in found:
+            if hit:
                 self._stats['hits'] += 1
                 self._record_hit(operation)
-                data = similar_entry['data']
-                if isinstance(data, str):
-                    data = json.loads(data)
-                return self._reconstruct_data(data, operation)
-
-        # For POI searches, try spatial matching
-        elif operation == "poi_search" and all(k in params for k in ['latitude', 'longitude', 'radius']):
-            spatial_entry = await self._find_spatial_poi_match(params)
-            if spatial_entry:
-                self._stats['hits'] += 1
-                self._record_hit(operation)
-                data = spatial_entry['data']
-                if isinstance(data, str):
-                    data = json.loads(data)
-                return self._reconstruct_data(data, operation)
+            else:
+                self._stats['misses'] += 1
+                self._record_miss(operation)
 
-        self._stats['misses'] += 1
-        self._record_miss(operation)
-        return None
+        return results
+
+    def _load_into_l1(
+        self,
+        key: str,
+        operation: str,
+        data: Any,
+        ttl_remaining: Optional[float] = None,
+    ) -> Any:
+        """
+        Reconstruct data read from PostgreSQL and keep it in the L1 tier.
+
+        Args:
+            key: Cache key the value is stored under
+            operation: Operation type (selects the model to reconstruct)
+            data: JSONB value as returned by asyncpg (str or decoded JSON)
+            ttl_remaining: Seconds until the database entry expires, if known
+
+        Returns:
+            Reconstructed value
+        """
+        raw = data if isinstance(data, str) else json.dumps(data)
+        if isinstance(data, str):
+            data = json.loads(data)
+
+        value = self._reconstruct_data(data, operation)
+        ttl = self._l1_ttl(operation)
+        if ttl_remaining is not None:
+            ttl = min(ttl, float(ttl_remaining))
+        self._l1.set(key, value, len(raw), ttl)
+        return self._l1_copy(value)
+
+    def _l1_ttl(self, operation: str) -> float:
+        """TTL for L1 entries: the operation TTL, capped by GEO_CACHE_L1_MAX_TTL."""
+        return min(self.ttl_config.get(operation, 3600), self._l1_max_ttl)
+
+    @staticmethod
+    def _l1_copy(value: Any) -> Any:
+        """Return L1 lists as shallow copies so callers can't reshape the cached list."""
+        return list(value) if isinstance(value, list) else value
 
     def _record_hit(self, operation: str) -> None:
         """Record a cache hit for the current stats collector."""
@@ -367,8 +595,8 @@ class UnifiedCache:
                 return Route(**data)
             return data
         
-        # For poi_search, reconstruct list of POIs
-        elif operation == "poi_search":
+        # For poi_search and poi_tile, reconstruct list of POIs
+        elif operation in ("poi_search", "poi_tile"):
             if isinstance(data, list):
                 return [POI(**item) if isinstance(item, dict) else item for item in data]
             return data
@@ -392,98 +620,237 @@ class UnifiedCache:
             params: Operation parameters
             data: Data to cache
         """
-        cache_key = CacheKey(provider=provider, operation=operation, params=params)
-        normalized_params = cache_key._normalize_params(params)
-        key = cache_key.generate_key()
-        
+        await self.set_many(provider, operation, [(params, data)])
+
+    async def set_many(
+        self,
+        provider: ProviderType,
+        operation: str,
+        items: List[Tuple[Dict[str, Any], Any]],
+    ) -> None:
+        """
+        Store several entries of the same operation with one batched upsert.
+
+        Args:
+            provider: Provider that generated this data
+            operation: Operation type
+            items: (params, data) pairs to cache
+        """
+        if not items:
+            return
+
         ttl = self.ttl_config.get(operation, 3600)  # Default 1 hour
-        
-        # Serialize data
-        entry = CacheEntry(
-            key=key,
-            data=data,
-            provider=provider,
-            operation=operation,
-            created_at=datetime.utcnow(),
-            expires_at=datetime.utcnow() + timedelta(seconds=ttl),
-            hit_count=0,
-            params=normalized_params  # Use normalized params for consistency
-        )
-        
-        data_serialized = entry._serialize_data(data)
-        
+        created_at = datetime.utcnow()
+        expires_at = created_at + timedelta(seconds=ttl)
+
+        # key -> (upsert record, serialized data); a repeated key keeps the last value
+        records: Dict[str, Tuple[tuple, Any]] = {}
+        for params, data in items:
+            cache_key = CacheKey(provider=provider, operation=operation, params=params)
+            normalized_params = cache_key._normalize_params(params)
+            key = cache_key.generate_key()
+
+            # Serialize data
+            entry = CacheEntry(
+                key=key,
+                data=data,
+                provider=provider,
+                operation=operation,
+                created_at=created_at,
+                expires_at=expires_at,
+                hit_count=0,
+                params=normalized_params  # Use normalized params for consistency
+            )
+            data_serialized = entry._serialize_data(data)
+            geo_cell, address_tokens = self._index_columns(operation, normalized_params)
+
+            records[key] = (
+                (
+                    key,
+                    json.dumps(data_serialized),
+                    provider.value,
+                    operation,
+                    created_at,
+                    expires_at,
+                    0,
+                    json.dumps(normalized_params),  # Store normalized params
+                    geo_cell,
+                    address_tokens,
+                ),
+                data_serialized,
+            )
+
         pool = await self._get_pool()
-        
-        # Use a single transaction to avoid concurrency issues
+
         try:
             async with pool.acquire() as conn:
-                async with conn.transaction():
-                    # Convert to JSON strings for JSONB columns
-                    await conn.execute(
-                        """
-                        INSERT INTO cache_entries (key, data, provider, operation, created_at, expires_at, hit_count, params)
-                        VALUES ($1, $2::jsonb, $3, $4, $5, $6, $7, $8::jsonb)
-                        ON CONFLICT (key) DO UPDATE SET
-                            data = EXCLUDED.data,
-                            expires_at = EXCLUDED.expires_at,
-                            hit_count = 0
-                        """,
-                        key,
-                        json.dumps(data_serialized),
-                        provider.value,
-                        operation,
-                        entry.created_at,
-                        entry.expires_at,
-                        0,
-                        json.dumps(normalized_params)  # Store normalized params
-                    )
-            
-            self._stats['sets'] += 1
-            
+                # executemany runs all upserts atomically in a single implicit
+                # transaction, with one round trip per batch
+                await conn.executemany(
+                    """
+                    INSERT INTO cache_entries (key, data, provider, operation, created_at, expires_at, hit_count, params, geo_cell, address_tokens)
+                    VALUES ($1, $2::jsonb, $3, $4, $5, $6, $7, $8::jsonb, $9, $10)
+                    ON CONFLICT (key) DO UPDATE SET
+                        data = EXCLUDED.data,
+                        expires_at = EXCLUDED.expires_at,
+                        hit_count = 0,
+                        geo_cell = EXCLUDED.geo_cell,
+                        address_tokens = EXCLUDED.address_tokens
+                    """,
+                    [record for record, _ in records.values()],
+                )
+
         except Exception as e:
             logger.error(f"❌ set({operation}): Error caching data: {e}", exc_info=True)
             # Don't fail the operation if cache fails
             return
-        
+
+        sets_before = self._stats['sets']
+        self._stats['sets'] += len(records)
+
+        # Keep reconstructed copies in L1 (never the caller's own objects,
+        # which may still be mutated after being cached)
+        l1_ttl = self._l1_ttl(operation)
+        for key, (record, data_serialized) in records.items():
+            self._l1.set(
+                key,
+                self._reconstruct_data(data_serialized, operation),
+                len(record[1]),
+                l1_ttl,
+            )
+
         # Clean up expired entries periodically
-        if self._stats['sets'] % 100 == 0:  # Every 100 sets
+        if sets_before // 100 != self._stats['sets'] // 100:  # Every 100 sets
             # Run cleanup in background to avoid blocking
             import asyncio
             asyncio.create_task(self._cleanup_expired())
     
+    def _index_columns(
+        self, operation: str, normalized_params: Dict[str, Any]
+    ) -> Tuple[Optional[str], Optional[List[str]]]:
+        """
+        Compute the indexed lookup columns stored alongside a cache entry.
+
+        Returns:
+            Tuple of (geo_cell, address_tokens). geo_cell is set for POI
+            searches, address_tokens for geocoding; the other is None.
+        """
+        if operation == "poi_search":
+            try:
+                return self._poi_grid_cell(
+                    float(normalized_params["latitude"]),
+                    float(normalized_params["longitude"]),
+                ), None
+            except (KeyError, TypeError, ValueError):
+                return None, None
+
+        if operation == "geocode" and normalized_params.get("address"):
+            return None, self._address_tokens(normalized_params["address"])
+
+        return None, None
+
+    def _poi_grid_cell(self, latitude: float, longitude: float) -> str:
+        """Return the grid cell key ("row:col") that contains a coordinate."""
+        row = math.floor(latitude / POI_GRID_CELL_DEG)
+        col = math.floor(longitude / POI_GRID_CELL_DEG)
+        return f"{row}:{col}"
+
+    def _poi_grid_cells_around(
+        self, latitude: float, longitude: float, radius_m: float
+    ) -> List[str]:
+        """
+        Return the grid cells that may hold centers within radius_m of a point.
+
+        Args:
+            latitude: Center latitude
+            longitude: Center longitude
+            radius_m: Search distance in meters
+
+        Returns:
+            List of grid cell keys covering the bounding box of the circle
+        """
+        lat_delta = radius_m / 111000
+        cos_lat = max(abs(math.cos(math.radians(latitude))), 0.01)
+        lon_delta = radius_m / (111000 * cos_lat)
+
+        min_row = math.floor((latitude - lat_delta) / POI_GRID_CELL_DEG)
+        max_row = math.floor((latitude + lat_delta) / POI_GRID_CELL_DEG)
+        min_col = math.floor((longitude - lon_delta) / POI_GRID_CELL_DEG)
+        max_col = math.floor((longitude + lon_delta) / POI_GRID_CELL_DEG)
+
+        return [
+            f"{row}:{col}"
+            for row in range(min_row, max_row + 1)
+            for col in range(min_col, max_col + 1)
+        ]
+
+    def _address_tokens(self, address: str) -> List[str]:
+        """Return the sorted distinct tokens of a normalized address."""
+        return sorted(set(self._normalize_address(address).split()))
+
+    def _geocode_candidate_filter(self, tokens: List[str]) -> Tuple[List[str], int, int]:
+        """
+        Build an index-friendly filter for addresses similar to ``tokens``.
+
+        A cached address is similar when the Jaccard similarity of the token
+        sets exceeds ADDRESS_SIMILARITY_THRESHOLD. That requires sharing more
+        than threshold * len(tokens) tokens, so it must contain at least one of
+        any (len(tokens) - required + 1) of them; the longest tokens are used
+        as probes since they are the most selective. It also bounds the
+        candidate's token count.
+
+        Returns:
+            Tuple of (probe_tokens, min_token_count, max_token_count)
+        """
+        required = math.floor(ADDRESS_SIMILARITY_THRESHOLD * len(tokens)) + 1
+        probes = sorted(tokens, key=lambda t: (-len(t), t))[: len(tokens) - required + 1]
+        max_count = math.ceil(len(tokens) / ADDRESS_SIMILARITY_THRESHOLD)
+        return probes, required, max_count
+
     async def _find_similar_geocode(self, address: str) -> Optional[Dict[str, Any]]:
         """
         Find similar geocoding entries using semantic matching.
         
         This method normalizes addresses and looks for similar cached results.
         For example, "Av. Paulista, São Paulo" should match "Avenida Paulista, SP".
+
+        Candidates are narrowed in the database through the GIN-indexed
+        address_tokens column, so only a handful of rows is compared here.
         """
         normalized_address = self._normalize_address(address)
+        tokens = self._address_tokens(address)
+        if not tokens:
+            return None
+
+        probes, min_count, max_count = self._geocode_candidate_filter(tokens)
         
         pool = await self._get_pool()
         
-        # Look through geocoding entries for similar addresses - simple read
+        # Only rows sharing a probe token and with a compatible size - simple read
         rows = None
         async with pool.acquire() as conn:
             rows = await conn.fetch(
                 """
-                SELECT key, data, params
+                SELECT key, address_tokens
                 FROM cache_entries
                 WHERE operation = 'geocode'
+                AND address_tokens && $1::text[]
+                AND cardinality(address_tokens) BETWEEN $2 AND $3
                 AND expires_at > NOW()
-                AND params->>'address' IS NOT NULL
-                """
+                """,
+                probes,
+                min_count,
+                max_count,
             )
-        
-        for row in rows:
-            # Parse params if needed
-            params_data = row['params']
-            if isinstance(params_data, str):
-                params_data = json.loads(params_data)
-            
-            cached_address = self._normalize_address(params_data.get('address', ''))
-            if self._addresses_similar(normalized_address, cached_address):
-                return dict(row)
+
+            for row in rows:
+                cached_address = ' '.join(row['address_tokens'])
+                if self._addresses_similar(normalized_address, cached_address):
+                    match = await conn.fetchrow(
+                        "SELECT key, data, params FROM cache_entries WHERE key = $1",
+                        row['key'],
+                    )
+                    return dict(match) if match else None
         
         return None
     
@@ -493,12 +860,24 @@ class UnifiedCache:
         
         If we have cached POI results for a nearby location with similar search criteria,
         we can reuse those results.
+
+        An entry matches when its center is closer than the mean of both
+        radii. Candidates are limited in the database to cached radii up to
+        POI_MATCH_MAX_RADIUS_RATIO times the target radius, to the grid cells
+        within the largest such distance (indexed geo_cell column) and to the
+        same category set, so only nearby rows are compared here.
         """
         target_lat = params['latitude']
         target_lon = params['longitude']
         target_radius = params['radius']
         target_categories = set(params.get('categories', []))
         
+        max_cached_radius = target_radius * POI_MATCH_MAX_RADIUS_RATIO
+        cells = self._poi_grid_cells_around(
+            target_lat, target_lon, (target_radius + max_cached_radius) / 2
+        )
+        normalized_categories = sorted(target_categories)
+        
         pool = await self._get_pool()
         
         # Search for nearby POI cache entries - simple read
@@ -506,37 +885,44 @@ class UnifiedCache:
         async with pool.acquire() as conn:
             rows = await conn.fetch(
                 """
-                SELECT key, data, params
+                SELECT key, params
                 FROM cache_entries
                 WHERE operation = 'poi_search'
+                AND geo_cell = ANY($1::text[])
+                AND params->'categories' = $2::jsonb
+                AND (params->>'radius')::float <= $3
                 AND expires_at > NOW()
-                AND params->>'latitude' IS NOT NULL
-                AND params->>'longitude' IS NOT NULL
-                AND params->>'radius' IS NOT NULL
-                """
+                """,
+                cells,
+                json.dumps(normalized_categories),
+                float(max_cached_radius),
             )
         
-        for row in rows:
-            try:
-                # Parse params if needed
-                params_data = row['params']
-                if isinstance(params_data, str):
-                    params_data = json.loads(params_data)
-                
-                cached_lat = float(params_data.get('latitude', 0))
-                cached_lon = float(params_data.get('longitude', 0))
-                cached_radius = float(params_data.get('radius', 0))
-                cached_categories = set(params_data.get('categories', []))
-                
-                # Check if locations are close enough
-                distance = self._calculate_distance(target_lat, target_lon, cached_lat, cached_lon)
-                
-                # If search areas overlap significantly and categories match
-                if (distance < (target_radius + cached_radius) / 2 and
-                    target_categories == cached_categories):
-                    return dict(row)
-            except (ValueError, KeyError):
-                continue
+            for row in rows:
+                try:
+                    # Parse params if needed
+                    params_data = row['params']
+                    if isinstance(params_data, str):
+                        params_data = json.loads(params_data)
+                    
+                    cached_lat = float(params_data.get('latitude', 0))
+                    cached_lon = float(params_data.get('longitude', 0))
+                    cached_radius = float(params_data.get('radius', 0))
+                    cached_categories = set(params_data.get('categories', []))
+                    
+                    # Check if locations are close enough
+                    distance = self._calculate_distance(target_lat, target_lon, cached_lat, cached_lon)
+                    
+                    # If search areas overlap significantly and categories match
+                    if (distance < (target_radius + cached_radius) / 2 and
+                        target_categories == cached_categories):
+                        match = await conn.fetchrow(
+                            "SELECT key, data, params FROM cache_entries WHERE key = $1",
+                            row['key'],
+                        )
+                        return dict(match) if match else None
+                except (ValueError, KeyError):
+                    continue
         
         return None
     
@@ -589,7 +975,7 @@ class UnifiedCache:
         similarity = len(intersection) / len(union) if union else 0
         
         # Consider similar if > 70% overlap
-        return similarity > 0.7
+        return similarity > ADDRESS_SIMILARITY_THRESHOLD
     
     def _calculate_distance(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
         """Calculate approximate distance between two points in meters."""
@@ -624,7 +1010,12 @@ class UnifiedCache:
                 self._stats['evictions'] += deleted_count
                 logger.debug(f"Cleaned up {deleted_count} expired cache entries")
     async def get_stats(self) -> Dict[str, Any]:
-        """Get cache statistics."""
+        """
+        Get cache statistics.
+
+        Top-level hits/misses cover both tiers; ``l1`` and ``postgres`` break
+        them down per tier (a PostgreSQL lookup only happens on an L1 miss).
+        """
         pool = await self._get_pool()
         
         async with pool.acquire() as conn:
@@ -634,6 +1025,13 @@ class UnifiedCache:
         
         total_requests = self._stats['hits'] + self._stats['misses']
         hit_rate = (self._stats['hits'] / total_requests * 100) if total_requests > 0 else 0
+
+        l1_stats = self._l1.get_stats()
+        postgres_hits = self._stats['hits'] - l1_stats['hits']
+        postgres_requests = postgres_hits + self._stats['misses']
+        postgres_hit_rate = (
+            (postgres_hits / postgres_requests * 100) if postgres_requests > 0 else 0
+        )
         
         return {
             'backend': 'postgres',
@@ -643,11 +1041,18 @@ class UnifiedCache:
             'sets': self._stats['sets'],
             'evictions': self._stats['evictions'],
             'hit_rate_percent': round(hit_rate, 2),
-            'ttl_config': self.ttl_config
+            'ttl_config': self.ttl_config,
+            'l1': l1_stats,
+            'postgres': {
+                'hits': postgres_hits,
+                'misses': self._stats['misses'],
+                'hit_rate_percent': round(postgres_hit_rate, 2),
+            },
         }
     
     async def clear(self) -> None:
         """Clear all cache entries."""
+        self._l1.clear()
         pool = await self._get_pool()
         
         async with pool.acquire() as conn:
@@ -665,6 +1070,7 @@ class UnifiedCache:
         Returns:
             Number of entries invalidated
         """
+        self._l1.invalidate_pattern(pattern)
         pool = await self._get_pool()
         
         # Convert fnmatch pattern to SQL LIKE pattern
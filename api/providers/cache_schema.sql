@@ -22,7 +22,13 @@ CREATE TABLE IF NOT EXISTS cache_entries (
     hit_count INTEGER NOT NULL DEFAULT 0,
 
     -- Original parameters stored as JSONB for semantic/spatial matching
-    params JSONB NOT NULL
+    params JSONB NOT NULL,
+
+    -- Grid cell ("row:col" of 0.05 degree cells) of the POI search center
+    geo_cell TEXT,
+
+    -- Sorted distinct tokens of the normalized geocoding address
+    address_tokens TEXT[]
 );
 
 -- Index on expires_at for efficient cleanup of expired entries
@@ -40,6 +46,14 @@ CREATE INDEX IF NOT EXISTS idx_cache_params ON cache_entries USING GIN (params);
 -- Composite index for common query patterns
 CREATE INDEX IF NOT EXISTS idx_cache_operation_expires ON cache_entries(operation, expires_at);
 
+-- Grid index for spatial matching of nearby POI searches
+CREATE INDEX IF NOT EXISTS idx_cache_operation_geo_cell ON cache_entries(operation, geo_cell)
+    WHERE geo_cell IS NOT NULL;
+
+-- GIN index on address tokens for semantic matching of geocoding entries
+CREATE INDEX IF NOT EXISTS idx_cache_address_tokens ON cache_entries USING GIN (address_tokens)
+    WHERE address_tokens IS NOT NULL;
+
 -- Table for cache statistics (optional, can be computed on demand)
 CREATE TABLE IF NOT EXISTS cache_stats (
     id SERIAL PRIMARY KEY,
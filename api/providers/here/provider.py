@@ -12,6 +12,8 @@ from typing import List, Optional, Dict, Any
 from ..base import GeoProvider, ProviderType
 from ..models import GeoLocation, Route, POI, POICategory
 from ..cache import UnifiedCache
+from api.utils.async_utils import AsyncRateLimiter
+from api.utils.http_client import PooledHttpClient
 
 logger = logging.getLogger(__name__)
 
@@ -67,12 +69,18 @@ class HEREProvider(GeoProvider):
     Requires HERE_API_KEY environment variable to be set.
     """
     
-    def __init__(self, cache: Optional[UnifiedCache] = None):
+    def __init__(
+        self,
+        cache: Optional[UnifiedCache] = None,
+        rate_limiter: Optional[AsyncRateLimiter] = None,
+    ):
         """
         Initialize HERE provider.
         
         Args:
             cache: Optional unified cache instance
+            rate_limiter: Optional limiter shared with other instances
+                (defaults to a private one at rate_limit_per_second)
             
         Raises:
             ValueError: If HERE_API_KEY is not configured
@@ -88,13 +96,17 @@ class HEREProvider(GeoProvider):
                 "HERE_API_KEY is required for HERE provider. Please set it in environment or .env file"
             )
         
-        self._client = httpx.AsyncClient(
+        # Keep-alive connections, one pool per event loop using the provider
+        self._http = PooledHttpClient(
             timeout=30.0,
             headers={
                 "User-Agent": "MapaLinear/1.0"
             }
         )
         
+        # Shared across the per-thread event loops that reuse this provider
+        self._rate_limiter = rate_limiter or AsyncRateLimiter(self.rate_limit_per_second)
+
         # HERE API endpoints
         self._geocode_url = "https://geocode.search.hereapi.com/v1/geocode"
         self._reverse_geocode_url = "https://revgeocode.search.hereapi.com/v1/revgeocode"
@@ -102,7 +114,12 @@ class HEREProvider(GeoProvider):
         self._places_url = "https://discover.search.hereapi.com/v1/discover"
         
         logger.info("HERE provider initialized successfully")
-    
+
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        """Pooled HTTP client of the running event loop."""
+        return self._http.client
+
     async def geocode(self, address: str) -> Optional[GeoLocation]:
         """
         Convert address to coordinates using HERE Geocoding API.
@@ -143,6 +160,7 @@ class HEREProvider(GeoProvider):
         error_msg = None
         
         try:
+            await self._rate_limiter.acquire()
             response = await self._client.get(self._geocode_url, params=params)
             response_status = response.status_code
             response_size = len(response.content)
@@ -286,6 +304,7 @@ class HEREProvider(GeoProvider):
         error_msg = None
         
         try:
+            await self._rate_limiter.acquire()
             response = await self._client.get(self._reverse_geocode_url, params=params)
             response_status = response.status_code
             response_size = len(response.content)
@@ -423,12 +442,7 @@ class HEREProvider(GeoProvider):
             return []
 
         # Build cache key
-        cache_params = {
-            "location": f"{location.latitude},{location.longitude}",
-            "radius": radius,
-            "categories": [c.value for c in categories],
-            "limit": limit
-        }
+        cache_params = self._poi_search_cache_params(location, radius, categories, limit)
 
         # Check cache first
         if self._cache:
@@ -438,15 +452,136 @@ class HEREProvider(GeoProvider):
                 params=cache_params
             )
             if cached_result is not None:
-                # Log cache hit
-                await _get_api_call_logger().log_cache_hit(
-                    provider="here",
-                    operation="poi_search",
-                    request_params=cache_params,
-                    result_count=len(cached_result) if isinstance(cached_result, list) else 0,
-                )
+                await self._log_poi_search_cache_hit(cache_params, cached_result)
                 return cached_result
 
+        pois = await self._browse_pois(location, radius, here_categories, limit)
+        if pois is None:
+            return []
+
+        # Cache the results
+        if self._cache:
+            await self._cache.set(
+                provider=self.provider_type,
+                operation="poi_search",
+                params=cache_params,
+                data=pois
+            )
+
+        return pois
+
+    async def search_pois_many(
+        self,
+        locations: List[GeoLocation],
+        radius: float,
+        categories: List[POICategory],
+        limit: int = 50
+    ) -> List[List[POI]]:
+        """
+        Search POIs around several locations with batched cache I/O.
+
+        All locations are looked up with one ``get_many`` call; the misses are
+        fetched from the Browse API one after another (paced by the rate
+        limiter) and stored with one ``set_many`` call.
+
+        Args:
+            locations: Center points for the searches
+            radius: Search radius in meters
+            categories: POI categories to search for
+            limit: Maximum results per location
+
+        Returns:
+            One list of POIs per location, in the same order as ``locations``
+        """
+        here_categories = self._map_categories_to_here(categories)
+        if not here_categories:
+            logger.warning(f"No valid HERE categories for: {categories}")
+            return [[] for _ in locations]
+
+        params_list = [
+            self._poi_search_cache_params(location, radius, categories, limit)
+            for location in locations
+        ]
+
+        if self._cache:
+            cached = await self._cache.get_many(
+                provider=self.provider_type,
+                operation="poi_search",
+                params_list=params_list
+            )
+        else:
+            cached = [None] * len(locations)
+
+        results: List[List[POI]] = []
+        to_cache = []
+        for location, cache_params, cached_result in zip(locations, params_list, cached):
+            if cached_result is not None:
+                await self._log_poi_search_cache_hit(cache_params, cached_result)
+                results.append(cached_result)
+                continue
+
+            pois = await self._browse_pois(location, radius, here_categories, limit)
+            if pois is None:
+                results.append([])
+                continue
+
+            results.append(pois)
+            to_cache.append((cache_params, pois))
+
+        if self._cache and to_cache:
+            await self._cache.set_many(
+                provider=self.provider_type,
+                operation="poi_search",
+                items=to_cache
+            )
+
+        return results
+
+    def _poi_search_cache_params(
+        self,
+        location: GeoLocation,
+        radius: float,
+        categories: List[POICategory],
+        limit: int
+    ) -> Dict[str, Any]:
+        """Build the cache key parameters for a POI search."""
+        return {
+            "location": f"{location.latitude},{location.longitude}",
+            "radius": radius,
+            "categories": [c.value for c in categories],
+            "limit": limit
+        }
+
+    async def _log_poi_search_cache_hit(
+        self, cache_params: Dict[str, Any], cached_result: Any
+    ) -> None:
+        """Log a POI search served from cache."""
+        await _get_api_call_logger().log_cache_hit(
+            provider="here",
+            operation="poi_search",
+            request_params=cache_params,
+            result_count=len(cached_result) if isinstance(cached_result, list) else 0,
+        )
+
+    async def _browse_pois(
+        self,
+        location: GeoLocation,
+        radius: float,
+        here_categories: str,
+        limit: int
+    ) -> Optional[List[POI]]:
+        """
+        Fetch POIs around a location from the HERE Browse API, bypassing the cache.
+
+        Args:
+            location: Center point for search
+            radius: Search radius in meters
+            here_categories: HERE category IDs (comma-separated)
+            limit: Maximum results to return
+
+        Returns:
+            List of found POIs, or None if the request failed (so it isn't cached)
+        """
         # HERE Browse API endpoint
         browse_url = "https://browse.search.hereapi.com/v1/browse"
 
@@ -465,6 +600,7 @@ class HEREProvider(GeoProvider):
         error_msg = None
 
         try:
+            await self._rate_limiter.acquire()
             response = await self._client.get(browse_url, params=params)
             response_status = response.status_code
             response_size = len(response.content)
@@ -496,15 +632,6 @@ class HEREProvider(GeoProvider):
                 result_count=len(pois),
             )
 
-            # Cache the results
-            if self._cache:
-                await self._cache.set(
-                    provider=self.provider_type,
-                    operation="poi_search",
-                    params=cache_params,
-                    data=pois
-                )
-
             logger.debug(f"Found {len(pois)} POIs via HERE near {location.latitude},{location.longitude}")
             return pois
 
@@ -529,7 +656,7 @@ class HEREProvider(GeoProvider):
                 response_size_bytes=response_size,
                 error_message=error_msg,
             )
-            return []
+            return None
         except Exception as e:
             error_msg = str(e)[:500]
             logger.error(f"Error searching POIs via HERE: {e}")
@@ -550,7 +677,7 @@ class HEREProvider(GeoProvider):
                 response_size_bytes=response_size,
                 error_message=error_msg,
             )
-            return []
+            return None
 
     async def get_poi_details(self, poi_id: str) -> Optional[POI]:
         """
@@ -596,6 +723,7 @@ class HEREProvider(GeoProvider):
         error_msg = None
 
         try:
+            await self._rate_limiter.acquire()
             response = await self._client.get(lookup_url, params=params)
             response_status = response.status_code
             response_size = len(response.content)
@@ -851,4 +979,4 @@ class HEREProvider(GeoProvider):
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        await self._client.aclose()
\ No newline at end of file
+        await self._http.aclose()
\ No newline at end of file
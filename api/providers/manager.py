@@ -191,6 +191,12 @@ def _register_built_in_providers(manager: GeoProviderManager):
     except ImportError as e:
         logger.warning(f"Could not register OSM provider: {e}")
     
+    try:
+        from .pbf.provider import OSMPBFProvider
+        manager.register_provider(ProviderType.OSM_PBF, OSMPBFProvider)
+    except ImportError as e:
+        logger.warning(f"Could not register OSM PBF provider: {e}")
+
     try:
         from .here.provider import HEREProvider
         manager.register_provider(ProviderType.HERE, HEREProvider)
@@ -7,14 +7,36 @@ This provider implements the GeoProvider interface using OpenStreetMap data sour
 import asyncio
 import logging
 import time
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+
+import numpy as np
+
 from ..base import GeoProvider, ProviderType
 from ..models import GeoLocation, Route, RouteStep, POI, POICategory
 from ..cache import UnifiedCache
+from ..settings import get_settings
 from api.services.api_call_logger import api_call_logger
+from api.utils.async_utils import AsyncRateLimiter
+from api.utils.geo_utils import as_route_array, tile_bounds, tile_indices, tiles_in_bbox
+from api.utils.http_client import PooledHttpClient
 
 logger = logging.getLogger(__name__)
 
+# Degrees-to-meters factor of the square POI search windows
+_METERS_PER_DEGREE = 111000.0
+# Server-side timeout for POI tile queries (Overpass [timeout:...]), seconds
+_TILE_QUERY_TIMEOUT_S = 180
+# Tile bboxes are widened by this much in queries (~1 cm)
+_TILE_BBOX_MARGIN_DEG = 1e-7
+
+_PLACES = ("city", "town", "village")
+# Places searched within 3x the radius: city centers may be far from highways
+_WIDE_PLACES = ("city", "town")
+
+# Slippy map tile (x, y), and a tile with one POI category
+Tile = Tuple[int, int]
+TileKey = Tuple[Tile, POICategory]
+
 
 class OSMProvider(GeoProvider):
     """
@@ -33,6 +55,13 @@ class OSMProvider(GeoProvider):
         from geopy.geocoders import Nominatim
         
         self._cache = cache
+
+        settings = get_settings()
+        # OSRM routing server (demo server by default)
+        self._osrm_endpoint = settings.osrm_endpoint.rstrip('/')
+        self._osrm_batch_max_destinations = max(1, settings.osrm_batch_max_destinations)
+        # Zoom level of the POI tile cache
+        self._tile_zoom = settings.poi_tile_zoom
         
         # Nominatim geolocator for geocoding
         self.geolocator = Nominatim(user_agent="mapalinear/1.0")
@@ -40,8 +69,15 @@ class OSMProvider(GeoProvider):
         # Rate limiting attributes
         self._last_request_time: float = 0.0
         self._query_delay: float = 1.0  # 1 second between requests
-        self._request_lock = asyncio.Lock()
+        # Thread-safe limiter: the provider is shared across per-thread event loops
+        self._rate_limiter = AsyncRateLimiter(1.0 / self._query_delay)
         
+        # Keep-alive connections to OSRM and Overpass, one pool per event loop
+        self._http = PooledHttpClient(
+            timeout=30.0,
+            headers={'User-Agent': 'mapalinear/1.0 (https://github.com/your-repo)'}
+        )
+
         # Multiple Overpass API endpoints for fallback
         self.overpass_endpoints = [
             "https://overpass-api.de/api/interpreter",
@@ -68,19 +104,6 @@ class OSMProvider(GeoProvider):
             'car_repair': POICategory.MECHANIC,
         }
     
-    def _get_http_client(self):
-        """
-        Create a new HTTP client for the current async context.
-        
-        Returns a context manager that provides an httpx.AsyncClient
-        configured for OSM API requests.
-        """
-        import httpx
-        return httpx.AsyncClient(
-            timeout=httpx.Timeout(30.0),
-            headers={'User-Agent': 'mapalinear/1.0 (https://github.com/your-repo)'}
-        )
-    
     async def geocode(self, address: str) -> Optional[GeoLocation]:
         """Convert address to coordinates using Nominatim."""
         import asyncio
@@ -309,14 +332,7 @@ class OSMProvider(GeoProvider):
     ) -> Optional[Route]:
         """Calculate route using OSMnx or basic routing."""
         # Check cache first
-        cache_key_params = {
-            "origin_lat": origin.latitude,
-            "origin_lon": origin.longitude,
-            "dest_lat": destination.latitude,
-            "dest_lon": destination.longitude,
-            "waypoints": [f"{w.latitude},{w.longitude}" for w in (waypoints or [])],
-            "avoid": avoid or []
-        }
+        cache_key_params = self._route_cache_params(origin, destination, waypoints, avoid)
         
         if self._cache:
             cached_result = await self._cache.get(
@@ -359,6 +375,85 @@ class OSMProvider(GeoProvider):
             logger.error(f"🗺️ Erro no cálculo da rota: {e}")
             return None
     
+    async def calculate_routes_many(
+        self,
+        origin: GeoLocation,
+        destinations: List[GeoLocation],
+    ) -> List[Optional[Route]]:
+        """
+        Calculate routes from one origin to several destinations.
+
+        All routes are looked up with one ``get_many`` call; the misses are
+        requested from OSRM in batches of up to OSRM_BATCH_MAX_DESTINATIONS
+        (see ``_calculate_osrm_api_route_batch``) and stored with one
+        ``set_many`` call. Routes are cached under the same keys as
+        ``calculate_route``, so either method reuses the other's results.
+        """
+        params_list = [
+            self._route_cache_params(origin, destination)
+            for destination in destinations
+        ]
+
+        if self._cache:
+            cached = await self._cache.get_many(
+                provider=ProviderType.OSM,
+                operation="route",
+                params_list=params_list
+            )
+        else:
+            cached = [None] * len(destinations)
+
+        results: List[Optional[Route]] = list(cached)
+        missing = [i for i, cached_result in enumerate(cached) if cached_result is None]
+
+        to_cache = []
+        batch_size = self._osrm_batch_max_destinations
+        for start in range(0, len(missing), batch_size):
+            batch = missing[start:start + batch_size]
+            route_data_list = await self._calculate_osrm_api_route_batch(
+                origin, [destinations[i] for i in batch]
+            )
+
+            for i, route_data in zip(batch, route_data_list):
+                if not route_data:
+                    continue
+                route = Route(
+                    origin=origin,
+                    destination=destinations[i],
+                    total_distance=route_data['distance'] / 1000.0,  # Convert to km
+                    total_duration=route_data['duration'] / 60.0,   # Convert to minutes
+                    geometry=route_data['geometry'],
+                    steps=route_data['steps'],
+                )
+                results[i] = route
+                to_cache.append((params_list[i], route))
+
+        if self._cache and to_cache:
+            await self._cache.set_many(
+                provider=ProviderType.OSM,
+                operation="route",
+                items=to_cache
+            )
+
+        return results
+
+    def _route_cache_params(
+        self,
+        origin: GeoLocation,
+        destination: GeoLocation,
+        waypoints: Optional[List[GeoLocation]] = None,
+        avoid: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Build the cache key parameters for a route."""
+        return {
+            "origin_lat": origin.latitude,
+            "origin_lon": origin.longitude,
+            "dest_lat": destination.latitude,
+            "dest_lon": destination.longitude,
+            "waypoints": [f"{w.latitude},{w.longitude}" for w in (waypoints or [])],
+            "avoid": avoid or []
+        }
+
     async def search_pois(
         self,
         location: GeoLocation,
@@ -366,60 +461,384 @@ class OSMProvider(GeoProvider):
         categories: List[POICategory],
         limit: int = 50
     ) -> List[POI]:
-        """Search POIs using Overpass API."""
-        # logger.debug(f"🔎 OSM POI Search: lat={location.latitude:.6f}, lon={location.longitude:.6f}, radius={radius}m")
-        # logger.debug(f"🔎 Categorias solicitadas: {[cat.value for cat in categories]}")
-        
-        # Check cache first
-        cache_key_params = {
-            "latitude": location.latitude,
-            "longitude": location.longitude,
-            "radius": radius,
-            "categories": [cat.value for cat in categories],
-            "limit": limit
+        """
+        Search POIs using Overpass API, through the POI tile cache.
+
+        Returns what a bbox query around ``location`` would: POIs within a
+        square window of half-side ``radius`` (3x for cities and towns), in
+        Overpass output order (nodes, then ways, by id), up to ``limit``.
+        """
+        results = await self.search_pois_many([location], radius, categories, limit)
+        return results[0]
+
+    async def search_pois_many(
+        self,
+        locations: List[GeoLocation],
+        radius: float,
+        categories: List[POICategory],
+        limit: int = 50
+    ) -> List[List[POI]]:
+        """
+        Search POIs around several locations from the POI tile cache.
+
+        The tiles under all search windows are looked up with one
+        ``get_many`` call; the missing ones are fetched with as few Overpass
+        queries as POI_TILE_MAX_PER_QUERY allows and stored with one
+        ``set_many``. A location whose tiles couldn't all be fetched gets an
+        empty list (and nothing is cached for the failed tiles).
+        """
+        windows = [
+            self._search_window_tiles(location, radius, categories)
+            for location in locations
+        ]
+        tiles, _ = await self._load_tiles([key for keys in windows for key in keys])
+
+        results: List[List[POI]] = []
+        for location, keys in zip(locations, windows):
+            if any(key not in tiles for key in keys):
+                results.append([])
+                continue
+            results.append(self._select_window_pois(
+                location, radius, categories, [tiles[key] for key in keys], limit
+            ))
+        return results
+
+    @property
+    def supports_corridor_search(self) -> bool:
+        """The tiles along a route are fetched in a few Overpass queries."""
+        return True
+
+    async def search_pois_along_route(
+        self,
+        route: List[GeoLocation],
+        radius: float,
+        categories: List[POICategory],
+    ) -> List[POI]:
+        """
+        Search POIs along a route from the POI tile cache.
+
+        Loads every tile under a square window of half-side ``radius`` (3x
+        for categories that include cities and towns) slid along the route.
+        Tiles are ordered along the route, so each Overpass query fills a
+        contiguous stretch of it. The result is every POI of those tiles: a
+        superset of the corridor, which callers narrow to their search
+        points with search_results_mask.
+
+        Raises:
+            RuntimeError: If any tile query failed (the tiles of the queries
+                that succeeded are still cached)
+        """
+        if not route:
+            return []
+
+        points = as_route_array([(p.latitude, p.longitude) for p in route])
+        window_deg = radius / _METERS_PER_DEGREE
+        step_deg = window_deg / 2
+        near = self._corridor_tiles(points, window_deg, step_deg)
+        wide = (
+            self._corridor_tiles(points, window_deg * 3, step_deg)
+            if any(self._includes_places(category) for category in categories)
+            else {}
+        )
+
+        # (first sample needing the tile, key); the sort is stable and only
+        # compares positions
+        ordered = sorted(
+            (
+                (position, (tile, category))
+                for category in categories
+                for tile, position in (
+                    wide if self._includes_places(category) else near
+                ).items()
+            ),
+            key=lambda item: item[0],
+        )
+        keys = [key for _, key in ordered]
+        tiles, failed = await self._load_tiles(keys)
+
+        pois_by_id: Dict[str, POI] = {}
+        for key in keys:
+            for poi in tiles.get(key, []):
+                pois_by_id.setdefault(poi.id, poi)
+
+        if failed:
+            raise RuntimeError(f"Corridor POI search failed for {failed} tile queries")
+
+        return list(pois_by_id.values())
+
+    # POI tile cache: Overpass results stored per (slippy map tile, category),
+    # so searches anywhere reuse the tiles earlier searches fetched
+
+    def _includes_places(self, category: POICategory) -> bool:
+        """Whether searching a category also searches cities, towns and villages."""
+        return self._overpass_filters([category])[2]
+
+    def _tile_cache_params(self, key: TileKey) -> Dict[str, Any]:
+        """Build the cache key parameters of one tile and category."""
+        (x, y), category = key
+        return {
+            "tile": f"{self._tile_zoom}/{x}/{y}",
+            "category": category.value,
         }
-        
+
+    def _search_window_tiles(
+        self,
+        location: GeoLocation,
+        radius: float,
+        categories: List[POICategory],
+    ) -> List[TileKey]:
+        """Tiles and categories needed to answer one per-point search."""
+        keys: List[TileKey] = []
+        for category in categories:
+            half_deg = radius / _METERS_PER_DEGREE
+            if self._includes_places(category):
+                half_deg *= 3  # city centers may be far from highways
+            for tile in tiles_in_bbox(
+                location.latitude - half_deg,
+                location.longitude - half_deg,
+                location.latitude + half_deg,
+                location.longitude + half_deg,
+                self._tile_zoom,
+            ):
+                keys.append((tile, category))
+        return keys
+
+    def _corridor_tiles(
+        self, points: np.ndarray, half_deg: float, step_deg: float
+    ) -> Dict[Tile, int]:
+        """
+        Tiles under a square window slid along a route.
+
+        The route is densified so consecutive samples are at most step_deg
+        apart on each axis, and each sample window is widened by step_deg / 2
+        to cover the points between samples.
+
+        Returns:
+            Tile -> index of the first sample that needs it, in that order
+        """
+        if len(points) > 1:
+            deltas = np.diff(points, axis=0)
+            counts = np.maximum(
+                1, np.ceil(np.abs(deltas).max(axis=1) / step_deg)
+            ).astype(np.int64)
+            segment = np.repeat(np.arange(len(deltas)), counts)
+            first = np.repeat(np.cumsum(counts) - counts, counts)
+            fraction = (np.arange(len(segment)) - first + 1) / counts[segment]
+            samples = np.vstack((
+                points[:1], points[segment] + deltas[segment] * fraction[:, None]
+            ))
+        else:
+            samples = points
+
+        half = half_deg + step_deg / 2
+        west, north = tile_indices(samples[:, 0] + half, samples[:, 1] - half, self._tile_zoom)
+        east, south = tile_indices(samples[:, 0] - half, samples[:, 1] + half, self._tile_zoom)
+
+        tiles: Dict[Tile, int] = {}
+        previous = None
+        for position, box in enumerate(zip(
+            west.tolist(), east.tolist(), north.tolist(), south.tolist()
+        )):
+            if box == previous:
+                continue
+            previous = box
+            for y in range(box[2], box[3] + 1):
+                for x in range(box[0], box[1] + 1):
+                    tiles.setdefault((x, y), position)
+        return tiles
+
+    async def _load_tiles(
+        self, keys: List[TileKey]
+    ) -> Tuple[Dict[TileKey, List[POI]], int]:
+        """
+        Get POI tiles from the cache, fetching the missing ones from Overpass.
+
+        All keys are read with one ``get_many``; the missing tiles are
+        fetched POI_TILE_MAX_PER_QUERY at a time, in the order they were
+        first needed, and stored with one ``set_many``.
+
+        Returns:
+            Tuple of (POIs of every tile available, failed Overpass queries)
+        """
+        unique = list(dict.fromkeys(keys))
         if self._cache:
-            cached_result = await self._cache.get(
+            cached = await self._cache.get_many(
                 provider=ProviderType.OSM,
-                operation="poi_search",
-                params=cache_key_params
+                operation="poi_tile",
+                params_list=[self._tile_cache_params(key) for key in unique]
             )
-            if cached_result is not None:
-                return cached_result
-        
+        else:
+            cached = [None] * len(unique)
+
+        tiles = {key: pois for key, pois in zip(unique, cached) if pois is not None}
+
+        missing: Dict[Tile, List[POICategory]] = {}
+        for tile, category in unique:
+            if (tile, category) not in tiles:
+                missing.setdefault(tile, []).append(category)
+
+        batches = list(missing.items())
+        batch_size = max(1, get_settings().poi_tile_max_per_query)
+        fetched: Dict[TileKey, List[POI]] = {}
+        failed = 0
+        for start in range(0, len(batches), batch_size):
+            result = await self._fetch_tiles(dict(batches[start:start + batch_size]))
+            if result is None:
+                failed += 1
+            else:
+                fetched.update(result)
+
+        if self._cache and fetched:
+            await self._cache.set_many(
+                provider=ProviderType.OSM,
+                operation="poi_tile",
+                items=[(self._tile_cache_params(key), pois) for key, pois in fetched.items()]
+            )
+
+        if missing:
+            logger.debug(
+                f"POI tiles: {len(unique)} needed, {len(tiles)} cached, {len(fetched)} fetched "
+                f"with {-(-len(batches) // batch_size)} queries ({failed} failed)"
+            )
+        tiles.update(fetched)
+        return tiles, failed
+
+    async def _fetch_tiles(
+        self, batch: Dict[Tile, List[POICategory]]
+    ) -> Optional[Dict[TileKey, List[POI]]]:
+        """
+        Query Overpass for whole tiles, bypassing the cache.
+
+        Each element is assigned to the tile containing it (elements on the
+        border of a tile outside the batch are left to that tile's own
+        query) and to every requested category whose tag filters it matches.
+
+        Args:
+            batch: Tile -> categories to fetch for it
+
+        Returns:
+            POIs per (tile, category), empty lists included, or None if the
+            request failed (so nothing is cached)
+        """
         try:
-            query = self._generate_overpass_query(location, radius, categories)
-            # logger.debug(f"🔎 Query Overpass gerada:\n{query}")
-            
-            overpass_data = await self._make_overpass_request(query)
-            
-            pois = []
-            for i, element in enumerate(overpass_data.get('elements', [])):
-                # logger.debug(f"🔎 Elemento {i}: {element.get('tags', {}).get('name', 'sem nome')} - {element.get('tags', {})}")
-                poi = self._parse_osm_element_to_poi(element)
-                if poi:
-                    pois.append(poi)
-                    # logger.debug(f"🔎 POI criado: {poi.name} ({poi.category.value})")
-                    if len(pois) >= limit:
-                        break
-                else:
-                    pass
-            
-            # Cache the result
-            if self._cache:
-                await self._cache.set(
-                    provider=ProviderType.OSM,
-                    operation="poi_search",
-                    params=cache_key_params,
-                    data=pois
-                )
-            
-            return pois
-            
-        except Exception:
-            return []
-    
+            query = self._generate_overpass_tiles_query(batch)
+            overpass_data = await self._make_overpass_request(
+                query, timeout=_TILE_QUERY_TIMEOUT_S + 10
+            )
+        except Exception as e:
+            logger.warning(f"Overpass tile query failed: {type(e).__name__}: {e}")
+            return None
+
+        fetched: Dict[TileKey, List[POI]] = {
+            (tile, category): [] for tile, categories in batch.items() for category in categories
+        }
+        filters = {
+            category: self._overpass_filters([category])
+            for categories in batch.values() for category in categories
+        }
+
+        for element in overpass_data.get('elements', []):
+            poi = self._parse_osm_element_to_poi(element)
+            if not poi:
+                continue
+            xs, ys = tile_indices(poi.location.latitude, poi.location.longitude, self._tile_zoom)
+            tile = (int(xs), int(ys))
+            tags = element.get('tags', {})
+            for category in batch.get(tile, []):
+                amenities, tourism, include_places = filters[category]
+                if (
+                    tags.get('amenity') in amenities
+                    or tags.get('tourism') in tourism
+                    or (include_places and tags.get('place') in _PLACES)
+                ):
+                    fetched[(tile, category)].append(poi)
+
+        return fetched
+
+    def _select_window_pois(
+        self,
+        location: GeoLocation,
+        radius: float,
+        categories: List[POICategory],
+        tile_pois: List[List[POI]],
+        limit: int,
+    ) -> List[POI]:
+        """
+        Pick from tile POIs the ones a bbox query around ``location`` returns.
+
+        See search_results_mask; results follow Overpass output order.
+        """
+        candidates: Dict[str, POI] = {}
+        for pois in tile_pois:
+            for poi in pois:
+                candidates.setdefault(poi.id, poi)
+        pois = list(candidates.values())
+
+        returned = self.search_results_mask(
+            np.array([[location.latitude, location.longitude]]),
+            pois, radius, categories, limit,
+        )[:, 0]
+        return sorted(
+            (poi for poi, keep in zip(pois, returned) if keep),
+            key=self._overpass_order,
+        )
+
+    def search_results_mask(
+        self,
+        locations: np.ndarray,
+        pois: List[POI],
+        radius: float,
+        categories: List[POICategory],
+        limit: Optional[int] = None,
+    ) -> np.ndarray:
+        """
+        Tell which POIs a bbox query around each location returns.
+
+        Windows are squares of half-side ``radius``, 3x for cities and towns
+        when the categories include places; with a ``limit``, each location
+        keeps its first POIs in Overpass output order (nodes, then ways, by
+        id), as the query would.
+        """
+        locations = np.asarray(locations, dtype=np.float64).reshape(-1, 2)
+        if not pois or not len(locations):
+            return np.zeros((len(pois), len(locations)), dtype=bool)
+
+        include_places = any(self._includes_places(category) for category in categories)
+        order = sorted(range(len(pois)), key=lambda i: self._overpass_order(pois[i]))
+        ranked = [pois[i] for i in order]
+
+        coords = as_route_array(
+            [(poi.location.latitude, poi.location.longitude) for poi in ranked]
+        )
+        window_deg = radius / _METERS_PER_DEGREE * np.array([
+            3 if self._is_wide_place(poi.provider_data.get('osm_tags', {}).get('place'), include_places)
+            else 1
+            for poi in ranked
+        ])
+        returned = (
+            (np.abs(coords[:, 0:1] - locations[:, 0]) <= window_deg[:, None])
+            & (np.abs(coords[:, 1:2] - locations[:, 1]) <= window_deg[:, None])
+        )
+        if limit is not None:
+            returned &= np.cumsum(returned, axis=0) <= limit
+
+        mask = np.empty_like(returned)
+        mask[order] = returned
+        return mask
+
+    @staticmethod
+    def _is_wide_place(place: Optional[str], include_places: bool) -> bool:
+        """Whether a place tag is searched within 3x the radius."""
+        return include_places and place in _WIDE_PLACES
+
+    @staticmethod
+    def _overpass_order(poi: POI) -> Tuple[bool, int]:
+        """Sort key of Overpass output order: nodes, then ways, by id."""
+        return (
+            poi.provider_data.get('element_type') != 'node',
+            poi.provider_data.get('osm_id', 0),
+        )
+
     async def get_poi_details(self, poi_id: str) -> Optional[POI]:
         """Get detailed POI information."""
         try:
@@ -463,15 +882,8 @@ class OSMProvider(GeoProvider):
     
     async def _wait_before_request(self):
         """Implement rate limiting for OSM requests."""
-        async with self._request_lock:
-            import time
-            current_time = time.time()
-            time_since_last = current_time - self._last_request_time
-            
-            if time_since_last < self._query_delay:
-                await asyncio.sleep(self._query_delay - time_since_last)
-            
-            self._last_request_time = time.time()
+        await self._rate_limiter.acquire()
+        self._last_request_time = time.time()
     
     async def _calculate_osm_route(
         self, 
@@ -498,8 +910,9 @@ class OSMProvider(GeoProvider):
         destination: GeoLocation
     ) -> Optional[dict]:
         """Calculate route using OSRM API with step extraction."""
-        # OSRM demo server - use with caution in production
-        osrm_url = f"http://router.project-osrm.org/route/v1/driving/{origin.longitude},{origin.latitude};{destination.longitude},{destination.latitude}"
+        # OSRM demo server by default - use with caution in production
+        osrm_endpoint = f"{self._osrm_endpoint}/route/v1/driving"
+        osrm_url = f"{osrm_endpoint}/{origin.longitude},{origin.latitude};{destination.longitude},{destination.latitude}"
         params = {
             'overview': 'full',
             'geometries': 'geojson',
@@ -514,106 +927,68 @@ class OSMProvider(GeoProvider):
         result_count = 0
         
         try:
-            # Use context manager to ensure proper client lifecycle
-            async with self._get_http_client() as client:
-                response = await client.get(osrm_url, params=params, timeout=30)
-                
-                response_status = response.status_code
-                response_size = len(response.content)
-                
-                if response.status_code != 200:
-                    logger.warning(f"🗺️ OSRM retornou status {response.status_code}")
-                    error_msg = f"HTTP {response.status_code}"
-
-                    # Log failed API call
-                    duration_ms = int((time.time() - start_time) * 1000)
-                    await api_call_logger.log_call(
-                        provider="osm",
-                        operation="osrm_route",
-                        endpoint="http://router.project-osrm.org/route/v1/driving",
-                        http_method="GET",
-                        response_status=response_status,
-                        duration_ms=duration_ms,
-                        request_params={
-                            "origin": f"{origin.latitude},{origin.longitude}",
-                            "destination": f"{destination.latitude},{destination.longitude}",
-                        },
-                        response_size_bytes=response_size,
-                        error_message=error_msg,
-                    )
-                    return None
-                
-                data = response.json()
-                
-                if data.get('code') != 'Ok':
-                    error_msg = data.get('message', 'Unknown error')
-                    logger.warning(f"🗺️ OSRM erro: {error_msg}")
-
-                    # Log failed API call
-                    duration_ms = int((time.time() - start_time) * 1000)
-                    await api_call_logger.log_call(
-                        provider="osm",
-                        operation="osrm_route",
-                        endpoint="http://router.project-osrm.org/route/v1/driving",
-                        http_method="GET",
-                        response_status=response_status,
-                        duration_ms=duration_ms,
-                        request_params={
-                            "origin": f"{origin.latitude},{origin.longitude}",
-                            "destination": f"{destination.latitude},{destination.longitude}",
-                        },
-                        response_size_bytes=response_size,
-                        error_message=error_msg,
-                    )
-                    return None
-                
-                if not data.get('routes'):
-                    logger.warning("🗺️ OSRM não retornou rotas")
-                    error_msg = "No routes returned"
-
-                    # Log failed API call
-                    duration_ms = int((time.time() - start_time) * 1000)
-                    await api_call_logger.log_call(
-                        provider="osm",
-                        operation="osrm_route",
-                        endpoint="http://router.project-osrm.org/route/v1/driving",
-                        http_method="GET",
-                        response_status=response_status,
-                        duration_ms=duration_ms,
-                        request_params={
-                            "origin": f"{origin.latitude},{origin.longitude}",
-                            "destination": f"{destination.latitude},{destination.longitude}",
-                        },
-                        response_size_bytes=response_size,
-                        error_message=error_msg,
-                    )
-                    return None
-                
-                route = data['routes'][0]
-                geometry = route['geometry']['coordinates']
-
-                # Convert to (lat, lon) format
-                geometry_converted = [(coord[1], coord[0]) for coord in geometry]
-
-                distance = route['distance']  # meters
-                duration = route['duration']  # seconds
+            client = self._http.client
+            response = await client.get(osrm_url, params=params, timeout=30)
+            
+            response_status = response.status_code
+            response_size = len(response.content)
+            
+            if response.status_code != 200:
+                logger.warning(f"🗺️ OSRM retornou status {response.status_code}")
+                error_msg = f"HTTP {response.status_code}"
 
-                # Extract steps from all legs
-                steps: List[RouteStep] = []
-                for leg in route.get('legs', []):
-                    for step in leg.get('steps', []):
-                        route_step = self._parse_osrm_step(step)
-                        if route_step:
-                            steps.append(route_step)
+                # Log failed API call
+                duration_ms = int((time.time() - start_time) * 1000)
+                await api_call_logger.log_call(
+                    provider="osm",
+                    operation="osrm_route",
+                    endpoint=osrm_endpoint,
+                    http_method="GET",
+                    response_status=response_status,
+                    duration_ms=duration_ms,
+                    request_params={
+                        "origin": f"{origin.latitude},{origin.longitude}",
+                        "destination": f"{destination.latitude},{destination.longitude}",
+                    },
+                    response_size_bytes=response_size,
+                    error_message=error_msg,
+                )
+                return None
+            
+            data = response.json()
+            
+            if data.get('code') != 'Ok':
+                error_msg = data.get('message', 'Unknown error')
+                logger.warning(f"🗺️ OSRM erro: {error_msg}")
 
-                result_count = len(geometry_converted)
+                # Log failed API call
+                duration_ms = int((time.time() - start_time) * 1000)
+                await api_call_logger.log_call(
+                    provider="osm",
+                    operation="osrm_route",
+                    endpoint=osrm_endpoint,
+                    http_method="GET",
+                    response_status=response_status,
+                    duration_ms=duration_ms,
+                    request_params={
+                        "origin": f"{origin.latitude},{origin.longitude}",
+                        "destination": f"{destination.latitude},{destination.longitude}",
+                    },
+                    response_size_bytes=response_size,
+                    error_message=error_msg,
+                )
+                return None
+            
+            if not data.get('routes'):
+                logger.warning("🗺️ OSRM não retornou rotas")
+                error_msg = "No routes returned"
 
-                # Log successful API call
+                # Log failed API call
                 duration_ms = int((time.time() - start_time) * 1000)
                 await api_call_logger.log_call(
                     provider="osm",
                     operation="osrm_route",
-                    endpoint="http://router.project-osrm.org/route/v1/driving",
+                    endpoint=osrm_endpoint,
                     http_method="GET",
                     response_status=response_status,
                     duration_ms=duration_ms,
@@ -622,15 +997,52 @@ class OSMProvider(GeoProvider):
                         "destination": f"{destination.latitude},{destination.longitude}",
                     },
                     response_size_bytes=response_size,
-                    result_count=result_count,
+                    error_message=error_msg,
                 )
+                return None
+            
+            route = data['routes'][0]
+            geometry = route['geometry']['coordinates']
 
-                return {
-                    'distance': distance,
-                    'duration': duration,
-                    'geometry': geometry_converted,
-                    'steps': steps
-                }
+            # Convert to (lat, lon) format
+            geometry_converted = [(coord[1], coord[0]) for coord in geometry]
+
+            distance = route['distance']  # meters
+            duration = route['duration']  # seconds
+
+            # Extract steps from all legs
+            steps: List[RouteStep] = []
+            for leg in route.get('legs', []):
+                for step in leg.get('steps', []):
+                    route_step = self._parse_osrm_step(step)
+                    if route_step:
+                        steps.append(route_step)
+
+            result_count = len(geometry_converted)
+
+            # Log successful API call
+            duration_ms = int((time.time() - start_time) * 1000)
+            await api_call_logger.log_call(
+                provider="osm",
+                operation="osrm_route",
+                endpoint=osrm_endpoint,
+                http_method="GET",
+                response_status=response_status,
+                duration_ms=duration_ms,
+                request_params={
+                    "origin": f"{origin.latitude},{origin.longitude}",
+                    "destination": f"{destination.latitude},{destination.longitude}",
+                },
+                response_size_bytes=response_size,
+                result_count=result_count,
+            )
+
+            return {
+                'distance': distance,
+                'duration': duration,
+                'geometry': geometry_converted,
+                'steps': steps
+            }
             
         except Exception as e:
             error_msg = str(e)[:500]
@@ -641,7 +1053,7 @@ class OSMProvider(GeoProvider):
             await api_call_logger.log_call(
                 provider="osm",
                 operation="osrm_route",
-                endpoint="http://router.project-osrm.org/route/v1/driving",
+                endpoint=osrm_endpoint,
                 http_method="GET",
                 response_status=response_status or 500,
                 duration_ms=duration_ms,
@@ -654,6 +1066,131 @@ class OSMProvider(GeoProvider):
             )
             return None
 
+    async def _calculate_osrm_api_route_batch(
+        self,
+        origin: GeoLocation,
+        destinations: List[GeoLocation]
+    ) -> List[Optional[dict]]:
+        """
+        Calculate routes from one origin to several destinations in one OSRM request.
+
+        OSRM's table service returns only durations/distances, but access
+        routes need geometry. So the request is a single multi-waypoint route
+        that returns to the origin between destinations
+        (origin;dest1;origin;dest2;...;origin;destN) with U-turns allowed at
+        waypoints (continue_straight=false). Each origin->destination leg is
+        then the same shortest path an individual request would return, and
+        its geometry is rebuilt from the leg's steps.
+
+        Returns:
+            One route dict (distance, duration, geometry, steps), or None
+            for destinations without a usable route, per destination.
+            All None if the request fails.
+        """
+        if not destinations:
+            return []
+
+        osrm_endpoint = f"{self._osrm_endpoint}/route/v1/driving"
+        origin_coord = f"{origin.longitude},{origin.latitude}"
+        coordinates = ";".join(
+            f"{origin_coord};{destination.longitude},{destination.latitude}"
+            for destination in destinations
+        )
+        osrm_url = f"{osrm_endpoint}/{coordinates}"
+        params = {
+            'overview': 'false',
+            'geometries': 'geojson',
+            'steps': 'true',
+            'continue_straight': 'false',
+        }
+
+        start_time = time.time()
+        response_status = 0
+        response_size = None
+        error_msg = None
+        results: List[Optional[dict]] = [None] * len(destinations)
+
+        try:
+            client = self._http.client
+            response = await client.get(osrm_url, params=params, timeout=30)
+
+            response_status = response.status_code
+            response_size = len(response.content)
+
+            if response.status_code != 200:
+                error_msg = f"HTTP {response.status_code}"
+            else:
+                data = response.json()
+                if data.get('code') != 'Ok':
+                    error_msg = data.get('message', 'Unknown error')
+                elif not data.get('routes'):
+                    error_msg = "No routes returned"
+                else:
+                    legs = data['routes'][0].get('legs', [])
+                    # Even legs go origin -> destination, odd legs come back
+                    for i in range(len(destinations)):
+                        if 2 * i < len(legs):
+                            results[i] = self._parse_osrm_leg(legs[2 * i])
+
+        except Exception as e:
+            error_msg = str(e)[:500]
+            response_status = response_status or 500
+
+        if error_msg:
+            logger.warning(f"🗺️ OSRM (lote) erro: {error_msg}")
+
+        duration_ms = int((time.time() - start_time) * 1000)
+        await api_call_logger.log_call(
+            provider="osm",
+            operation="osrm_route_batch",
+            endpoint=osrm_endpoint,
+            http_method="GET",
+            response_status=response_status,
+            duration_ms=duration_ms,
+            request_params={
+                "origin": f"{origin.latitude},{origin.longitude}",
+                "destinations": len(destinations),
+            },
+            response_size_bytes=response_size,
+            result_count=sum(1 for r in results if r),
+            error_message=error_msg,
+        )
+
+        return results
+
+    def _parse_osrm_leg(self, leg: dict) -> Optional[dict]:
+        """
+        Build a route dict from one leg of an OSRM route response.
+
+        Args:
+            leg: OSRM leg dictionary (requested with steps=true)
+
+        Returns:
+            Route dict (distance, duration, geometry, steps), or None if the
+            leg has less than two geometry points
+        """
+        steps: List[RouteStep] = []
+        geometry: List[Tuple[float, float]] = []
+        for step in leg.get('steps', []):
+            route_step = self._parse_osrm_step(step)
+            if not route_step:
+                continue
+            steps.append(route_step)
+            for point in route_step.geometry:
+                # Consecutive steps share their boundary point
+                if not geometry or geometry[-1] != point:
+                    geometry.append(point)
+
+        if len(geometry) < 2:
+            return None
+
+        return {
+            'distance': leg.get('distance', 0),  # meters
+            'duration': leg.get('duration', 0),  # seconds
+            'geometry': geometry,
+            'steps': steps,
+        }
+
     def _parse_osrm_step(self, step: dict) -> Optional[RouteStep]:
         """
         Parse an OSRM step into a RouteStep model.
@@ -692,30 +1229,67 @@ class OSMProvider(GeoProvider):
             logger.warning(f"Failed to parse OSRM step: {e}")
             return None
 
-    def _generate_overpass_query(self, location: GeoLocation, radius: float, categories: List[POICategory]) -> str:
-        """Generate Overpass query for POI search."""
+    def _generate_overpass_tiles_query(self, batch: Dict[Tile, List[POICategory]]) -> str:
+        """
+        Generate an Overpass query for whole POI tiles.
 
-        # Convert radius to degrees (approximate)
-        radius_deg = radius / 111000  # Rough conversion
+        Each tile is queried with the tag filters of its categories, one
+        regex per key. Tiles of the same grid row that need the same
+        categories and touch each other share one bbox. Boxes are widened by
+        a hair so elements on a tile border are never lost to rounding.
 
-        # Calculate bounding box for regular POIs (gas stations, restaurants, etc)
-        bbox = {
-            'south': location.latitude - radius_deg,
-            'west': location.longitude - radius_deg,
-            'north': location.latitude + radius_deg,
-            'east': location.longitude + radius_deg
-        }
+        Args:
+            batch: Tile -> categories to fetch for it
+        """
+        groups: Dict[Tuple[str, ...], List[Tile]] = {}
+        for tile, categories in batch.items():
+            groups.setdefault(tuple(sorted(c.value for c in categories)), []).append(tile)
 
-        # Use larger radius for places (cities/towns/villages) - 3x the normal radius
-        # City centers may be far from highways but still relevant
-        place_radius_deg = (radius * 3) / 111000
-        bbox_places = {
-            'south': location.latitude - place_radius_deg,
-            'west': location.longitude - place_radius_deg,
-            'north': location.latitude + place_radius_deg,
-            'east': location.longitude + place_radius_deg
-        }
+        query_parts = [f'[out:json][timeout:{_TILE_QUERY_TIMEOUT_S}];', '(']
+
+        for values, tiles in groups.items():
+            amenity_filters, tourism_filters, include_places = self._overpass_filters(
+                [POICategory(value) for value in values]
+            )
+            filters = [
+                (key, '|'.join(sorted(tag_values)))
+                for key, tag_values in (('amenity', amenity_filters), ('tourism', tourism_filters))
+                if tag_values
+            ]
+            if include_places:
+                filters.append(('place', '|'.join(_PLACES)))
+
+            # Runs of adjacent tiles along each grid row
+            runs: List[List[int]] = []
+            for x, y in sorted(tiles, key=lambda tile: (tile[1], tile[0])):
+                if runs and runs[-1][2] == y and runs[-1][1] == x - 1:
+                    runs[-1][1] = x
+                else:
+                    runs.append([x, x, y])
+
+            for first_x, last_x, y in runs:
+                south, west, _, _ = tile_bounds(first_x, y, self._tile_zoom)
+                _, _, north, east = tile_bounds(last_x, y, self._tile_zoom)
+                bbox = (
+                    f"{south - _TILE_BBOX_MARGIN_DEG:.7f},{west - _TILE_BBOX_MARGIN_DEG:.7f},"
+                    f"{north + _TILE_BBOX_MARGIN_DEG:.7f},{east + _TILE_BBOX_MARGIN_DEG:.7f}"
+                )
+                for key, regex in filters:
+                    query_parts.append(f'  node["{key}"~"^({regex})$"]({bbox});')
+                    query_parts.append(f'  way["{key}"~"^({regex})$"]({bbox});')
 
+        query_parts.extend([');', 'out meta;'])
+        return '\n'.join(query_parts)
+
+    def _overpass_filters(
+        self, categories: List[POICategory]
+    ) -> Tuple[List[str], List[str], bool]:
+        """
+        Map POI categories to Overpass tag filters.
+
+        Returns:
+            Tuple of (amenity values, tourism values, include_places)
+        """
         # Map categories to OSM amenity tags (use set to avoid duplicates)
         amenity_filters = set()
         tourism_filters = set()
@@ -723,49 +1297,21 @@ class OSMProvider(GeoProvider):
         for category in categories:
             if category in (POICategory.SERVICES, POICategory.CITY, POICategory.TOWN, POICategory.VILLAGE):
                 include_places = True  # Include city/town/village searches
-            osm_amenities = self._get_osm_amenities_for_category(category)
-            osm_tourism = self._get_osm_tourism_tags_for_category(category)
-            # logger.debug(f"🔧 Categoria {category.value} -> amenities OSM: {osm_amenities}")
-            amenity_filters.update(osm_amenities)
-            tourism_filters.update(osm_tourism)
-
-        amenity_filters = list(amenity_filters)  # Convert back to list
-        tourism_filters = list(tourism_filters)
-
-        # Build query
-        bbox_str = f"{bbox['south']},{bbox['west']},{bbox['north']},{bbox['east']}"
-        bbox_places_str = f"{bbox_places['south']},{bbox_places['west']},{bbox_places['north']},{bbox_places['east']}"
-
-        query_parts = ['[out:json];', '(']
-
-        # Add amenity searches (normal radius)
-        for amenity in amenity_filters:
-            query_parts.append(f'  node["amenity"="{amenity}"]({bbox_str});')
-            query_parts.append(f'  way["amenity"="{amenity}"]({bbox_str});')
-
-        # Add tourism tag searches (normal radius)
-        for tourism in tourism_filters:
-            query_parts.append(f'  node["tourism"="{tourism}"]({bbox_str});')
-            query_parts.append(f'  way["tourism"="{tourism}"]({bbox_str});')
-
-        # Add place searches - cities and towns with LARGER radius, villages with normal radius
-        if include_places:
-            for place_type in ['city', 'town']:
-                query_parts.append(f'  node["place"="{place_type}"]({bbox_places_str});')
-                query_parts.append(f'  way["place"="{place_type}"]({bbox_places_str});')
-            # Villages use normal radius
-            query_parts.append(f'  node["place"="village"]({bbox_str});')
-            query_parts.append(f'  way["place"="village"]({bbox_str});')
-
-        query_parts.extend([');', 'out meta;'])
+            amenity_filters.update(self._get_osm_amenities_for_category(category))
+            tourism_filters.update(self._get_osm_tourism_tags_for_category(category))
 
-        final_query = '\n'.join(query_parts)
-        # logger.debug(f"🔧 Query Overpass:\n{final_query}")
-        return final_query
+        return list(amenity_filters), list(tourism_filters), include_places
     
-    async def _make_overpass_request(self, query: str) -> dict:
-        """Make request to Overpass API with fallback endpoints."""
+    async def _make_overpass_request(self, query: str, timeout: Optional[float] = None) -> dict:
+        """
+        Make request to Overpass API with fallback endpoints.
+
+        Args:
+            query: Overpass QL query
+            timeout: Request timeout in seconds (defaults to the client's)
+        """
         await self._wait_before_request()
+        request_options = {'timeout': timeout} if timeout is not None else {}
         
         last_exception = None
         
@@ -778,37 +1324,36 @@ class OSMProvider(GeoProvider):
             error_msg = None
             
             try:
+                client = self._http.client
+                response = await client.post(
+                    endpoint,
+                    data={'data': query},
+                    headers={'Content-Type': 'application/x-www-form-urlencoded'},
+                    **request_options
+                )
+                
+                response_status = response.status_code
+                response_size = len(response.content)
+                response.raise_for_status()
+                
+                result = response.json()
+                result_count = len(result.get('elements', []))
+                
+                # Log successful API call
+                duration_ms = int((time.time() - start_time) * 1000)
+                await api_call_logger.log_call(
+                    provider="osm",
+                    operation="overpass_query",
+                    endpoint=endpoint,
+                    http_method="POST",
+                    response_status=response_status,
+                    duration_ms=duration_ms,
+                    request_params={"query_length": len(query)},
+                    response_size_bytes=response_size,
+                    result_count=result_count,
+                )
                 
-                # Use context manager to ensure proper client lifecycle
-                async with self._get_http_client() as client:
-                    response = await client.post(
-                        endpoint,
-                        data={'data': query},
-                        headers={'Content-Type': 'application/x-www-form-urlencoded'}
-                    )
-                    
-                    response_status = response.status_code
-                    response_size = len(response.content)
-                    response.raise_for_status()
-                    
-                    result = response.json()
-                    result_count = len(result.get('elements', []))
-                    
-                    # Log successful API call
-                    duration_ms = int((time.time() - start_time) * 1000)
-                    await api_call_logger.log_call(
-                        provider="osm",
-                        operation="overpass_query",
-                        endpoint=endpoint,
-                        http_method="POST",
-                        response_status=response_status,
-                        duration_ms=duration_ms,
-                        request_params={"query_length": len(query)},
-                        response_size_bytes=response_size,
-                        result_count=result_count,
-                    )
-                    
-                    return result
+                return result
                 
             except Exception as e:
                 last_exception = e
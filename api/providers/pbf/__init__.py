@@ -0,0 +1,10 @@
+"""
+Offline OpenStreetMap POI provider backed by a local PBF extract.
+
+This module reads .osm.pbf extracts into an on-disk spatial index and
+answers POI searches from it, without Overpass API requests.
+"""
+
+from .provider import OSMPBFProvider
+
+__all__ = ['OSMPBFProvider']
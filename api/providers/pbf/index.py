@@ -0,0 +1,337 @@
+"""
+On-disk spatial index of OSM POIs built from a PBF extract.
+
+The extract is read once (two passes: POI ways first, to learn which node
+coordinates their centers need, then nodes) and the matching elements are
+written to a directory of flat arrays, sorted by grid cell:
+
+    meta.json        format version, source extract, tag filters, counts
+    cells.npy        (N,) int64 grid cell of each row, ascending
+    coords.npy       (N, 2) float64 (lat, lon); way centers for ways
+    row_keys.npy     (N,) int64 element key of each row
+    keys.npy         (N,) int64 element keys (osm id * 2 + is_way), ascending
+    key_rows.npy     (N,) int64 row of each key
+    tag_offsets.npy  (N + 1,) int64 offsets of each row's tags in tags.bin
+    tags.bin         UTF-8 JSON tag objects, concatenated
+
+The arrays are opened memory-mapped, so a lookup only reads the pages of
+the cells it touches: the cells of each grid row in the query window form
+one contiguous range of rows, found with a binary search.
+"""
+
+import json
+import logging
+import math
+import os
+import shutil
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from .reader import PBFReader, Tags
+
+logger = logging.getLogger(__name__)
+
+INDEX_FORMAT_VERSION = 1
+
+# Grid cell size in degrees (~5.5 km of latitude)
+DEFAULT_CELL_SIZE_DEG = 0.05
+
+_META_FILE = "meta.json"
+
+
+def _element_key(osm_id: int, is_way: bool) -> int:
+    """Index key of an element (node and way ids overlap)."""
+    return osm_id * 2 + int(is_way)
+
+
+class POIIndex:
+    """
+    Read-only view of an index directory.
+
+    Rows are elements; ``element(row)`` returns them in the shape of
+    Overpass JSON output (ways with a ``center``), so they can be parsed
+    by OSMProvider._parse_osm_element_to_poi.
+    """
+
+    def __init__(self, index_dir: str):
+        """
+        Open an index.
+
+        Args:
+            index_dir: Directory written by build_poi_index
+
+        Raises:
+            FileNotFoundError: If the index doesn't exist
+            ValueError: If it was written with another format version
+        """
+        self.index_dir = index_dir
+        with open(os.path.join(index_dir, _META_FILE), encoding="utf-8") as f:
+            self.meta: Dict[str, Any] = json.load(f)
+        if self.meta.get("version") != INDEX_FORMAT_VERSION:
+            raise ValueError(f"Unsupported POI index version: {self.meta.get('version')}")
+
+        self._cell_size = float(self.meta["cell_size_deg"])
+        self._columns = int(math.ceil(360.0 / self._cell_size))
+
+        def _load(name: str) -> np.ndarray:
+            return np.load(os.path.join(index_dir, name), mmap_mode="r")
+
+        self._cells = _load("cells.npy")
+        self._coords = _load("coords.npy")
+        self._row_keys = _load("row_keys.npy")
+        self._keys = _load("keys.npy")
+        self._key_rows = _load("key_rows.npy")
+        self._tag_offsets = _load("tag_offsets.npy")
+
+        tags_path = os.path.join(index_dir, "tags.bin")
+        if os.path.getsize(tags_path):
+            self._tags = np.memmap(tags_path, dtype=np.uint8, mode="r")
+        else:
+            # mmap can't map an empty file
+            self._tags = np.empty(0, dtype=np.uint8)
+
+    def __len__(self) -> int:
+        """Number of indexed elements."""
+        return len(self._cells)
+
+    def _row_col(self, latitude: float, longitude: float):
+        return (
+            int(math.floor((latitude + 90.0) / self._cell_size)),
+            int(math.floor((longitude + 180.0) / self._cell_size)),
+        )
+
+    def query_bbox(self, south: float, west: float, north: float, east: float) -> np.ndarray:
+        """
+        Rows of the elements inside a bounding box.
+
+        Args:
+            south, west, north, east: Box bounds in degrees
+
+        Returns:
+            Array of row numbers
+        """
+        if len(self) == 0:
+            return np.empty(0, dtype=np.int64)
+
+        min_row, min_col = self._row_col(south, west)
+        max_row, max_col = self._row_col(north, east)
+        min_col = max(min_col, 0)
+        max_col = min(max_col, self._columns - 1)
+
+        # The cells of one grid row are contiguous in the sorted cell array
+        ranges = []
+        for grid_row in range(min_row, max_row + 1):
+            first_cell = grid_row * self._columns + min_col
+            last_cell = grid_row * self._columns + max_col
+            start, end = np.searchsorted(self._cells, [first_cell, last_cell + 1])
+            if end > start:
+                ranges.append(np.arange(start, end))
+        if not ranges:
+            return np.empty(0, dtype=np.int64)
+
+        rows = np.concatenate(ranges)
+        coords = self._coords[rows]
+        inside = (
+            (coords[:, 0] >= south) & (coords[:, 0] <= north)
+            & (coords[:, 1] >= west) & (coords[:, 1] <= east)
+        )
+        return rows[inside]
+
+    def coordinates(self, rows: np.ndarray) -> np.ndarray:
+        """(lat, lon) of the given rows as an (M, 2) array."""
+        return np.asarray(self._coords[rows])
+
+    def tags(self, row: int) -> Tags:
+        """Tags of one row."""
+        start, end = self._tag_offsets[row], self._tag_offsets[row + 1]
+        return json.loads(bytes(self._tags[start:end]).decode("utf-8"))
+
+    def element(self, row: int) -> Dict[str, Any]:
+        """
+        One row as an Overpass JSON element.
+
+        Returns:
+            Dict with type, id, tags and lat/lon (nodes) or center (ways)
+        """
+        key = int(self._row_keys[row])
+        lat, lon = (float(v) for v in self._coords[row])
+        element: Dict[str, Any] = {
+            "type": "way" if key % 2 else "node",
+            "id": key // 2,
+            "tags": self.tags(row),
+        }
+        if key % 2:
+            element["center"] = {"lat": lat, "lon": lon}
+        else:
+            element["lat"] = lat
+            element["lon"] = lon
+        return element
+
+    def find(self, osm_type: str, osm_id: int) -> Optional[int]:
+        """
+        Row of an element.
+
+        Args:
+            osm_type: "node" or "way"
+            osm_id: OSM element id
+
+        Returns:
+            Row number, or None if the element isn't indexed
+        """
+        if osm_type not in ("node", "way") or len(self) == 0:
+            return None
+        key = _element_key(osm_id, osm_type == "way")
+        position = int(np.searchsorted(self._keys, key))
+        if position < len(self._keys) and self._keys[position] == key:
+            return int(self._key_rows[position])
+        return None
+
+
+def build_poi_index(
+    pbf_path: str,
+    index_dir: str,
+    keep: Callable[[Tags], bool],
+    cell_size_deg: float = DEFAULT_CELL_SIZE_DEG,
+    filters: Optional[Dict[str, Any]] = None,
+) -> POIIndex:
+    """
+    Build a POI index from a PBF extract.
+
+    Args:
+        pbf_path: Path of the .osm.pbf extract
+        index_dir: Output directory (replaced if it exists)
+        keep: Predicate selecting the elements to index by their tags
+        cell_size_deg: Grid cell size in degrees
+        filters: Description of ``keep`` stored in meta.json, so callers can
+            detect an index built with other filters
+
+    Returns:
+        The opened index
+    """
+    started = time.perf_counter()
+    reader = PBFReader(pbf_path)
+
+    # Pass 1: POI ways and the nodes their centers need
+    ways = list(reader.iter_ways(keep))
+    way_refs = [way.refs for way in ways if len(way.refs)]
+    needed: np.ndarray = (
+        np.unique(np.concatenate(way_refs)) if way_refs else np.empty(0, dtype=np.int64)
+    )
+
+    # Pass 2: POI nodes, and the coordinates of the way nodes
+    keys: List[int] = []
+    lats: List[float] = []
+    lons: List[float] = []
+    tags: List[Tags] = []
+    ref_ids: List[np.ndarray] = []
+    ref_coords: List[np.ndarray] = []
+
+    for group in reader.iter_nodes():
+        for position, node_tags in group.tags.items():
+            if keep(node_tags):
+                keys.append(_element_key(int(group.ids[position]), False))
+                lats.append(float(group.lats[position]))
+                lons.append(float(group.lons[position]))
+                tags.append(node_tags)
+        if len(needed):
+            mask = np.isin(group.ids, needed, assume_unique=False)
+            if mask.any():
+                ref_ids.append(group.ids[mask])
+                ref_coords.append(np.column_stack((group.lats[mask], group.lons[mask])))
+
+    # Way centers: center of the bounding box of their nodes (like Overpass "out center")
+    if ref_ids:
+        node_ids = np.concatenate(ref_ids)
+        order = np.argsort(node_ids, kind="stable")
+        node_ids = node_ids[order]
+        node_coords = np.concatenate(ref_coords)[order]
+    else:
+        node_ids = np.empty(0, dtype=np.int64)
+        node_coords = np.empty((0, 2), dtype=np.float64)
+
+    skipped_ways = 0
+    for way in ways:
+        positions = np.searchsorted(node_ids, way.refs)
+        found = positions < len(node_ids)
+        found[found] = node_ids[positions[found]] == way.refs[found]
+        if not found.any():
+            # None of its nodes are in the extract (clipped at the border)
+            skipped_ways += 1
+            continue
+        coords = node_coords[positions[found]]
+        south, west = coords.min(axis=0)
+        north, east = coords.max(axis=0)
+        keys.append(_element_key(way.id, True))
+        lats.append(float((south + north) / 2))
+        lons.append(float((west + east) / 2))
+        tags.append(way.tags)
+
+    _write_index(index_dir, keys, lats, lons, tags, cell_size_deg, {
+        "version": INDEX_FORMAT_VERSION,
+        "source": os.path.abspath(pbf_path),
+        "source_mtime": os.path.getmtime(pbf_path),
+        "cell_size_deg": cell_size_deg,
+        "filters": filters or {},
+        "elements": len(keys),
+    })
+
+    logger.info(
+        f"POI index built from {os.path.basename(pbf_path)}: {len(keys)} elements "
+        f"({len(ways) - skipped_ways} ways) in {time.perf_counter() - started:.1f}s"
+    )
+    return POIIndex(index_dir)
+
+
+def _write_index(
+    index_dir: str,
+    keys: List[int],
+    lats: List[float],
+    lons: List[float],
+    tags: List[Tags],
+    cell_size_deg: float,
+    meta: Dict[str, Any],
+) -> None:
+    """Write the index arrays, replacing index_dir only once complete."""
+    coords = np.column_stack((
+        np.asarray(lats, dtype=np.float64),
+        np.asarray(lons, dtype=np.float64),
+    )).reshape(-1, 2)
+    columns = int(math.ceil(360.0 / cell_size_deg))
+    cells = (
+        np.floor((coords[:, 0] + 90.0) / cell_size_deg).astype(np.int64) * columns
+        + np.floor((coords[:, 1] + 180.0) / cell_size_deg).astype(np.int64)
+    )
+
+    # Rows sorted by cell; the key lookup maps keys back to rows
+    order = np.argsort(cells, kind="stable")
+    keys_array = np.asarray(keys, dtype=np.int64)[order]
+    key_order = np.argsort(keys_array, kind="stable")
+
+    encoded = [
+        json.dumps(tags[i], ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        for i in order
+    ]
+    tag_offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(blob) for blob in encoded], out=tag_offsets[1:])
+
+    tmp_dir = f"{index_dir}.tmp"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+
+    np.save(os.path.join(tmp_dir, "cells.npy"), cells[order])
+    np.save(os.path.join(tmp_dir, "coords.npy"), coords[order])
+    np.save(os.path.join(tmp_dir, "row_keys.npy"), keys_array)
+    np.save(os.path.join(tmp_dir, "keys.npy"), keys_array[key_order])
+    np.save(os.path.join(tmp_dir, "key_rows.npy"), key_order.astype(np.int64))
+    np.save(os.path.join(tmp_dir, "tag_offsets.npy"), tag_offsets)
+    with open(os.path.join(tmp_dir, "tags.bin"), "wb") as f:
+        for blob in encoded:
+            f.write(blob)
+    with open(os.path.join(tmp_dir, _META_FILE), "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+
+    # Never leave a partial index behind
+    shutil.rmtree(index_dir, ignore_errors=True)
+    os.replace(tmp_dir, index_dir)
@@ -0,0 +1,249 @@
+"""
+OSM provider answering POI searches from a local PBF extract.
+
+POI discovery with OSMProvider goes through public Overpass endpoints, so
+its throughput is capped by their rate limits and availability.
+OSMPBFProvider reads a regional .osm.pbf extract (e.g. from Geofabrik) once
+into a POIIndex on disk and serves search_pois and get_poi_details from
+it in milliseconds. Elements are parsed by the inherited
+_parse_osm_element_to_poi, so POIs, categories and quality scores are the
+same as with Overpass, with one difference: ways (POIs mapped as areas) are
+returned at their bounding box center, while OSMProvider's 'out meta'
+queries get ways without coordinates and drop them. Routing and geocoding
+are inherited unchanged.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..base import ProviderType
+from ..cache import UnifiedCache
+from ..models import GeoLocation, POI, POICategory
+from ..osm.provider import OSMProvider
+from ..settings import get_settings
+from api.utils.geo_utils import haversine_distances_m
+from .index import POIIndex, build_poi_index
+from .reader import Tags
+
+logger = logging.getLogger(__name__)
+
+# Degrees-to-meters factor of the square search windows (OSMProvider.search_pois)
+_METERS_PER_DEGREE = 111000.0
+
+_PLACES = ("city", "town", "village")
+
+
+class OSMPBFProvider(OSMProvider):
+    """
+    OSM provider with a local, memory-mapped POI index.
+
+    The index is built on first use when missing, or when the extract or
+    the category tag mapping changed since it was built. Building reads the
+    whole extract and can take minutes for a large region; it runs in a
+    thread under a lock, since background workers each run their own event
+    loop.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[UnifiedCache] = None,
+        pbf_path: Optional[str] = None,
+        index_path: Optional[str] = None,
+    ):
+        """
+        Initialize the provider.
+
+        Args:
+            cache: Unified cache (used by the inherited routing/geocoding)
+            pbf_path: Extract path (defaults to OSM_PBF_PATH)
+            index_path: Index directory (defaults to OSM_PBF_INDEX_PATH)
+        """
+        super().__init__(cache=cache)
+        settings = get_settings()
+        self._pbf_path = pbf_path or settings.osm_pbf_path
+        self._index_path = index_path or settings.osm_pbf_index_path
+        self._index: Optional[POIIndex] = None
+        self._index_lock = threading.Lock()
+
+        amenities, tourism, _ = self._overpass_filters(list(POICategory))
+        self._index_filters: Dict[str, List[str]] = {
+            "amenity": sorted(amenities),
+            "tourism": sorted(tourism),
+            "place": list(_PLACES),
+        }
+
+    # Index lifecycle
+
+    def _keep(self, tags: Tags) -> bool:
+        """Whether an element can match any POI category search."""
+        filters = self._index_filters
+        return (
+            tags.get("amenity") in filters["amenity"]
+            or tags.get("tourism") in filters["tourism"]
+            or tags.get("place") in filters["place"]
+        )
+
+    def _index_is_current(self, index: POIIndex) -> bool:
+        """Whether an existing index matches the extract and tag filters."""
+        if index.meta.get("filters") != self._index_filters:
+            return False
+        if os.path.exists(self._pbf_path):
+            return index.meta.get("source_mtime") == os.path.getmtime(self._pbf_path)
+        return True  # extract removed after indexing: keep serving the index
+
+    def build_index(self) -> POIIndex:
+        """
+        Build the index from the extract, replacing any existing one.
+
+        Raises:
+            FileNotFoundError: If the extract doesn't exist
+        """
+        if not os.path.exists(self._pbf_path):
+            raise FileNotFoundError(f"OSM extract not found: {self._pbf_path}")
+        logger.info(f"Building POI index from {self._pbf_path} into {self._index_path}")
+        return build_poi_index(
+            self._pbf_path,
+            self._index_path,
+            keep=self._keep,
+            filters=self._index_filters,
+        )
+
+    def _load_index(self) -> POIIndex:
+        """Open the index, building it first when missing or stale."""
+        with self._index_lock:
+            if self._index is not None:
+                return self._index
+
+            index = None
+            try:
+                index = POIIndex(self._index_path)
+            except (FileNotFoundError, ValueError) as e:
+                logger.info(f"POI index unavailable ({e}), building it")
+            if index is None or not self._index_is_current(index):
+                index = self.build_index()
+
+            logger.info(f"POI index loaded: {len(index)} elements from {self._index_path}")
+            self._index = index
+            return index
+
+    async def _get_index(self) -> POIIndex:
+        """Get the index, loading (or building) it on first use."""
+        if self._index is not None:
+            return self._index
+        return await asyncio.to_thread(self._load_index)
+
+    # POI search
+
+    async def search_pois(
+        self,
+        location: GeoLocation,
+        radius: float,
+        categories: List[POICategory],
+        limit: int = 50
+    ) -> List[POI]:
+        """Search POIs in the local index (same windows as the Overpass query)."""
+        index = await self._get_index()
+        return self._search_index(index, location, radius, categories, limit)
+
+    async def search_pois_many(
+        self,
+        locations: List[GeoLocation],
+        radius: float,
+        categories: List[POICategory],
+        limit: int = 50
+    ) -> List[List[POI]]:
+        """Search POIs around several locations; local lookups skip the cache."""
+        index = await self._get_index()
+        return [
+            self._search_index(index, location, radius, categories, limit)
+            for location in locations
+        ]
+
+    @property
+    def supports_corridor_search(self) -> bool:
+        """Per-point lookups are local, so corridor queries don't pay off."""
+        return False
+
+    def _search_index(
+        self,
+        index: POIIndex,
+        location: GeoLocation,
+        radius: float,
+        categories: List[POICategory],
+        limit: int,
+    ) -> List[POI]:
+        """
+        Find the POIs a per-point Overpass query would match, closest first.
+
+        Uses the square windows and tag filters of OSMProvider.search_pois:
+        half-side of ``radius`` for amenities, tourism tags and villages, 3x
+        for cities and towns. Unlike OSMProvider, which drops ways because
+        its output has no coordinates for them, matching ways are returned
+        at their bounding box center.
+        """
+        amenities, tourism, include_places = self._overpass_filters(categories)
+        amenities, tourism = set(amenities), set(tourism)
+
+        window_deg = radius / _METERS_PER_DEGREE
+        outer_deg = window_deg * 3 if include_places else window_deg
+        lat, lon = location.latitude, location.longitude
+        rows = index.query_bbox(lat - outer_deg, lon - outer_deg, lat + outer_deg, lon + outer_deg)
+        if len(rows) == 0:
+            return []
+
+        coords = index.coordinates(rows)
+        in_window = (
+            (np.abs(coords[:, 0] - lat) <= window_deg)
+            & (np.abs(coords[:, 1] - lon) <= window_deg)
+        )
+        distances = haversine_distances_m(lat, lon, coords[:, 0], coords[:, 1])
+
+        matches: List[Tuple[float, int]] = []
+        for i, row in enumerate(rows):
+            tags = index.tags(int(row))
+            place = tags.get("place")
+            if self._is_wide_place(place, include_places):
+                matched = True  # already within the 3x window
+            elif not in_window[i]:
+                matched = False
+            else:
+                matched = (
+                    tags.get("amenity") in amenities
+                    or tags.get("tourism") in tourism
+                    or (include_places and place == "village")
+                )
+            if matched:
+                matches.append((float(distances[i]), int(row)))
+
+        pois: List[POI] = []
+        for _, row in sorted(matches):
+            poi = self._parse_osm_element_to_poi(index.element(row))
+            if poi:
+                pois.append(poi)
+                if len(pois) >= limit:
+                    break
+        return pois
+
+    async def get_poi_details(self, poi_id: str) -> Optional[POI]:
+        """Get a POI from the local index by its "type/id" identifier."""
+        try:
+            osm_type, osm_id = poi_id.split('/', 1)
+            index = await self._get_index()
+            row = index.find(osm_type, int(osm_id))
+        except Exception as e:
+            logger.error(f"POI details error for {poi_id}: {type(e).__name__}: {e}")
+            return None
+
+        if row is None:
+            return None
+        return self._parse_osm_element_to_poi(index.element(row))
+
+    @property
+    def provider_type(self) -> ProviderType:
+        """Return OSM PBF provider type."""
+        return ProviderType.OSM_PBF
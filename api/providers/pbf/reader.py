@@ -0,0 +1,424 @@
+"""
+Minimal reader for OpenStreetMap PBF extracts (.osm.pbf).
+
+Decodes the protobuf wire format of the OSM PBF spec (fileformat.proto and
+osmformat.proto) directly, so no protobuf or osmium dependency is needed:
+blobs are inflated with zlib and the packed arrays that make up most of a
+block (dense node ids, coordinates and tags, way node refs) are varint
+decoded with NumPy.
+
+Only what the POI index needs is read: nodes with coordinates and tags, and
+ways with tags and node refs. Relations and element metadata are skipped.
+"""
+
+import struct
+import zlib
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+# Features a reader must understand to decode the file (HeaderBlock)
+SUPPORTED_FEATURES = {"OsmSchema-V0.6", "DenseNodes"}
+
+# Upper bounds from the spec, to fail fast on corrupt files
+_MAX_BLOB_HEADER_SIZE = 64 * 1024
+_MAX_BLOB_SIZE = 32 * 1024 * 1024
+
+# Protobuf wire types
+_VARINT = 0
+_FIXED64 = 1
+_LENGTH_DELIMITED = 2
+_FIXED32 = 5
+
+Tags = Dict[str, str]
+
+
+class PBFError(ValueError):
+    """The file is not a valid or supported OSM PBF extract."""
+
+
+class NodeGroup(NamedTuple):
+    """Nodes of one primitive group."""
+
+    ids: np.ndarray
+    lats: np.ndarray
+    lons: np.ndarray
+    # Position in ids -> tags, for tagged nodes only
+    tags: Dict[int, Tags]
+
+
+class Way(NamedTuple):
+    """A way with its node refs."""
+
+    id: int
+    refs: np.ndarray
+    tags: Tags
+
+
+class _Block(NamedTuple):
+    """Decoded PrimitiveBlock header with its raw primitive groups."""
+
+    strings: List[str]
+    granularity: int
+    lat_offset: int
+    lon_offset: int
+    groups: List[memoryview]
+
+
+# =============================================================================
+# PROTOBUF WIRE FORMAT
+# =============================================================================
+
+
+def _read_varint(buf: memoryview, pos: int) -> Tuple[int, int]:
+    """Decode one varint at pos; returns (value, next position)."""
+    result = 0
+    shift = 0
+    while True:
+        try:
+            byte = buf[pos]
+        except IndexError:
+            raise PBFError("Truncated varint") from None
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _iter_fields(buf: memoryview) -> Iterator[Tuple[int, int, object]]:
+    """
+    Iterate over the fields of a protobuf message.
+
+    Yields:
+        (field number, wire type, value); value is an int for varints and a
+        memoryview for length-delimited and fixed-size fields
+    """
+    pos = 0
+    end = len(buf)
+    while pos < end:
+        key, pos = _read_varint(buf, pos)
+        field, wire_type = key >> 3, key & 7
+        if wire_type == _VARINT:
+            value, pos = _read_varint(buf, pos)
+        elif wire_type == _LENGTH_DELIMITED:
+            length, pos = _read_varint(buf, pos)
+            value = buf[pos:pos + length]
+            pos += length
+        elif wire_type == _FIXED64:
+            value = buf[pos:pos + 8]
+            pos += 8
+        elif wire_type == _FIXED32:
+            value = buf[pos:pos + 4]
+            pos += 4
+        else:
+            raise PBFError(f"Unsupported wire type {wire_type}")
+        if pos > end:
+            raise PBFError("Truncated message")
+        yield field, wire_type, value
+
+
+def _to_int64(value: int) -> int:
+    """Reinterpret a decoded varint as a two's complement int64."""
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def _zigzag(value: int) -> int:
+    """Decode a zigzag-encoded (sint) varint."""
+    return (value >> 1) ^ -(value & 1)
+
+
+def _packed_uvarints(data: memoryview) -> np.ndarray:
+    """Decode a packed repeated varint field into a uint64 array."""
+    raw = np.frombuffer(data, dtype=np.uint8)
+    if len(raw) == 0:
+        return np.empty(0, dtype=np.uint64)
+
+    # Each value ends at a byte without the continuation bit
+    ends = np.flatnonzero(raw < 0x80)
+    if len(ends) == 0 or ends[-1] != len(raw) - 1:
+        raise PBFError("Truncated packed varint")
+    starts = np.empty_like(ends)
+    starts[0] = 0
+    starts[1:] = ends[:-1] + 1
+
+    shifts = (np.arange(len(raw)) - np.repeat(starts, ends - starts + 1)) * 7
+    parts = (raw & 0x7F).astype(np.uint64) << shifts.astype(np.uint64)
+    return np.bitwise_or.reduceat(parts, starts)
+
+
+def _packed_zigzag(data: memoryview) -> np.ndarray:
+    """Decode a packed sint64 field into an int64 array."""
+    values = _packed_uvarints(data)
+    return (values >> np.uint64(1)).astype(np.int64) ^ -(values & np.uint64(1)).astype(np.int64)
+
+
+def _repeated(values: List[np.ndarray]) -> np.ndarray:
+    """Join the occurrences of a repeated field (packed or not)."""
+    if not values:
+        return np.empty(0, dtype=np.int64)
+    return values[0] if len(values) == 1 else np.concatenate(values)
+
+
+def _tags(strings: List[str], keys, vals) -> Tags:
+    """Build a tag dict from string table indices."""
+    return {strings[int(k)]: strings[int(v)] for k, v in zip(keys, vals)}
+
+
+# =============================================================================
+# READER
+# =============================================================================
+
+
+class PBFReader:
+    """
+    Sequential reader of an OSM PBF file.
+
+    Each ``iter_*`` call reads the file from the start, so callers that
+    need ways before nodes (to know which node coordinates to keep) simply
+    make two passes.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the reader.
+
+        Args:
+            path: Path of the .osm.pbf file
+        """
+        self.path = path
+
+    def _iter_blobs(self) -> Iterator[Tuple[str, bytes]]:
+        """Yield (blob type, decompressed blob data) for each file block."""
+        with open(self.path, "rb") as f:
+            while True:
+                size_bytes = f.read(4)
+                if not size_bytes:
+                    return
+                if len(size_bytes) < 4:
+                    raise PBFError("Truncated blob header size")
+
+                (header_size,) = struct.unpack(">I", size_bytes)
+                if header_size > _MAX_BLOB_HEADER_SIZE:
+                    raise PBFError(f"Blob header too large: {header_size} bytes")
+                header = f.read(header_size)
+
+                blob_type: Optional[str] = None
+                data_size = 0
+                for field, _, value in _iter_fields(memoryview(header)):
+                    if field == 1:
+                        blob_type = bytes(value).decode("utf-8")
+                    elif field == 3:
+                        data_size = value
+                if blob_type is None or data_size > _MAX_BLOB_SIZE:
+                    raise PBFError("Invalid blob header")
+
+                blob = f.read(data_size)
+                if len(blob) < data_size:
+                    raise PBFError("Truncated blob")
+                yield blob_type, self._blob_data(blob)
+
+    @staticmethod
+    def _blob_data(blob: bytes) -> bytes:
+        """Decompress a Blob message (raw or zlib)."""
+        for field, _, value in _iter_fields(memoryview(blob)):
+            if field == 1:
+                return bytes(value)
+            if field == 3:
+                return zlib.decompress(value)
+            if field in (4, 5, 6, 7):
+                raise PBFError("Unsupported blob compression (only raw and zlib are supported)")
+        raise PBFError("Blob without data")
+
+    @staticmethod
+    def _check_header(data: bytes) -> None:
+        """Reject files that require features this reader doesn't implement."""
+        for field, _, value in _iter_fields(memoryview(data)):
+            if field == 4:
+                feature = bytes(value).decode("utf-8")
+                if feature not in SUPPORTED_FEATURES:
+                    raise PBFError(f"Unsupported required feature: {feature}")
+
+    def _iter_blocks(self) -> Iterator[_Block]:
+        """Yield the decoded PrimitiveBlocks of the file."""
+        seen_header = False
+        for blob_type, data in self._iter_blobs():
+            if blob_type == "OSMHeader":
+                self._check_header(data)
+                seen_header = True
+            elif blob_type == "OSMData":
+                if not seen_header:
+                    raise PBFError("OSMData block before OSMHeader")
+                yield self._parse_block(data)
+            # Unknown blob types are skipped, as the spec requires
+
+    @staticmethod
+    def _parse_block(data: bytes) -> _Block:
+        """Decode a PrimitiveBlock's string table and granularity."""
+        strings: List[str] = []
+        groups: List[memoryview] = []
+        granularity = 100
+        lat_offset = 0
+        lon_offset = 0
+
+        for field, _, value in _iter_fields(memoryview(data)):
+            if field == 1:
+                strings = [
+                    bytes(s).decode("utf-8", errors="replace")
+                    for f, _, s in _iter_fields(value)
+                    if f == 1
+                ]
+            elif field == 2:
+                groups.append(value)
+            elif field == 17:
+                granularity = value
+            elif field == 19:
+                lat_offset = _to_int64(value)
+            elif field == 20:
+                lon_offset = _to_int64(value)
+
+        return _Block(strings, granularity, lat_offset, lon_offset, groups)
+
+    def iter_nodes(self) -> Iterator[NodeGroup]:
+        """
+        Iterate over the nodes of the file, one group at a time.
+
+        Yields:
+            NodeGroup with ids, coordinates (degrees) and the tags of
+            tagged nodes
+        """
+        for block in self._iter_blocks():
+            for group in block.groups:
+                for field, _, value in _iter_fields(group):
+                    if field == 2:
+                        yield self._dense_nodes(block, value)
+                    elif field == 1:
+                        yield self._node(block, value)
+
+    def iter_ways(self, keep: Optional[Callable[[Tags], bool]] = None) -> Iterator[Way]:
+        """
+        Iterate over the ways of the file.
+
+        Args:
+            keep: Optional predicate on the tags; node refs are only decoded
+                for ways it accepts
+
+        Yields:
+            Way objects
+        """
+        for block in self._iter_blocks():
+            for group in block.groups:
+                for field, _, value in _iter_fields(group):
+                    if field == 3:
+                        way = self._way(block, value, keep)
+                        if way is not None:
+                            yield way
+
+    @staticmethod
+    def _coordinates(block: _Block, raw: np.ndarray, offset: int) -> np.ndarray:
+        """Convert raw coordinates to degrees (granularity in nanodegrees)."""
+        return (offset + block.granularity * raw.astype(np.float64)) * 1e-9
+
+    def _dense_nodes(self, block: _Block, data: memoryview) -> NodeGroup:
+        """Decode a DenseNodes message (delta-coded ids and coordinates)."""
+        ids = lats = lons = np.empty(0, dtype=np.int64)
+        keys_vals = np.empty(0, dtype=np.uint64)
+
+        for field, wire_type, value in _iter_fields(data):
+            if wire_type != _LENGTH_DELIMITED:
+                continue
+            if field == 1:
+                ids = np.cumsum(_packed_zigzag(value))
+            elif field == 8:
+                lats = np.cumsum(_packed_zigzag(value))
+            elif field == 9:
+                lons = np.cumsum(_packed_zigzag(value))
+            elif field == 10:
+                keys_vals = _packed_uvarints(value)
+
+        if not (len(ids) == len(lats) == len(lons)):
+            raise PBFError("DenseNodes arrays have different lengths")
+
+        # keys_vals holds (key, val) string indices per node, each node's
+        # list terminated by 0; it is empty when no node in the group has tags
+        tags: Dict[int, Tags] = {}
+        if len(keys_vals):
+            terminators = np.flatnonzero(keys_vals == 0)
+            if len(terminators) != len(ids):
+                raise PBFError("DenseNodes keys_vals doesn't match the node count")
+            starts = np.empty_like(terminators)
+            starts[0] = 0
+            starts[1:] = terminators[:-1] + 1
+            for i in np.flatnonzero(terminators > starts):
+                pairs = keys_vals[starts[i]:terminators[i]]
+                tags[int(i)] = _tags(block.strings, pairs[0::2], pairs[1::2])
+
+        return NodeGroup(
+            ids=ids,
+            lats=self._coordinates(block, lats, block.lat_offset),
+            lons=self._coordinates(block, lons, block.lon_offset),
+            tags=tags,
+        )
+
+    def _node(self, block: _Block, data: memoryview) -> NodeGroup:
+        """Decode a (non-dense) Node message as a group of one."""
+        node_id = lat = lon = 0
+        keys: List[np.ndarray] = []
+        vals: List[np.ndarray] = []
+
+        for field, wire_type, value in _iter_fields(data):
+            if field == 1:
+                node_id = _zigzag(value)
+            elif field == 8:
+                lat = _zigzag(value)
+            elif field == 9:
+                lon = _zigzag(value)
+            elif field in (2, 3):
+                values = (
+                    _packed_uvarints(value) if wire_type == _LENGTH_DELIMITED
+                    else np.array([value], dtype=np.uint64)
+                )
+                (keys if field == 2 else vals).append(values)
+
+        tags = _tags(block.strings, _repeated(keys), _repeated(vals))
+        return NodeGroup(
+            ids=np.array([node_id], dtype=np.int64),
+            lats=self._coordinates(block, np.array([lat]), block.lat_offset),
+            lons=self._coordinates(block, np.array([lon]), block.lon_offset),
+            tags={0: tags} if tags else {},
+        )
+
+    def _way(
+        self,
+        block: _Block,
+        data: memoryview,
+        keep: Optional[Callable[[Tags], bool]],
+    ) -> Optional[Way]:
+        """Decode a Way message; None if rejected by keep."""
+        way_id = 0
+        keys: List[np.ndarray] = []
+        vals: List[np.ndarray] = []
+        refs: List[memoryview] = []
+
+        for field, wire_type, value in _iter_fields(data):
+            if field == 1:
+                way_id = _to_int64(value)
+            elif field in (2, 3):
+                values = (
+                    _packed_uvarints(value) if wire_type == _LENGTH_DELIMITED
+                    else np.array([value], dtype=np.uint64)
+                )
+                (keys if field == 2 else vals).append(values)
+            elif field == 8:
+                refs.append(value)
+
+        tags = _tags(block.strings, _repeated(keys), _repeated(vals))
+        if keep is not None and not keep(tags):
+            return None
+
+        deltas = [
+            _packed_zigzag(value) if isinstance(value, memoryview)
+            else np.array([_zigzag(value)], dtype=np.int64)
+            for value in refs
+        ]
+        return Way(id=way_id, refs=np.cumsum(_repeated(deltas)), tags=tags)
@@ -43,7 +43,7 @@ class ProviderSettings(BaseSettings):
     poi_provider: str = Field(
         default="osm",
         alias="POI_PROVIDER",
-        description="Provider for POI search (osm, here). Route calculation always uses OSM."
+        description="Provider for POI search (osm, osm_pbf, here). Route calculation always uses OSM."
     )
     
     # OSM Provider settings
@@ -62,6 +62,16 @@ class ProviderSettings(BaseSettings):
         alias="OSM_USER_AGENT",
         description="User agent for OSM API requests"
     )
+    osrm_endpoint: str = Field(
+        default="http://router.project-osrm.org",
+        alias="OSRM_ENDPOINT",
+        description="OSRM routing server base URL"
+    )
+    osrm_batch_max_destinations: int = Field(
+        default=25,
+        alias="OSRM_BATCH_MAX_DESTINATIONS",
+        description="Maximum destinations per batched OSRM access-route request"
+    )
     
     # HERE Maps settings
     here_api_key: Optional[str] = Field(
@@ -96,6 +106,16 @@ class ProviderSettings(BaseSettings):
         alias="GOOGLE_PLACES_ENABLED",
         description="Enable Google Places enrichment for restaurants and hotels"
     )
+    google_places_rate_limit: float = Field(
+        default=10.0,
+        alias="GOOGLE_PLACES_RATE_LIMIT",
+        description="Google Places API requests per second during POI enrichment"
+    )
+    google_places_rate_burst: int = Field(
+        default=5,
+        alias="GOOGLE_PLACES_RATE_BURST",
+        description="Google Places requests allowed to start at once before GOOGLE_PLACES_RATE_LIMIT pacing applies"
+    )
 
     # HERE Maps enrichment settings
     here_enrichment_enabled: bool = Field(
@@ -103,6 +123,21 @@ class ProviderSettings(BaseSettings):
         alias="HERE_ENRICHMENT_ENABLED",
         description="Enable HERE Maps enrichment for OSM POIs (adds phone, website, hours). Only applies when POI_PROVIDER=osm."
     )
+    here_enrichment_rate_limit: float = Field(
+        default=5.0,
+        alias="HERE_ENRICHMENT_RATE_LIMIT",
+        description="HERE place search requests per second during POI enrichment"
+    )
+    here_enrichment_rate_burst: int = Field(
+        default=5,
+        alias="HERE_ENRICHMENT_RATE_BURST",
+        description="HERE requests allowed to start at once before HERE_ENRICHMENT_RATE_LIMIT pacing applies"
+    )
+    enrichment_max_concurrency: int = Field(
+        default=8,
+        alias="ENRICHMENT_MAX_CONCURRENCY",
+        description="Maximum in-flight enrichment requests per provider. Each provider is still paced by its own rate limit."
+    )
 
     # Map duplication detection settings
     duplicate_map_tolerance_km: float = Field(
@@ -168,6 +203,21 @@ class ProviderSettings(BaseSettings):
         alias="GEO_CACHE_TTL_POI_DETAILS",
         description="Cache TTL for POI details in seconds"
     )
+    geo_cache_l1_max_entries: int = Field(
+        default=5000,
+        alias="GEO_CACHE_L1_MAX_ENTRIES",
+        description="Maximum entries in the in-process L1 cache tier (0 disables it)"
+    )
+    geo_cache_l1_max_bytes: int = Field(
+        default=64 * 1024 * 1024,  # 64 MB
+        alias="GEO_CACHE_L1_MAX_BYTES",
+        description="Maximum estimated size in bytes of the in-process L1 cache tier"
+    )
+    geo_cache_l1_max_ttl: int = Field(
+        default=900,  # 15 minutes
+        alias="GEO_CACHE_L1_MAX_TTL",
+        description="Upper bound in seconds for L1 entry lifetime. Bounds staleness after another process invalidates the PostgreSQL cache."
+    )
     
     # Rate limiting configuration
     geo_rate_limit_here: float = Field(
@@ -185,7 +235,100 @@ class ProviderSettings(BaseSettings):
         alias="GEO_RATE_LIMIT_TOMTOM",
         description="TomTom rate limit (requests per second)"
     )
-    
+    poi_search_max_concurrency: int = Field(
+        default=8,
+        alias="POI_SEARCH_MAX_CONCURRENCY",
+        description="Maximum in-flight POI searches while processing route segments. Each provider still paces its API calls by its own rate limit."
+    )
+    poi_search_mode: str = Field(
+        default="corridor",
+        alias="POI_SEARCH_MODE",
+        description="POI search strategy for route segments: 'corridor' (one search along the whole route, for providers that support it) or 'points' (one search per search point). Both keep at most 20 POIs per search point, the first ones in provider order."
+    )
+    poi_tile_zoom: int = Field(
+        default=13,
+        alias="POI_TILE_ZOOM",
+        description="Zoom level of the slippy map tiles the OSM POI cache is keyed by (13 = ~4.5 km tiles in Brazil)."
+    )
+    poi_tile_max_per_query: int = Field(
+        default=64,
+        alias="POI_TILE_MAX_PER_QUERY",
+        description="Maximum POI tiles fetched by one Overpass query when filling the tile cache."
+    )
+    junction_max_concurrency: int = Field(
+        default=8,
+        alias="JUNCTION_MAX_CONCURRENCY",
+        description="Maximum junction calculations (access route requests) in flight while assembling a map."
+    )
+    junction_batch_routing: bool = Field(
+        default=True,
+        alias="JUNCTION_BATCH_ROUTING",
+        description="Fetch access routes of POIs sharing a lookback point with batched routing requests."
+    )
+
+    # Pooled HTTP clients of the external API providers
+    http_max_connections: int = Field(
+        default=20,
+        alias="HTTP_MAX_CONNECTIONS",
+        description="Maximum open connections per provider HTTP client (per event loop)"
+    )
+    http_max_keepalive_connections: int = Field(
+        default=10,
+        alias="HTTP_MAX_KEEPALIVE_CONNECTIONS",
+        description="Idle connections each provider HTTP client keeps open for reuse"
+    )
+    http_keepalive_expiry: float = Field(
+        default=30.0,
+        alias="HTTP_KEEPALIVE_EXPIRY",
+        description="Seconds an idle keep-alive connection is kept before being closed"
+    )
+    http2_enabled: bool = Field(
+        default=True,
+        alias="HTTP2_ENABLED",
+        description="Negotiate HTTP/2 with providers that support it (requires the optional 'h2' package)"
+    )
+
+    # Route segment storage
+    route_geometry_storage_format: str = Field(
+        default="coordinates",
+        alias="ROUTE_GEOMETRY_STORAGE_FORMAT",
+        description="Format of newly stored route segment geometries: 'coordinates' ([lat, lon] arrays) or 'polyline6' (encoded polyline). Both formats are always readable."
+    )
+
+    # Offline POI search (POI_PROVIDER=osm_pbf)
+    osm_pbf_path: str = Field(
+        default="data/osm/region.osm.pbf",
+        alias="OSM_PBF_PATH",
+        description="Regional OpenStreetMap extract (.osm.pbf, e.g. from Geofabrik) used by the osm_pbf POI provider."
+    )
+    osm_pbf_index_path: str = Field(
+        default="data/osm/poi_index",
+        alias="OSM_PBF_INDEX_PATH",
+        description="Directory of the POI index built from OSM_PBF_PATH. Built on first use when missing or older than the extract."
+    )
+
+    # Offline city lookup
+    municipality_gazetteer_enabled: bool = Field(
+        default=True,
+        alias="MUNICIPALITY_GAZETTEER_ENABLED",
+        description="Resolve POI cities from IBGE municipality boundaries held in memory, using network reverse geocoding only for points outside every boundary. Also geocodes \"City, UF\" origins and destinations to the municipality seat without Nominatim."
+    )
+    municipality_gazetteer_path: str = Field(
+        default="data/ibge_municipalities.json",
+        alias="MUNICIPALITY_GAZETTEER_PATH",
+        description="Local copy of the municipality boundaries and seats. Built in the background at startup when missing, or ahead of time with `make gazetteer`."
+    )
+    municipality_seats_commit: str = Field(
+        default="",
+        alias="MUNICIPALITY_SEATS_COMMIT",
+        description="Full commit SHA of kelvins/Municipios-Brasileiros to download the full municipality seats table from, extending the table shipped in api/services/municipality_seats.csv (state capitals and other large cities). Without it (or the hash) only the shipped table is used."
+    )
+    municipality_seats_sha256: str = Field(
+        default="",
+        alias="MUNICIPALITY_SEATS_SHA256",
+        description="Expected SHA-256 of csv/municipios.csv at MUNICIPALITY_SEATS_COMMIT; a download with another hash is rejected."
+    )
+
     # API configuration
     mapalinear_api_url: str = Field(
         default="http://localhost:8001/api",
@@ -203,6 +346,23 @@ class ProviderSettings(BaseSettings):
         description="API server port"
     )
     
+    # Background operations
+    async_worker_threads: int = Field(
+        default=4,
+        alias="ASYNC_WORKER_THREADS",
+        description="Number of background worker threads running async operations (map generation, regeneration). Each keeps one event loop and database engine for its lifetime."
+    )
+    async_queue_max_size: int = Field(
+        default=50,
+        alias="ASYNC_QUEUE_MAX_SIZE",
+        description="Maximum number of async operations waiting for a worker; new requests get HTTP 503 beyond it (0 = unlimited)"
+    )
+    async_shutdown_timeout: float = Field(
+        default=60.0,
+        alias="ASYNC_SHUTDOWN_TIMEOUT",
+        description="Seconds to wait on shutdown for queued and running async operations to finish"
+    )
+
     # PostgreSQL Cache configuration (always uses PostgreSQL)
     postgres_host: str = Field(
         default="localhost",
@@ -264,6 +424,7 @@ class ProviderSettings(BaseSettings):
             "reverse_geocode": self.geo_cache_ttl_geocode,
             "route": self.geo_cache_ttl_route,
             "poi_search": self.geo_cache_ttl_poi,
+            "poi_tile": self.geo_cache_ttl_poi,
             "poi_details": self.geo_cache_ttl_poi_details,
         }
         return ttl_config.get(operation, 3600)  # Default 1 hour
@@ -19,6 +19,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from api.database.connection import get_db
 from api.database.models.poi import POI
 from api.database.models.user import User
+from api.database.repositories.map_response_cache import MapResponseCacheRepository
 from api.database.repositories.poi import POIRepository
 from api.database.repositories.system_settings import SystemSettingsRepository
 from api.middleware.auth import get_current_admin
@@ -397,6 +398,7 @@ async def refresh_pois(
 
     updated_count = 0
     failed_count = 0
+    refreshed_ids = []
 
     for poi_id_str in request.poi_ids:
         try:
@@ -492,6 +494,7 @@ async def refresh_pois(
 
             if poi_updated:
                 updated_count += 1
+                refreshed_ids.append(poi.id)
             else:
                 # POI was processed but nothing changed
                 pass
@@ -503,6 +506,9 @@ async def refresh_pois(
             logger.error(f"Error refreshing POI {poi_id_str}: {e}")
             failed_count += 1
 
+    # Maps showing these POIs must be reassembled on their next open
+    await MapResponseCacheRepository(db).delete_for_pois(refreshed_ids)
+
     await db.commit()
 
     logger.info(
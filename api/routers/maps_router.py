@@ -18,7 +18,7 @@ import unicodedata
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Query
 from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -27,10 +27,11 @@ from ..database.models.user import User
 from ..middleware.auth import get_current_admin, get_current_user
 from ..middleware.request_id import get_request_id
 from ..models.road_models import LinearMapResponse, SavedMapResponse
-from ..services.async_service import AsyncService
+from ..services.async_service import AsyncService, JobPriority
 from ..services.map_storage_service_db import MapStorageServiceDB
 from ..services.road_service import RoadService
 from ..utils.export_utils import export_to_pdf
+from ..utils.polyline import GEOMETRY_FORMAT_COORDINATES, GEOMETRY_FORMATS
 
 logger = logging.getLogger(__name__)
 
@@ -132,6 +133,12 @@ async def list_available_maps(
 @router.get("/{map_id}", response_model=LinearMapResponse)
 async def get_saved_map(
     map_id: str,
+    geometry_format: str = Query(
+        GEOMETRY_FORMAT_COORDINATES,
+        pattern=f"^({'|'.join(GEOMETRY_FORMATS)})$",
+        description="Segment geometry encoding: 'coordinates' (list of points) or 'polyline6' (encoded polyline, precision 6)",
+    ),
+    if_none_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -141,8 +148,13 @@ async def get_saved_map(
     User must have the map in their collection to access it,
     unless they are an admin (can view any map).
 
+    The response carries an ETag; requests sending it back in
+    If-None-Match get a 304 while the map is unchanged.
+
     Args:
         map_id: ID of the map to retrieve
+        geometry_format: Segment geometry encoding ('coordinates' or 'polyline6')
+        if_none_match: ETag(s) of the copy the client already has
 
     Returns:
         The complete linear map data
@@ -151,15 +163,26 @@ async def get_saved_map(
         storage = MapStorageServiceDB(db)
 
         # Admins can view any map, regular users only their own collection
-        if current_user.is_admin:
-            linear_map = await storage.load_map(map_id)
-        else:
-            linear_map = await storage.load_map(map_id, user_id=current_user.id)
+        cached = await storage.get_map_response(
+            map_id,
+            user_id=None if current_user.is_admin else current_user.id,
+            geometry_format=geometry_format,
+        )
 
-        if linear_map is None:
+        if cached is None:
             raise HTTPException(status_code=404, detail=f"Map {map_id} not found")
 
-        return linear_map
+        headers = {"ETag": cached.etag, "Cache-Control": "private, no-cache"}
+        if if_none_match and (
+            if_none_match.strip() == "*"
+            or cached.etag
+            in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+        ):
+            return Response(status_code=304, headers=headers)
+
+        return Response(
+            content=cached.payload, media_type="application/json", headers=headers
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -387,6 +410,11 @@ async def regenerate_map(
         if existing_map is None:
             raise HTTPException(status_code=404, detail=f"Map {map_id} not found")
 
+        if not AsyncService.can_accept():
+            raise HTTPException(
+                status_code=503, detail="Operation queue is full, try again later"
+            )
+
         # Store map info before the session closes
         origin = existing_map.origin
         destination = existing_map.destination
@@ -433,12 +461,18 @@ async def regenerate_map(
                 # Replace original map data with temporary map data
                 # This preserves the original map ID and user associations
                 # Old segments have usage decremented, new segments are linked
-                from ..services.map_storage_service_db import replace_map_data_sync
+                from ..services.map_storage_service_db import (
+                    cache_map_response_sync,
+                    replace_map_data_sync,
+                )
 
                 success = replace_map_data_sync(map_id, temp_map_id)
                 if not success:
                     raise Exception("Failed to replace map data")
 
+                # Cache the regenerated response so users get it on next open
+                cache_map_response_sync(map_id)
+
                 logger.info(
                     f"Map {map_id} successfully regenerated with new segment versions"
                 )
@@ -486,7 +520,8 @@ async def regenerate_map(
             AsyncService.run_async,
             operation.operation_id,
             process_regeneration,
-            request_id=get_request_id()
+            request_id=get_request_id(),
+            priority=JobPriority.REGENERATION,
         )
 
         return {"operation_id": operation.operation_id}
@@ -506,51 +541,23 @@ def _cleanup_orphan_segments():
     This typically happens after map regeneration when old segment versions
     are no longer used by any map.
     """
-    import asyncio
-    from sqlalchemy.ext.asyncio import (
-        AsyncSession,
-        async_sessionmaker,
-        create_async_engine,
-    )
+    from api.database.connection import get_background_session
     from api.database.repositories.route_segment import RouteSegmentRepository
-    from api.providers.settings import get_settings
-
-    settings = get_settings()
+    from api.utils.async_utils import run_async_safe
 
     async def _cleanup():
-        database_url = (
-            f"postgresql+asyncpg://{settings.postgres_user}:{settings.postgres_password}"
-            f"@{settings.postgres_host}:{settings.postgres_port}/{settings.postgres_database}"
-        )
-        engine = create_async_engine(
-            database_url,
-            pool_size=1,
-            max_overflow=0,
-            pool_pre_ping=True,
-        )
-        session_maker = async_sessionmaker(
-            engine,
-            class_=AsyncSession,
-            expire_on_commit=False,
-        )
-
         try:
-            async with session_maker() as session:
-                try:
-                    repo = RouteSegmentRepository(session)
-                    deleted = await repo.delete_orphan_segments()
-                    await session.commit()
-                    if deleted > 0:
-                        logger.info(
-                            f"Orphan cleanup: deleted {deleted} unused segments"
-                        )
-                except Exception as e:
-                    await session.rollback()
-                    logger.warning(f"Orphan cleanup failed: {e}")
-        finally:
-            await engine.dispose()
+            async with get_background_session() as session:
+                repo = RouteSegmentRepository(session)
+                deleted = await repo.delete_orphan_segments()
+                if deleted > 0:
+                    logger.info(
+                        f"Orphan cleanup: deleted {deleted} unused segments"
+                    )
+        except Exception as e:
+            logger.warning(f"Orphan cleanup failed: {e}")
 
     try:
-        asyncio.run(_cleanup())
+        run_async_safe(_cleanup())
     except Exception as e:
         logger.warning(f"Error running orphan cleanup: {e}")
@@ -13,6 +13,7 @@ from fastapi import APIRouter, Query, HTTPException
 from api.models.municipality_models import Municipality, MunicipalityListResponse
 from api.providers.cache import UnifiedCache, CacheKey
 from api.providers.base import ProviderType
+from api.services.municipality_gazetteer import IBGE_API_URL, parse_ibge_municipalities
 
 logger = logging.getLogger(__name__)
 
@@ -21,9 +22,6 @@ router = APIRouter(prefix="/api/municipalities", tags=["municipalities"])
 # Cache instance
 cache = UnifiedCache()
 
-# IBGE API endpoint
-IBGE_API_URL = "https://servicodados.ibge.gov.br/api/v1/localidades/municipios"
-
 
 async def fetch_municipalities_from_ibge() -> List[Municipality]:
     """
@@ -39,27 +37,7 @@ async def fetch_municipalities_from_ibge() -> List[Municipality]:
         response.raise_for_status()
         data = response.json()
 
-    municipalities = []
-    for item in data:
-        try:
-            # Extract UF from nested structure (defensive parsing)
-            microrregiao = item.get("microrregiao") or {}
-            mesorregiao = microrregiao.get("mesorregiao") or {}
-            uf_data = mesorregiao.get("UF") or {}
-            uf = uf_data.get("sigla", "")
-
-            if not uf:
-                logger.debug(f"Municipality without UF: {item.get('nome', 'unknown')}")
-                continue
-
-            municipalities.append(Municipality(
-                id=item["id"],
-                nome=item["nome"],
-                uf=uf
-            ))
-        except (KeyError, TypeError, AttributeError) as e:
-            logger.warning(f"Failed to parse municipality: {item.get('nome', 'unknown')}: {e}")
-            continue
+    municipalities = parse_ibge_municipalities(data)
 
     # Sort by name for better UX
     municipalities.sort(key=lambda m: (m.uf, m.nome))
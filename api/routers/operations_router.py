@@ -93,6 +93,12 @@ async def start_async_linear_map(
     except Exception as e:
         logger.warning(f"⚠️ Erro ao verificar duplicatas: {e}. Continuando sem validação.")
 
+    if not AsyncService.can_accept():
+        raise HTTPException(
+            status_code=503,
+            detail="Fila de processamento cheia. Tente novamente em alguns minutos."
+        )
+
     # Store user_id for the background task
     user_id = str(current_user.id)
 
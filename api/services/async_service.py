@@ -3,11 +3,16 @@ Service for managing async operations with PostgreSQL storage.
 """
 
 import asyncio
+import contextvars
 import logging
+import queue
 import threading
+import time
 import uuid
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, List, Optional, Union
+from enum import IntEnum
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from api.database.connection import get_session
 from api.database.models.async_operation import AsyncOperation
@@ -34,6 +39,229 @@ def _serialize_for_json(obj: Any) -> Any:
     return obj
 
 
+class JobPriority(IntEnum):
+    """Scheduling priority of a background operation (lower runs first)."""
+    INTERACTIVE = 0
+    REGENERATION = 1
+
+
+# Assumed duration of an operation until the pool has measured some
+# (matches the initial 5-minute estimate of create_operation)
+_DEFAULT_JOB_DURATION_S = 300.0
+
+# Weight of the latest job in the running average of job durations
+_DURATION_SMOOTHING = 0.2
+
+
+@dataclass
+class QueueStatus:
+    """Place of a queued job in the worker pool."""
+    position: int
+    estimated_start: datetime
+
+
+class _WorkerPool:
+    """
+    Fixed set of daemon threads that run background operations.
+
+    Each worker owns one event loop and one database engine for its whole
+    lifetime (see ``init_worker_engine``), so all phases of an operation and
+    all operations run by the same worker share a single connection pool.
+    Threads are started on first use; ASYNC_WORKER_THREADS sets their number.
+
+    Jobs wait in a priority queue: interactive requests go before map
+    regenerations, and jobs of the same priority run in submission order.
+    """
+
+    def __init__(self):
+        self._queue: "queue.PriorityQueue[tuple]" = queue.PriorityQueue()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._accepting = True
+        self._sequence = 0
+        # Queued jobs: sequence -> (priority, key)
+        self._pending: Dict[int, Tuple[int, Optional[str]]] = {}
+        self._running = 0
+        self._average_duration_s = _DEFAULT_JOB_DURATION_S
+
+    @property
+    def size(self) -> int:
+        """Number of worker threads (configured, if not started yet)."""
+        from api.providers.settings import get_settings
+
+        return len(self._threads) or max(1, get_settings().async_worker_threads)
+
+    def submit(
+        self,
+        job: Callable[[], None],
+        key: Optional[str] = None,
+        priority: int = JobPriority.INTERACTIVE,
+    ) -> bool:
+        """
+        Queue a job to run on the next free worker.
+
+        Args:
+            job: Function to run
+            key: Identifier used to look the job up in the queue (operation ID)
+            priority: Scheduling priority, lower values run first
+
+        Returns:
+            False if the pool is shutting down and the job was not queued
+        """
+        self._ensure_started()
+        with self._lock:
+            if not self._accepting:
+                return False
+            self._sequence += 1
+            self._pending[self._sequence] = (int(priority), key)
+            self._queue.put((int(priority), self._sequence, job))
+        return True
+
+    def has_capacity(self) -> bool:
+        """Whether a new job can be queued (ASYNC_QUEUE_MAX_SIZE, shutdown)."""
+        from api.providers.settings import get_settings
+
+        max_size = get_settings().async_queue_max_size
+        with self._lock:
+            if not self._accepting:
+                return False
+            return max_size <= 0 or len(self._pending) < max_size
+
+    def queue_status(self, key: str) -> Optional[QueueStatus]:
+        """
+        Position and estimated start of a queued job.
+
+        The estimate assumes the running jobs just started and all jobs take
+        the running average duration of the jobs finished so far.
+
+        Args:
+            key: Identifier given to submit
+
+        Returns:
+            QueueStatus (position 1 runs next), or None if the job is not
+            waiting in the queue
+        """
+        size = self.size
+        with self._lock:
+            own = next(
+                ((entry[0], sequence) for sequence, entry in self._pending.items() if entry[1] == key),
+                None,
+            )
+            if own is None:
+                return None
+            ahead = sum(
+                1 for sequence, entry in self._pending.items() if (entry[0], sequence) < own
+            )
+            busy = self._running + ahead
+            rounds = 0 if busy < size else (busy - size) // size + 1
+            wait_s = rounds * self._average_duration_s
+        return QueueStatus(
+            position=ahead + 1,
+            estimated_start=datetime.now() + timedelta(seconds=wait_s),
+        )
+
+    def average_duration_s(self) -> float:
+        """Running average duration of the finished jobs, in seconds."""
+        with self._lock:
+            return self._average_duration_s
+
+    def shutdown(self, timeout: float) -> int:
+        """
+        Stop accepting jobs and wait for the queued and running ones.
+
+        Jobs still queued when the timeout expires are dropped; their
+        operations are marked as failed on the next startup. The pool then
+        returns to its initial state, starting new workers on next use.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            Number of dropped jobs
+        """
+        with self._lock:
+            self._accepting = False
+            drained = self._idle.wait_for(
+                lambda: not self._pending and not self._running, timeout
+            )
+            dropped = 0
+            if not drained:
+                while True:
+                    try:
+                        _, sequence, _ = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    self._pending.pop(sequence, None)
+                    self._queue.task_done()
+                    dropped += 1
+            # Sentinels sort after any job
+            for _ in self._threads:
+                self._sequence += 1
+                self._queue.put((float("inf"), self._sequence, None))
+            threads = self._threads
+            self._threads = []
+            self._queue = queue.PriorityQueue()
+            self._accepting = True
+
+        if drained:
+            for thread in threads:
+                thread.join(timeout=1)
+        return dropped
+
+    def _ensure_started(self) -> None:
+        from api.providers.settings import get_settings
+
+        with self._lock:
+            if self._threads or not self._accepting:
+                return
+            size = max(1, get_settings().async_worker_threads)
+            for index in range(size):
+                thread = threading.Thread(
+                    target=self._run_worker,
+                    args=(self._queue,),
+                    name=f"async-worker-{index}",
+                    daemon=True,
+                )
+                thread.start()
+                self._threads.append(thread)
+            logger.info(f"Started {size} background worker threads")
+
+    def _run_worker(self, jobs: "queue.PriorityQueue[tuple]") -> None:
+        from api.database.connection import init_worker_engine
+
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        init_worker_engine()
+
+        while True:
+            _, sequence, job = jobs.get()
+            if job is None:
+                jobs.task_done()
+                break
+            with self._lock:
+                self._pending.pop(sequence, None)
+                self._running += 1
+            started = time.monotonic()
+            try:
+                # Fresh context per job so request IDs don't leak between jobs
+                contextvars.copy_context().run(job)
+            except Exception as e:
+                logger.error(f"Unhandled error in background worker: {e}", exc_info=True)
+            finally:
+                elapsed = time.monotonic() - started
+                with self._lock:
+                    self._running -= 1
+                    self._average_duration_s += _DURATION_SMOOTHING * (
+                        elapsed - self._average_duration_s
+                    )
+                    self._idle.notify_all()
+                jobs.task_done()
+
+
+_worker_pool = _WorkerPool()
+
+
 class AsyncService:
     """Service for managing async operations stored in PostgreSQL."""
 
@@ -122,13 +350,53 @@ class AsyncService:
         """
         Get an operation by its ID.
 
+        Operations still waiting for a worker get their queue position,
+        estimated start and an estimated completion based on it.
+
         Args:
             operation_id: Operation ID
 
         Returns:
             AsyncOperationResponse or None if not found
         """
-        return await AsyncService._get_operation_async(operation_id)
+        response = await AsyncService._get_operation_async(operation_id)
+        if response is None or response.status != OperationStatus.IN_PROGRESS:
+            return response
+
+        status = _worker_pool.queue_status(operation_id)
+        if status is None:
+            return response
+        return response.model_copy(update={
+            "queue_position": status.position,
+            "estimated_start": status.estimated_start,
+            "estimated_completion": status.estimated_start + timedelta(
+                seconds=_worker_pool.average_duration_s()
+            ),
+        })
+
+    @staticmethod
+    def can_accept() -> bool:
+        """
+        Whether a new operation can be queued.
+
+        False while shutting down or when ASYNC_QUEUE_MAX_SIZE operations
+        are already waiting for a worker.
+        """
+        return _worker_pool.has_capacity()
+
+    @staticmethod
+    def shutdown(timeout: float) -> int:
+        """
+        Drain the background workers: stop accepting operations and wait
+        for the queued and running ones to finish.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            Number of queued operations dropped when the timeout expired
+        """
+        return _worker_pool.shutdown(timeout)
 
     @staticmethod
     async def _update_progress_async(
@@ -270,18 +538,24 @@ class AsyncService:
         function: Callable,
         *args,
         request_id: Optional[str] = None,
+        priority: JobPriority = JobPriority.INTERACTIVE,
         **kwargs
     ) -> None:
         """
-        Execute a function asynchronously in a background thread.
+        Execute a function asynchronously on a background worker thread.
+
+        The function runs synchronously on the worker; async code it calls
+        through ``run_async_safe`` runs on the worker's event loop and can
+        reuse its database engine via ``get_background_session``.
 
         Args:
             operation_id: Operation ID
             function: Function to execute
             request_id: Optional request ID for log tracking
+            priority: Queue priority (interactive requests before regenerations)
             *args, **kwargs: Arguments for the function
         """
-        from api.database.connection import create_standalone_engine, get_standalone_session
+        from api.database.connection import get_background_session
         from api.database.repositories.async_operation import AsyncOperationRepository
         from api.middleware.request_id import set_request_id
 
@@ -289,16 +563,12 @@ class AsyncService:
             # Set request ID for this thread (for log tracking)
             if request_id:
                 set_request_id(request_id)
-            # Create a new event loop for this thread
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-            # Create a standalone engine for this thread
-            engine = create_standalone_engine()
+            # The worker thread's long-lived event loop
+            loop = asyncio.get_event_loop()
 
             async def _update_progress_bg(progress: float, phase: Optional[str] = None):
-                """Update progress using the thread's own database connection."""
-                async with get_standalone_session(engine) as session:
+                """Update progress using the worker's database engine."""
+                async with get_background_session() as session:
                     repo = AsyncOperationRepository(session)
                     await repo.update_progress(
                         operation_id=operation_id,
@@ -313,18 +583,18 @@ class AsyncService:
                         _active_operations[operation_id].current_phase = phase
 
             async def _complete_operation_bg(result: Dict[str, Any]):
-                """Complete operation using the thread's own database connection."""
+                """Complete operation using the worker's database engine."""
                 # Serialize datetime objects to ISO strings for JSONB storage
                 serialized_result = _serialize_for_json(result)
-                async with get_standalone_session(engine) as session:
+                async with get_background_session() as session:
                     repo = AsyncOperationRepository(session)
                     await repo.complete_operation(operation_id=operation_id, result=serialized_result)
                 _active_operations.pop(operation_id, None)
                 logger.info(f"Operation {operation_id} completed successfully")
 
             async def _fail_operation_bg(error: str):
-                """Fail operation using the thread's own database connection."""
-                async with get_standalone_session(engine) as session:
+                """Fail operation using the worker's database engine."""
+                async with get_background_session() as session:
                     repo = AsyncOperationRepository(session)
                     await repo.fail_operation(operation_id=operation_id, error=error)
                 _active_operations.pop(operation_id, None)
@@ -407,20 +677,17 @@ class AsyncService:
                     loop.run_until_complete(_fail_operation_bg(str(e)))
                 except Exception as fail_error:
                     logger.error(f"Failed to mark operation as failed: {fail_error}")
-            finally:
-                # Clean up the engine and loop
-                try:
-                    loop.run_until_complete(engine.dispose())
-                except Exception:
-                    pass
-                loop.close()
 
-        # Start background thread
-        thread = threading.Thread(target=_worker)
-        thread.daemon = True
-        thread.start()
+        if not _worker_pool.submit(_worker, key=operation_id, priority=priority):
+            logger.warning(f"Async operation {operation_id} not queued: workers are shutting down")
+            # Already created as in_progress: fail it so clients stop polling
+            try:
+                AsyncService.fail_operation(operation_id, "Operação cancelada (servidor em encerramento)")
+            except Exception as fail_error:
+                logger.error(f"Failed to mark operation as failed: {fail_error}")
+            return
 
-        logger.info(f"Async operation {operation_id} started in background")
+        logger.info(f"Async operation {operation_id} queued ({priority.name.lower()} priority)")
 
     @staticmethod
     async def cleanup_old_operations(max_age_hours: int = 24) -> int:
@@ -163,47 +163,16 @@ class DatabaseLogHandler(logging.Handler):
         self._log_queue.clear()
 
         try:
-            # Use standalone session to avoid event loop conflicts
-            from sqlalchemy.ext.asyncio import (
-                AsyncSession,
-                async_sessionmaker,
-                create_async_engine,
-            )
-
-            from api.providers.settings import get_settings
-
-            settings = get_settings()
-            database_url = (
-                f"postgresql+asyncpg://{settings.postgres_user}:{settings.postgres_password}"
-                f"@{settings.postgres_host}:{settings.postgres_port}/{settings.postgres_database}"
-            )
-            engine = create_async_engine(
-                database_url,
-                pool_size=1,
-                max_overflow=0,
-                pool_pre_ping=True,
-            )
-            session_maker = async_sessionmaker(
-                engine,
-                class_=AsyncSession,
-                expire_on_commit=False,
-            )
+            # Reuses the background worker's engine when running on its loop
+            from api.database.connection import get_background_session
 
-            try:
-                async with session_maker() as session:
-                    try:
-                        from api.database.repositories.application_log import (
-                            ApplicationLogRepository,
-                        )
-
-                        repo = ApplicationLogRepository(session)
-                        await repo.create_logs_batch(to_flush)
-                        await session.commit()
-                    except Exception:
-                        await session.rollback()
-                        raise
-            finally:
-                await engine.dispose()
+            async with get_background_session() as session:
+                from api.database.repositories.application_log import (
+                    ApplicationLogRepository,
+                )
+
+                repo = ApplicationLogRepository(session)
+                await repo.create_logs_batch(to_flush)
 
         except Exception:
             # Re-queue logs for retry on failure
@@ -8,18 +8,37 @@ import asyncio
 import logging
 import time
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-import httpx
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.database.repositories.google_places_cache import GooglePlacesCacheRepository
 from api.models.road_models import MilestoneType, RoadMilestone
 from api.providers.settings import get_settings
 from api.services.api_call_logger import api_call_logger
+from api.utils.async_utils import AsyncRateLimiter
+from api.utils.http_client import PooledHttpClient
 
 logger = logging.getLogger(__name__)
 
+# Shared by all services and event loops so the quota is respected globally
+_rate_limiter: Optional[AsyncRateLimiter] = None
+
+# Keep-alive connections to the Places API, one pool per event loop
+_http = PooledHttpClient(timeout=10.0)
+
+
+def _get_rate_limiter() -> AsyncRateLimiter:
+    """Get the Google Places rate limiter, creating it from settings."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        settings = get_settings()
+        _rate_limiter = AsyncRateLimiter(
+            settings.google_places_rate_limit,
+            burst=settings.google_places_rate_burst,
+        )
+    return _rate_limiter
+
 
 @dataclass
 class GooglePlaceData:
@@ -33,6 +52,17 @@ class GooglePlaceData:
     match_distance_meters: Optional[float]
 
 
+@dataclass
+class PlaceQuery:
+    """A POI to look up on Google Places."""
+
+    osm_poi_id: str
+    name: str
+    latitude: float
+    longitude: float
+    poi_type: MilestoneType
+
+
 # Types that should be enriched with Google Places data
 ENRICHABLE_TYPES = {
     MilestoneType.RESTAURANT,
@@ -99,57 +129,117 @@ class GooglePlacesService:
         Returns:
             GooglePlaceData if found, None otherwise
         """
+        results = await self.get_places_data([
+            PlaceQuery(osm_poi_id, name, latitude, longitude, poi_type)
+        ])
+        return results.get(osm_poi_id)
+
+    async def get_places_data(
+        self, queries: List[PlaceQuery]
+    ) -> Dict[str, GooglePlaceData]:
+        """
+        Get Google Places data for many POIs.
+
+        Cached POIs are answered by a single cache query; only the misses
+        are searched, concurrently (at most ENRICHMENT_MAX_CONCURRENCY in flight, paced by
+        the shared Google Places rate limiter) and then cached. The cache
+        read and writes go through the caller's session, which this method
+        does not commit: its transaction stays open across all the Google
+        API calls.
+
+        Args:
+            queries: POIs to look up (repeated osm_poi_id are searched once)
+
+        Returns:
+            Dict mapping osm_poi_id to its data (POIs without a match are
+            left out)
+        """
         if not self.is_enabled():
-            return None
+            return {}
 
-        # Check cache first
-        if self.cache_repo:
-            cached = await self.cache_repo.get_by_osm_id(osm_poi_id)
-            if cached:
-                return GooglePlaceData(
-                    google_place_id=cached.google_place_id,
-                    rating=float(cached.rating) if cached.rating else None,
-                    rating_count=cached.user_rating_count,
-                    google_maps_uri=cached.google_maps_uri,
-                    matched_name=cached.matched_name,
-                    match_distance_meters=(
-                        float(cached.match_distance_meters)
-                        if cached.match_distance_meters
-                        else None
-                    ),
-                )
+        results = await self._get_cached([query.osm_poi_id for query in queries])
+        misses: Dict[str, PlaceQuery] = {}
 
-        # Query Google Places API
-        try:
-            place_data = await self._search_nearby(
-                name=name,
-                latitude=latitude,
-                longitude=longitude,
-                poi_type=poi_type,
-            )
+        for query in queries:
+            if query.osm_poi_id not in results:
+                misses.setdefault(query.osm_poi_id, query)
 
-            if place_data and self.cache_repo:
-                # Cache the result
-                await self.cache_repo.upsert(
-                    osm_poi_id=osm_poi_id,
-                    google_place_id=place_data.google_place_id,
-                    rating=place_data.rating,
-                    user_rating_count=place_data.rating_count,
-                    google_maps_uri=place_data.google_maps_uri,
-                    matched_name=place_data.matched_name,
-                    match_distance_meters=place_data.match_distance_meters,
-                    search_latitude=latitude,
-                    search_longitude=longitude,
-                    search_name=name,
-                    ttl_seconds=self.settings.google_places_cache_ttl,
-                )
-                logger.debug(f"Cached Google Places data for POI {osm_poi_id}")
+        logger.debug(
+            f"Google Places: {len(results)} cached POIs, {len(misses)} to search"
+        )
 
-            return place_data
+        if not misses:
+            return results
 
-        except Exception as e:
-            logger.error(f"Error fetching Google Places data for {name}: {e}")
-            return None
+        semaphore = asyncio.Semaphore(max(1, self.settings.enrichment_max_concurrency))
+
+        async def _search(query: PlaceQuery) -> Optional[GooglePlaceData]:
+            async with semaphore:
+                try:
+                    return await self._search_nearby(
+                        name=query.name,
+                        latitude=query.latitude,
+                        longitude=query.longitude,
+                        poi_type=query.poi_type,
+                    )
+                except Exception as e:
+                    logger.error(f"Error fetching Google Places data for {query.name}: {e}")
+                    return None
+
+        fetched = await asyncio.gather(*(_search(query) for query in misses.values()))
+
+        for query, place_data in zip(misses.values(), fetched):
+            if not place_data:
+                continue
+            results[query.osm_poi_id] = place_data
+            if self.cache_repo:
+                try:
+                    await self._store_in_cache(query, place_data)
+                except Exception as e:
+                    logger.error(f"Error caching Google Places data for {query.name}: {e}")
+
+        return results
+
+    async def _get_cached(self, osm_poi_ids: List[str]) -> Dict[str, GooglePlaceData]:
+        """Get cached Google Places data for many POIs with one query."""
+        if not self.cache_repo or not osm_poi_ids:
+            return {}
+
+        entries = await self.cache_repo.get_by_osm_ids(osm_poi_ids)
+        return {
+            osm_poi_id: GooglePlaceData(
+                google_place_id=cached.google_place_id,
+                rating=float(cached.rating) if cached.rating else None,
+                rating_count=cached.user_rating_count,
+                google_maps_uri=cached.google_maps_uri,
+                matched_name=cached.matched_name,
+                match_distance_meters=(
+                    float(cached.match_distance_meters)
+                    if cached.match_distance_meters
+                    else None
+                ),
+            )
+            for osm_poi_id, cached in entries.items()
+        }
+
+    async def _store_in_cache(
+        self, query: PlaceQuery, place_data: GooglePlaceData
+    ) -> None:
+        """Cache Google Places data for a POI."""
+        await self.cache_repo.upsert(
+            osm_poi_id=query.osm_poi_id,
+            google_place_id=place_data.google_place_id,
+            rating=place_data.rating,
+            user_rating_count=place_data.rating_count,
+            google_maps_uri=place_data.google_maps_uri,
+            matched_name=place_data.matched_name,
+            match_distance_meters=place_data.match_distance_meters,
+            search_latitude=query.latitude,
+            search_longitude=query.longitude,
+            search_name=query.name,
+            ttl_seconds=self.settings.google_places_cache_ttl,
+        )
+        logger.debug(f"Cached Google Places data for POI {query.osm_poi_id}")
 
     async def _search_nearby(
         self,
@@ -193,54 +283,32 @@ class GooglePlacesService:
             ),
         }
 
+        await _get_rate_limiter().acquire()
+
         start_time = time.time()
         response_status = 0
         response_size = None
         error_msg = None
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    self.NEARBY_SEARCH_URL,
-                    json=request_body,
-                    headers=headers,
-                    timeout=10.0,
-                )
-
-                response_status = response.status_code
-                response_size = len(response.content)
-
-                if response.status_code != 200:
-                    error_msg = f"HTTP {response.status_code}: {response.text[:200]}"
-                    logger.warning(
-                        f"Google Places API error: {response.status_code} - {response.text}"
-                    )
-                    
-                    # Log failed API call
-                    duration_ms = int((time.time() - start_time) * 1000)
-                    await api_call_logger.log_call(
-                        provider="google_places",
-                        operation="nearby_search",
-                        endpoint=self.NEARBY_SEARCH_URL,
-                        http_method="POST",
-                        response_status=response_status,
-                        duration_ms=duration_ms,
-                        request_params={
-                            "name": name,
-                            "latitude": latitude,
-                            "longitude": longitude,
-                            "poi_type": poi_type.value if hasattr(poi_type, 'value') else str(poi_type),
-                            "included_types": included_types,
-                        },
-                        response_size_bytes=response_size,
-                        error_message=error_msg,
-                    )
-                    return None
+        client = _http.client
+        try:
+            response = await client.post(
+                self.NEARBY_SEARCH_URL,
+                json=request_body,
+                headers=headers,
+                timeout=10.0,
+            )
 
-                data = response.json()
-                places = data.get("places", [])
+            response_status = response.status_code
+            response_size = len(response.content)
 
-                # Log successful API call
+            if response.status_code != 200:
+                error_msg = f"HTTP {response.status_code}: {response.text[:200]}"
+                logger.warning(
+                    f"Google Places API error: {response.status_code} - {response.text}"
+                )
+                
+                # Log failed API call
                 duration_ms = int((time.time() - start_time) * 1000)
                 await api_call_logger.log_call(
                     provider="google_places",
@@ -257,55 +325,79 @@ class GooglePlacesService:
                         "included_types": included_types,
                     },
                     response_size_bytes=response_size,
-                    result_count=len(places),
+                    error_message=error_msg,
                 )
+                return None
 
-                if not places:
-                    logger.debug(f"No Google Places results for {name}")
-                    return None
-
-                # Find the best match based on name similarity
-                best_match = self._find_best_match(name, places, latitude, longitude)
-
-                if best_match:
-                    return GooglePlaceData(
-                        google_place_id=best_match.get("id", ""),
-                        rating=best_match.get("rating"),
-                        rating_count=best_match.get("userRatingCount"),
-                        google_maps_uri=best_match.get("googleMapsUri"),
-                        matched_name=best_match.get("displayName", {}).get("text"),
-                        match_distance_meters=self._calculate_distance(
-                            latitude,
-                            longitude,
-                            best_match.get("location", {}).get("latitude", latitude),
-                            best_match.get("location", {}).get("longitude", longitude),
-                        ),
-                    )
+            data = response.json()
+            places = data.get("places", [])
+
+            # Log successful API call
+            duration_ms = int((time.time() - start_time) * 1000)
+            await api_call_logger.log_call(
+                provider="google_places",
+                operation="nearby_search",
+                endpoint=self.NEARBY_SEARCH_URL,
+                http_method="POST",
+                response_status=response_status,
+                duration_ms=duration_ms,
+                request_params={
+                    "name": name,
+                    "latitude": latitude,
+                    "longitude": longitude,
+                    "poi_type": poi_type.value if hasattr(poi_type, 'value') else str(poi_type),
+                    "included_types": included_types,
+                },
+                response_size_bytes=response_size,
+                result_count=len(places),
+            )
 
+            if not places:
+                logger.debug(f"No Google Places results for {name}")
                 return None
 
-            except Exception as e:
-                error_msg = str(e)[:500]
-                logger.warning(f"Google Places API exception: {e}")
-                
-                # Log failed API call
-                duration_ms = int((time.time() - start_time) * 1000)
-                await api_call_logger.log_call(
-                    provider="google_places",
-                    operation="nearby_search",
-                    endpoint=self.NEARBY_SEARCH_URL,
-                    http_method="POST",
-                    response_status=response_status or 500,
-                    duration_ms=duration_ms,
-                    request_params={
-                        "name": name,
-                        "latitude": latitude,
-                        "longitude": longitude,
-                    },
-                    response_size_bytes=response_size,
-                    error_message=error_msg,
+            # Find the best match based on name similarity
+            best_match = self._find_best_match(name, places, latitude, longitude)
+
+            if best_match:
+                return GooglePlaceData(
+                    google_place_id=best_match.get("id", ""),
+                    rating=best_match.get("rating"),
+                    rating_count=best_match.get("userRatingCount"),
+                    google_maps_uri=best_match.get("googleMapsUri"),
+                    matched_name=best_match.get("displayName", {}).get("text"),
+                    match_distance_meters=self._calculate_distance(
+                        latitude,
+                        longitude,
+                        best_match.get("location", {}).get("latitude", latitude),
+                        best_match.get("location", {}).get("longitude", longitude),
+                    ),
                 )
-                return None
+
+            return None
+
+        except Exception as e:
+            error_msg = str(e)[:500]
+            logger.warning(f"Google Places API exception: {e}")
+            
+            # Log failed API call
+            duration_ms = int((time.time() - start_time) * 1000)
+            await api_call_logger.log_call(
+                provider="google_places",
+                operation="nearby_search",
+                endpoint=self.NEARBY_SEARCH_URL,
+                http_method="POST",
+                response_status=response_status or 500,
+                duration_ms=duration_ms,
+                request_params={
+                    "name": name,
+                    "latitude": latitude,
+                    "longitude": longitude,
+                },
+                response_size_bytes=response_size,
+                error_message=error_msg,
+            )
+            return None
 
     def _get_google_types(self, poi_type: MilestoneType) -> List[str]:
         """Map MilestoneType to Google Places types."""
@@ -404,8 +496,8 @@ class GooglePlacesService:
         """
         Enrich a list of milestones with Google Places data.
 
-        Only enriches restaurants and hotels. Uses batch processing
-        with rate limiting to avoid overwhelming the API.
+        Only enriches restaurants and hotels. Lookups run concurrently
+        within the Google Places rate limit (see get_places_data).
 
         Args:
             milestones: List of milestones to enrich
@@ -417,10 +509,10 @@ class GooglePlacesService:
             logger.info("Google Places enrichment is disabled")
             return milestones
 
-        enriched = []
+        queries = {}
         enrichable_count = 0
 
-        for milestone in milestones:
+        for index, milestone in enumerate(milestones):
             if self.should_enrich(milestone):
                 enrichable_count += 1
                 # Get OSM ID from tags
@@ -429,7 +521,7 @@ class GooglePlacesService:
                     osm_id = str(osm_id)
 
                 if osm_id:
-                    place_data = await self.get_place_data(
+                    queries[index] = PlaceQuery(
                         osm_poi_id=osm_id,
                         name=milestone.name,
                         latitude=milestone.coordinates.latitude,
@@ -437,17 +529,19 @@ class GooglePlacesService:
                         poi_type=milestone.type,
                     )
 
-                    if place_data:
-                        # Create a new milestone with enriched data
-                        milestone_dict = milestone.model_dump()
-                        milestone_dict["rating"] = place_data.rating
-                        milestone_dict["rating_count"] = place_data.rating_count
-                        milestone_dict["google_maps_uri"] = place_data.google_maps_uri
-                        milestone = RoadMilestone(**milestone_dict)
-
-                    # Rate limiting: small delay between API calls
-                    await asyncio.sleep(0.1)
+        places = await self.get_places_data(list(queries.values()))
 
+        enriched = []
+        for index, milestone in enumerate(milestones):
+            query = queries.get(index)
+            place_data = places.get(query.osm_poi_id) if query else None
+            if place_data:
+                # Create a new milestone with enriched data
+                milestone_dict = milestone.model_dump()
+                milestone_dict["rating"] = place_data.rating
+                milestone_dict["rating_count"] = place_data.rating_count
+                milestone_dict["google_maps_uri"] = place_data.google_maps_uri
+                milestone = RoadMilestone(**milestone_dict)
             enriched.append(milestone)
 
         logger.info(
@@ -462,17 +556,13 @@ def enrich_milestones_sync(milestones: List[RoadMilestone]) -> List[RoadMileston
     """
     Sync wrapper for enriching milestones with Google Places data.
 
-    Creates a standalone database session for the operation.
+    Runs on the current thread's event loop, reusing the background
+    worker's database engine when available.
     """
-    from api.database.connection import get_database_url
+    from api.database.connection import get_background_session
+    from api.utils.async_utils import run_async_safe
 
     async def _enrich():
-        from sqlalchemy.ext.asyncio import (
-            AsyncSession,
-            async_sessionmaker,
-            create_async_engine,
-        )
-
         settings = get_settings()
 
         # Check if enrichment is enabled
@@ -480,28 +570,11 @@ def enrich_milestones_sync(milestones: List[RoadMilestone]) -> List[RoadMileston
             logger.info("Google Places enrichment is disabled or not configured")
             return milestones
 
-        # Create standalone engine
-        engine = create_async_engine(
-            get_database_url(),
-            pool_size=1,
-            max_overflow=0,
-            pool_pre_ping=True,
-        )
-
-        session_maker = async_sessionmaker(
-            engine, class_=AsyncSession, expire_on_commit=False
-        )
-
-        try:
-            async with session_maker() as session:
-                service = GooglePlacesService(session)
-                result = await service.enrich_milestones(milestones)
-                await session.commit()
-                return result
-        finally:
-            await engine.dispose()
+        async with get_background_session() as session:
+            service = GooglePlacesService(session)
+            return await service.enrich_milestones(milestones)
 
-    return asyncio.run(_enrich())
+    return run_async_safe(_enrich())
 
 
 async def enrich_map_pois_with_google_places(
@@ -512,8 +585,8 @@ async def enrich_map_pois_with_google_places(
     Enrich POIs in a map with Google Places data (ratings).
 
     This function fetches POIs for the given map from the database,
-    enriches eligible POIs (restaurants, hotels, cafes, etc.) with
-    Google Places ratings, and updates them in the database.
+    looks up eligible POIs (restaurants, hotels, cafes, etc.) on Google
+    Places concurrently, and stores the ratings with one bulk update.
 
     Args:
         session: Database session
@@ -524,6 +597,7 @@ async def enrich_map_pois_with_google_places(
     """
     from uuid import UUID
     from api.database.repositories.map_poi import MapPOIRepository
+    from api.database.repositories.poi import POIRepository
     from api.models.road_models import MilestoneType
 
     settings = get_settings()
@@ -557,8 +631,7 @@ async def enrich_map_pois_with_google_places(
     map_pois = await map_poi_repo.get_pois_for_map(UUID(map_id), include_poi_details=True)
     db_pois = [mp.poi for mp in map_pois if mp.poi]
 
-    enriched_count = 0
-
+    candidates = []
     for db_poi in db_pois:
         # Check if this POI type is enrichable
         milestone_type = TYPE_TO_MILESTONE.get(db_poi.type)
@@ -569,30 +642,31 @@ async def enrich_map_pois_with_google_places(
         if db_poi.rating is not None:
             continue
 
-        # Get Google Places data
-        try:
-            place_data = await service.get_place_data(
-                osm_poi_id=db_poi.osm_id or str(db_poi.id),
-                name=db_poi.name,
-                latitude=float(db_poi.latitude),
-                longitude=float(db_poi.longitude),
-                poi_type=milestone_type,
-            )
-
-            if place_data and place_data.rating is not None:
-                # Update POI with Google Places data
-                db_poi.rating = place_data.rating
-                db_poi.rating_count = place_data.rating_count
-                db_poi.google_maps_uri = place_data.google_maps_uri
-                if "google_places" not in (db_poi.enriched_by or []):
-                    db_poi.enriched_by = (db_poi.enriched_by or []) + ["google_places"]
-                enriched_count += 1
-
-            # Rate limiting
-            await asyncio.sleep(0.1)
-
-        except Exception as e:
-            logger.warning(f"Error enriching POI {db_poi.id} with Google Places: {e}")
+        candidates.append((db_poi, PlaceQuery(
+            osm_poi_id=db_poi.osm_id or str(db_poi.id),
+            name=db_poi.name,
+            latitude=float(db_poi.latitude),
+            longitude=float(db_poi.longitude),
+            poi_type=milestone_type,
+        )))
+
+    places = await service.get_places_data([query for _, query in candidates])
+
+    updates = []
+    for db_poi, query in candidates:
+        place_data = places.get(query.osm_poi_id)
+        if place_data and place_data.rating is not None:
+            updates.append({
+                "id": db_poi.id,
+                "rating": place_data.rating,
+                "rating_count": place_data.rating_count,
+                "google_maps_uri": place_data.google_maps_uri,
+            })
+
+    # One UPDATE for the whole map instead of per-POI ORM writes
+    enriched_count = 0
+    if updates:
+        enriched_count = await POIRepository(session).bulk_update_google_places(updates)
 
     logger.info(
         f"Google Places enrichment: {enriched_count} POIs enriched "
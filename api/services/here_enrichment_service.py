@@ -17,9 +17,25 @@ from api.database.models.poi import POI as DBPoi
 from api.database.repositories.poi import POIRepository
 from api.providers.here.provider import HEREProvider
 from api.providers.models import GeoLocation, POI, POICategory
+from api.utils.async_utils import AsyncRateLimiter
 
 logger = logging.getLogger(__name__)
 
+# Shared by all services and event loops so the quota is respected globally
+_rate_limiter: Optional[AsyncRateLimiter] = None
+
+
+def _get_rate_limiter() -> AsyncRateLimiter:
+    """Get the HERE enrichment rate limiter, creating it from settings."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        settings = get_settings()
+        _rate_limiter = AsyncRateLimiter(
+            settings.here_enrichment_rate_limit,
+            burst=settings.here_enrichment_rate_burst,
+        )
+    return _rate_limiter
+
 
 @dataclass
 class HereEnrichmentResult:
@@ -32,6 +48,7 @@ class HereEnrichmentResult:
     phone: Optional[str] = None
     website: Optional[str] = None
     opening_hours: Optional[str] = None
+    here_data: Optional[dict] = None
     match_distance_meters: Optional[float] = None
     error: Optional[str] = None
 
@@ -88,7 +105,7 @@ class HereEnrichmentService:
     def here_provider(self) -> HEREProvider:
         """Lazy initialization of HERE provider."""
         if self._here_provider is None:
-            self._here_provider = HEREProvider()
+            self._here_provider = HEREProvider(rate_limiter=_get_rate_limiter())
         return self._here_provider
 
     def is_enabled(self) -> bool:
@@ -108,7 +125,10 @@ class HereEnrichmentService:
         search_radius: float = 100.0,
     ) -> HereEnrichmentResult:
         """
-        Enrich a single POI with HERE Maps data.
+        Match a single POI against HERE Maps.
+
+        The result is not written to the database; enrich_pois stores the
+        results of a whole batch at once.
 
         Args:
             poi: Database POI to enrich
@@ -196,18 +216,6 @@ class HereEnrichmentService:
                     else:
                         opening_hours_str = str(general_hours)
 
-            # Update POI in database
-            if self.poi_repo:
-                await self.poi_repo.update_with_here_data(
-                    poi=poi,
-                    here_id=here_id,
-                    here_data=here_data,
-                    phone=here_poi.phone,
-                    website=here_poi.website,
-                    opening_hours=opening_hours_str,
-                )
-                logger.info(f"Enriched POI {poi.name} with HERE data (here_id={here_id})")
-
             return HereEnrichmentResult(
                 poi_id=str(poi.id),
                 osm_id=poi.osm_id,
@@ -216,6 +224,7 @@ class HereEnrichmentService:
                 phone=here_poi.phone,
                 website=here_poi.website,
                 opening_hours=opening_hours_str,
+                here_data=here_data,
                 match_distance_meters=distance
             )
 
@@ -327,15 +336,20 @@ class HereEnrichmentService:
         self,
         pois: List[DBPoi],
         search_radius: float = 100.0,
-        delay_between_requests: float = 0.2,
+        max_concurrency: Optional[int] = None,
     ) -> List[HereEnrichmentResult]:
         """
         Enrich a list of POIs with HERE Maps data.
 
+        POIs are matched concurrently (paced by the shared HERE enrichment
+        rate limiter) and, when the service has a session, the matches are
+        stored with one bulk update.
+
         Args:
             pois: List of database POIs to enrich
             search_radius: Search radius in meters (default 100m)
-            delay_between_requests: Delay between API calls in seconds
+            max_concurrency: Maximum HERE requests in flight
+                (default: ENRICHMENT_MAX_CONCURRENCY)
 
         Returns:
             List of enrichment results
@@ -344,21 +358,35 @@ class HereEnrichmentService:
             logger.warning("HERE Maps enrichment is disabled")
             return []
 
-        results = []
-        enrichable_count = 0
-
-        for poi in pois:
-            if self.should_enrich(poi):
-                enrichable_count += 1
-                result = await self.enrich_poi(poi, search_radius)
-                results.append(result)
-
-                # Rate limiting
-                await asyncio.sleep(delay_between_requests)
+        enrichable = [poi for poi in pois if self.should_enrich(poi)]
+        if max_concurrency is None:
+            max_concurrency = self.settings.enrichment_max_concurrency
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _enrich(poi: DBPoi) -> HereEnrichmentResult:
+            async with semaphore:
+                return await self.enrich_poi(poi, search_radius)
+
+        results = list(await asyncio.gather(*(_enrich(poi) for poi in enrichable)))
+
+        updates = [
+            {
+                "id": poi.id,
+                "here_id": result.here_id,
+                "here_data": result.here_data,
+                "phone": result.phone,
+                "website": result.website,
+                "opening_hours": result.opening_hours,
+            }
+            for poi, result in zip(enrichable, results)
+            if result.matched and result.here_id and result.here_data is not None
+        ]
+        if self.poi_repo and updates:
+            await self.poi_repo.bulk_update_here_data(updates)
 
         logger.info(
             f"HERE enrichment completed: {len([r for r in results if r.matched])} matched "
-            f"out of {enrichable_count} enrichable POIs"
+            f"out of {len(enrichable)} enrichable POIs"
         )
         return results
 
@@ -7,6 +7,7 @@ This service handles:
 - Calculating junction coordinates, side, and access distance
 """
 
+import asyncio
 import logging
 from dataclasses import dataclass
 from decimal import Decimal
@@ -22,6 +23,7 @@ from api.utils.geo_utils import (
     calculate_distance_meters,
     interpolate_coordinate_at_distance,
 )
+from api.utils.route_index import RouteIndex
 
 logger = logging.getLogger(__name__)
 
@@ -77,6 +79,11 @@ class JunctionCalculationService:
     - Finding the optimal junction point (with 10km lookback)
     - Determining which side of the road a POI is on
     - Calculating access route distance
+
+    Nearest-point queries against the main route go through a RouteIndex,
+    built once per route geometry and reused for every POI of the map.
+    Access routes are memoized per (lookback point, POI) pair, so concurrent
+    calculations that need the same route share one request.
     """
 
     # Default lookback distance in km for junction calculation
@@ -93,6 +100,32 @@ class JunctionCalculationService:
             geo_provider: Geographic provider for routing (optional, for access routes)
         """
         self.geo_provider = geo_provider
+        self._route_index: Optional[RouteIndex] = None
+        # (lookback_lat, lookback_lon, poi_lat, poi_lon) -> access route task
+        self._access_routes: Dict[Tuple[float, float, float, float], "asyncio.Future[Optional[Route]]"] = {}
+
+    def get_route_index(self, route_geometry: List[Tuple[float, float]]) -> RouteIndex:
+        """
+        Get the spatial index for a route geometry, building it on first use.
+
+        The index of the last geometry is kept, so all POIs of a map assembly
+        (which share the same geometry list) reuse a single index.
+
+        Args:
+            route_geometry: Route geometry as [(lat, lon), ...]
+
+        Returns:
+            RouteIndex for the geometry
+        """
+        index = self._route_index
+        if (
+            index is None
+            or index.geometry is not route_geometry
+            or len(index) != len(route_geometry)
+        ):
+            index = RouteIndex(route_geometry)
+            self._route_index = index
+        return index
 
     def aggregate_search_points(
         self,
@@ -202,25 +235,8 @@ class JunctionCalculationService:
         Returns:
             JunctionResult with calculated junction data, or None if calculation fails
         """
-        # Calculate approximate POI distance from origin
-        segment_start_km = float(map_segment.distance_from_origin_km)
-        sp_index = segment_poi.search_point_index
         straight_line_distance_m = segment_poi.straight_line_distance_m
 
-        # Find the search point that discovered this POI
-        discovery_sp = None
-        for sp in global_sps:
-            if (sp.segment_id == segment_poi.segment_id and
-                sp.segment_sp_index == sp_index):
-                discovery_sp = sp
-                break
-
-        if not discovery_sp:
-            # Estimate POI distance based on segment start + search point index
-            poi_approx_distance_km = segment_start_km + (sp_index * 1.0)  # 1km per SP
-        else:
-            poi_approx_distance_km = discovery_sp.distance_from_map_origin_km
-
         # Check if POI is close enough to not need access route calculation
         if straight_line_distance_m <= self.NEARBY_THRESHOLD_M:
             # For nearby POIs, junction is the closest point on route
@@ -244,9 +260,7 @@ class JunctionCalculationService:
             )
 
         # For distant POIs, must calculate access route
-        lookback_sp = self.find_lookback_point(
-            poi_approx_distance_km, global_sps, self.DEFAULT_LOOKBACK_KM
-        )
+        lookback_sp = self._find_poi_lookback_point(segment_poi, map_segment, global_sps)
 
         if not lookback_sp:
             logger.warning(f"No lookback point found for POI at ({poi_lat}, {poi_lon})")
@@ -270,6 +284,131 @@ class JunctionCalculationService:
 
         return junction_result
 
+    def _find_poi_lookback_point(
+        self,
+        segment_poi: SegmentPOI,
+        map_segment: MapSegment,
+        global_sps: List[GlobalSearchPoint],
+    ) -> Optional[GlobalSearchPoint]:
+        """
+        Find the lookback search point an access route to a POI starts from.
+
+        Args:
+            segment_poi: SegmentPOI association with discovery data
+            map_segment: MapSegment with segment position in map
+            global_sps: All search points with global distances
+
+        Returns:
+            Lookback GlobalSearchPoint, or None if there are no search points
+        """
+        # Calculate approximate POI distance from origin
+        segment_start_km = float(map_segment.distance_from_origin_km)
+        sp_index = segment_poi.search_point_index
+
+        # Find the search point that discovered this POI
+        discovery_sp = None
+        for sp in global_sps:
+            if (sp.segment_id == segment_poi.segment_id and
+                sp.segment_sp_index == sp_index):
+                discovery_sp = sp
+                break
+
+        if not discovery_sp:
+            # Estimate POI distance based on segment start + search point index
+            poi_approx_distance_km = segment_start_km + (sp_index * 1.0)  # 1km per SP
+        else:
+            poi_approx_distance_km = discovery_sp.distance_from_map_origin_km
+
+        return self.find_lookback_point(
+            poi_approx_distance_km, global_sps, self.DEFAULT_LOOKBACK_KM
+        )
+
+    async def prefetch_access_routes(
+        self,
+        pois: List[Tuple[float, float, SegmentPOI, MapSegment]],
+        global_sps: List[GlobalSearchPoint],
+        max_concurrency: int = 1,
+    ) -> int:
+        """
+        Fetch access routes for many POIs, grouped by lookback point.
+
+        Distant POIs that share a lookback point are routed with one
+        ``calculate_routes_many`` call per group instead of one request each.
+        Fetched routes seed the access route memo, so the following
+        ``calculate_junction`` calls reuse them. POIs whose batched route
+        failed are left out and fall back to an individual request.
+
+        Args:
+            pois: (poi_lat, poi_lon, SegmentPOI, MapSegment) tuples
+            global_sps: All search points with global distances
+            max_concurrency: Maximum groups requested at once
+
+        Returns:
+            Number of access routes fetched
+        """
+        if not self.geo_provider:
+            return 0
+
+        # lookback coords -> POI coords needing a route from it (deduplicated)
+        groups: Dict[Tuple[float, float], List[Tuple[float, float]]] = {}
+        for poi_lat, poi_lon, segment_poi, map_segment in pois:
+            if segment_poi.straight_line_distance_m <= self.NEARBY_THRESHOLD_M:
+                continue
+            lookback_sp = self._find_poi_lookback_point(segment_poi, map_segment, global_sps)
+            if not lookback_sp:
+                continue
+            lookback_coords = (lookback_sp.lat, lookback_sp.lon)
+            key = (lookback_coords[0], lookback_coords[1], poi_lat, poi_lon)
+            group = groups.setdefault(lookback_coords, [])
+            if key not in self._access_routes and (poi_lat, poi_lon) not in group:
+                group.append((poi_lat, poi_lon))
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        loop = asyncio.get_running_loop()
+
+        async def _fetch_group(
+            lookback_coords: Tuple[float, float],
+            poi_coords: List[Tuple[float, float]],
+        ) -> int:
+            origin = GeoLocation(latitude=lookback_coords[0], longitude=lookback_coords[1])
+            destinations = [
+                GeoLocation(latitude=lat, longitude=lon) for lat, lon in poi_coords
+            ]
+            async with semaphore:
+                try:
+                    routes = await self.geo_provider.calculate_routes_many(
+                        origin, destinations
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to fetch batched access routes: {e}")
+                    return 0
+
+            fetched = 0
+            for (poi_lat, poi_lon), route in zip(poi_coords, routes):
+                if route is None:
+                    continue
+                future = loop.create_future()
+                future.set_result(route)
+                self._access_routes.setdefault(
+                    (lookback_coords[0], lookback_coords[1], poi_lat, poi_lon), future
+                )
+                fetched += 1
+            return fetched
+
+        counts = await asyncio.gather(
+            *(
+                _fetch_group(lookback_coords, poi_coords)
+                for lookback_coords, poi_coords in groups.items()
+                if poi_coords
+            )
+        )
+        fetched = sum(counts)
+        logger.info(
+            f"Fetched {fetched} access routes for "
+            f"{sum(len(c) for c in groups.values())} POIs in {len(counts)} lookback groups"
+        )
+        return fetched
+
     def _find_closest_route_point(
         self,
         lat: float,
@@ -280,16 +419,8 @@ class JunctionCalculationService:
         if not route_geometry:
             return (lat, lon)
 
-        best_point = route_geometry[0]
-        best_distance = float('inf')
-
-        for point in route_geometry:
-            distance = calculate_distance_meters(lat, lon, point[0], point[1])
-            if distance < best_distance:
-                best_distance = distance
-                best_point = point
-
-        return best_point
+        index = self.get_route_index(route_geometry).nearest_index(lat, lon)
+        return route_geometry[index]
 
     def _calculate_distance_along_route(
         self,
@@ -301,28 +432,9 @@ class JunctionCalculationService:
         if not route_geometry:
             return 0.0
 
-        # Find the closest segment and calculate cumulative distance
-        cumulative_distance = 0.0
-        best_match_distance = 0.0
-        best_match_cumulative = 0.0
-
-        for i, route_point in enumerate(route_geometry):
-            if i > 0:
-                prev = route_geometry[i - 1]
-                segment_dist = calculate_distance_meters(
-                    prev[0], prev[1], route_point[0], route_point[1]
-                )
-                cumulative_distance += segment_dist / 1000.0
-
-            point_dist = calculate_distance_meters(
-                point[0], point[1], route_point[0], route_point[1]
-            )
-
-            if i == 0 or point_dist < best_match_distance:
-                best_match_distance = point_dist
-                best_match_cumulative = cumulative_distance
-
-        return best_match_cumulative
+        # Cumulative distance of the closest route point
+        route_index = self.get_route_index(route_geometry)
+        return route_index.cumulative_km[route_index.nearest_index(point[0], point[1])]
 
     def _determine_side(
         self,
@@ -340,15 +452,9 @@ class JunctionCalculationService:
             return "center"
 
         # Find the junction index in route
-        junction_idx = 0
-        best_dist = float('inf')
-        for i, point in enumerate(route_geometry):
-            dist = calculate_distance_meters(
-                junction[0], junction[1], point[0], point[1]
-            )
-            if dist < best_dist:
-                best_dist = dist
-                junction_idx = i
+        junction_idx = self.get_route_index(route_geometry).nearest_index(
+            junction[0], junction[1]
+        )
 
         # Get direction vector (from previous point to next point)
         prev_idx = max(0, junction_idx - 1)
@@ -402,15 +508,9 @@ class JunctionCalculationService:
             return "center"
 
         # Find junction index in main route
-        junction_idx = 0
-        best_dist = float('inf')
-        for i, point in enumerate(route_geometry):
-            dist = calculate_distance_meters(
-                junction[0], junction[1], point[0], point[1]
-            )
-            if dist < best_dist:
-                best_dist = dist
-                junction_idx = i
+        junction_idx = self.get_route_index(route_geometry).nearest_index(
+            junction[0], junction[1]
+        )
 
         # Get main route direction vector
         prev_idx = max(0, junction_idx - 1)
@@ -471,6 +571,42 @@ class JunctionCalculationService:
         else:
             return "right"
 
+    async def _get_access_route(
+        self,
+        lookback_coords: Tuple[float, float],
+        poi_lat: float,
+        poi_lon: float,
+    ) -> Optional[Route]:
+        """
+        Route from a lookback point to a POI, fetching each pair only once.
+
+        The first caller for a pair starts the request; concurrent and later
+        callers await the same task. Failures propagate to every awaiter.
+
+        Args:
+            lookback_coords: Lookback point (lat, lon)
+            poi_lat: POI latitude
+            poi_lon: POI longitude
+
+        Returns:
+            Access route, or None if the provider found no route
+        """
+        key = (lookback_coords[0], lookback_coords[1], poi_lat, poi_lon)
+        task = self._access_routes.get(key)
+        if task is None:
+            origin = GeoLocation(
+                latitude=lookback_coords[0],
+                longitude=lookback_coords[1]
+            )
+            destination = GeoLocation(latitude=poi_lat, longitude=poi_lon)
+            task = asyncio.ensure_future(
+                self.geo_provider.calculate_route(origin, destination)
+            )
+            self._access_routes[key] = task
+        else:
+            logger.debug(f"Reusing access route for POI at ({poi_lat}, {poi_lon})")
+        return await task
+
     async def _calculate_junction_with_routing(
         self,
         poi_lat: float,
@@ -490,14 +626,8 @@ class JunctionCalculationService:
 
         try:
             # Route from lookback point to POI
-            origin = GeoLocation(
-                latitude=lookback_coords[0],
-                longitude=lookback_coords[1]
-            )
-            destination = GeoLocation(latitude=poi_lat, longitude=poi_lon)
-
-            access_route = await self.geo_provider.calculate_route(
-                origin, destination
+            access_route = await self._get_access_route(
+                lookback_coords, poi_lat, poi_lon
             )
 
             if not access_route or not access_route.geometry:
@@ -562,6 +692,7 @@ class JunctionCalculationService:
         The algorithm:
         1. Iterates through access route points in order
         2. For each point, checks if it's within 50m of any main route point
+           (nearest main route point comes from the route index)
         3. Tracks all overlapping segments
         4. Returns the end of the LAST overlapping segment (closest to POI)
 
@@ -570,17 +701,7 @@ class JunctionCalculationService:
         if not access_geometry or not main_geometry:
             return None, 0.0
 
-        # Pre-calculate cumulative distances along main route
-        main_cumulative_distances = [0.0]
-        for i in range(1, len(main_geometry)):
-            prev = main_geometry[i - 1]
-            curr = main_geometry[i]
-            segment_dist = calculate_distance_meters(
-                prev[0], prev[1], curr[0], curr[1]
-            )
-            main_cumulative_distances.append(
-                main_cumulative_distances[-1] + segment_dist / 1000.0
-            )
+        route_index = self.get_route_index(main_geometry)
 
         # Track the last (most recent) point where routes overlap
         last_intersection = None
@@ -590,22 +711,14 @@ class JunctionCalculationService:
         # Iterate through access route points to find where it leaves the main route
         for access_point in access_geometry:
             # Find closest point on main route
-            closest_distance = float('inf')
-            closest_main_point = None
-            closest_main_distance_km = 0.0
-
-            for i, main_point in enumerate(main_geometry):
-                dist = calculate_distance_meters(
-                    main_point[0], main_point[1],
-                    access_point[0], access_point[1]
-                )
-                if dist < closest_distance:
-                    closest_distance = dist
-                    closest_main_point = main_point
-                    closest_main_distance_km = main_cumulative_distances[i]
+            closest_idx, closest_distance = route_index.nearest(
+                access_point[0], access_point[1]
+            )
+            closest_main_point = main_geometry[closest_idx]
+            closest_main_distance_km = route_index.cumulative_km[closest_idx]
 
             # Check if this access point is within tolerance of main route
-            is_within_tolerance = closest_distance < 50 and closest_main_point is not None
+            is_within_tolerance = closest_distance < 50
 
             if is_within_tolerance:
                 in_overlapping_segment = True
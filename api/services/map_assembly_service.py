@@ -8,6 +8,7 @@ This service handles:
 - Calculating distances from map origin
 """
 
+import asyncio
 import logging
 from decimal import Decimal
 from typing import Dict, List, Optional, Set, Tuple
@@ -28,12 +29,20 @@ from api.database.repositories.poi import POIRepository
 from api.database.repositories.segment_poi import SegmentPOIRepository
 from api.models.road_models import Coordinates, MapSegmentResponse
 from api.providers.base import GeoProvider
+from api.providers.settings import get_settings
 from api.services.junction_calculation_service import (
     GlobalSearchPoint,
     JunctionCalculationService,
     JunctionResult,
 )
+from api.services.municipality_gazetteer import get_municipality_gazetteer
 from api.services.poi_debug_service import POIDebugDataCollector
+from api.utils.polyline import (
+    GEOMETRY_FORMAT_COORDINATES,
+    GEOMETRY_FORMAT_POLYLINE,
+    geometry_to_coordinates,
+    geometry_to_polyline,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -77,6 +86,7 @@ class MapAssemblyService:
         route_total_km: float,
         debug_collector: Optional[POIDebugDataCollector] = None,
         origin_city: Optional[str] = None,
+        segment_pois_by_segment: Optional[Dict[UUID, List[SegmentPOI]]] = None,
     ) -> Tuple[int, int, Dict[str, UUID]]:
         """
         Assemble a map from a list of route segments.
@@ -96,6 +106,9 @@ class MapAssemblyService:
             route_total_km: Total route length in km
             debug_collector: Optional collector for POI debug data
             origin_city: Optional origin city name to filter out POIs
+            segment_pois_by_segment: Optional SegmentPOIs (with POI loaded) per
+                segment ID, as loaded during segment processing. When given,
+                they are reused instead of being queried again.
 
         Returns:
             Tuple of (num_map_segments_created, num_map_pois_created, poi_to_map_poi_mapping)
@@ -116,12 +129,12 @@ class MapAssemblyService:
         logger.info(f"Aggregated {len(global_sps)} global search points")
 
         # Step 3: Collect all SegmentPOIs from all segments
+        segment_pois_by_segment = await self._load_segment_pois(
+            [ms.segment_id for ms in map_segments], segment_pois_by_segment
+        )
         all_segment_pois: List[Tuple[SegmentPOI, MapSegment]] = []
         for map_segment in map_segments:
-            segment_pois = await self.segment_poi_repo.get_by_segment_with_pois(
-                map_segment.segment_id
-            )
-            for sp in segment_pois:
+            for sp in segment_pois_by_segment.get(map_segment.segment_id, []):
                 all_segment_pois.append((sp, map_segment))
 
         logger.info(f"Found {len(all_segment_pois)} SegmentPOIs across all segments")
@@ -139,6 +152,45 @@ class MapAssemblyService:
 
         return len(map_segments), num_pois, poi_to_map_poi
 
+    async def _load_segment_pois(
+        self,
+        segment_ids: List[UUID],
+        preloaded: Optional[Dict[UUID, List[SegmentPOI]]] = None,
+    ) -> Dict[UUID, List[SegmentPOI]]:
+        """
+        Get the SegmentPOIs of the given segments, with their POI loaded.
+
+        Preloaded SegmentPOIs come from another (already closed) session, so
+        they are merged into this one without a database round trip; changes
+        made during assembly (like a POI city found by reverse geocoding) are
+        then saved with the map. Segments missing from preloaded are fetched
+        with a single bulk query.
+
+        Args:
+            segment_ids: Segment IDs of the map
+            preloaded: Optional SegmentPOIs already loaded per segment ID
+
+        Returns:
+            Dictionary mapping segment ID -> SegmentPOIs
+        """
+        preloaded = preloaded or {}
+        by_segment: Dict[UUID, List[SegmentPOI]] = {}
+
+        for segment_id in segment_ids:
+            if segment_id in preloaded and segment_id not in by_segment:
+                by_segment[segment_id] = [
+                    await self.session.merge(sp, load=False)
+                    for sp in preloaded[segment_id]
+                ]
+
+        missing = list(dict.fromkeys(sid for sid in segment_ids if sid not in by_segment))
+        if missing:
+            by_segment.update(
+                await self.segment_poi_repo.get_by_segments_with_pois(missing)
+            )
+
+        return by_segment
+
     async def _create_map_segments(
         self,
         map_id: UUID,
@@ -205,9 +257,9 @@ class MapAssemblyService:
             if poi.id not in unique_pois:
                 unique_pois[poi.id] = (poi, segment_poi, map_segment)
 
-        # Enrich POIs without city via reverse geocoding
+        # Enrich POIs without city (offline gazetteer, reverse geocoding fallback)
         pois_needing_city = [poi for poi, _, _ in unique_pois.values() if not poi.city]
-        if pois_needing_city and self.junction_service.geo_provider:
+        if pois_needing_city:
             await self._enrich_pois_with_city(pois_needing_city)
 
         # Step 2: Filter out POIs in origin city and disabled POIs BEFORE junction calculation
@@ -247,24 +299,17 @@ class MapAssemblyService:
             logger.info(f"Filtered out {filtered_out_count} POIs in origin city '{origin_city}'")
 
         # Step 3: Calculate junctions only for filtered POIs
+        # Distant POIs need an access route request each, so calculations run
+        # concurrently (bounded); results are merged below in input order
+        junctions = await self._calculate_junctions(
+            filtered_segment_pois, route_geometry, route_total_km, global_sps
+        )
+
         best_junction_for_poi: Dict[UUID, Tuple[JunctionResult, SegmentPOI, MapSegment, POI]] = {}
         skipped_pois = 0
 
-        for segment_poi, map_segment in filtered_segment_pois:
+        for (segment_poi, map_segment), junction in zip(filtered_segment_pois, junctions):
             poi = segment_poi.poi
-            if not poi:
-                continue
-
-            # Calculate junction for this POI
-            junction = await self.junction_service.calculate_junction(
-                poi_lat=poi.latitude,
-                poi_lon=poi.longitude,
-                segment_poi=segment_poi,
-                map_segment=map_segment,
-                route_geometry=route_geometry,
-                route_total_km=route_total_km,
-                global_sps=global_sps,
-            )
 
             # Skip POI if junction calculation failed
             if junction is None:
@@ -330,6 +375,75 @@ class MapAssemblyService:
 
         return len(map_pois), poi_to_map_poi
 
+    async def _calculate_junctions(
+        self,
+        segment_pois_with_map_segments: List[Tuple[SegmentPOI, MapSegment]],
+        route_geometry: List[Tuple[float, float]],
+        route_total_km: float,
+        global_sps: List[GlobalSearchPoint],
+        max_concurrency: Optional[int] = None,
+    ) -> List[Optional[JunctionResult]]:
+        """
+        Calculate junctions for many SegmentPOIs with a bounded number in flight.
+
+        With JUNCTION_BATCH_ROUTING enabled, access routes are first fetched
+        in batches grouped by lookback point.
+
+        Args:
+            segment_pois_with_map_segments: (SegmentPOI, MapSegment) tuples whose
+                POI is loaded
+            route_geometry: Full route geometry
+            route_total_km: Total route length
+            global_sps: Aggregated search points
+            max_concurrency: Maximum calculations at once
+                (defaults to JUNCTION_MAX_CONCURRENCY)
+
+        Returns:
+            One JunctionResult (or None if calculation failed) per input tuple,
+            in the same order
+        """
+        settings = get_settings()
+        if max_concurrency is None:
+            max_concurrency = settings.junction_max_concurrency
+
+        if settings.junction_batch_routing:
+            # Route POIs sharing a lookback point together; calculate_junction
+            # then reuses the prefetched access routes
+            await self.junction_service.prefetch_access_routes(
+                [
+                    (segment_poi.poi.latitude, segment_poi.poi.longitude, segment_poi, map_segment)
+                    for segment_poi, map_segment in segment_pois_with_map_segments
+                ],
+                global_sps,
+                max_concurrency=max_concurrency,
+            )
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _calculate(
+            segment_poi: SegmentPOI, map_segment: MapSegment
+        ) -> Optional[JunctionResult]:
+            poi = segment_poi.poi
+            async with semaphore:
+                return await self.junction_service.calculate_junction(
+                    poi_lat=poi.latitude,
+                    poi_lon=poi.longitude,
+                    segment_poi=segment_poi,
+                    map_segment=map_segment,
+                    route_geometry=route_geometry,
+                    route_total_km=route_total_km,
+                    global_sps=global_sps,
+                )
+
+        return list(
+            await asyncio.gather(
+                *(
+                    _calculate(segment_poi, map_segment)
+                    for segment_poi, map_segment in segment_pois_with_map_segments
+                )
+            )
+        )
+
     def _collect_debug_data(
         self,
         debug_collector: POIDebugDataCollector,
@@ -629,7 +743,10 @@ class MapAssemblyService:
 
     async def _enrich_pois_with_city(self, pois: List[POI]) -> None:
         """
-        Enrich POIs with city information via reverse geocoding.
+        Enrich POIs with city information.
+
+        Cities come from the offline municipality gazetteer; reverse
+        geocoding is only used for the POIs it cannot place.
 
         This method is called only for POIs that:
         1. Don't already have city information
@@ -638,28 +755,46 @@ class MapAssemblyService:
         Args:
             pois: List of POI models that need city enrichment
         """
-        geo_provider = self.junction_service.geo_provider
-        if not geo_provider:
-            return
-
+        gazetteer = get_municipality_gazetteer()
         enriched_count = 0
+        unresolved = []
         for poi in pois:
-            try:
-                reverse_loc = await geo_provider.reverse_geocode(
-                    float(poi.latitude),
-                    float(poi.longitude),
-                    poi_name=poi.name,
+            city = await gazetteer.lookup_city(float(poi.latitude), float(poi.longitude))
+            if city:
+                poi.city = city
+                enriched_count += 1
+            else:
+                unresolved.append(poi)
+
+        geo_provider = self.junction_service.geo_provider
+        if unresolved and geo_provider:
+            if enriched_count > 0:
+                logger.info(
+                    f"Reverse geocoding {len(unresolved)} POIs outside known municipalities"
                 )
-                if reverse_loc and reverse_loc.city:
-                    poi.city = reverse_loc.city
-                    enriched_count += 1
-            except Exception as e:
-                logger.debug(f"Reverse geocoding failed for POI {poi.name}: {e}")
+            for poi in unresolved:
+                try:
+                    reverse_loc = await geo_provider.reverse_geocode(
+                        float(poi.latitude),
+                        float(poi.longitude),
+                        poi_name=poi.name,
+                    )
+                    if reverse_loc and reverse_loc.city:
+                        poi.city = reverse_loc.city
+                        enriched_count += 1
+                except Exception as e:
+                    logger.debug(f"Reverse geocoding failed for POI {poi.name}: {e}")
 
         if enriched_count > 0:
             logger.info(f"Enriched {enriched_count}/{len(pois)} POIs with city information")
+            # Other maps showing these POIs now serve outdated cached responses
+            await self.poi_repo.touch_maps([poi.id for poi in pois if poi.city])
 
-    async def get_segments_for_response(self, map_id: UUID) -> List[MapSegmentResponse]:
+    async def get_segments_for_response(
+        self,
+        map_id: UUID,
+        geometry_format: str = GEOMETRY_FORMAT_COORDINATES,
+    ) -> List[MapSegmentResponse]:
         """
         Get segments for a map formatted as MapSegmentResponse objects.
 
@@ -668,6 +803,8 @@ class MapAssemblyService:
 
         Args:
             map_id: ID of the map
+            geometry_format: 'coordinates' (list of Coordinates, the legacy
+                shape) or 'polyline6' (one encoded polyline string per segment)
 
         Returns:
             List of MapSegmentResponse objects with full geometry and distances
@@ -680,14 +817,16 @@ class MapAssemblyService:
             if segment is None:
                 continue
 
-            # Convert geometry from [[lat, lon], ...] to List[Coordinates]
-            geometry_coords = []
-            if segment.geometry:
-                for point in segment.geometry:
-                    if isinstance(point, (list, tuple)) and len(point) >= 2:
-                        geometry_coords.append(
-                            Coordinates(latitude=point[0], longitude=point[1])
-                        )
+            if geometry_format == GEOMETRY_FORMAT_POLYLINE:
+                # Polyline-stored geometries are passed through untouched
+                geometry = geometry_to_polyline(segment.geometry)
+            else:
+                # Convert geometry (stored as [[lat, lon], ...] or polyline)
+                # to List[Coordinates]
+                geometry = [
+                    Coordinates(latitude=lat, longitude=lon)
+                    for lat, lon in geometry_to_coordinates(segment.geometry)
+                ]
 
             segments_response.append(
                 MapSegmentResponse(
@@ -695,7 +834,8 @@ class MapAssemblyService:
                     sequence_order=ms.sequence_order,
                     distance_from_origin_km=float(ms.distance_from_origin_km),
                     length_km=float(segment.length_km),
-                    geometry=geometry_coords,
+                    geometry=geometry,
+                    geometry_format=geometry_format,
                     road_name=segment.road_name,
                     start_lat=float(segment.start_lat),
                     start_lon=float(segment.start_lon),
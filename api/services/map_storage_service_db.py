@@ -13,6 +13,7 @@ This service handles:
 Maps are now global/shared - multiple users can have the same map in their collection.
 """
 
+import hashlib
 import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
@@ -20,12 +21,19 @@ from uuid import UUID, uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api.database.connection import get_background_session
 from api.database.models.map import Map
 from api.database.models.map_poi import MapPOI
+from api.database.models.map_response_cache import MapResponseCache
 from api.database.models.poi import POI
 from api.database.models.route_segment import RouteSegment
 from api.database.models.user_map import UserMap
-from api.database.repositories import MapPOIRepository, MapRepository, POIRepository
+from api.database.repositories import (
+    MapPOIRepository,
+    MapRepository,
+    MapResponseCacheRepository,
+    POIRepository,
+)
 from api.database.repositories.user_map import UserMapRepository
 from api.providers.base import GeoProvider
 from api.services.map_assembly_service import MapAssemblyService
@@ -39,6 +47,8 @@ from api.models.road_models import (
     RoadMilestone,
     SavedMapResponse,
 )
+from api.utils.async_utils import run_async_safe
+from api.utils.polyline import GEOMETRY_FORMAT_COORDINATES
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +68,7 @@ class MapStorageServiceDB:
         self.poi_repo = POIRepository(session)
         self.map_poi_repo = MapPOIRepository(session)
         self.user_map_repo = UserMapRepository(session)
+        self.response_cache_repo = MapResponseCacheRepository(session)
         # Lazy-loaded repositories for segment operations
         self._map_segment_repo = None
         self._route_segment_repo = None
@@ -87,6 +98,7 @@ class MapStorageServiceDB:
         route_segments_data: Optional[List[Tuple[RouteSegment, bool]]] = None,
         route_geometry: Optional[List[Tuple[float, float]]] = None,
         route_total_km: Optional[float] = None,
+        segment_pois_by_segment: Optional[Dict[UUID, List[Any]]] = None,
     ) -> str:
         """
         Save a linear map to database and associate with user if provided.
@@ -99,6 +111,8 @@ class MapStorageServiceDB:
             route_segments_data: Optional list of (RouteSegment, is_new) tuples
             route_geometry: Optional full route geometry for junction calculation
             route_total_km: Optional total route length in km
+            segment_pois_by_segment: Optional SegmentPOIs already loaded per
+                segment ID (skips reloading them during assembly)
 
         Returns:
             The ID of the saved map
@@ -157,6 +171,7 @@ class MapStorageServiceDB:
                 route_total_km=route_total_km,
                 debug_collector=debug_collector,
                 origin_city=origin_city,
+                segment_pois_by_segment=segment_pois_by_segment,
             )
             logger.info(
                 f"Assembled map with {num_segments} segments and {num_pois} POIs"
@@ -187,7 +202,10 @@ class MapStorageServiceDB:
             raise
 
     async def load_map(
-        self, map_id: str, user_id: Optional[UUID] = None
+        self,
+        map_id: str,
+        user_id: Optional[UUID] = None,
+        geometry_format: str = GEOMETRY_FORMAT_COORDINATES,
     ) -> Optional[LinearMapResponse]:
         """
         Load a saved map from database.
@@ -195,6 +213,8 @@ class MapStorageServiceDB:
         Args:
             map_id: ID of the map to load
             user_id: Optional user ID to verify access (via user_maps)
+            geometry_format: Segment geometry encoding in the response,
+                'coordinates' (legacy) or 'polyline6'
 
         Returns:
             The loaded linear map, or None if not found/not accessible
@@ -217,40 +237,106 @@ class MapStorageServiceDB:
                 logger.warning(f"Mapa nao encontrado: {map_id}")
                 return None
 
-            # Load POIs with details
-            map_pois = await self.map_poi_repo.get_pois_for_map(
-                map_uuid, include_poi_details=True
+            linear_map = await self._build_linear_map(db_map, geometry_format)
+
+            logger.info(
+                f"Mapa carregado: {linear_map.origin} -> {linear_map.destination}"
             )
+            return linear_map
 
-            # Load segments from MapSegment/RouteSegment (new format)
-            assembly_service = MapAssemblyService(self.session)
-            segments = await assembly_service.get_segments_for_response(map_uuid)
+        except ValueError as e:
+            logger.warning(f"Erro de valor ao carregar mapa {map_id}: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Erro ao carregar mapa {map_id}: {e}", exc_info=True)
+            return None
 
-            # Convert POIs to milestones
-            milestones = [self._map_poi_to_milestone(map_poi) for map_poi in map_pois]
+    async def _build_linear_map(
+        self, db_map: Map, geometry_format: str
+    ) -> LinearMapResponse:
+        """
+        Assemble the LinearMapResponse of a saved map.
 
-            # Get creation date from metadata or created_at
-            creation_date = db_map.created_at
-            if db_map.metadata_ and "creation_date" in db_map.metadata_:
-                creation_date = datetime.fromisoformat(
-                    db_map.metadata_["creation_date"]
-                )
+        Args:
+            db_map: Map entity
+            geometry_format: Segment geometry encoding in the response
 
-            linear_map = LinearMapResponse(
-                id=str(db_map.id),
-                origin=db_map.origin,
-                destination=db_map.destination,
-                total_length_km=db_map.total_length_km,
-                road_id=db_map.road_id or "",
-                segments=segments,
-                milestones=milestones,
-                creation_date=creation_date,
+        Returns:
+            The assembled linear map
+        """
+        # Load POIs with details
+        map_pois = await self.map_poi_repo.get_pois_for_map(
+            db_map.id, include_poi_details=True
+        )
+
+        # Load segments from MapSegment/RouteSegment (new format)
+        assembly_service = MapAssemblyService(self.session)
+        segments = await assembly_service.get_segments_for_response(
+            db_map.id, geometry_format=geometry_format
+        )
+
+        # Convert POIs to milestones
+        milestones = [self._map_poi_to_milestone(map_poi) for map_poi in map_pois]
+
+        # Get creation date from metadata or created_at
+        creation_date = db_map.created_at
+        if db_map.metadata_ and "creation_date" in db_map.metadata_:
+            creation_date = datetime.fromisoformat(
+                db_map.metadata_["creation_date"]
             )
 
-            logger.info(
-                f"Mapa carregado: {linear_map.origin} -> {linear_map.destination}"
+        return LinearMapResponse(
+            id=str(db_map.id),
+            origin=db_map.origin,
+            destination=db_map.destination,
+            total_length_km=db_map.total_length_km,
+            road_id=db_map.road_id or "",
+            segments=segments,
+            milestones=milestones,
+            creation_date=creation_date,
+        )
+
+    async def get_map_response(
+        self,
+        map_id: str,
+        user_id: Optional[UUID] = None,
+        geometry_format: str = GEOMETRY_FORMAT_COORDINATES,
+    ) -> Optional[MapResponseCache]:
+        """
+        Get the serialized response of a saved map, from cache when possible.
+
+        A cached payload of the current map version costs one indexed read
+        (access check included); otherwise the map is assembled and the
+        result cached for the next request.
+
+        Args:
+            map_id: ID of the map to load
+            user_id: Optional user ID to verify access (via user_maps)
+            geometry_format: Segment geometry encoding in the response,
+                'coordinates' (legacy) or 'polyline6'
+
+        Returns:
+            Cache entry with etag and JSON payload, or None if not
+            found/not accessible
+        """
+        try:
+            map_uuid = UUID(map_id)
+
+            cached = await self.response_cache_repo.get_current(
+                map_uuid, geometry_format, user_id=user_id
             )
-            return linear_map
+            if cached:
+                return cached
+
+            if user_id:
+                has_access = await self.user_map_repo.user_has_map(user_id, map_uuid)
+                if not has_access:
+                    logger.warning(
+                        f"User {user_id} does not have access to map {map_id}"
+                    )
+                    return None
+
+            return await self.cache_map_response(map_id, geometry_format)
 
         except ValueError as e:
             logger.warning(f"Erro de valor ao carregar mapa {map_id}: {e}")
@@ -259,6 +345,51 @@ class MapStorageServiceDB:
             logger.error(f"Erro ao carregar mapa {map_id}: {e}", exc_info=True)
             return None
 
+    async def cache_map_response(
+        self,
+        map_id: str,
+        geometry_format: str = GEOMETRY_FORMAT_COORDINATES,
+    ) -> Optional[MapResponseCache]:
+        """
+        Assemble a saved map and store its serialized response in the cache.
+
+        Args:
+            map_id: ID of the map
+            geometry_format: Segment geometry encoding in the response
+
+        Returns:
+            The stored cache entry, or None if the map does not exist
+        """
+        map_uuid = UUID(map_id)
+        db_map = await self.map_repo.get_by_id(map_uuid)
+        if not db_map:
+            logger.warning(f"Mapa nao encontrado: {map_id}")
+            return None
+
+        # Version read before assembly: POI changes committed meanwhile
+        # leave the entry outdated instead of hiding behind it
+        map_version = await self.response_cache_repo.get_version(map_uuid)
+        linear_map = await self._build_linear_map(db_map, geometry_format)
+        payload = linear_map.model_dump_json()
+        etag = f'"{hashlib.sha256(payload.encode()).hexdigest()}"'
+
+        await self.response_cache_repo.upsert(
+            map_uuid,
+            geometry_format,
+            map_version=map_version,
+            etag=etag,
+            payload=payload,
+        )
+        logger.info(f"Resposta do mapa {map_id} armazenada em cache ({geometry_format})")
+
+        return MapResponseCache(
+            map_id=map_uuid,
+            geometry_format=geometry_format,
+            map_version=map_version,
+            etag=etag,
+            payload=payload,
+        )
+
     async def list_user_maps(self, user_id: UUID) -> List[SavedMapResponse]:
         """
         List all maps associated with a user (via user_maps).
@@ -270,42 +401,12 @@ class MapStorageServiceDB:
             List of saved map metadata, sorted by added_at (newest first)
         """
         try:
-            # Get user's map associations
-            user_maps = await self.user_map_repo.get_user_maps(user_id, limit=100)
-            saved_maps = []
-
-            for user_map in user_maps:
-                db_map = user_map.map
-
-                # Count POIs for this map
-                pois = await self.map_poi_repo.get_pois_for_map(db_map.id)
-
-                # Extract road refs from metadata
-                road_refs = []
-                if db_map.metadata_ and "road_refs" in db_map.metadata_:
-                    road_refs = db_map.metadata_["road_refs"]
-
-                # Get creation date
-                creation_date = db_map.created_at
-                if db_map.metadata_ and "creation_date" in db_map.metadata_:
-                    try:
-                        creation_date = datetime.fromisoformat(
-                            db_map.metadata_["creation_date"]
-                        )
-                    except (ValueError, TypeError):
-                        pass
-
-                saved_map = SavedMapResponse(
-                    id=str(db_map.id),
-                    name=None,
-                    origin=db_map.origin,
-                    destination=db_map.destination,
-                    total_length_km=db_map.total_length_km,
-                    creation_date=creation_date,
-                    road_refs=road_refs,
-                    milestone_count=len(pois),
-                )
-                saved_maps.append(saved_map)
+            # Get user's maps with their POI counts in one query
+            rows = await self.map_repo.get_user_maps_for_listing(user_id, limit=100)
+            saved_maps = [
+                self._to_saved_map_response(row["map"], row["poi_count"])
+                for row in rows
+            ]
 
             logger.info(f"Listados {len(saved_maps)} mapas para usuario {user_id}")
             return saved_maps
@@ -334,48 +435,14 @@ class MapStorageServiceDB:
             List of available maps
         """
         try:
-            if origin or destination:
-                # Search by location
-                search_term = origin or destination or ""
-                maps = await self.map_repo.search_by_location(search_term, limit=limit)
-            else:
-                maps = await self.map_repo.get_all_maps(skip=skip, limit=limit)
-
-            saved_maps = []
-
-            for db_map in maps:
-                # Count POIs for this map
-                pois = await self.map_poi_repo.get_pois_for_map(db_map.id)
-
-                # Count users with this map
-                user_count = await self.user_map_repo.get_map_user_count(db_map.id)
-
-                # Extract road refs from metadata
-                road_refs = []
-                if db_map.metadata_ and "road_refs" in db_map.metadata_:
-                    road_refs = db_map.metadata_["road_refs"]
-
-                # Get creation date
-                creation_date = db_map.created_at
-                if db_map.metadata_ and "creation_date" in db_map.metadata_:
-                    try:
-                        creation_date = datetime.fromisoformat(
-                            db_map.metadata_["creation_date"]
-                        )
-                    except (ValueError, TypeError):
-                        pass
-
-                saved_map = SavedMapResponse(
-                    id=str(db_map.id),
-                    name=None,
-                    origin=db_map.origin,
-                    destination=db_map.destination,
-                    total_length_km=db_map.total_length_km,
-                    creation_date=creation_date,
-                    road_refs=road_refs,
-                    milestone_count=len(pois),
-                )
-                saved_maps.append(saved_map)
+            # Maps with their POI counts in one query (optionally searched by location)
+            rows = await self.map_repo.get_maps_for_listing(
+                skip=skip, limit=limit, location=origin or destination
+            )
+            saved_maps = [
+                self._to_saved_map_response(row["map"], row["poi_count"])
+                for row in rows
+            ]
 
             logger.info(f"Listados {len(saved_maps)} mapas disponiveis")
             return saved_maps
@@ -423,63 +490,32 @@ class MapStorageServiceDB:
             return R * c
 
         try:
-            # Get more maps than needed so we can sort and filter
-            maps = await self.map_repo.get_all_maps(skip=0, limit=limit * 3)
+            # Get more maps than needed so we can sort and filter, with POI
+            # counts and origin coordinates in one query
+            rows = await self.map_repo.get_maps_for_listing(
+                skip=0, limit=limit * 3, with_origin=True
+            )
 
             saved_maps = []
             maps_with_distance = []
 
-            for db_map in maps:
-                # Count POIs for this map
-                pois = await self.map_poi_repo.get_pois_for_map(db_map.id)
-
-                # Extract road refs from metadata
-                road_refs = []
-                if db_map.metadata_ and "road_refs" in db_map.metadata_:
-                    road_refs = db_map.metadata_["road_refs"]
-
-                # Get creation date
-                creation_date = db_map.created_at
-                if db_map.metadata_ and "creation_date" in db_map.metadata_:
-                    try:
-                        creation_date = datetime.fromisoformat(
-                            db_map.metadata_["creation_date"]
-                        )
-                    except (ValueError, TypeError):
-                        pass
-
-                saved_map = SavedMapResponse(
-                    id=str(db_map.id),
-                    name=None,
-                    origin=db_map.origin,
-                    destination=db_map.destination,
-                    total_length_km=db_map.total_length_km,
-                    creation_date=creation_date,
-                    road_refs=road_refs,
-                    milestone_count=len(pois),
-                )
+            for row in rows:
+                db_map = row["map"]
+                saved_map = self._to_saved_map_response(db_map, row["poi_count"])
 
                 # Calculate distance if user location provided
                 distance = float("inf")
                 if user_lat is not None and user_lon is not None:
-                    try:
-                        # Get first segment's start point from map_segments relationship
-                        if db_map.map_segments:
-                            # Sort by sequence_order to get first segment
-                            sorted_segments = sorted(
-                                db_map.map_segments, key=lambda s: s.sequence_order
-                            )
-                            first_map_segment = sorted_segments[0]
-                            if first_map_segment.segment:
-                                origin_lat = float(first_map_segment.segment.start_lat)
-                                origin_lon = float(first_map_segment.segment.start_lon)
-                                distance = haversine_distance(
-                                    user_lat, user_lon, origin_lat, origin_lon
-                                )
-                    except (AttributeError, IndexError, TypeError) as e:
-                        logger.debug(
-                            f"Could not get coordinates for map {db_map.id}: {e}"
+                    # Origin is the start point of the map's first segment
+                    if row["origin_lat"] is not None and row["origin_lon"] is not None:
+                        distance = haversine_distance(
+                            user_lat,
+                            user_lon,
+                            float(row["origin_lat"]),
+                            float(row["origin_lon"]),
                         )
+                    else:
+                        logger.debug(f"Could not get coordinates for map {db_map.id}")
 
                 maps_with_distance.append((saved_map, distance))
 
@@ -604,6 +640,9 @@ class MapStorageServiceDB:
                     f"(map {map_id})"
                 )
 
+            # Drop the cached responses along with the map
+            await self.response_cache_repo.delete_for_map(map_uuid)
+
             # Delete the map (cascades to MapSegments, MapPOIs, etc.)
             deleted = await self.map_repo.delete_by_id(map_uuid)
 
@@ -678,6 +717,45 @@ class MapStorageServiceDB:
 
     # Helper methods for conversion
 
+    def _to_saved_map_response(
+        self, db_map: Map, milestone_count: int
+    ) -> SavedMapResponse:
+        """
+        Build the listing entry of a map.
+
+        Args:
+            db_map: Map instance
+            milestone_count: Number of POIs in the map
+
+        Returns:
+            SavedMapResponse with road refs and creation date from metadata
+        """
+        # Extract road refs from metadata
+        road_refs = []
+        if db_map.metadata_ and "road_refs" in db_map.metadata_:
+            road_refs = db_map.metadata_["road_refs"]
+
+        # Get creation date
+        creation_date = db_map.created_at
+        if db_map.metadata_ and "creation_date" in db_map.metadata_:
+            try:
+                creation_date = datetime.fromisoformat(
+                    db_map.metadata_["creation_date"]
+                )
+            except (ValueError, TypeError):
+                pass
+
+        return SavedMapResponse(
+            id=str(db_map.id),
+            name=None,
+            origin=db_map.origin,
+            destination=db_map.destination,
+            total_length_km=db_map.total_length_km,
+            creation_date=creation_date,
+            road_refs=road_refs,
+            milestone_count=milestone_count,
+        )
+
     def _extract_city_name(self, location_string: str) -> str:
         """
         Extract city name from location string.
@@ -781,40 +859,51 @@ class MapStorageServiceDB:
 # Sync wrappers for use in background tasks and sync contexts
 
 
-def _create_standalone_session():
-    """
-    Create a completely standalone async session with its own engine.
-    This avoids event loop conflicts when called from sync contexts.
+async def save_map_async(
+    linear_map: LinearMapResponse,
+    geo_provider: GeoProvider,
+    user_id: Optional[str] = None,
+    debug_collector: Optional[POIDebugDataCollector] = None,
+    route_segments_data: Optional[List[Tuple[Any, bool]]] = None,
+    route_geometry: Optional[List[Tuple[float, float]]] = None,
+    route_total_km: Optional[float] = None,
+    segment_pois_by_segment: Optional[Dict[Any, List[Any]]] = None,
+) -> str:
     """
-    from sqlalchemy.ext.asyncio import (
-        AsyncSession,
-        async_sessionmaker,
-        create_async_engine,
-    )
-
-    from api.providers.settings import get_settings
+    Save a map to the database using a background session.
+    Use this from coroutines running outside a request
+    (like RoadService.generate_linear_map_async).
 
-    settings = get_settings()
-    database_url = (
-        f"postgresql+asyncpg://{settings.postgres_user}:{settings.postgres_password}"
-        f"@{settings.postgres_host}:{settings.postgres_port}/{settings.postgres_database}"
-    )
-
-    # Create a fresh engine for this sync operation
-    engine = create_async_engine(
-        database_url,
-        pool_size=1,
-        max_overflow=0,
-        pool_pre_ping=True,
-    )
+    Args:
+        linear_map: The linear map to save
+        geo_provider: Geographic provider for access route calculation
+        user_id: Optional user ID to associate the map with (as creator)
+        debug_collector: Optional debug data collector with POI debug info
+        route_segments_data: Optional list of (RouteSegment, is_new) tuples
+        route_geometry: Optional full route geometry for junction calculation
+        route_total_km: Optional total route length in km
+        segment_pois_by_segment: Optional SegmentPOIs already loaded per
+            segment ID (skips reloading them during assembly)
 
-    session_maker = async_sessionmaker(
-        engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
+    Returns:
+        The ID of the saved map
+    """
+    from uuid import UUID as PyUUID
 
-    return engine, session_maker
+    async with get_background_session() as session:
+        storage = MapStorageServiceDB(session)
+        # Convert string user_id to UUID if provided
+        uuid_user_id = PyUUID(user_id) if user_id else None
+        return await storage.save_map(
+            linear_map,
+            geo_provider=geo_provider,
+            user_id=uuid_user_id,
+            debug_collector=debug_collector,
+            route_segments_data=route_segments_data,
+            route_geometry=route_geometry,
+            route_total_km=route_total_km,
+            segment_pois_by_segment=segment_pois_by_segment,
+        )
 
 
 def save_map_sync(
@@ -828,7 +917,7 @@ def save_map_sync(
 ) -> str:
     """
     Sync wrapper for saving a map to the database.
-    Use this from sync contexts (like RoadService.generate_linear_map).
+    Use this from sync contexts; see save_map_async.
 
     Args:
         linear_map: The linear map to save
@@ -842,36 +931,54 @@ def save_map_sync(
     Returns:
         The ID of the saved map
     """
-    import asyncio
-    from uuid import UUID as PyUUID
+    # Run on the current thread's event loop (the worker's, in background jobs)
+    return run_async_safe(
+        save_map_async(
+            linear_map,
+            geo_provider=geo_provider,
+            user_id=user_id,
+            debug_collector=debug_collector,
+            route_segments_data=route_segments_data,
+            route_geometry=route_geometry,
+            route_total_km=route_total_km,
+        )
+    )
 
-    async def _save():
-        engine, session_maker = _create_standalone_session()
-        try:
-            async with session_maker() as session:
-                try:
-                    storage = MapStorageServiceDB(session)
-                    # Convert string user_id to UUID if provided
-                    uuid_user_id = PyUUID(user_id) if user_id else None
-                    result = await storage.save_map(
-                        linear_map,
-                        geo_provider=geo_provider,
-                        user_id=uuid_user_id,
-                        debug_collector=debug_collector,
-                        route_segments_data=route_segments_data,
-                        route_geometry=route_geometry,
-                        route_total_km=route_total_km,
-                    )
-                    await session.commit()
-                    return result
-                except Exception:
-                    await session.rollback()
-                    raise
-        finally:
-            await engine.dispose()
 
-    # Run in a new event loop
-    return asyncio.run(_save())
+async def cache_map_response_async(map_id: str) -> bool:
+    """
+    Store the serialized response of a finished map in the response cache.
+    Use this from coroutines running outside a request, once the map will
+    not change anymore (after POI enrichment / data replacement).
+
+    Args:
+        map_id: ID of the map
+
+    Returns:
+        True if the response was cached, False otherwise
+    """
+    try:
+        async with get_background_session() as session:
+            storage = MapStorageServiceDB(session)
+            return await storage.cache_map_response(map_id) is not None
+    except Exception as e:
+        # The cache is an optimization; the map is assembled on first open instead
+        logger.warning(f"Erro ao armazenar resposta do mapa {map_id} em cache: {e}")
+        return False
+
+
+def cache_map_response_sync(map_id: str) -> bool:
+    """
+    Sync wrapper for cache_map_response_async.
+    Use this from sync contexts (like background tasks).
+
+    Args:
+        map_id: ID of the map
+
+    Returns:
+        True if the response was cached, False otherwise
+    """
+    return run_async_safe(cache_map_response_async(map_id))
 
 
 def delete_map_sync(map_id: str) -> bool:
@@ -885,25 +992,13 @@ def delete_map_sync(map_id: str) -> bool:
     Returns:
         True if deleted successfully, False otherwise
     """
-    import asyncio
-
     async def _delete():
-        engine, session_maker = _create_standalone_session()
-        try:
-            async with session_maker() as session:
-                try:
-                    storage = MapStorageServiceDB(session)
-                    result = await storage.delete_map_permanently(map_id)
-                    await session.commit()
-                    return result
-                except Exception:
-                    await session.rollback()
-                    raise
-        finally:
-            await engine.dispose()
+        async with get_background_session() as session:
+            storage = MapStorageServiceDB(session)
+            return await storage.delete_map_permanently(map_id)
 
-    # Run in a new event loop
-    return asyncio.run(_delete())
+    # Run on the current thread's event loop (the worker's, in background jobs)
+    return run_async_safe(_delete())
 
 
 async def replace_map_data_async(
@@ -968,6 +1063,11 @@ async def replace_map_data_async(
         from api.database.repositories.poi_debug_data import POIDebugDataRepository
         debug_repo = POIDebugDataRepository(session)
 
+        deleted_responses = await storage.response_cache_repo.delete_for_map(
+            original_uuid
+        )
+        logger.info(f"Deleted {deleted_responses} cached responses from original map")
+
         deleted_debug = await debug_repo.delete_by_map(original_uuid)
         logger.info(f"Deleted {deleted_debug} debug entries from original map")
 
@@ -1035,22 +1135,10 @@ def replace_map_data_sync(original_map_id: str, temp_map_id: str) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    import asyncio
-
     async def _replace():
-        engine, session_maker = _create_standalone_session()
-        try:
-            async with session_maker() as session:
-                try:
-                    result = await replace_map_data_async(
-                        original_map_id, temp_map_id, session
-                    )
-                    await session.commit()
-                    return result
-                except Exception:
-                    await session.rollback()
-                    raise
-        finally:
-            await engine.dispose()
-
-    return asyncio.run(_replace())
+        async with get_background_session() as session:
+            return await replace_map_data_async(
+                original_map_id, temp_map_id, session
+            )
+
+    return run_async_safe(_replace())
@@ -19,6 +19,7 @@ from api.models.road_models import (
 )
 from api.providers.base import GeoProvider
 from api.providers.models import POI, POICategory
+from api.services.municipality_gazetteer import get_municipality_gazetteer
 from api.services.poi_quality_service import POIQualityService, format_opening_hours
 from api.utils.geo_utils import calculate_distance_meters
 
@@ -282,25 +283,38 @@ class MilestoneFactory:
         self, milestones: List[RoadMilestone]
     ) -> None:
         """
-        Enrich milestones with city information via reverse geocoding.
+        Enrich milestones with city information.
 
-        Only geocodes milestones that don't already have city information.
-        Modifies milestones in-place.
+        Only resolves milestones that don't already have city information,
+        from the offline municipality gazetteer first and via reverse
+        geocoding for the points it cannot place. Modifies milestones in-place.
 
         Args:
             milestones: List of milestones to enrich
         """
-        if not self.geo_provider:
-            logger.warning("No geo_provider configured for city enrichment")
-            return
-
         milestones_without_city = [m for m in milestones if not m.city]
-        logger.info(f"Reverse geocoding for city info...")
         logger.info(
-            f"{len(milestones_without_city)} POIs need reverse geocoding"
+            f"{len(milestones_without_city)} POIs need city information"
         )
 
+        gazetteer = get_municipality_gazetteer()
+        unresolved = []
         for milestone in milestones_without_city:
+            city = await gazetteer.lookup_city(
+                milestone.coordinates.latitude, milestone.coordinates.longitude
+            )
+            if city:
+                milestone.city = city
+            else:
+                unresolved.append(milestone)
+
+        if unresolved and not self.geo_provider:
+            logger.warning("No geo_provider configured for city enrichment")
+            unresolved = []
+        if unresolved:
+            logger.info(f"Reverse geocoding {len(unresolved)} POIs for city info...")
+
+        for milestone in unresolved:
             try:
                 reverse_loc = await self.geo_provider.reverse_geocode(
                     milestone.coordinates.latitude,
@@ -314,7 +328,7 @@ class MilestoneFactory:
 
         cities_found = len([m for m in milestones if m.city])
         logger.info(
-            f"Reverse geocoding complete: "
+            f"City enrichment complete: "
             f"{cities_found}/{len(milestones)} POIs with city identified"
         )
 
@@ -0,0 +1,616 @@
+"""
+Offline municipality gazetteer for resolving POI cities.
+
+Cities of POIs used to come from one reverse geocoding request per POI,
+which with Nominatim's one request per second could add minutes to a map
+save. The gazetteer keeps IBGE municipality boundaries in a
+MunicipalityIndex and answers the same question locally; callers fall back
+to reverse geocoding only for points outside every boundary.
+
+It also geocodes "City, UF" inputs (the format of the municipality picker)
+to the municipality seat, so route origins and destinations usually need no
+Nominatim request; free-form addresses still go to the geo provider.
+
+Seat coordinates come from municipality_seats.csv, shipped with the package
+and read without any download, so "City, UF" geocoding works from the first
+request. The shipped table covers the state capitals and a few other large
+cities; ``make gazetteer-seats`` replaces it with the full table, downloaded
+at a pinned commit and checked against its SHA-256
+(MUNICIPALITY_SEATS_COMMIT / MUNICIPALITY_SEATS_SHA256). With the pin set,
+the full table is also downloaded when the dataset is built.
+
+The boundaries are read from a local JSON file (MUNICIPALITY_GAZETTEER_PATH).
+When the file does not exist it is built once from the IBGE APIs (municipality
+list + boundary mesh) plus the seats, and written to that path. Files written
+by older versions get the seats again on the next load.
+
+Building takes a large download, so it never runs on an interactive request:
+the app loads the gazetteer in the background at startup, and
+``make gazetteer`` builds the file ahead of time.
+"""
+
+import csv
+import hashlib
+import io
+import json
+import logging
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from api.models.municipality_models import Municipality
+from api.providers.models import GeoLocation
+from api.providers.settings import get_settings
+from api.utils.municipality_index import (
+    IndexedMunicipality,
+    MunicipalityIndex,
+    MunicipalityNameIndex,
+    MunicipalitySeat,
+    normalize_name,
+)
+
+logger = logging.getLogger(__name__)
+
+# IBGE API endpoints
+IBGE_API_URL = "https://servicodados.ibge.gov.br/api/v1/localidades/municipios"
+IBGE_BOUNDARIES_URL = "https://servicodados.ibge.gov.br/api/v3/malhas/paises/BR"
+IBGE_BOUNDARIES_PARAMS = {
+    "formato": "application/vnd.geo+json",
+    "qualidade": "intermediaria",
+    "intrarregiao": "municipio",
+}
+
+# Seat (sede municipal) coordinates by IBGE code, derived from IBGE data,
+# at a pinned commit of the repository
+MUNICIPALITY_SEATS_URL = (
+    "https://raw.githubusercontent.com/kelvins/Municipios-Brasileiros/{commit}/csv/municipios.csv"
+)
+
+_COMMIT_SHA = re.compile(r"[0-9a-f]{40}")
+
+# Seats table shipped with the package, in the format of MUNICIPALITY_SEATS_URL
+BUNDLED_SEATS_PATH = os.path.join(os.path.dirname(__file__), "municipality_seats.csv")
+
+# Dataset format: 2 adds the seat of each municipality, 3 the shipped seats
+GAZETTEER_DATA_VERSION = 3
+
+# Boundary coordinates are stored with ~1 m precision
+_COORDINATE_DECIMALS = 5
+
+UF_CODES = frozenset({
+    "AC", "AL", "AM", "AP", "BA", "CE", "DF", "ES", "GO", "MA", "MG", "MS", "MT", "PA",
+    "PB", "PE", "PI", "PR", "RJ", "RN", "RO", "RR", "RS", "SC", "SE", "SP", "TO",
+})
+
+# UF of each IBGE state code (codigo_uf)
+_UF_BY_CODE = {
+    11: "RO", 12: "AC", 13: "AM", 14: "RR", 15: "PA", 16: "AP", 17: "TO",
+    21: "MA", 22: "PI", 23: "CE", 24: "RN", 25: "PB", 26: "PE", 27: "AL", 28: "SE", 29: "BA",
+    31: "MG", 32: "ES", 33: "RJ", 35: "SP",
+    41: "PR", 42: "SC", 43: "RS",
+    50: "MS", 51: "MT", 52: "GO", 53: "DF",
+}
+
+# Separators between city and UF: "Campinas, SP", "Campinas - SP", "Campinas/SP"
+_UF_SEPARATOR = re.compile(r"\s*(?:,|/|\s-\s)\s*")
+
+# Wait before trying to download the dataset again after a failure
+_RETRY_AFTER_SECONDS = 3600
+
+
+def parse_ibge_municipalities(data: List[Dict[str, Any]]) -> List[Municipality]:
+    """
+    Parse the IBGE municipality list.
+
+    Args:
+        data: JSON response of the IBGE localidades/municipios API
+
+    Returns:
+        List of Municipality objects (entries without UF are skipped)
+    """
+    municipalities = []
+    for item in data:
+        try:
+            # Extract UF from nested structure (defensive parsing)
+            microrregiao = item.get("microrregiao") or {}
+            mesorregiao = microrregiao.get("mesorregiao") or {}
+            uf_data = mesorregiao.get("UF") or {}
+            uf = uf_data.get("sigla", "")
+
+            if not uf:
+                logger.debug(f"Municipality without UF: {item.get('nome', 'unknown')}")
+                continue
+
+            municipalities.append(Municipality(
+                id=item["id"],
+                nome=item["nome"],
+                uf=uf
+            ))
+        except (KeyError, TypeError, AttributeError) as e:
+            logger.warning(f"Failed to parse municipality: {item.get('nome', 'unknown')}: {e}")
+            continue
+
+    return municipalities
+
+
+def parse_municipality_seats(text: str) -> Dict[int, Tuple[float, float]]:
+    """
+    Parse the municipality seats table.
+
+    Args:
+        text: CSV with codigo_ibge, latitude and longitude columns
+
+    Returns:
+        IBGE code -> (latitude, longitude) of the seat (invalid rows are skipped)
+    """
+    seats = {}
+    for row in csv.DictReader(io.StringIO(text)):
+        try:
+            seats[int(row["codigo_ibge"])] = (float(row["latitude"]), float(row["longitude"]))
+        except (KeyError, TypeError, ValueError):
+            continue
+    return seats
+
+
+def parse_seat_municipalities(text: str) -> List[MunicipalitySeat]:
+    """
+    Parse the municipality seats table with the name and UF of each seat.
+
+    Args:
+        text: CSV with codigo_ibge, nome, latitude, longitude and codigo_uf
+            columns
+
+    Returns:
+        List of MunicipalitySeat objects (invalid rows are skipped)
+    """
+    seats = []
+    for row in csv.DictReader(io.StringIO(text)):
+        try:
+            uf = _UF_BY_CODE[int(row["codigo_uf"])]
+            seats.append(MunicipalitySeat(
+                IndexedMunicipality(int(row["codigo_ibge"]), row["nome"], uf),
+                float(row["latitude"]),
+                float(row["longitude"]),
+            ))
+        except (KeyError, TypeError, ValueError):
+            continue
+    return seats
+
+
+def _read_bundled_seats() -> str:
+    """Read the seats table shipped with the package."""
+    with open(BUNDLED_SEATS_PATH, encoding="utf-8") as f:
+        return f.read()
+
+
+def parse_city_uf(address: str) -> Optional[Tuple[str, Optional[str]]]:
+    """
+    Split a "City, UF" input into its parts.
+
+    A trailing ", Brasil" is ignored; a bare name is returned without UF.
+
+    Args:
+        address: Address as typed or picked by the user
+
+    Returns:
+        Tuple of (city, UF or None), or None when the input has more parts
+        (street addresses and other free-form text)
+    """
+    parts = [part for part in _UF_SEPARATOR.split(address.strip()) if part]
+    if parts and normalize_name(parts[-1]) in ("brasil", "brazil"):
+        parts.pop()
+    if len(parts) == 1:
+        return parts[0], None
+    if len(parts) == 2 and parts[1].upper() in UF_CODES:
+        return parts[0], parts[1].upper()
+    return None
+
+
+def _geometry_rings(geometry: Optional[Dict[str, Any]]) -> List[List[List[float]]]:
+    """Flatten a GeoJSON Polygon/MultiPolygon into its rings."""
+    if not geometry:
+        return []
+    if geometry.get("type") == "Polygon":
+        polygons = [geometry.get("coordinates") or []]
+    elif geometry.get("type") == "MultiPolygon":
+        polygons = geometry.get("coordinates") or []
+    else:
+        return []
+
+    return [
+        [
+            [round(point[0], _COORDINATE_DECIMALS), round(point[1], _COORDINATE_DECIMALS)]
+            for point in ring
+        ]
+        for polygon in polygons
+        for ring in polygon
+    ]
+
+
+def build_gazetteer_data(
+    municipalities: List[Municipality], boundaries: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Join the municipality list with the IBGE boundary mesh.
+
+    Args:
+        municipalities: Parsed IBGE municipality list
+        boundaries: GeoJSON FeatureCollection with one feature per
+            municipality (property 'codarea' = IBGE code)
+
+    Returns:
+        Gazetteer dataset: {"municipalities": [{"id", "nome", "uf", "rings"}]}
+    """
+    by_code = {m.id: m for m in municipalities}
+
+    entries = []
+    for feature in boundaries.get("features") or []:
+        try:
+            code = int((feature.get("properties") or {}).get("codarea"))
+        except (TypeError, ValueError):
+            continue
+        municipality = by_code.get(code)
+        rings = _geometry_rings(feature.get("geometry"))
+        if municipality is None or not rings:
+            continue
+        entries.append({
+            "id": municipality.id,
+            "nome": municipality.nome,
+            "uf": municipality.uf,
+            "rings": rings,
+        })
+
+    return {"municipalities": entries}
+
+
+def add_municipality_seats(
+    data: Dict[str, Any], seats: Dict[int, Tuple[float, float]]
+) -> Dict[str, Any]:
+    """
+    Add seat coordinates to a gazetteer dataset.
+
+    Args:
+        data: Dataset as produced by build_gazetteer_data
+        seats: IBGE code -> (latitude, longitude), from parse_municipality_seats
+
+    Returns:
+        The dataset in the current format, with a "seat" [lon, lat] for each
+        municipality in ``seats``
+    """
+    for entry in data.get("municipalities") or []:
+        seat = seats.get(entry["id"])
+        if seat is not None:
+            entry["seat"] = [seat[1], seat[0]]
+    data["version"] = GAZETTEER_DATA_VERSION
+    return data
+
+
+def index_from_data(data: Dict[str, Any]) -> MunicipalityIndex:
+    """
+    Build a MunicipalityIndex from a gazetteer dataset.
+
+    Args:
+        data: Dataset as produced by build_gazetteer_data
+
+    Returns:
+        The municipality index
+    """
+    return MunicipalityIndex([
+        (IndexedMunicipality(entry["id"], entry["nome"], entry["uf"]), entry["rings"])
+        for entry in data.get("municipalities") or []
+    ])
+
+
+def name_index_from_data(data: Dict[str, Any]) -> MunicipalityNameIndex:
+    """
+    Build a MunicipalityNameIndex from a gazetteer dataset.
+
+    Args:
+        data: Dataset as produced by build_gazetteer_data (municipalities
+            without a seat are left out)
+
+    Returns:
+        The municipality name index
+    """
+    return MunicipalityNameIndex([
+        MunicipalitySeat(
+            IndexedMunicipality(entry["id"], entry["nome"], entry["uf"]),
+            entry["seat"][1],
+            entry["seat"][0],
+        )
+        for entry in data.get("municipalities") or []
+        if entry.get("seat")
+    ])
+
+
+def _download_seats_csv(commit: str, sha256: str) -> str:
+    """
+    Download the municipality seats table at a pinned commit.
+
+    Args:
+        commit: Full commit SHA of the seats repository
+        sha256: Expected SHA-256 of the CSV file
+
+    Returns:
+        The CSV text
+
+    Raises:
+        ValueError: If the pin is missing or the file doesn't match its hash
+    """
+    if not _COMMIT_SHA.fullmatch(commit or "") or not sha256:
+        raise ValueError("MUNICIPALITY_SEATS_COMMIT/MUNICIPALITY_SEATS_SHA256 nao configurados")
+
+    logger.info(f"Baixando sedes de municipios (commit {commit[:12]})...")
+    with httpx.Client(timeout=60.0) as client:
+        response = client.get(MUNICIPALITY_SEATS_URL.format(commit=commit))
+        response.raise_for_status()
+
+    digest = hashlib.sha256(response.content).hexdigest()
+    if digest != sha256.lower():
+        raise ValueError(f"Tabela de sedes com SHA-256 inesperado: {digest}")
+    return response.content.decode("utf-8")
+
+
+def _download_seats(commit: str, sha256: str) -> Dict[int, Tuple[float, float]]:
+    """Download and parse the seats table at a pinned commit (see _download_seats_csv)."""
+    return parse_municipality_seats(_download_seats_csv(commit, sha256))
+
+
+def _municipality_seats(seats_commit: str, seats_sha256: str) -> Dict[int, Tuple[float, float]]:
+    """
+    Get the seats for a dataset: the shipped table, extended by the pinned
+    download when configured (a failed download leaves the shipped table).
+    """
+    seats = parse_municipality_seats(_read_bundled_seats())
+    if seats_commit or seats_sha256:
+        try:
+            seats.update(_download_seats(seats_commit, seats_sha256))
+        except Exception as e:
+            logger.warning(f"Tabela completa de sedes indisponivel, usando a tabela embutida: {e}")
+    return seats
+
+
+def _download_data(seats_commit: str, seats_sha256: str) -> Dict[str, Any]:
+    """Download the municipality list and boundaries from IBGE, and the seats."""
+    logger.info("Baixando malha de municipios do IBGE...")
+    with httpx.Client(timeout=120.0) as client:
+        response = client.get(IBGE_API_URL)
+        response.raise_for_status()
+        municipalities = parse_ibge_municipalities(response.json())
+
+        response = client.get(IBGE_BOUNDARIES_URL, params=IBGE_BOUNDARIES_PARAMS)
+        response.raise_for_status()
+        boundaries = response.json()
+
+    data = build_gazetteer_data(municipalities, boundaries)
+    return add_municipality_seats(data, _municipality_seats(seats_commit, seats_sha256))
+
+
+def _write_data(path: str, data: Dict[str, Any]) -> None:
+    """Store the dataset, replacing the file only once fully written."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    # Write to a temporary file first so a crash never leaves a partial dataset
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+def _load_data(path: str, seats_commit: str = "", seats_sha256: str = "") -> Dict[str, Any]:
+    """
+    Read the dataset from disk, downloading and storing it when missing.
+
+    A dataset written by an older version gets the seats again (the pinned
+    seats table is the only download).
+    """
+    if not os.path.exists(path):
+        data = _download_data(seats_commit, seats_sha256)
+        _write_data(path, data)
+        return data
+
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("version", 1) < GAZETTEER_DATA_VERSION:
+        data = add_municipality_seats(data, _municipality_seats(seats_commit, seats_sha256))
+        try:
+            _write_data(path, data)
+        except OSError as e:
+            logger.warning(f"Nao foi possivel atualizar {path}: {e}")
+    return data
+
+
+class MunicipalityGazetteer:
+    """
+    Lazily loaded municipality index shared by all event loops.
+
+    Loading runs in a thread (file parsing and the first download are
+    blocking) under a thread lock, since background workers each run their
+    own event loop. Lookups never wait for it: until the index is loaded
+    they start loading it in the background and answer None, so callers use
+    their network fallbacks instead of stalling on a download. "City, UF"
+    geocoding is answered from the shipped seats table until then.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        enabled: bool = True,
+        seats_commit: str = "",
+        seats_sha256: str = "",
+    ):
+        """
+        Initialize the gazetteer.
+
+        Args:
+            path: Local dataset path
+            enabled: Whether lookups are served at all
+            seats_commit: Pinned commit of the seats table
+            seats_sha256: Expected SHA-256 of the seats table
+        """
+        self.path = path
+        self.enabled = enabled
+        self.seats_commit = seats_commit
+        self.seats_sha256 = seats_sha256
+        self._index: Optional[MunicipalityIndex] = None
+        self._names: Optional[MunicipalityNameIndex] = None
+        self._bundled_names: Optional[MunicipalityNameIndex] = None
+        self._lock = threading.Lock()
+        self._failed_at: Optional[float] = None
+        self._loader: Optional[threading.Thread] = None
+        # Separate from _lock, which is held for the whole load
+        self._loader_lock = threading.Lock()
+
+    def _load_index(self) -> Optional[MunicipalityIndex]:
+        """Load the index once; after a failure, retry only after a while."""
+        with self._lock:
+            if self._index is not None:
+                return self._index
+            if (
+                self._failed_at is not None
+                and time.monotonic() - self._failed_at < _RETRY_AFTER_SECONDS
+            ):
+                return None
+
+            try:
+                started = time.perf_counter()
+                data = _load_data(self.path, self.seats_commit, self.seats_sha256)
+                self._names = name_index_from_data(data)
+                self._index = index_from_data(data)
+                logger.info(
+                    f"Gazetteer de municipios carregado: {len(self._index)} municipios "
+                    f"({len(self._names)} com sede) em {time.perf_counter() - started:.1f}s"
+                )
+            except Exception as e:
+                self._failed_at = time.monotonic()
+                logger.warning(f"Gazetteer de municipios indisponivel: {e}")
+            return self._index
+
+    def load_in_background(self) -> None:
+        """Start loading the index in a daemon thread, unless loaded or loading."""
+        if not self.enabled or self._index is not None:
+            return
+        with self._loader_lock:
+            if self._loader is not None and self._loader.is_alive():
+                return
+            self._loader = threading.Thread(
+                target=self._load_index, name="municipality-gazetteer", daemon=True
+            )
+            self._loader.start()
+
+    def _ready_index(self) -> Optional[MunicipalityIndex]:
+        """
+        Get the municipality index if loaded, without waiting for it.
+
+        Returns:
+            The index, or None if disabled or not loaded yet (loading is
+            then started in the background)
+        """
+        if not self.enabled:
+            return None
+        if self._index is None:
+            self.load_in_background()
+        return self._index
+
+    def _name_index(self) -> MunicipalityNameIndex:
+        """
+        Get the seats of the loaded dataset, or of the shipped table until
+        the dataset is loaded (the table is small and read without a download).
+        """
+        if self._names is not None:
+            return self._names
+        if self._bundled_names is None:
+            self._bundled_names = MunicipalityNameIndex(
+                parse_seat_municipalities(_read_bundled_seats())
+            )
+        return self._bundled_names
+
+    async def lookup_city(self, latitude: float, longitude: float) -> Optional[str]:
+        """
+        Resolve the municipality name of a point.
+
+        Args:
+            latitude: Latitude
+            longitude: Longitude
+
+        Returns:
+            Municipality name, or None if unknown or the index isn't loaded
+            yet (caller should fall back to reverse geocoding)
+        """
+        index = self._ready_index()
+        if index is None:
+            return None
+        municipality = index.lookup(latitude, longitude)
+        return municipality.name if municipality else None
+
+    async def geocode(self, address: str) -> Optional[GeoLocation]:
+        """
+        Geocode a "City, UF" input to the municipality seat.
+
+        Args:
+            address: Address as typed or picked by the user
+
+        Returns:
+            Location of the seat, or None when the input isn't a municipality
+            with a known seat (caller should fall back to the geo provider)
+        """
+        parsed = parse_city_uf(address)
+        if parsed is None or not self.enabled:
+            return None
+
+        # Loads the full dataset in the background for the next lookups
+        self._ready_index()
+        seat = self._name_index().find(*parsed)
+        if seat is None:
+            return None
+        municipality = seat.municipality
+        return GeoLocation(
+            latitude=seat.latitude,
+            longitude=seat.longitude,
+            address=f"{municipality.name}, {municipality.uf}, Brasil",
+            city=municipality.name,
+            state=municipality.uf,
+        )
+
+
+_gazetteer: Optional[MunicipalityGazetteer] = None
+
+
+def get_municipality_gazetteer() -> MunicipalityGazetteer:
+    """
+    Get the global municipality gazetteer (singleton pattern).
+
+    Returns:
+        MunicipalityGazetteer configured from settings
+    """
+    global _gazetteer
+    if _gazetteer is None:
+        settings = get_settings()
+        _gazetteer = MunicipalityGazetteer(
+            settings.municipality_gazetteer_path,
+            enabled=settings.municipality_gazetteer_enabled,
+            seats_commit=settings.municipality_seats_commit,
+            seats_sha256=settings.municipality_seats_sha256,
+        )
+    return _gazetteer
+
+
+if __name__ == "__main__":
+    import sys
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    if sys.argv[1:] == ["seats"]:
+        # Replace the shipped seats table with the pinned full table (make gazetteer-seats)
+        settings = get_settings()
+        text = _download_seats_csv(settings.municipality_seats_commit, settings.municipality_seats_sha256)
+        with open(BUNDLED_SEATS_PATH, "w", encoding="utf-8", newline="") as f:
+            f.write(text)
+        logger.info(f"{len(parse_seat_municipalities(text))} sedes gravadas em {BUNDLED_SEATS_PATH}")
+    # Build the dataset ahead of time (make gazetteer)
+    elif get_municipality_gazetteer()._load_index() is None:
+        raise SystemExit(1)
@@ -5,6 +5,9 @@ This service handles enrichment of POIs with external data sources:
 - Google Places: Ratings for restaurants, hotels, cafes, etc.
 - HERE Maps: Contact info (phone, website, hours) for various POI types.
 
+Both providers run at the same time, each in its own session, paced by its
+own rate limiter (see GOOGLE_PLACES_RATE_LIMIT / HERE_ENRICHMENT_RATE_LIMIT).
+
 The service provides both sync and async interfaces and handles all
 database session management internally.
 """
@@ -13,73 +16,34 @@ import asyncio
 import logging
 from typing import List, Optional
 
-from sqlalchemy.ext.asyncio import (
-    AsyncSession,
-    async_sessionmaker,
-    create_async_engine,
-)
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from api.database.connection import get_background_session
 from api.providers.settings import get_settings
+from api.utils.async_utils import run_async_safe
 
 logger = logging.getLogger(__name__)
 
 
-def _create_async_engine_and_session():
-    """
-    Create a standalone async engine and session maker.
-
-    Returns:
-        Tuple of (engine, session_maker)
-    """
-    settings = get_settings()
-    database_url = (
-        f"postgresql+asyncpg://{settings.postgres_user}:{settings.postgres_password}"
-        f"@{settings.postgres_host}:{settings.postgres_port}/{settings.postgres_database}"
-    )
-    engine = create_async_engine(
-        database_url,
-        pool_size=1,
-        max_overflow=0,
-        pool_pre_ping=True,
-    )
-    session_maker = async_sessionmaker(
-        engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
-    return engine, session_maker
-
-
 async def _run_with_session(async_func):
     """
     Run an async function with a managed database session.
 
+    Uses the background worker's long-lived engine when available.
+
     Args:
         async_func: Async function that takes a session parameter
 
     Returns:
         Result of the async function
     """
-    engine, session_maker = _create_async_engine_and_session()
-    try:
-        async with session_maker() as session:
-            try:
-                result = await async_func(session)
-                await session.commit()
-                return result
-            except Exception:
-                await session.rollback()
-                raise
-    finally:
-        await engine.dispose()
+    async with get_background_session() as session:
+        return await async_func(session)
 
 
-def enrich_map_with_google_places_sync(map_id: str) -> int:
+async def enrich_map_with_google_places_async(map_id: str) -> int:
     """
-    Enrich POIs in a map with Google Places data (sync version).
-
-    This is a convenience wrapper that runs the async enrichment
-    in a new event loop.
+    Enrich POIs in a map with Google Places data.
 
     Args:
         map_id: Map UUID string
@@ -105,21 +69,34 @@ def enrich_map_with_google_places_sync(map_id: str) -> int:
         return await enrich_map_pois_with_google_places(session, map_id)
 
     try:
-        return asyncio.run(_run_with_session(_enrich))
+        return await _run_with_session(_enrich)
     except Exception as e:
         logger.warning(f"Error enriching with Google Places: {e}")
         return 0
 
 
-def enrich_map_with_here_sync(
+def enrich_map_with_google_places_sync(map_id: str) -> int:
+    """
+    Enrich POIs in a map with Google Places data (sync version).
+
+    This is a convenience wrapper that runs the async enrichment
+    on the current thread's event loop.
+
+    Args:
+        map_id: Map UUID string
+
+    Returns:
+        Number of POIs enriched
+    """
+    return run_async_safe(enrich_map_with_google_places_async(map_id))
+
+
+async def enrich_map_with_here_async(
     map_id: str,
     poi_types: Optional[List[str]] = None,
 ) -> int:
     """
-    Enrich POIs in a map with HERE Maps data (sync version).
-
-    This is a convenience wrapper that runs the async enrichment
-    in a new event loop.
+    Enrich POIs in a map with HERE Maps data.
 
     Args:
         map_id: Map UUID string
@@ -131,8 +108,8 @@ def enrich_map_with_here_sync(
     settings = get_settings()
 
     # Early exit checks
-    if settings.poi_provider.lower() != "osm":
-        logger.debug("HERE enrichment only applies when POI_PROVIDER=osm")
+    if settings.poi_provider.lower() not in ("osm", "osm_pbf"):
+        logger.debug("HERE enrichment only applies to OSM POIs (POI_PROVIDER=osm or osm_pbf)")
         return 0
     if not settings.here_enrichment_enabled:
         logger.debug("HERE enrichment is disabled (HERE_ENRICHMENT_ENABLED=false)")
@@ -165,19 +142,39 @@ def enrich_map_with_here_sync(
         return matched
 
     try:
-        return asyncio.run(_run_with_session(_enrich))
+        return await _run_with_session(_enrich)
     except Exception as e:
         logger.warning(f"Error enriching with HERE: {e}")
         return 0
 
 
+def enrich_map_with_here_sync(
+    map_id: str,
+    poi_types: Optional[List[str]] = None,
+) -> int:
+    """
+    Enrich POIs in a map with HERE Maps data (sync version).
+
+    This is a convenience wrapper that runs the async enrichment
+    on the current thread's event loop.
+
+    Args:
+        map_id: Map UUID string
+        poi_types: Optional list of POI types to enrich
+
+    Returns:
+        Number of POIs enriched
+    """
+    return run_async_safe(enrich_map_with_here_async(map_id, poi_types))
+
+
 def enrich_map_pois(map_id: str) -> dict:
     """
     Enrich all POIs in a map with available external data sources.
 
-    This is the main entry point for POI enrichment. It will:
-    1. Enrich with Google Places (if enabled and configured)
-    2. Enrich with HERE Maps (if enabled and configured)
+    This is the main entry point for POI enrichment. It will, in parallel:
+    - Enrich with Google Places (if enabled and configured)
+    - Enrich with HERE Maps (if enabled and configured)
 
     Args:
         map_id: Map UUID string
@@ -190,8 +187,28 @@ def enrich_map_pois(map_id: str) -> dict:
             "total_enriched": int,
         }
     """
-    google_count = enrich_map_with_google_places_sync(map_id)
-    here_count = enrich_map_with_here_sync(map_id)
+    return run_async_safe(enrich_map_pois_async(map_id))
+
+
+async def enrich_map_pois_async(map_id: str) -> dict:
+    """
+    Enrich all POIs in a map with available external data sources.
+
+    Async counterpart of enrich_map_pois, for callers already running on an
+    event loop (e.g. RoadService.generate_linear_map_async).
+
+    Args:
+        map_id: Map UUID string
+
+    Returns:
+        Dict with enrichment results (see enrich_map_pois)
+    """
+    # Both write through SQL-side merges of enriched_by, so their sessions
+    # never overwrite each other's enrichment marks
+    google_count, here_count = await asyncio.gather(
+        enrich_map_with_google_places_async(map_id),
+        enrich_map_with_here_async(map_id),
+    )
 
     return {
         "google_places_enriched": google_count,
@@ -5,18 +5,34 @@ This service handles searching for POIs around route segments.
 Side determination and junction calculation are handled by JunctionCalculationService.
 """
 
+import asyncio
 import logging
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
 
 from api.database.models.route_segment import RouteSegment
 from api.providers.base import GeoProvider
 from api.providers.models import GeoLocation, POI, POICategory
+from api.providers.settings import get_settings
 from api.services.milestone_factory import MilestoneFactory
 from api.services.poi_quality_service import POIQualityService
-from api.utils.geo_utils import calculate_distance_meters
+from api.utils.geo_utils import (
+    as_route_array,
+    calculate_distance_meters,
+    haversine_distances_m,
+)
 
 logger = logging.getLogger(__name__)
 
+# Corridor search: consecutive segments farther apart than this are searched
+# as separate runs (search points are ~1 km apart within a segment)
+_CORRIDOR_MAX_GAP_M = 5000.0
+
+# POIs kept per search point; corridor assignment applies the same cap so
+# both search modes keep the same POIs
+_POINT_SEARCH_LIMIT = 20
+
 
 class POISearchService:
     """
@@ -68,59 +84,272 @@ class POISearchService:
         Returns:
             List of tuples (POI, search_point_index, straight_line_distance_m)
         """
-        if not segment.search_points:
-            logger.debug(f"Segment {segment.id} has no search points")
-            return []
+        results = await self.search_pois_for_segments(
+            [segment],
+            categories=categories,
+            max_distance_from_road=max_distance_from_road,
+        )
+        return results[0]
 
-        # Track unique POIs with best discovery data
-        # Key: poi_id, Value: (POI, search_point_index, distance_m)
-        best_discovery: Dict[str, Tuple[POI, int, int]] = {}
+    async def search_pois_for_segments(
+        self,
+        segments: List[RouteSegment],
+        categories: List[POICategory],
+        max_distance_from_road: float = 3000,
+        max_concurrency: Optional[int] = None,
+        on_segment_done: Optional[Callable[[int, int], None]] = None,
+    ) -> List[List[Tuple[POI, int, int]]]:
+        """
+        Search POIs for many segments with a bounded number of in-flight requests.
 
-        for sp in segment.search_points:
-            sp_index = sp["index"]
-            sp_lat = sp["lat"]
-            sp_lon = sp["lon"]
+        With POI_SEARCH_MODE=corridor and a provider that supports it,
+        consecutive segments are grouped into runs and each run is searched
+        with ``search_pois_along_route`` (a few requests along the whole
+        run), then the POIs are assigned locally to their closest search
+        point. Runs that fail fall back to the per-point search below.
 
-            try:
-                pois = await self.poi_provider.search_pois(
-                    location=GeoLocation(latitude=sp_lat, longitude=sp_lon),
-                    radius=max_distance_from_road,
-                    categories=categories,
-                    limit=20,
-                )
+        In points mode, each segment's search points are resolved with one
+        ``search_pois_many`` call, so the provider reads and writes the cache
+        in batches instead of once per point. Segments are searched
+        concurrently, limited by a shared semaphore; the provider fetches a
+        segment's cache misses one at a time and paces them by its rate
+        limit, so at most ``max_concurrency`` provider searches are in flight.
+
+        Results are merged per segment in search point order, so the
+        "closest discovery wins" outcome is the same as a sequential search.
+
+        Args:
+            segments: RouteSegments with pre-computed search_points
+            categories: POI categories to search for
+            max_distance_from_road: Maximum search radius in meters
+            max_concurrency: Maximum segments (or runs) searched at once
+                (defaults to POI_SEARCH_MAX_CONCURRENCY)
+            on_segment_done: Optional callback (completed_count, total) invoked
+                each time all search points of a segment have finished
 
-                for poi in pois:
-                    # Calculate straight-line distance
-                    distance_m = int(
-                        calculate_distance_meters(
-                            poi.location.latitude,
-                            poi.location.longitude,
-                            sp_lat,
-                            sp_lon,
-                        )
+        Returns:
+            One list of (POI, search_point_index, straight_line_distance_m)
+            tuples per input segment, in the same order as ``segments``
+        """
+        settings = get_settings()
+        if max_concurrency is None:
+            max_concurrency = settings.poi_search_max_concurrency
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        total = len(segments)
+        completed = 0
+        results: List[List[Tuple[POI, int, int]]] = [[] for _ in segments]
+
+        def _segment_done(index: int, discoveries: List[Tuple[POI, int, int]]) -> None:
+            nonlocal completed
+            results[index] = discoveries
+            completed += 1
+            if on_segment_done:
+                on_segment_done(completed, total)
+
+        async def _search_points(segment: RouteSegment) -> List[List[POI]]:
+            async with semaphore:
+                try:
+                    return await self.poi_provider.search_pois_many(
+                        locations=[
+                            GeoLocation(latitude=sp["lat"], longitude=sp["lon"])
+                            for sp in segment.search_points
+                        ],
+                        radius=max_distance_from_road,
+                        categories=categories,
+                        limit=_POINT_SEARCH_LIMIT,
                     )
+                except Exception as e:
+                    logger.warning(f"Error searching POIs for segment {segment.id}: {e}")
+                    return [[] for _ in segment.search_points]
+
+        async def _search_segment(index: int) -> None:
+            segment = segments[index]
+            if not segment.search_points:
+                logger.debug(f"Segment {segment.id} has no search points")
+                _segment_done(index, [])
+                return
 
-                    # Skip abandoned POIs
-                    provider_data = poi.provider_data or {}
-                    if provider_data.get("is_abandoned", False):
-                        continue
+            search_results = await _search_points(segment)
 
-                    # Keep best (closest) discovery for each POI
-                    if poi.id in best_discovery:
-                        _, _, prev_distance = best_discovery[poi.id]
-                        if distance_m < prev_distance:
-                            best_discovery[poi.id] = (poi, sp_index, distance_m)
-                    else:
-                        best_discovery[poi.id] = (poi, sp_index, distance_m)
+            # Track unique POIs with best discovery data
+            # Key: poi_id, Value: (POI, search_point_index, distance_m)
+            best_discovery: Dict[str, Tuple[POI, int, int]] = {}
+            for sp, pois in zip(segment.search_points, search_results):
+                if pois:
+                    self._merge_discoveries(best_discovery, sp, pois)
 
+            logger.info(
+                f"Found {len(best_discovery)} unique POIs for segment {segment.id}"
+            )
+            _segment_done(index, list(best_discovery.values()))
+
+        async def _search_run(run: List[int]) -> None:
+            run_segments = [segments[i] for i in run]
+            try:
+                async with semaphore:
+                    pois = await self.poi_provider.search_pois_along_route(
+                        route=[
+                            GeoLocation(latitude=sp["lat"], longitude=sp["lon"])
+                            for segment in run_segments
+                            for sp in segment.search_points
+                        ],
+                        radius=max_distance_from_road,
+                        categories=categories,
+                    )
             except Exception as e:
                 logger.warning(
-                    f"Error searching POIs at search point {sp_index}: {e}"
+                    f"Corridor POI search failed for {len(run)} segments, "
+                    f"falling back to per-point search: {e}"
                 )
+                await asyncio.gather(*(_search_segment(i) for i in run))
+                return
+
+            assigned = self._assign_corridor_pois(
+                run_segments, pois, max_distance_from_road, categories
+            )
+            logger.info(
+                f"Corridor search: {len(pois)} POIs along {len(run)} segments"
+            )
+            for index, discoveries in zip(run, assigned):
+                _segment_done(index, discoveries)
+
+        use_corridor = (
+            settings.poi_search_mode == "corridor"
+            and self.poi_provider.supports_corridor_search
+        )
+        if use_corridor:
+            runs, empty = self._corridor_runs(segments)
+            tasks = [_search_run(run) for run in runs]
+            tasks += [_search_segment(i) for i in empty]
+        else:
+            tasks = [_search_segment(i) for i in range(total)]
+
+        await asyncio.gather(*tasks)
+        return results
+
+    @staticmethod
+    def _corridor_runs(segments: List[RouteSegment]) -> Tuple[List[List[int]], List[int]]:
+        """
+        Group segments into runs whose search points form a continuous path.
+
+        A run is broken where the next segment starts farther than
+        _CORRIDOR_MAX_GAP_M from the end of the previous one (segments
+        already searched for an earlier route are not in ``segments``).
+
+        Returns:
+            Tuple of (runs as lists of segment indices in order,
+            indices of segments without search points)
+        """
+        runs: List[List[int]] = []
+        empty: List[int] = []
+        last_point: Optional[Dict] = None
+
+        for index, segment in enumerate(segments):
+            if not segment.search_points:
+                empty.append(index)
                 continue
 
-        logger.info(
-            f"Found {len(best_discovery)} unique POIs for segment {segment.id}"
+            first_point = segment.search_points[0]
+            if runs and last_point is not None and calculate_distance_meters(
+                last_point["lat"], last_point["lon"], first_point["lat"], first_point["lon"]
+            ) <= _CORRIDOR_MAX_GAP_M:
+                runs[-1].append(index)
+            else:
+                runs.append([index])
+            last_point = segment.search_points[-1]
+
+        return runs, empty
+
+    def _assign_corridor_pois(
+        self,
+        run_segments: List[RouteSegment],
+        pois: List[POI],
+        max_distance_from_road: float,
+        categories: List[POICategory],
+    ) -> List[List[Tuple[POI, int, int]]]:
+        """
+        Assign corridor POIs to the closest search point of each segment.
+
+        A search point "finds" a POI when the provider's per-point search
+        there would return it (search_results_mask, the same windows and
+        per-point limit as search_pois); among those search points, the
+        closest one wins, as in _merge_discoveries.
+
+        Returns:
+            One list of (POI, search_point_index, distance_m) per segment
+        """
+        if not pois:
+            return [[] for _ in run_segments]
+
+        poi_coords = as_route_array(
+            [(poi.location.latitude, poi.location.longitude) for poi in pois]
         )
 
-        return list(best_discovery.values())
+        assigned = []
+        for segment in run_segments:
+            sps = segment.search_points
+            sp_coords = as_route_array([(sp["lat"], sp["lon"]) for sp in sps])
+
+            # (POIs x search points) membership and distances
+            in_window = self.poi_provider.search_results_mask(
+                sp_coords, pois, max_distance_from_road, categories,
+                limit=_POINT_SEARCH_LIMIT,
+            )
+            distances = haversine_distances_m(
+                poi_coords[:, 0:1], poi_coords[:, 1:2], sp_coords[:, 0], sp_coords[:, 1]
+            )
+            distances[~in_window] = np.inf
+            nearest = np.argmin(distances, axis=1)
+
+            best_discovery: Dict[str, Tuple[POI, int, int]] = {}
+            for poi_index in np.flatnonzero(in_window.any(axis=1)):
+                self._merge_discoveries(
+                    best_discovery, sps[nearest[poi_index]], [pois[poi_index]]
+                )
+            assigned.append(list(best_discovery.values()))
+
+        return assigned
+
+    @staticmethod
+    def _merge_discoveries(
+        best_discovery: Dict[str, Tuple[POI, int, int]],
+        sp: Dict,
+        pois: List[POI],
+    ) -> None:
+        """
+        Merge POIs found at one search point into the best-discovery map.
+
+        Args:
+            best_discovery: Map of poi_id -> (POI, search_point_index, distance_m),
+                updated in place
+            sp: Search point dict with index, lat and lon
+            pois: POIs returned by the provider for this search point
+        """
+        sp_index = sp["index"]
+        sp_lat = sp["lat"]
+        sp_lon = sp["lon"]
+
+        for poi in pois:
+            # Calculate straight-line distance
+            distance_m = int(
+                calculate_distance_meters(
+                    poi.location.latitude,
+                    poi.location.longitude,
+                    sp_lat,
+                    sp_lon,
+                )
+            )
+
+            # Skip abandoned POIs
+            provider_data = poi.provider_data or {}
+            if provider_data.get("is_abandoned", False):
+                continue
+
+            # Keep best (closest) discovery for each POI
+            if poi.id in best_discovery:
+                _, _, prev_distance = best_discovery[poi.id]
+                if distance_m < prev_distance:
+                    best_discovery[poi.id] = (poi, sp_index, distance_m)
+            else:
+                best_discovery[poi.id] = (poi, sp_index, distance_m)
@@ -26,6 +26,7 @@ from api.providers.models import GeoLocation, Route, POICategory
 from api.providers.settings import get_settings
 from api.services.cache_stats_collector import cache_stats_context
 from api.services.milestone_factory import MilestoneFactory
+from api.services.municipality_gazetteer import get_municipality_gazetteer
 from api.services.poi_debug_service import POIDebugDataCollector
 from api.services.poi_quality_service import POIQualityService
 from api.services.poi_search_service import POISearchService
@@ -36,35 +37,17 @@ from api.utils.geo_utils import calculate_distance_meters
 logger = logging.getLogger(__name__)
 
 
-def _is_debug_enabled_sync() -> bool:
+async def _is_debug_enabled() -> bool:
     """
-    Check if POI debug is enabled (sync version for use in generate_linear_map).
-    Uses synchronous psycopg2 to avoid event loop conflicts.
+    Check if POI debug is enabled (for use in generate_linear_map_async).
+    Uses the background worker's engine when running on a worker loop.
     """
-    import psycopg2
-
-    settings = get_settings()
+    from api.database.connection import get_background_session
+    from api.services.poi_debug_service import POIDebugService
 
     try:
-        conn = psycopg2.connect(
-            host=settings.postgres_host,
-            port=settings.postgres_port,
-            database=settings.postgres_database,
-            user=settings.postgres_user,
-            password=settings.postgres_password,
-        )
-        try:
-            with conn.cursor() as cur:
-                cur.execute(
-                    "SELECT value FROM system_settings WHERE key = 'poi_debug_enabled'"
-                )
-                row = cur.fetchone()
-                if row:
-                    return row[0].lower() == "true"
-                # Default to true if setting doesn't exist
-                return True
-        finally:
-            conn.close()
+        async with get_background_session() as session:
+            return await POIDebugService(session).is_debug_enabled()
     except Exception as e:
         logger.warning(f"Error checking debug config: {e}")
         # Default to true on error
@@ -172,6 +155,24 @@ class RoadService:
 
     def _geocode_and_validate(
         self, address: str, address_type: str = "location"
+    ) -> GeoLocation:
+        """
+        Geocode an address and validate the result (sync version).
+
+        Args:
+            address: Address string to geocode
+            address_type: Type of address for error messages
+
+        Returns:
+            GeoLocation object
+
+        Raises:
+            ValueError: If geocoding fails
+        """
+        return run_async_safe(self._geocode_and_validate_async(address, address_type))
+
+    async def _geocode_and_validate_async(
+        self, address: str, address_type: str = "location"
     ) -> GeoLocation:
         """
         Geocode an address and validate the result.
@@ -187,7 +188,7 @@ class RoadService:
             ValueError: If geocoding fails
         """
         logger.info(f"Geocoding {address_type}: {address}")
-        location = run_async_safe(self.geo_provider.geocode(address))
+        location = await self._geocode_async(address)
 
         if not location:
             raise ValueError(f"Could not geocode {address_type}: {address}")
@@ -199,6 +200,26 @@ class RoadService:
 
         return location
 
+    async def _geocode_async(self, address: str) -> Optional[GeoLocation]:
+        """
+        Geocode an address, locally when it names a municipality.
+
+        "City, UF" inputs are resolved to the municipality seat by the
+        municipality gazetteer, without network requests; anything else
+        (or an unknown name) goes to the geo provider.
+
+        Args:
+            address: Address string to geocode
+
+        Returns:
+            GeoLocation object, or None if not found
+        """
+        location = await get_municipality_gazetteer().geocode(address)
+        if location:
+            logger.debug(f"Geocoded locally from the municipality gazetteer: {address}")
+            return location
+        return await self.geo_provider.geocode(address)
+
     def _log_route_info(self, route: Route):
         """Log detailed route information."""
         logger.info(f"Route calculated:")
@@ -216,7 +237,7 @@ class RoadService:
                 f"lon={route.geometry[-1][1]:.6f}"
             )
 
-    def _enrich_map_pois(self, map_id: str, reporter: "ProgressReporter") -> None:
+    async def _enrich_map_pois_async(self, map_id: str, reporter: "ProgressReporter") -> None:
         """
         Enrich POIs in a map with external data sources.
 
@@ -228,17 +249,17 @@ class RoadService:
             reporter: Progress reporter for phase updates
         """
         from api.services.progress_phases import MapGenerationPhase
-        from api.services.poi_enrichment_service import enrich_map_pois
+        from api.services.poi_enrichment_service import enrich_map_pois_async
 
         reporter.start_phase(MapGenerationPhase.ENRICHMENT)
-        result = enrich_map_pois(map_id)
+        result = await enrich_map_pois_async(map_id)
         logger.info(
             f"POI enrichment complete: {result['google_places_enriched']} Google Places, "
             f"{result['here_enriched']} HERE"
         )
         reporter.complete_phase(MapGenerationPhase.ENRICHMENT)
 
-    def _process_steps_into_segments(
+    async def _process_steps_into_segments_async(
         self,
         steps: List,
         milestone_categories: List[POICategory],
@@ -246,13 +267,18 @@ class RoadService:
         force_poi_refresh: bool = False,
         force_new_segments: bool = False,
         progress_reporter: Optional["ProgressReporter"] = None,
-    ) -> Tuple[List[Tuple[RouteSegmentDB, bool]], List[Tuple[Any, int, int, RouteSegmentDB]]]:
+    ) -> Tuple[
+        List[Tuple[RouteSegmentDB, bool]],
+        List[Tuple[Any, int, int, RouteSegmentDB]],
+        Dict[Any, List[Any]],
+    ]:
         """
         Process OSRM steps into reusable RouteSegments.
 
         For new segments (not previously seen), searches for POIs and creates
         SegmentPOI associations. Also returns all discovered POIs for milestone
-        creation.
+        creation, and the SegmentPOIs of every segment so map assembly does
+        not have to load them again.
 
         Args:
             steps: List of RouteStep objects from OSRM
@@ -268,184 +294,175 @@ class RoadService:
             Tuple of:
             - List of (RouteSegment, is_new) tuples
             - List of (POI, search_point_index, distance_m, segment) tuples
+            - Dict mapping segment ID -> SegmentPOIs with their POI loaded
         """
         from api.services.progress_phases import MapGenerationPhase
-        import asyncio
-        from sqlalchemy.ext.asyncio import (
-            AsyncSession,
-            async_sessionmaker,
-            create_async_engine,
-        )
+        from api.database.connection import get_background_session
         from api.services.segment_service import SegmentService
         from api.database.repositories.segment_poi import SegmentPOIRepository
         from api.database.repositories.poi import POIRepository
 
-        settings = get_settings()
+        # Collect all POIs with their segment info for milestone creation
+        all_pois_with_segments: List[Tuple[Any, int, int, RouteSegmentDB]] = []
 
-        async def _process():
-            database_url = (
-                f"postgresql+asyncpg://{settings.postgres_user}:{settings.postgres_password}"
-                f"@{settings.postgres_host}:{settings.postgres_port}/{settings.postgres_database}"
-            )
-            engine = create_async_engine(
-                database_url,
-                pool_size=1,
-                max_overflow=0,
-                pool_pre_ping=True,
-            )
-            session_maker = async_sessionmaker(
-                engine,
-                class_=AsyncSession,
-                expire_on_commit=False,
+        async with get_background_session() as session:
+            segment_service = SegmentService(session)
+            segment_poi_repo = SegmentPOIRepository(session)
+            poi_repo = POIRepository(session)
+
+            # Bulk get or create segments
+            # When force_new_segments=True, creates new versioned segments
+            results = await segment_service.bulk_get_or_create_segments(
+                steps, force_new=force_new_segments
             )
 
-            # Collect all POIs with their segment info for milestone creation
-            all_pois_with_segments: List[Tuple[Any, int, int, RouteSegmentDB]] = []
+            # Progress calculation within POI_SEARCH phase (0-100% of the phase)
+            total_segments = len(results)
+
+            def _report_segment_progress(segments_done: int):
+                """Report progress based on processed segments within POI_SEARCH phase."""
+                if progress_reporter and total_segments > 0:
+                    # Calculate progress within the phase (0-100%)
+                    phase_progress = (segments_done / total_segments) * 100
+                    progress_reporter.report(MapGenerationPhase.POI_SEARCH, phase_progress)
+
+            # Start POI search phase
+            if progress_reporter:
+                progress_reporter.start_phase(MapGenerationPhase.POI_SEARCH)
+
+            # Search POIs for all NEW segments concurrently (bounded in-flight limit)
+            segments_to_search = [
+                segment
+                for segment, is_new in results
+                if is_new and await segment_service.needs_poi_search(segment)
+            ]
+            search_results = await self.poi_search_service.search_pois_for_segments(
+                segments_to_search,
+                categories=milestone_categories,
+                max_distance_from_road=max_distance_from_road,
+                on_segment_done=lambda done, _total: _report_segment_progress(done),
+            )
+            pois_by_segment = {
+                segment.id: pois_with_data
+                for segment, pois_with_data in zip(segments_to_search, search_results)
+            }
+            segments_done = len(segments_to_search)
 
-            try:
-                async with session_maker() as session:
-                    try:
-                        segment_service = SegmentService(session)
-                        segment_poi_repo = SegmentPOIRepository(session)
-                        poi_repo = POIRepository(session)
+            # Persist the POIs of all searched segments in one bulk upsert
+            poi_id_map = await self._persist_pois_for_segments(
+                session,
+                [poi for pois_with_data in search_results for poi, _, _ in pois_with_data],
+            )
 
-                        # Bulk get or create segments
-                        # When force_new_segments=True, creates new versioned segments
-                        results = await segment_service.bulk_get_or_create_segments(
-                            steps, force_new=force_new_segments
+            # Create SegmentPOI associations for the searched segments
+            for segment, _ in results:
+                if segment.id not in pois_by_segment:
+                    continue
+                pois_with_data = pois_by_segment[segment.id]
+
+                if pois_with_data:
+                    # Create SegmentPOI associations with DB POI IDs
+                    poi_tuples = []
+                    for poi, sp_idx, dist_m in pois_with_data:
+                        db_poi_id = poi_id_map.get(poi.id)
+                        if db_poi_id:
+                            poi_tuples.append((db_poi_id, sp_idx, dist_m))
+
+                    if poi_tuples:
+                        await segment_service.associate_pois_to_segment(
+                            segment, poi_tuples
                         )
+                    else:
+                        from api.database.repositories.route_segment import RouteSegmentRepository
+                        segment_repo = RouteSegmentRepository(session)
+                        await segment_repo.mark_pois_fetched(segment.id)
+                else:
+                    from api.database.repositories.route_segment import RouteSegmentRepository
+                    segment_repo = RouteSegmentRepository(session)
+                    await segment_repo.mark_pois_fetched(segment.id)
+
+            # Load the SegmentPOIs of all segments (new and reused) at once;
+            # they are handed to map assembly along with the segments
+            segment_pois_by_segment = await segment_poi_repo.get_by_segments_with_pois(
+                [segment.id for segment, _ in results]
+            )
 
-                        # Progress calculation within POI_SEARCH phase (0-100% of the phase)
-                        total_segments = len(results)
-
-                        def _report_segment_progress(segment_index: int):
-                            """Report progress based on segment index within POI_SEARCH phase."""
-                            if progress_reporter and total_segments > 0:
-                                # Calculate progress within the phase (0-100%)
-                                phase_progress = ((segment_index + 1) / total_segments) * 100
-                                progress_reporter.report(MapGenerationPhase.POI_SEARCH, phase_progress)
-
-                        # Start POI search phase
-                        if progress_reporter:
-                            progress_reporter.start_phase(MapGenerationPhase.POI_SEARCH)
-
-                        # For each segment, get or search POIs
-                        for idx, (segment, is_new) in enumerate(results):
-                            if is_new and await segment_service.needs_poi_search(segment):
-                                # Search POIs for this NEW segment
-                                pois_with_data = await self.poi_search_service.search_pois_for_segment(
-                                    segment=segment,
-                                    categories=milestone_categories,
-                                    max_distance_from_road=max_distance_from_road,
-                                )
-
-                                if pois_with_data:
-                                    # Persist POIs first and get DB POI IDs
-                                    poi_id_map = await self._persist_pois_for_segment(
-                                        session, pois_with_data
-                                    )
-
-                                    # Create SegmentPOI associations with DB POI IDs
-                                    poi_tuples = []
-                                    for poi, sp_idx, dist_m in pois_with_data:
-                                        db_poi_id = poi_id_map.get(poi.id)
-                                        if db_poi_id:
-                                            poi_tuples.append((db_poi_id, sp_idx, dist_m))
-
-                                    if poi_tuples:
-                                        await segment_service.associate_pois_to_segment(
-                                            segment, poi_tuples
-                                        )
-                                    else:
-                                        from api.database.repositories.route_segment import RouteSegmentRepository
-                                        segment_repo = RouteSegmentRepository(session)
-                                        await segment_repo.mark_pois_fetched(segment.id)
-
-                                    # Collect POIs for milestone creation
-                                    for poi, sp_idx, dist_m in pois_with_data:
-                                        all_pois_with_segments.append((poi, sp_idx, dist_m, segment))
-                                else:
-                                    from api.database.repositories.route_segment import RouteSegmentRepository
-                                    segment_repo = RouteSegmentRepository(session)
-                                    await segment_repo.mark_pois_fetched(segment.id)
-                                # Report progress after processing new segment
-                                _report_segment_progress(idx)
-                            else:
-                                # EXISTING segment - load POIs from SegmentPOI associations
-                                segment_pois = await segment_poi_repo.get_by_segment_with_pois(
-                                    segment.id
-                                )
-                                for sp in segment_pois:
-                                    if sp.poi:
-                                        # Convert DB POI to provider POI format for consistency
-                                        from api.providers.models import POI as ProviderPOI, GeoLocation
-
-                                        # Safely convert type to POICategory
-                                        try:
-                                            poi_category = POICategory(sp.poi.type) if sp.poi.type else POICategory.OTHER
-                                        except ValueError:
-                                            # Type not in POICategory enum (e.g., 'village', 'city')
-                                            poi_category = POICategory.OTHER
-
-                                        provider_poi = ProviderPOI(
-                                            id=str(sp.poi.osm_id or sp.poi.id),
-                                            name=sp.poi.name,
-                                            location=GeoLocation(
-                                                latitude=float(sp.poi.latitude),
-                                                longitude=float(sp.poi.longitude),
-                                                city=sp.poi.city,
-                                            ),
-                                            category=poi_category,
-                                            amenities=sp.poi.amenities or [],
-                                            phone=sp.poi.phone,
-                                            website=sp.poi.website,
-                                            rating=float(sp.poi.rating) if sp.poi.rating else None,
-                                            review_count=sp.poi.rating_count,
-                                            provider_data=sp.poi.tags or {},
-                                        )
-                                        all_pois_with_segments.append((
-                                            provider_poi,
-                                            sp.search_point_index,
-                                            sp.straight_line_distance_m,
-                                            segment,
-                                        ))
-                                # Report progress after processing existing segment
-                                _report_segment_progress(idx)
-
-                        await session.commit()
-                        return results, all_pois_with_segments
-
-                    except Exception:
-                        await session.rollback()
-                        raise
-            finally:
-                await engine.dispose()
-
-        return asyncio.run(_process())
-
-    async def _persist_pois_for_segment(
+            # Collect POIs for milestone creation, in route order
+            for segment, _ in results:
+                if segment.id in pois_by_segment:
+                    for poi, sp_idx, dist_m in pois_by_segment[segment.id]:
+                        all_pois_with_segments.append((poi, sp_idx, dist_m, segment))
+                else:
+                    # EXISTING segment - use POIs from SegmentPOI associations
+                    for sp in segment_pois_by_segment.get(segment.id, []):
+                        if sp.poi:
+                            # Convert DB POI to provider POI format for consistency
+                            from api.providers.models import POI as ProviderPOI, GeoLocation
+
+                            # Safely convert type to POICategory
+                            try:
+                                poi_category = POICategory(sp.poi.type) if sp.poi.type else POICategory.OTHER
+                            except ValueError:
+                                # Type not in POICategory enum (e.g., 'village', 'city')
+                                poi_category = POICategory.OTHER
+
+                            provider_poi = ProviderPOI(
+                                id=str(sp.poi.osm_id or sp.poi.id),
+                                name=sp.poi.name,
+                                location=GeoLocation(
+                                    latitude=float(sp.poi.latitude),
+                                    longitude=float(sp.poi.longitude),
+                                    city=sp.poi.city,
+                                ),
+                                category=poi_category,
+                                amenities=sp.poi.amenities or [],
+                                phone=sp.poi.phone,
+                                website=sp.poi.website,
+                                rating=float(sp.poi.rating) if sp.poi.rating else None,
+                                review_count=sp.poi.rating_count,
+                                provider_data=sp.poi.tags or {},
+                            )
+                            all_pois_with_segments.append((
+                                provider_poi,
+                                sp.search_point_index,
+                                sp.straight_line_distance_m,
+                                segment,
+                            ))
+                    # Report progress after processing existing segment
+                    segments_done += 1
+                    _report_segment_progress(segments_done)
+
+            return results, all_pois_with_segments, segment_pois_by_segment
+
+    async def _persist_pois_for_segments(
         self,
         session,
-        pois_with_data: List[Tuple],
+        pois: List[Any],
     ) -> Dict[str, Any]:
         """
         Persist POIs to database before creating SegmentPOI associations.
 
+        All POIs found for a batch of segments are written with a single
+        set-based upsert (POIRepository.bulk_upsert_by_osm_ids) instead of
+        one lookup per POI.
+
         Args:
             session: Database session
-            pois_with_data: List of (POI, sp_index, distance_m) tuples
+            pois: Provider POIs found across the searched segments
 
         Returns:
             Dict mapping provider POI ID -> database POI UUID
         """
-        from uuid import UUID
         from api.database.repositories.poi import POIRepository
         from api.providers.models import POI as ProviderPOI
 
         poi_repo = POIRepository(session)
-        poi_id_map: Dict[str, UUID] = {}
 
-        for poi, _, _ in pois_with_data:
+        # Provider POI ID -> OSM ID, and the rows to upsert
+        osm_ids: Dict[str, str] = {}
+        poi_data_list: List[dict] = []
+
+        for poi in pois:
             if not isinstance(poi, ProviderPOI):
                 continue
 
@@ -460,8 +477,14 @@ class RoadService:
             # Note: Reverse geocoding for city is done later in MapAssemblyService
             # only for POIs that actually appear in the final map (after deduplication)
 
-            # Prepare POI data dict
-            poi_data = {
+            # Get OSM ID if available
+            osm_id = poi.provider_data.get("osm_id") or poi.provider_data.get("id") or poi.id
+            if not osm_id:
+                continue
+
+            osm_ids[poi.id] = str(osm_id)
+            poi_data_list.append({
+                "osm_id": str(osm_id),
                 "name": poi.name,
                 "type": poi.category.value if poi.category else "other",
                 "latitude": poi.location.latitude,
@@ -473,16 +496,15 @@ class RoadService:
                 "rating": poi.rating,
                 "rating_count": poi.review_count,
                 "tags": poi.provider_data,
-            }
-
-            # Get OSM ID if available
-            osm_id = poi.provider_data.get("osm_id") or poi.provider_data.get("id") or poi.id
+            })
 
-            if osm_id:
-                db_poi, _ = await poi_repo.get_or_create_by_osm_id(str(osm_id), poi_data)
-                poi_id_map[poi.id] = db_poi.id
+        db_ids = await poi_repo.bulk_upsert_by_osm_ids(poi_data_list)
 
-        return poi_id_map
+        return {
+            poi_id: db_ids[osm_id]
+            for poi_id, osm_id in osm_ids.items()
+            if osm_id in db_ids
+        }
 
     # ========================================================================
     # MAIN PUBLIC METHODS
@@ -528,12 +550,64 @@ class RoadService:
             force_new_segments: If True, always create new segment versions
                                (used during map regeneration for versioning)
 
+        Returns:
+            LinearMapResponse with segments and milestones
+        """
+        # The whole pipeline runs on one event loop (the worker's, in background jobs)
+        return run_async_safe(
+            self.generate_linear_map_async(
+                origin=origin,
+                destination=destination,
+                road_id=road_id,
+                include_cities=include_cities,
+                max_distance_from_road=max_distance_from_road,
+                max_detour_distance_km=max_detour_distance_km,
+                progress_callback=progress_callback,
+                segment_length_km=segment_length_km,
+                user_id=user_id,
+                force_new_segments=force_new_segments,
+            )
+        )
+
+    async def generate_linear_map_async(
+        self,
+        origin: str,
+        destination: str,
+        road_id: Optional[str] = None,
+        include_cities: bool = True,
+        max_distance_from_road: float = 3000,
+        max_detour_distance_km: float = 5.0,
+        progress_callback: Optional[Callable[[float, Optional[str]], None]] = None,
+        segment_length_km: float = 1.0,
+        user_id: Optional[str] = None,
+        force_new_segments: bool = False,
+    ) -> LinearMapResponse:
+        """
+        Generate a linear map of a route between origin and destination.
+
+        Async version of generate_linear_map: geocoding, routing, segment
+        processing, saving and enrichment are all awaited on the caller's
+        event loop, so one job uses a single loop and a single DB engine.
+
+        Args:
+            origin: Starting point address
+            destination: End point address
+            road_id: Optional road identifier
+            include_cities: Whether to include city markers
+            max_distance_from_road: Maximum POI search radius in meters
+            max_detour_distance_km: Maximum detour distance for distant POIs
+            progress_callback: Callback for progress updates (progress: float, phase: str)
+            segment_length_km: Target length for each segment
+            user_id: Optional user ID to associate the map with
+            force_new_segments: If True, always create new segment versions
+                               (used during map regeneration for versioning)
+
         Returns:
             LinearMapResponse with segments and milestones
         """
         # Use cache stats context to track hit/miss per operation
         with cache_stats_context() as cache_stats:
-            return self._generate_linear_map_impl(
+            return await self._generate_linear_map_impl(
                 origin=origin,
                 destination=destination,
                 road_id=road_id,
@@ -547,7 +621,7 @@ class RoadService:
                 force_new_segments=force_new_segments,
             )
 
-    def _generate_linear_map_impl(
+    async def _generate_linear_map_impl(
         self,
         origin: str,
         destination: str,
@@ -561,7 +635,7 @@ class RoadService:
         cache_stats,
         force_new_segments: bool = False,
     ) -> LinearMapResponse:
-        """Internal implementation of generate_linear_map with cache stats tracking."""
+        """Internal implementation of generate_linear_map_async with cache stats tracking."""
         from api.services.cache_stats_collector import CacheStatsCollector
         from api.services.progress_phases import (
             MapGenerationPhase,
@@ -583,17 +657,15 @@ class RoadService:
 
         # Step 1: Geocode origin and destination
         reporter.start_phase(MapGenerationPhase.GEOCODING)
-        origin_location = self._geocode_and_validate(origin, "origin")
+        origin_location = await self._geocode_and_validate_async(origin, "origin")
         reporter.report(MapGenerationPhase.GEOCODING, 50)
-        destination_location = self._geocode_and_validate(destination, "destination")
+        destination_location = await self._geocode_and_validate_async(destination, "destination")
         reporter.complete_phase(MapGenerationPhase.GEOCODING)
 
         # Step 2: Calculate route
         reporter.start_phase(MapGenerationPhase.ROUTE_CALCULATION)
         logger.info("Calculating route...")
-        route = run_async_safe(
-            self.geo_provider.calculate_route(origin_location, destination_location)
-        )
+        route = await self.geo_provider.calculate_route(origin_location, destination_location)
 
         if not route:
             raise ValueError(f"Could not calculate route from {origin} to {destination}")
@@ -623,7 +695,11 @@ class RoadService:
         reporter.complete_phase(MapGenerationPhase.SEGMENT_PROCESSING)
 
         logger.info(f"Processing {len(route.steps)} OSRM steps into reusable segments")
-        route_segments_data, all_pois_with_segments = self._process_steps_into_segments(
+        (
+            route_segments_data,
+            all_pois_with_segments,
+            segment_pois_by_segment,
+        ) = await self._process_steps_into_segments_async(
             route.steps,
             milestone_categories=milestone_categories,
             max_distance_from_road=max_distance_from_road,
@@ -639,7 +715,7 @@ class RoadService:
         # Check if debug is enabled and create collector
         debug_collector: Optional[POIDebugDataCollector] = None
         try:
-            if _is_debug_enabled_sync():
+            if await _is_debug_enabled():
                 debug_collector = POIDebugDataCollector()
                 debug_collector.set_main_route_geometry(route.geometry)
         except Exception as e:
@@ -664,9 +740,9 @@ class RoadService:
         # Save linear map to database
         reporter.start_phase(MapGenerationPhase.SAVING)
         try:
-            from .map_storage_service_db import save_map_sync
+            from .map_storage_service_db import save_map_async
 
-            map_id = save_map_sync(
+            map_id = await save_map_async(
                 linear_map,
                 geo_provider=self.geo_provider,
                 user_id=user_id,
@@ -674,6 +750,7 @@ class RoadService:
                 route_segments_data=route_segments_data,
                 route_geometry=route.geometry,
                 route_total_km=route.total_distance,
+                segment_pois_by_segment=segment_pois_by_segment,
             )
             linear_map.id = map_id
             reporter.complete_phase(MapGenerationPhase.SAVING)
@@ -683,7 +760,12 @@ class RoadService:
 
         # Step 7: POI Enrichment (Google Places and/or HERE)
         if map_id:
-            self._enrich_map_pois(map_id, reporter)
+            await self._enrich_map_pois_async(map_id, reporter)
+
+            # The map is final now: cache its response for the first open
+            from .map_storage_service_db import cache_map_response_async
+
+            await cache_map_response_async(map_id)
 
         # Log cache statistics summary at the end of map generation
         cache_stats.log_summary()
@@ -757,7 +839,7 @@ class RoadService:
             Tuple of (latitude, longitude) or None if not found
         """
         try:
-            location = await self.geo_provider.geocode(address)
+            location = await self._geocode_async(address)
             if location:
                 return (location.latitude, location.longitude)
             return None
@@ -22,7 +22,9 @@ from api.database.models.segment_poi import SegmentPOI
 from api.database.repositories.route_segment import RouteSegmentRepository
 from api.database.repositories.segment_poi import SegmentPOIRepository
 from api.providers.models import RouteStep
+from api.providers.settings import get_settings
 from api.utils.geo_utils import calculate_distance_meters
+from api.utils.polyline import geometry_for_storage
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +54,7 @@ class SegmentService:
         self.session = session
         self.segment_repo = RouteSegmentRepository(session)
         self.segment_poi_repo = SegmentPOIRepository(session)
+        self.geometry_storage_format = get_settings().route_geometry_storage_format
 
     @staticmethod
     def calculate_segment_hash(
@@ -241,7 +244,9 @@ class SegmentService:
             end_lon=Decimal(str(end_coords[1])),
             road_name=step.road_name or None,
             length_km=Decimal(str(length_km)),
-            geometry=list(step.geometry),
+            geometry=geometry_for_storage(
+                step.geometry, self.geometry_storage_format
+            ),
             search_points=search_points,
             osrm_instruction=None,  # Can be populated from maneuver if needed
             osrm_maneuver_type=step.maneuver_type,
@@ -299,61 +304,77 @@ class SegmentService:
             # Bulk fetch existing segments
             existing_segments = await self.segment_repo.bulk_get_by_hashes(hashes)
 
-        # Process each step
-        for i, step in enumerate(steps):
-            hash_val = hashes[i]
+        # One row per distinct hash that still has to be created
+        new_rows: Dict[str, dict] = {}
+        for step, hash_val in zip(steps, hashes):
+            if hash_val not in existing_segments and hash_val not in new_rows:
+                new_rows[hash_val] = self._segment_values_from_step(step, hash_val)
 
-            if hash_val in existing_segments:
-                segment = existing_segments[hash_val]
-                await self.segment_repo.increment_usage_count(segment.id)
-                results.append((segment, False))
-            else:
-                # Create new segment with versioned hash
-                segment = await self._create_segment_from_step(step, hash_val)
+        # Insert all new segments at once; hashes created concurrently by
+        # another generation are skipped by the database and fetched instead
+        created_segments = await self.segment_repo.bulk_create_missing(
+            list(new_rows.values())
+        )
+        lost_hashes = [h for h in new_rows if h not in created_segments]
+        if lost_hashes:
+            existing_segments.update(
+                await self.segment_repo.bulk_get_by_hashes(lost_hashes)
+            )
+
+        # Every use of a segment except its creation counts as a reuse
+        reused_ids: List[UUID] = []
+        for hash_val in hashes:
+            segment = created_segments.pop(hash_val, None)
+            if segment is not None:
                 results.append((segment, True))
-                # Add to existing_segments to handle duplicate steps
+                # Later duplicate steps reuse the segment just created
                 existing_segments[hash_val] = segment
+            else:
+                segment = existing_segments[hash_val]
+                reused_ids.append(segment.id)
+                results.append((segment, False))
+
+        await self.segment_repo.bulk_increment_usage(reused_ids)
 
         return results
 
-    async def _create_segment_from_step(
+    def _segment_values_from_step(
         self,
         step: RouteStep,
         segment_hash: str,
-    ) -> RouteSegment:
+    ) -> dict:
         """
-        Create a new RouteSegment from a RouteStep.
+        Build the column values of a new RouteSegment from a RouteStep.
 
         Args:
             step: RouteStep from OSRM
             segment_hash: Pre-calculated hash for the segment
 
         Returns:
-            Created RouteSegment
+            Dict of RouteSegment column values
         """
         start_coords = step.start_coords
         end_coords = step.end_coords
         length_km = step.distance_km
         search_points = self.generate_search_points(step.geometry, length_km)
 
-        segment = RouteSegment(
-            segment_hash=segment_hash,
-            start_lat=Decimal(str(start_coords[0])),
-            start_lon=Decimal(str(start_coords[1])),
-            end_lat=Decimal(str(end_coords[0])),
-            end_lon=Decimal(str(end_coords[1])),
-            road_name=step.road_name or None,
-            length_km=Decimal(str(length_km)),
-            geometry=list(step.geometry),
-            search_points=search_points,
-            osrm_instruction=None,
-            osrm_maneuver_type=step.maneuver_type,
-            usage_count=1,
-            pois_fetched_at=None,
-        )
-
-        created_segment = await self.segment_repo.create(segment)
-        return created_segment
+        return {
+            "segment_hash": segment_hash,
+            "start_lat": Decimal(str(start_coords[0])),
+            "start_lon": Decimal(str(start_coords[1])),
+            "end_lat": Decimal(str(end_coords[0])),
+            "end_lon": Decimal(str(end_coords[1])),
+            "road_name": step.road_name or None,
+            "length_km": Decimal(str(length_km)),
+            "geometry": geometry_for_storage(
+                step.geometry, self.geometry_storage_format
+            ),
+            "search_points": search_points,
+            "osrm_instruction": None,
+            "osrm_maneuver_type": step.maneuver_type,
+            "usage_count": 1,
+            "pois_fetched_at": None,
+        }
 
     async def associate_pois_to_segment(
         self,
@@ -2,11 +2,14 @@
 Async utility functions for safe execution of coroutines.
 
 This module provides helpers for running async code from synchronous contexts,
-handling event loop conflicts that can occur in various execution environments.
+handling event loop conflicts that can occur in various execution environments,
+and a rate limiter that is safe to share between threads and event loops.
 """
 
 import asyncio
 import concurrent.futures
+import threading
+import time
 from typing import Any, Coroutine
 
 
@@ -43,3 +46,56 @@ def run_async_safe(coro: Coroutine) -> Any:
     except RuntimeError:
         # No event loop in this thread, create and use a new one
         return asyncio.run(coro)
+
+
+class AsyncRateLimiter:
+    """
+    Token bucket that keeps awaited calls within a requests-per-second budget.
+
+    Up to ``burst`` calls may start at once after an idle period; sustained
+    traffic is spaced by ``1 / rate_per_second`` seconds (implemented as a
+    generic cell rate algorithm, i.e. a single "next slot" timestamp).
+
+    Slots are reserved under a ``threading.Lock`` and the wait happens with
+    ``asyncio.sleep`` outside of it, so a single limiter can be shared by
+    provider singletons that are used from several threads, each running its
+    own event loop (see ``AsyncService.run_async``). An ``asyncio.Lock``
+    would be bound to whichever loop first contended for it.
+    """
+
+    def __init__(self, rate_per_second: float, burst: int = 1):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate_per_second: Maximum number of acquisitions per second.
+                Values <= 0 disable limiting.
+            burst: Bucket size, i.e. how many acquisitions may run ahead of
+                the steady rate (1 = strict spacing)
+        """
+        self._interval = 1.0 / rate_per_second if rate_per_second > 0 else 0.0
+        self._burst = max(1, burst)
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def interval(self) -> float:
+        """Minimum number of seconds between two acquisitions."""
+        return self._interval
+
+    def _reserve_slot(self) -> float:
+        """Reserve the next free slot and return how long to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+            # The bucket lets the first `burst` slots start before their turn
+            return max(0.0, slot - (self._burst - 1) * self._interval - now)
+
+    async def acquire(self) -> None:
+        """Wait until the caller is allowed to issue its request."""
+        if self._interval <= 0:
+            return
+        delay = self._reserve_slot()
+        if delay > 0:
+            await asyncio.sleep(delay)
@@ -3,10 +3,29 @@ Geographic utility functions for distance and coordinate calculations.
 
 This module contains pure mathematical functions with no dependencies on
 providers or services. All functions are stateless and can be tested independently.
+
+Route-level functions come in two forms:
+- Array kernels that take a route as an (N, 2) float64 array of (lat, lon)
+  and process many query points at once with NumPy.
+- The original scalar API (lists of (lat, lon) tuples, one query point),
+  kept as thin wrappers over the array kernels.
+calculate_distance_meters and interpolate_coordinate_at_distance are O(1)
+per call and stay plain math, which is faster than NumPy for a single value.
 """
 
 import math
-from typing import List, Tuple, Optional
+from typing import List, Sequence, Tuple, Optional
+
+import numpy as np
+
+# Earth radius in meters
+EARTH_RADIUS_M = 6371000.0
+
+# Latitude limit of Web Mercator (slippy map) tiles
+MAX_TILE_LATITUDE = 85.0511287798
+
+# Max elements of a (query points x route points) matrix computed at once
+_MAX_PAIRWISE_ELEMENTS = 1_000_000
 
 
 def calculate_distance_meters(
@@ -41,13 +60,333 @@ def calculate_distance_meters(
     )
     c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
 
-    # Earth radius in meters
-    R = 6371000
-    distance = R * c
+    distance = EARTH_RADIUS_M * c
 
     return distance
 
 
+# =============================================================================
+# ARRAY KERNELS
+# =============================================================================
+
+
+def as_route_array(geometry: Sequence[Tuple[float, float]]) -> np.ndarray:
+    """
+    Convert a route geometry to an (N, 2) float64 array.
+
+    Args:
+        geometry: Route geometry as list of (lat, lon) tuples, or an array
+
+    Returns:
+        Array of shape (N, 2) with columns (lat, lon)
+    """
+    route = np.asarray(geometry, dtype=np.float64)
+    return route.reshape(-1, 2)
+
+
+def haversine_distances_m(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """
+    Haversine distance between points, element-wise with NumPy broadcasting.
+
+    Args:
+        lat1, lon1: First point coordinates (degrees), scalars or arrays
+        lat2, lon2: Second point coordinates (degrees), scalars or arrays
+
+    Returns:
+        Array of distances in meters (broadcast shape of the inputs)
+    """
+    lat1_rad = np.radians(lat1)
+    lat2_rad = np.radians(lat2)
+    dlat = lat2_rad - lat1_rad
+    dlon = np.radians(lon2) - np.radians(lon1)
+
+    a = (
+        np.sin(dlat / 2) ** 2
+        + np.cos(lat1_rad) * np.cos(lat2_rad) * np.sin(dlon / 2) ** 2
+    )
+    # Rounding can push a slightly outside [0, 1]
+    a = np.clip(a, 0.0, 1.0)
+    return EARTH_RADIUS_M * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def segment_lengths_m(route: np.ndarray) -> np.ndarray:
+    """
+    Length of each segment of a route.
+
+    Args:
+        route: Route as an (N, 2) array of (lat, lon)
+
+    Returns:
+        Array of N-1 segment lengths in meters
+    """
+    return haversine_distances_m(
+        route[:-1, 0], route[:-1, 1], route[1:, 0], route[1:, 1]
+    )
+
+
+def cumulative_distances_m(route: np.ndarray) -> np.ndarray:
+    """
+    Distance from the route start to each route point.
+
+    Args:
+        route: Route as an (N, 2) array of (lat, lon)
+
+    Returns:
+        Array of N cumulative distances in meters (0.0 for the first point);
+        empty for an empty route
+    """
+    if len(route) == 0:
+        return np.empty(0, dtype=np.float64)
+
+    cumulative = np.empty(len(route), dtype=np.float64)
+    cumulative[0] = 0.0
+    np.cumsum(segment_lengths_m(route), out=cumulative[1:])
+    return cumulative
+
+
+def _pairwise_argmin(targets: np.ndarray, points: np.ndarray, distance_fn) -> np.ndarray:
+    """
+    For each point, index of the target minimizing distance_fn.
+
+    The (points x targets) distance matrix is computed in row chunks to keep
+    memory bounded on long routes. Ties resolve to the lowest target index.
+    """
+    result = np.empty(len(points), dtype=np.intp)
+    chunk = max(1, _MAX_PAIRWISE_ELEMENTS // max(1, len(targets)))
+
+    for start in range(0, len(points), chunk):
+        block = points[start:start + chunk]
+        distances = distance_fn(
+            block[:, 0:1], block[:, 1:2], targets[:, 0], targets[:, 1]
+        )
+        result[start:start + chunk] = np.argmin(distances, axis=1)
+
+    return result
+
+
+def _squared_degree_distances(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Squared Euclidean distance in degree space (cheap, for ranking only)."""
+    return (lat2 - lat1) ** 2 + (lon2 - lon1) ** 2
+
+
+def closest_point_indices(route: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """
+    Index of the closest route point for each query point.
+
+    Uses Euclidean distance in degree space, like find_closest_point_index.
+
+    Args:
+        route: Route as an (N, 2) array of (lat, lon)
+        points: Query points as an (M, 2) array of (lat, lon)
+
+    Returns:
+        Array of M route point indices (all 0 for an empty route)
+    """
+    points = as_route_array(points)
+    if len(route) == 0:
+        return np.zeros(len(points), dtype=np.intp)
+    return _pairwise_argmin(route, points, _squared_degree_distances)
+
+
+def closest_segment_indices(route: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """
+    Index of the closest route segment for each query point.
+
+    Segments are compared by the haversine distance to their midpoint,
+    like find_closest_segment_index.
+
+    Args:
+        route: Route as an (N, 2) array of (lat, lon)
+        points: Query points as an (M, 2) array of (lat, lon)
+
+    Returns:
+        Array of M segment indices in [0, N-2] (all 0 if the route has
+        fewer than 2 points)
+    """
+    points = as_route_array(points)
+    if len(route) < 2:
+        return np.zeros(len(points), dtype=np.intp)
+
+    midpoints = (route[:-1] + route[1:]) / 2
+    return _pairwise_argmin(midpoints, points, haversine_distances_m)
+
+
+def distances_along_route_km(
+    route: np.ndarray,
+    points: np.ndarray,
+    cumulative_m: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Distance along the route to reach each query point.
+
+    The distance is measured to the start of the closest segment, like
+    calculate_distance_along_route.
+
+    Args:
+        route: Route as an (N, 2) array of (lat, lon)
+        points: Query points as an (M, 2) array of (lat, lon)
+        cumulative_m: Optional precomputed cumulative_distances_m(route)
+
+    Returns:
+        Array of M distances in kilometers
+    """
+    points = as_route_array(points)
+    if len(route) == 0:
+        return np.zeros(len(points), dtype=np.float64)
+    if cumulative_m is None:
+        cumulative_m = cumulative_distances_m(route)
+
+    segment_idx = closest_segment_indices(route, points)
+    return cumulative_m[segment_idx] / 1000.0
+
+
+def distances_to_route_end_km(
+    route: np.ndarray,
+    points: np.ndarray,
+    cumulative_m: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Distance from each query point to the end of the route.
+
+    Each point is projected onto the end of its closest segment, like
+    calculate_distance_from_point_to_end.
+
+    Args:
+        route: Route as an (N, 2) array of (lat, lon)
+        points: Query points as an (M, 2) array of (lat, lon)
+        cumulative_m: Optional precomputed cumulative_distances_m(route)
+
+    Returns:
+        Array of M distances in kilometers (zeros if the route has fewer
+        than 2 points)
+    """
+    points = as_route_array(points)
+    if len(route) < 2:
+        return np.zeros(len(points), dtype=np.float64)
+    if cumulative_m is None:
+        cumulative_m = cumulative_distances_m(route)
+
+    projection_idx = closest_segment_indices(route, points) + 1
+    projection = route[projection_idx]
+    remaining_m = cumulative_m[-1] - cumulative_m[projection_idx]
+    to_projection_m = haversine_distances_m(
+        points[:, 0], points[:, 1], projection[:, 0], projection[:, 1]
+    )
+    return (remaining_m + to_projection_m) / 1000.0
+
+
+def interpolate_coordinates_at_distances(
+    route: np.ndarray,
+    target_distances_km,
+    total_distance_km: float,
+) -> np.ndarray:
+    """
+    Interpolate coordinates at many distances along the route.
+
+    Distances are mapped to a fractional point index proportionally to
+    total_distance_km, like interpolate_coordinate_at_distance.
+
+    Args:
+        route: Route as an (N, 2) array of (lat, lon)
+        target_distances_km: Distances from start in kilometers (array-like)
+        total_distance_km: Total route distance in kilometers
+
+    Returns:
+        Array of shape (M, 2) with interpolated (lat, lon)
+    """
+    targets = np.atleast_1d(np.asarray(target_distances_km, dtype=np.float64))
+    if len(route) == 0:
+        return np.zeros((len(targets), 2), dtype=np.float64)
+
+    last = len(route) - 1
+    if total_distance_km > 0:
+        ratio = np.clip(targets / total_distance_km, 0.0, 1.0)
+    else:
+        ratio = np.zeros_like(targets)
+    target_index = ratio * last
+
+    index_before = np.minimum(np.floor(target_index).astype(np.intp), last)
+    index_after = np.minimum(index_before + 1, last)
+    local_ratio = (target_index - index_before)[:, None]
+
+    point_before = route[index_before]
+    result = point_before + (route[index_after] - point_before) * local_ratio
+
+    # Out-of-range distances snap to the route ends
+    result[targets <= 0] = route[0]
+    result[(targets > 0) & (targets >= total_distance_km)] = route[-1]
+    return result
+
+
+def tile_indices(latitudes, longitudes, zoom: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Slippy map (Web Mercator) tiles containing coordinates.
+
+    Latitudes beyond MAX_TILE_LATITUDE are clamped to the first/last tile
+    row, as are longitudes outside [-180, 180] to the first/last column.
+
+    Args:
+        latitudes: Latitudes in degrees (scalar or array)
+        longitudes: Longitudes in degrees (scalar or array)
+        zoom: Tile zoom level (2**zoom tiles per axis)
+
+    Returns:
+        Tuple of (x, y) int64 arrays; y grows southwards
+    """
+    n = 1 << zoom
+    lat = np.radians(np.clip(
+        np.asarray(latitudes, dtype=np.float64), -MAX_TILE_LATITUDE, MAX_TILE_LATITUDE
+    ))
+    lon = np.asarray(longitudes, dtype=np.float64)
+    x = np.floor((lon + 180.0) / 360.0 * n)
+    y = np.floor((1.0 - np.arcsinh(np.tan(lat)) / np.pi) / 2.0 * n)
+    return (
+        np.clip(x, 0, n - 1).astype(np.int64),
+        np.clip(y, 0, n - 1).astype(np.int64),
+    )
+
+
+def tile_bounds(x: int, y: int, zoom: int) -> Tuple[float, float, float, float]:
+    """
+    Bounding box of a slippy map tile.
+
+    Returns:
+        Tuple of (south, west, north, east) in degrees
+    """
+    n = 1 << zoom
+
+    def _latitude(row: int) -> float:
+        return math.degrees(math.atan(math.sinh(math.pi * (1.0 - 2.0 * row / n))))
+
+    return _latitude(y + 1), x / n * 360.0 - 180.0, _latitude(y), (x + 1) / n * 360.0 - 180.0
+
+
+def tiles_in_bbox(
+    south: float, west: float, north: float, east: float, zoom: int
+) -> List[Tuple[int, int]]:
+    """
+    Slippy map tiles intersecting a bounding box.
+
+    Args:
+        south, west, north, east: Box bounds in degrees
+        zoom: Tile zoom level
+
+    Returns:
+        List of (x, y) tiles, row by row from the north-west corner
+    """
+    xs, ys = tile_indices([north, south], [west, east], zoom)
+    return [
+        (x, y)
+        for y in range(int(ys[0]), int(ys[1]) + 1)
+        for x in range(int(xs[0]), int(xs[1]) + 1)
+    ]
+
+
+# =============================================================================
+# SCALAR API (thin wrappers over the array kernels where the work is O(N))
+# =============================================================================
+
+
 def calculate_distance_along_route(
     geometry: List[Tuple[float, float]], target_point: Tuple[float, float]
 ) -> float:
@@ -64,40 +403,8 @@ def calculate_distance_along_route(
     if not geometry:
         return 0.0
 
-    # Find the segment in geometry closest to target point
-    min_distance = float("inf")
-    closest_segment_idx = 0
-
-    for i in range(len(geometry) - 1):
-        # Calculate distance from target to this segment
-        seg_start = geometry[i]
-        seg_end = geometry[i + 1]
-
-        # Distance to segment midpoint (simplified)
-        midpoint = (
-            (seg_start[0] + seg_end[0]) / 2,
-            (seg_start[1] + seg_end[1]) / 2,
-        )
-        dist = calculate_distance_meters(
-            target_point[0], target_point[1], midpoint[0], midpoint[1]
-        )
-
-        if dist < min_distance:
-            min_distance = dist
-            closest_segment_idx = i
-
-    # Calculate cumulative distance up to the closest segment
-    cumulative_distance = 0.0
-    for i in range(closest_segment_idx):
-        cumulative_distance += calculate_distance_meters(
-            geometry[i][0],
-            geometry[i][1],
-            geometry[i + 1][0],
-            geometry[i + 1][1],
-        )
-
-    # Convert to km
-    return cumulative_distance / 1000.0
+    route = as_route_array(geometry)
+    return float(distances_along_route_km(route, [target_point])[0])
 
 
 def calculate_distance_from_point_to_end(
@@ -119,53 +426,8 @@ def calculate_distance_from_point_to_end(
     if not geometry or len(geometry) < 2:
         return 0.0
 
-    # Find the segment in geometry closest to start point
-    min_distance = float("inf")
-    closest_segment_idx = 0
-    projection_point = start_point
-
-    for i in range(len(geometry) - 1):
-        seg_start = geometry[i]
-        seg_end = geometry[i + 1]
-
-        # Calculate projection of start_point onto this segment
-        # For simplicity, we'll use the midpoint approach
-        midpoint = (
-            (seg_start[0] + seg_end[0]) / 2,
-            (seg_start[1] + seg_end[1]) / 2,
-        )
-        dist = calculate_distance_meters(
-            start_point[0], start_point[1], midpoint[0], midpoint[1]
-        )
-
-        if dist < min_distance:
-            min_distance = dist
-            closest_segment_idx = i
-            # Use the end of this segment as the projection point
-            projection_point = seg_end
-
-    # Calculate distance from projection point to end of geometry
-    cumulative_distance = 0.0
-
-    # Start from the segment after the closest one
-    for i in range(closest_segment_idx + 1, len(geometry) - 1):
-        cumulative_distance += calculate_distance_meters(
-            geometry[i][0],
-            geometry[i][1],
-            geometry[i + 1][0],
-            geometry[i + 1][1],
-        )
-
-    # Also add the distance from the start_point to the projection_point
-    cumulative_distance += calculate_distance_meters(
-        start_point[0],
-        start_point[1],
-        projection_point[0],
-        projection_point[1],
-    )
-
-    # Convert to km
-    return cumulative_distance / 1000.0
+    route = as_route_array(geometry)
+    return float(distances_to_route_end_km(route, [start_point])[0])
 
 
 def interpolate_coordinate_at_distance(
@@ -193,21 +455,19 @@ def interpolate_coordinate_at_distance(
     if target_distance_km >= total_distance_km:
         return geometry[-1]
 
-    # Calculate the ratio along the route
+    # O(1) per call, so this stays scalar: converting the whole geometry to an
+    # array would cost more than the interpolation itself. Use
+    # interpolate_coordinates_at_distances for many distances at once.
     ratio = target_distance_km / total_distance_km
-
-    # Find the appropriate segment in the geometry
     total_points = len(geometry)
     target_index = ratio * (total_points - 1)
 
-    # Get the two points to interpolate between
     index_before = int(target_index)
     index_after = min(index_before + 1, total_points - 1)
 
     if index_before == index_after:
         return geometry[index_before]
 
-    # Interpolate between the two points
     point_before = geometry[index_before]
     point_after = geometry[index_after]
     local_ratio = target_index - index_before
@@ -234,18 +494,8 @@ def find_closest_point_index(
     if not geometry:
         return 0
 
-    min_distance = float("inf")
-    closest_idx = 0
-
-    for i, (pt_lat, pt_lon) in enumerate(geometry):
-        dist = (
-            (pt_lat - target_point[0]) ** 2 + (pt_lon - target_point[1]) ** 2
-        ) ** 0.5
-        if dist < min_distance:
-            min_distance = dist
-            closest_idx = i
-
-    return closest_idx
+    route = as_route_array(geometry)
+    return int(closest_point_indices(route, [target_point])[0])
 
 
 def find_closest_segment_index(
@@ -264,23 +514,5 @@ def find_closest_segment_index(
     if not geometry or len(geometry) < 2:
         return 0
 
-    min_distance = float("inf")
-    segment_idx = 0
-
-    for i in range(len(geometry) - 1):
-        seg_start = geometry[i]
-        seg_end = geometry[i + 1]
-        midpoint = (
-            (seg_start[0] + seg_end[0]) / 2,
-            (seg_start[1] + seg_end[1]) / 2,
-        )
-
-        dist = calculate_distance_meters(
-            target_point[0], target_point[1], midpoint[0], midpoint[1]
-        )
-
-        if dist < min_distance:
-            min_distance = dist
-            segment_idx = i
-
-    return segment_idx
+    route = as_route_array(geometry)
+    return int(closest_segment_indices(route, [target_point])[0])
@@ -0,0 +1,127 @@
+"""
+Long-lived, pooled HTTP clients for the external API providers.
+
+Creating an ``httpx.AsyncClient`` per request pays DNS, TCP and TLS setup on
+every call and throws keep-alive away. A PooledHttpClient is owned by a
+provider for its whole lifetime and hands out one pooled client per event
+loop instead: httpx connections belong to the loop that opened them, and
+the providers are shared by several loops (one per background worker
+thread of ``AsyncService.run_async``, plus short-lived ones started by
+``run_async_safe``), so a single client can't be shared between them.
+
+``close_http_clients`` closes every pooled client and is called from the
+FastAPI lifespan on shutdown.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import threading
+import weakref
+from typing import Dict, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional 'h2' package (pip install "httpx[http2]")
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Seconds to wait for a client owned by another thread's loop to close
+_CLOSE_TIMEOUT_SECONDS = 5.0
+
+_registry: "weakref.WeakSet[PooledHttpClient]" = weakref.WeakSet()
+
+
+class PooledHttpClient:
+    """
+    One keep-alive ``httpx.AsyncClient`` per event loop, created on first use.
+
+    Pool limits, keep-alive expiry and HTTP/2 come from settings
+    (HTTP_MAX_CONNECTIONS, HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    HTTP_KEEPALIVE_EXPIRY, HTTP2_ENABLED).
+    """
+
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Initialize the pooled client.
+
+        Args:
+            timeout: Default request timeout in seconds
+            headers: Headers sent with every request
+        """
+        self._timeout = timeout
+        self._headers = dict(headers or {})
+        self._clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+        self._lock = threading.Lock()
+        _registry.add(self)
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create a client with the configured pool limits."""
+        from api.providers.settings import get_settings
+
+        settings = get_settings()
+        return httpx.AsyncClient(
+            timeout=httpx.Timeout(self._timeout),
+            headers=self._headers,
+            limits=httpx.Limits(
+                max_connections=settings.http_max_connections,
+                max_keepalive_connections=settings.http_max_keepalive_connections,
+                keepalive_expiry=settings.http_keepalive_expiry,
+            ),
+            http2=settings.http2_enabled and HTTP2_AVAILABLE,
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        Client of the running event loop.
+
+        Must be accessed from a coroutine. Clients of loops that have been
+        closed since (e.g. by a finished ``asyncio.run``) are dropped here.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            for closed_loop in [l for l in self._clients if l.is_closed()]:
+                del self._clients[closed_loop]
+
+            client = self._clients.get(loop)
+            if client is None or client.is_closed:
+                client = self._create_client()
+                self._clients[loop] = client
+            return client
+
+    async def aclose(self) -> None:
+        """
+        Close the clients of every event loop.
+
+        Clients of the running loop and of loops running in other threads
+        are closed gracefully; clients of idle loops are only dropped, since
+        nothing can run their close (their sockets are released with them).
+        """
+        current_loop = asyncio.get_running_loop()
+        with self._lock:
+            clients = list(self._clients.items())
+            self._clients.clear()
+
+        for loop, client in clients:
+            try:
+                if loop is current_loop:
+                    await client.aclose()
+                elif loop.is_running():
+                    future = asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+                    await asyncio.wait_for(
+                        asyncio.wrap_future(future), timeout=_CLOSE_TIMEOUT_SECONDS
+                    )
+            except Exception as e:
+                logger.warning(f"Error closing HTTP client: {e}")
+
+
+async def close_http_clients() -> None:
+    """Close all pooled HTTP clients (application shutdown)."""
+    for pooled in list(_registry):
+        await pooled.aclose()
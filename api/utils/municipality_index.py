@@ -0,0 +1,204 @@
+"""
+Point-in-municipality index for offline city lookup.
+
+Reverse geocoding a POI just to learn its city costs one network request
+(one per second against Nominatim). MunicipalityIndex answers the same
+question from municipality boundaries held in memory: a coarse grid narrows
+each lookup down to the few municipalities whose bounding box covers the
+point, and an even-odd ray cast over their rings decides which one contains
+it.
+
+MunicipalityNameIndex does the opposite for "City, UF" inputs: it maps
+accent- and case-insensitive municipality names to their seat coordinates,
+so they can be geocoded without Nominatim.
+"""
+
+import math
+import re
+import unicodedata
+from array import array
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+# Boundary ring as [(lon, lat), ...] (GeoJSON order)
+Ring = Sequence[Sequence[float]]
+
+
+class IndexedMunicipality(NamedTuple):
+    """A municipality known by the index."""
+
+    code: int
+    name: str
+    uf: str
+
+
+class _Ring(NamedTuple):
+    """Ring coordinates stored compactly, with its bounding box."""
+
+    lons: array
+    lats: array
+    min_lon: float
+    min_lat: float
+    max_lon: float
+    max_lat: float
+
+
+def _to_ring(coordinates: Ring) -> Optional[_Ring]:
+    """Convert GeoJSON ring coordinates; rings with less than 3 points are dropped."""
+    if len(coordinates) < 3:
+        return None
+    lons = array("d", (point[0] for point in coordinates))
+    lats = array("d", (point[1] for point in coordinates))
+    return _Ring(lons, lats, min(lons), min(lats), max(lons), max(lats))
+
+
+def _crossings(ring: _Ring, lat: float, lon: float) -> int:
+    """Count ring edges crossed by a ray cast from the point towards +lon."""
+    lons = ring.lons
+    lats = ring.lats
+    count = 0
+    j = len(lats) - 1
+    for i in range(len(lats)):
+        lat_i = lats[i]
+        lat_j = lats[j]
+        if (lat_i > lat) != (lat_j > lat):
+            lon_cross = lons[i] + (lat - lat_i) * (lons[j] - lons[i]) / (lat_j - lat_i)
+            if lon < lon_cross:
+                count += 1
+        j = i
+    return count
+
+
+class MunicipalityIndex:
+    """
+    In-memory boundaries of municipalities with a grid for fast lookups.
+
+    Each municipality is a set of rings (outer boundaries and holes of all
+    its polygons); a point is inside when it crosses an odd number of ring
+    edges, which handles holes and multi-part municipalities alike.
+    """
+
+    def __init__(
+        self,
+        boundaries: Sequence[Tuple[IndexedMunicipality, Sequence[Ring]]],
+        cell_size_deg: float = 0.25,
+    ):
+        """
+        Build the index.
+
+        Args:
+            boundaries: (municipality, rings) pairs; rings as [(lon, lat), ...]
+            cell_size_deg: Grid cell size in degrees
+        """
+        self.cell_size_deg = cell_size_deg
+        self.municipalities: List[IndexedMunicipality] = []
+        self._rings: List[List[_Ring]] = []
+        self._grid: Dict[Tuple[int, int], List[int]] = {}
+
+        for municipality, rings in boundaries:
+            converted = [ring for ring in map(_to_ring, rings) if ring is not None]
+            if not converted:
+                continue
+
+            position = len(self.municipalities)
+            self.municipalities.append(municipality)
+            self._rings.append(converted)
+
+            min_x, min_y = self._cell(
+                min(ring.min_lat for ring in converted),
+                min(ring.min_lon for ring in converted),
+            )
+            max_x, max_y = self._cell(
+                max(ring.max_lat for ring in converted),
+                max(ring.max_lon for ring in converted),
+            )
+            for x in range(min_x, max_x + 1):
+                for y in range(min_y, max_y + 1):
+                    self._grid.setdefault((x, y), []).append(position)
+
+    def __len__(self) -> int:
+        return len(self.municipalities)
+
+    def _cell(self, lat: float, lon: float) -> Tuple[int, int]:
+        """Grid cell of a coordinate."""
+        return (
+            math.floor(lon / self.cell_size_deg),
+            math.floor(lat / self.cell_size_deg),
+        )
+
+    def lookup(self, lat: float, lon: float) -> Optional[IndexedMunicipality]:
+        """
+        Find the municipality containing the given coordinates.
+
+        Args:
+            lat: Latitude
+            lon: Longitude
+
+        Returns:
+            The containing municipality, or None if the point is outside
+            every boundary
+        """
+        for position in self._grid.get(self._cell(lat, lon), ()):
+            crossings = 0
+            for ring in self._rings[position]:
+                if ring.min_lat <= lat <= ring.max_lat and lon <= ring.max_lon:
+                    crossings += _crossings(ring, lat, lon)
+            if crossings % 2 == 1:
+                return self.municipalities[position]
+        return None
+
+
+class MunicipalitySeat(NamedTuple):
+    """A municipality with the coordinates of its seat."""
+
+    municipality: IndexedMunicipality
+    latitude: float
+    longitude: float
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize a place name for comparison.
+
+    Drops accents, case and punctuation, so "São João d'Aliança",
+    "sao joao d aliança" and "SAO JOAO D'ALIANCA" are the same name.
+    """
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(re.split(r"[^0-9a-z]+", stripped.casefold())).strip()
+
+
+class MunicipalityNameIndex:
+    """In-memory municipality seats by normalized name."""
+
+    def __init__(self, seats: Sequence[MunicipalitySeat]):
+        """
+        Build the index.
+
+        Args:
+            seats: Municipalities with their seat coordinates
+        """
+        self._by_name: Dict[str, List[MunicipalitySeat]] = {}
+        for seat in seats:
+            self._by_name.setdefault(normalize_name(seat.municipality.name), []).append(seat)
+        self._size = len(seats)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def find(self, name: str, uf: Optional[str] = None) -> Optional[MunicipalitySeat]:
+        """
+        Find a municipality by name.
+
+        Args:
+            name: Municipality name, in any case and with or without accents
+            uf: State abbreviation. Without it, the name must be unique
+                nationwide (many names repeat across states)
+
+        Returns:
+            The municipality and its seat, or None if unknown or ambiguous
+        """
+        candidates = self._by_name.get(normalize_name(name), [])
+        if uf is not None:
+            uf = uf.strip().upper()
+            candidates = [seat for seat in candidates if seat.municipality.uf == uf]
+        return candidates[0] if len(candidates) == 1 else None
@@ -0,0 +1,157 @@
+"""
+Encoded polyline support for compact route geometries.
+
+Route segment geometries can be stored and served either as the legacy list
+of [lat, lon] pairs or as an encoded polyline string (Google polyline
+algorithm, 6 decimal places - the same "polyline6" format OSRM uses), which
+is several times smaller and does not need one object per point.
+"""
+
+from typing import Iterable, List, Sequence, Tuple, Union
+
+GEOMETRY_FORMAT_COORDINATES = "coordinates"
+GEOMETRY_FORMAT_POLYLINE = "polyline6"
+GEOMETRY_FORMATS = (GEOMETRY_FORMAT_COORDINATES, GEOMETRY_FORMAT_POLYLINE)
+
+POLYLINE_PRECISION = 6
+
+
+def _encode_value(value: int, chunks: List[str]) -> None:
+    """Append the polyline encoding of one signed delta."""
+    value = ~(value << 1) if value < 0 else value << 1
+    while value >= 0x20:
+        chunks.append(chr((0x20 | (value & 0x1F)) + 63))
+        value >>= 5
+    chunks.append(chr(value + 63))
+
+
+def encode_polyline(
+    points: Iterable[Sequence[float]], precision: int = POLYLINE_PRECISION
+) -> str:
+    """
+    Encode coordinates as a polyline string.
+
+    Args:
+        points: Coordinates as [(lat, lon), ...] (lists or tuples)
+        precision: Number of decimal places kept
+
+    Returns:
+        Encoded polyline
+    """
+    factor = 10 ** precision
+    chunks: List[str] = []
+    prev_lat = prev_lon = 0
+
+    for point in points:
+        lat = round(point[0] * factor)
+        lon = round(point[1] * factor)
+        _encode_value(lat - prev_lat, chunks)
+        _encode_value(lon - prev_lon, chunks)
+        prev_lat, prev_lon = lat, lon
+
+    return "".join(chunks)
+
+
+def decode_polyline(
+    encoded: str, precision: int = POLYLINE_PRECISION
+) -> List[Tuple[float, float]]:
+    """
+    Decode a polyline string into coordinates.
+
+    Args:
+        encoded: Encoded polyline
+        precision: Number of decimal places used when encoding
+
+    Returns:
+        Coordinates as [(lat, lon), ...]
+
+    Raises:
+        ValueError: If the string is not a valid polyline
+    """
+    factor = 10 ** precision
+    points: List[Tuple[float, float]] = []
+    index = 0
+    length = len(encoded)
+    lat = lon = 0
+
+    while index < length:
+        deltas = []
+        for _ in range(2):
+            result = 0
+            shift = 0
+            while True:
+                if index >= length:
+                    raise ValueError("Polyline truncated")
+                byte = ord(encoded[index]) - 63
+                index += 1
+                result |= (byte & 0x1F) << shift
+                shift += 5
+                if byte < 0x20:
+                    break
+            deltas.append(~(result >> 1) if result & 1 else result >> 1)
+
+        lat += deltas[0]
+        lon += deltas[1]
+        points.append((lat / factor, lon / factor))
+
+    return points
+
+
+def geometry_to_coordinates(
+    geometry: Union[str, Sequence[Sequence[float]], None]
+) -> List[Tuple[float, float]]:
+    """
+    Read a stored geometry in either format as coordinates.
+
+    Args:
+        geometry: Encoded polyline, or list of [lat, lon] pairs
+
+    Returns:
+        Coordinates as [(lat, lon), ...]; malformed points are skipped
+    """
+    if not geometry:
+        return []
+    if isinstance(geometry, str):
+        return decode_polyline(geometry)
+    return [
+        (point[0], point[1])
+        for point in geometry
+        if isinstance(point, (list, tuple)) and len(point) >= 2
+    ]
+
+
+def geometry_to_polyline(
+    geometry: Union[str, Sequence[Sequence[float]], None]
+) -> str:
+    """
+    Read a stored geometry in either format as an encoded polyline.
+
+    Geometries already stored as polylines are returned as is.
+
+    Args:
+        geometry: Encoded polyline, or list of [lat, lon] pairs
+
+    Returns:
+        Encoded polyline (precision 6)
+    """
+    if isinstance(geometry, str):
+        return geometry
+    return encode_polyline(geometry_to_coordinates(geometry))
+
+
+def geometry_for_storage(
+    points: Sequence[Sequence[float]], storage_format: str
+) -> Union[str, List[Sequence[float]]]:
+    """
+    Convert coordinates into the value stored in RouteSegment.geometry.
+
+    Args:
+        points: Coordinates as [(lat, lon), ...]
+        storage_format: GEOMETRY_FORMAT_COORDINATES or GEOMETRY_FORMAT_POLYLINE
+
+    Returns:
+        Encoded polyline or list of coordinates
+    """
+    if storage_format == GEOMETRY_FORMAT_POLYLINE:
+        return encode_polyline(points)
+    return list(points)
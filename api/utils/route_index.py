@@ -0,0 +1,145 @@
+"""
+Spatial index over a route geometry for nearest-point queries.
+
+Route geometries can have tens of thousands of points, and junction
+calculation asks "which route point is closest to X?" once per POI (and once
+per access-route point). RouteIndex builds a static KD-tree once per route so
+those queries are logarithmic instead of a full haversine scan, and keeps the
+cumulative distance of every point so "distance along route" is a lookup.
+"""
+
+import math
+from typing import List, Optional, Tuple
+
+from api.utils.geo_utils import (
+    as_route_array,
+    calculate_distance_meters,
+    cumulative_distances_m,
+)
+
+# KD-tree node: (point_index, split_axis, left_subtree, right_subtree)
+_Node = Tuple[int, int, Optional["_Node"], Optional["_Node"]]
+
+
+def _to_unit_vector(lat: float, lon: float) -> Tuple[float, float, float]:
+    """Convert (lat, lon) in degrees to a 3D unit vector on the sphere."""
+    lat_rad = math.radians(lat)
+    lon_rad = math.radians(lon)
+    cos_lat = math.cos(lat_rad)
+    return (cos_lat * math.cos(lon_rad), cos_lat * math.sin(lon_rad), math.sin(lat_rad))
+
+
+class RouteIndex:
+    """
+    Nearest-point index and cumulative distances for one route geometry.
+
+    Points are stored as 3D unit vectors: the straight-line (chord) distance
+    between two unit vectors grows monotonically with their great-circle
+    distance, so the nearest point by chord is the nearest point by haversine.
+    Ties are broken by the lowest point index, like a linear scan would.
+
+    Attributes:
+        geometry: Route geometry as [(lat, lon), ...]
+        cumulative_km: Distance from the route start to each point, in km
+    """
+
+    def __init__(self, geometry: List[Tuple[float, float]]):
+        """
+        Build the index.
+
+        Args:
+            geometry: Route geometry as [(lat, lon), ...]
+        """
+        self.geometry = geometry
+        self._vectors = [_to_unit_vector(lat, lon) for lat, lon in geometry]
+
+        self.cumulative_km: List[float] = (
+            cumulative_distances_m(as_route_array(geometry)) / 1000.0
+        ).tolist()
+
+        self._root = self._build(list(range(len(geometry))), 0)
+
+    def __len__(self) -> int:
+        return len(self.geometry)
+
+    def _build(self, indices: List[int], depth: int) -> Optional[_Node]:
+        """Recursively build a balanced KD-tree over the given point indices."""
+        if not indices:
+            return None
+
+        axis = depth % 3
+        vectors = self._vectors
+        indices.sort(key=lambda i: vectors[i][axis])
+        median = len(indices) // 2
+
+        return (
+            indices[median],
+            axis,
+            self._build(indices[:median], depth + 1),
+            self._build(indices[median + 1:], depth + 1),
+        )
+
+    def nearest_index(self, lat: float, lon: float) -> int:
+        """
+        Find the index of the route point closest to the given coordinates.
+
+        Args:
+            lat: Query latitude
+            lon: Query longitude
+
+        Returns:
+            Index into geometry, or -1 if the geometry is empty
+        """
+        if self._root is None:
+            return -1
+
+        query = _to_unit_vector(lat, lon)
+        vectors = self._vectors
+        # Best match as (squared chord distance, point index)
+        best = (float("inf"), -1)
+
+        # Stack of (node, squared distance from query to the node's region bound)
+        stack: List[Tuple[_Node, float]] = [(self._root, 0.0)]
+        while stack:
+            node, bound = stack.pop()
+            if bound > best[0]:
+                continue
+            index, axis, left, right = node
+            vector = vectors[index]
+
+            dx = vector[0] - query[0]
+            dy = vector[1] - query[1]
+            dz = vector[2] - query[2]
+            candidate = (dx * dx + dy * dy + dz * dz, index)
+            if candidate < best:
+                best = candidate
+
+            diff = query[axis] - vector[axis]
+            near, far = (left, right) if diff < 0 else (right, left)
+            # Far side is only worth visiting if the splitting plane is within
+            # reach; pushed first so the near side is explored first
+            if far is not None:
+                stack.append((far, max(bound, diff * diff)))
+            if near is not None:
+                stack.append((near, bound))
+
+        return best[1]
+
+    def nearest(self, lat: float, lon: float) -> Tuple[int, float]:
+        """
+        Find the closest route point and its haversine distance.
+
+        Args:
+            lat: Query latitude
+            lon: Query longitude
+
+        Returns:
+            Tuple of (index into geometry, distance in meters);
+            (-1, inf) if the geometry is empty
+        """
+        index = self.nearest_index(lat, lon)
+        if index < 0:
+            return index, float("inf")
+
+        point = self.geometry[index]
+        return index, calculate_distance_meters(lat, lon, point[0], point[1])
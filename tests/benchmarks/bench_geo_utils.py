@@ -0,0 +1,161 @@
+"""
+Micro-benchmark for the vectorized geometry kernels in api/utils/geo_utils.py.
+
+Compares per-point pure-Python loops (the pre-NumPy implementations) against
+the array kernels on route sizes seen in production: a 1,000 km OSRM route
+has roughly 20k geometry points and a few hundred POIs.
+
+Not collected by pytest. Run with:
+
+    poetry run python -m tests.benchmarks.bench_geo_utils
+"""
+
+import random
+import time
+from typing import Callable, List, Tuple
+
+from api.utils.geo_utils import (
+    as_route_array,
+    calculate_distance_meters,
+    closest_point_indices,
+    closest_segment_indices,
+    cumulative_distances_m,
+    distances_along_route_km,
+    interpolate_coordinates_at_distances,
+)
+
+ROUTE_SIZES = (2_000, 20_000)
+NUM_QUERY_POINTS = 200
+
+
+def _make_route(num_points: int, seed: int = 42) -> List[Tuple[float, float]]:
+    """Random walk heading north, ~50 m between points."""
+    rng = random.Random(seed)
+    lat, lon = -23.5, -46.6
+    route = []
+    for _ in range(num_points):
+        lat += rng.uniform(-0.0001, 0.0008)
+        lon += rng.uniform(-0.0004, 0.0004)
+        route.append((lat, lon))
+    return route
+
+
+def _make_queries(route: List[Tuple[float, float]], seed: int = 7) -> List[Tuple[float, float]]:
+    """Query points scattered up to ~3 km around random route points."""
+    rng = random.Random(seed)
+    return [
+        (lat + rng.uniform(-0.03, 0.03), lon + rng.uniform(-0.03, 0.03))
+        for lat, lon in rng.sample(route, NUM_QUERY_POINTS)
+    ]
+
+
+# Pure-Python reference implementations (pre-vectorization behaviour)
+
+
+def _py_cumulative(route):
+    cumulative = [0.0]
+    for a, b in zip(route, route[1:]):
+        cumulative.append(cumulative[-1] + calculate_distance_meters(a[0], a[1], b[0], b[1]))
+    return cumulative
+
+
+def _py_closest_point(route, point):
+    best_idx, best = 0, float("inf")
+    for i, (lat, lon) in enumerate(route):
+        dist = ((lat - point[0]) ** 2 + (lon - point[1]) ** 2) ** 0.5
+        if dist < best:
+            best_idx, best = i, dist
+    return best_idx
+
+
+def _py_closest_segment(route, point):
+    best_idx, best = 0, float("inf")
+    for i in range(len(route) - 1):
+        mid_lat = (route[i][0] + route[i + 1][0]) / 2
+        mid_lon = (route[i][1] + route[i + 1][1]) / 2
+        dist = calculate_distance_meters(point[0], point[1], mid_lat, mid_lon)
+        if dist < best:
+            best_idx, best = i, dist
+    return best_idx
+
+
+def _py_distance_along(route, point):
+    idx = _py_closest_segment(route, point)
+    return sum(
+        calculate_distance_meters(route[i][0], route[i][1], route[i + 1][0], route[i + 1][1])
+        for i in range(idx)
+    ) / 1000.0
+
+
+def _py_interpolate(route, target_km, total_km):
+    ratio = target_km / total_km
+    target_index = ratio * (len(route) - 1)
+    before = int(target_index)
+    after = min(before + 1, len(route) - 1)
+    frac = target_index - before
+    return (
+        route[before][0] + (route[after][0] - route[before][0]) * frac,
+        route[before][1] + (route[after][1] - route[before][1]) * frac,
+    )
+
+
+def _time(fn: Callable[[], object], repeat: int = 3) -> float:
+    """Best wall time of fn over `repeat` runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run() -> None:
+    print(f"{'kernel':<28}{'points':>8}{'python':>12}{'numpy':>12}{'speedup':>10}")
+
+    for size in ROUTE_SIZES:
+        route = _make_route(size)
+        queries = _make_queries(route)
+        route_arr = as_route_array(route)
+        query_arr = as_route_array(queries)
+        total_km = _py_cumulative(route)[-1] / 1000.0
+        targets = [total_km * i / 1000 for i in range(1, 1000)]
+
+        cases = [
+            (
+                "cumulative distances",
+                lambda: _py_cumulative(route),
+                lambda: cumulative_distances_m(as_route_array(route)),
+            ),
+            (
+                f"closest point x{NUM_QUERY_POINTS}",
+                lambda: [_py_closest_point(route, q) for q in queries],
+                lambda: closest_point_indices(route_arr, query_arr),
+            ),
+            (
+                f"closest segment x{NUM_QUERY_POINTS}",
+                lambda: [_py_closest_segment(route, q) for q in queries],
+                lambda: closest_segment_indices(route_arr, query_arr),
+            ),
+            (
+                f"distance along x{NUM_QUERY_POINTS}",
+                lambda: [_py_distance_along(route, q) for q in queries],
+                lambda: distances_along_route_km(route_arr, query_arr),
+            ),
+            (
+                "interpolate x999",
+                lambda: [_py_interpolate(route, t, total_km) for t in targets],
+                lambda: interpolate_coordinates_at_distances(route_arr, targets, total_km),
+            ),
+        ]
+
+        for name, python_fn, numpy_fn in cases:
+            python_s = _time(python_fn, repeat=1)
+            numpy_s = _time(numpy_fn)
+            print(
+                f"{name:<28}{size:>8}{python_s * 1000:>10.1f}ms"
+                f"{numpy_s * 1000:>10.1f}ms{python_s / numpy_s:>9.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    run()
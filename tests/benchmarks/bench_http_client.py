@@ -0,0 +1,118 @@
+"""
+Benchmark of provider HTTP clients against a local stub server.
+
+Compares the previous pattern of one ``httpx.AsyncClient`` per request
+(new TCP connection every time) with the pooled keep-alive clients of
+api/utils/http_client.py, sequentially (one search point after the other)
+and with concurrent requests (as during POI search / enrichment).
+
+The stub answers instantly over plain HTTP on localhost, so the numbers
+isolate client-side setup cost; real providers add DNS lookups, network
+round trips and a TLS handshake per new connection on top of it.
+
+Not collected by pytest. Run with:
+
+    poetry run python -m tests.benchmarks.bench_http_client
+"""
+
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Awaitable, Callable, Tuple
+
+import httpx
+
+from api.utils.http_client import PooledHttpClient
+
+NUM_REQUESTS = 500
+CONCURRENCY = 8
+BODY = b'{"code": "Ok", "routes": []}'
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Minimal JSON endpoint with HTTP/1.1 keep-alive."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes; avoid Nagle/delayed-ACK stalls
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _start_stub_server() -> Tuple[ThreadingHTTPServer, str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address
+    return server, f"http://{host}:{port}/route"
+
+
+async def _per_request_client(url: str) -> None:
+    """Previous behaviour: a brand-new client (and connection) per request."""
+    async with httpx.AsyncClient(timeout=httpx.Timeout(30.0)) as client:
+        response = await client.get(url)
+        response.raise_for_status()
+
+
+def _pooled_request(pooled: PooledHttpClient) -> Callable[[str], Awaitable[None]]:
+    async def _request(url: str) -> None:
+        response = await pooled.client.get(url)
+        response.raise_for_status()
+    return _request
+
+
+async def _run(request: Callable[[str], Awaitable[None]], url: str, concurrency: int) -> float:
+    """Issue NUM_REQUESTS requests, `concurrency` at a time; returns seconds."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one():
+        async with semaphore:
+            await request(url)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(_one() for _ in range(NUM_REQUESTS)))
+    return time.perf_counter() - start
+
+
+async def _bench(url: str) -> None:
+    print(f"{'mode':<14}{'client':<14}{'total':>10}{'per request':>14}{'speedup':>10}")
+
+    for mode, concurrency in (("sequential", 1), (f"concurrent x{CONCURRENCY}", CONCURRENCY)):
+        # Warm-up so both variants start from the same interpreter state
+        await _run(_per_request_client, url, concurrency)
+
+        per_request_s = await _run(_per_request_client, url, concurrency)
+
+        pooled = PooledHttpClient()
+        pooled_s = await _run(_pooled_request(pooled), url, concurrency)
+        await pooled.aclose()
+
+        for name, seconds in (("per-request", per_request_s), ("pooled", pooled_s)):
+            print(
+                f"{mode:<14}{name:<14}{seconds * 1000:>8.0f}ms"
+                f"{seconds / NUM_REQUESTS * 1e6:>12.0f}us"
+                f"{per_request_s / seconds:>9.1f}x"
+            )
+        saved = (per_request_s - pooled_s) / NUM_REQUESTS * 1e6
+        print(f"{'':<14}{'saved':<14}{'':>10}{saved:>12.0f}us")
+
+
+def run() -> None:
+    server, url = _start_stub_server()
+    try:
+        asyncio.run(_bench(url))
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    run()
@@ -23,6 +23,16 @@ from api.providers.base import GeoProvider, ProviderType
 from api.providers.models import GeoLocation, Route, POI, POICategory
 from api.providers.cache import UnifiedCache
 from api.providers.manager import GeoProviderManager
+from api.services.municipality_gazetteer import MunicipalityGazetteer
+
+
+@pytest.fixture(autouse=True)
+def disabled_municipality_gazetteer(monkeypatch):
+    """Keep app startups and services in tests from downloading the gazetteer."""
+    monkeypatch.setattr(
+        "api.services.municipality_gazetteer._gazetteer",
+        MunicipalityGazetteer("", enabled=False),
+    )
 
 
 @pytest.fixture
@@ -46,6 +56,18 @@ def mock_user():
     return user
 
 
+@pytest.fixture(autouse=True)
+def offline_municipality_gazetteer(monkeypatch):
+    """Keep the municipality gazetteer from downloading IBGE data in tests."""
+    from api.services import municipality_gazetteer
+
+    monkeypatch.setattr(
+        municipality_gazetteer,
+        "_gazetteer",
+        municipality_gazetteer.MunicipalityGazetteer("", enabled=False),
+    )
+
+
 @pytest.fixture(scope="session")
 def event_loop():
     """Create an instance of the default event loop for the test session."""
@@ -0,0 +1,199 @@
+"""
+Generate tiny.osm.pbf, the extract used by the OSM PBF provider tests.
+
+Writes the OSM PBF format (fileformat.proto / osmformat.proto) by hand so
+the fixture can be regenerated without osmium. The extract has a raw
+(uncompressed) OSMHeader blob and zlib OSMData blobs with:
+- DenseNodes: POI nodes (fuel, restaurant, town, hotel), an untagged
+  node, a non-POI shop and the untagged nodes of the POI ways
+- a plain (non-dense) Node: a pharmacy
+- Ways: a fuel station area, a road (not a POI) and a restaurant whose
+  nodes are outside the extract
+- a Relation (skipped by the reader)
+
+Run from the repository root:
+
+    python -m tests.providers.data.make_tiny_extract
+"""
+
+import os
+import struct
+import zlib
+
+GRANULARITY = 100
+OUTPUT = os.path.join(os.path.dirname(__file__), "tiny.osm.pbf")
+
+DENSE_NODES = [
+    # (id, lat, lon, tags)
+    (1, -23.5000, -46.6000, {"amenity": "fuel", "name": "Posto Shell", "brand": "Shell", "opening_hours": "24/7"}),
+    (2, -23.5050, -46.6050, {"amenity": "restaurant", "name": "Restaurante Bom Prato", "cuisine": "regional"}),
+    (3, -23.5010, -46.6010, {}),
+    (4, -23.5500, -46.6500, {"place": "town", "name": "Vila Nova"}),
+    (5, -23.5010, -46.6015, {"shop": "bakery", "name": "Padaria"}),
+    (7, -23.9000, -46.9000, {"tourism": "hotel", "name": "Hotel Litoral"}),
+    (10, -23.5200, -46.6200, {}),
+    (11, -23.5200, -46.6210, {}),
+    (12, -23.5210, -46.6210, {}),
+    (13, -23.5210, -46.6200, {}),
+]
+PLAIN_NODE = (20, -23.5020, -46.6020, {"amenity": "pharmacy", "name": "Drogaria Central"})
+WAYS = [
+    # (id, refs, tags)
+    (100, [10, 11, 12, 13, 10], {"amenity": "fuel", "name": "Posto Ipiranga"}),
+    (101, [1, 3, 10], {"highway": "primary", "ref": "BR-116"}),
+    (102, [998, 999], {"amenity": "restaurant", "name": "Fora do Extrato"}),
+]
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    value &= (1 << 64) - 1
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _zigzag(value: int) -> int:
+    return (value << 1) ^ (value >> 63)
+
+
+def _key(field: int, wire_type: int) -> bytes:
+    return _varint((field << 3) | wire_type)
+
+
+def _uint(field: int, value: int) -> bytes:
+    return _key(field, 0) + _varint(value)
+
+
+def _sint(field: int, value: int) -> bytes:
+    return _key(field, 0) + _varint(_zigzag(value))
+
+
+def _bytes(field: int, payload: bytes) -> bytes:
+    return _key(field, 2) + _varint(len(payload)) + payload
+
+
+def _packed(field: int, values, signed: bool = False) -> bytes:
+    return _bytes(field, b"".join(_varint(_zigzag(v) if signed else v) for v in values))
+
+
+def _deltas(values):
+    previous = 0
+    for value in values:
+        yield value - previous
+        previous = value
+
+
+class _Strings:
+    """String table; index 0 is the reserved empty string."""
+
+    def __init__(self):
+        self.strings = [""]
+
+    def __call__(self, value: str) -> int:
+        if value not in self.strings:
+            self.strings.append(value)
+        return self.strings.index(value)
+
+    def encode(self) -> bytes:
+        return _bytes(1, b"".join(_bytes(1, s.encode("utf-8")) for s in self.strings))
+
+
+def _raw(coordinate: float) -> int:
+    return round(coordinate * 1e9 / GRANULARITY)
+
+
+def _primitive_block(strings: _Strings, group: bytes) -> bytes:
+    return strings.encode() + _bytes(2, group) + _uint(17, GRANULARITY)
+
+
+def _dense_block() -> bytes:
+    strings = _Strings()
+    keys_vals = []
+    for _, _, _, tags in DENSE_NODES:
+        for key, value in tags.items():
+            keys_vals += [strings(key), strings(value)]
+        keys_vals.append(0)
+    dense = (
+        _packed(1, _deltas([n[0] for n in DENSE_NODES]), signed=True)
+        + _packed(8, _deltas([_raw(n[1]) for n in DENSE_NODES]), signed=True)
+        + _packed(9, _deltas([_raw(n[2]) for n in DENSE_NODES]), signed=True)
+        + _packed(10, keys_vals)
+    )
+    return _primitive_block(strings, _bytes(2, dense))
+
+
+def _plain_node_block() -> bytes:
+    strings = _Strings()
+    node_id, lat, lon, tags = PLAIN_NODE
+    node = (
+        _sint(1, node_id)
+        + _packed(2, [strings(k) for k in tags])
+        + _packed(3, [strings(v) for v in tags.values()])
+        + _sint(8, _raw(lat))
+        + _sint(9, _raw(lon))
+    )
+    return _primitive_block(strings, _bytes(1, node))
+
+
+def _way_block() -> bytes:
+    strings = _Strings()
+    group = b""
+    for way_id, refs, tags in WAYS:
+        way = (
+            _uint(1, way_id)
+            + _packed(2, [strings(k) for k in tags])
+            + _packed(3, [strings(v) for v in tags.values()])
+            + _packed(8, _deltas(refs), signed=True)
+        )
+        group += _bytes(3, way)
+    return _primitive_block(strings, group)
+
+
+def _relation_block() -> bytes:
+    strings = _Strings()
+    relation = (
+        _uint(1, 500)
+        + _packed(2, [strings("type")])
+        + _packed(3, [strings("route")])
+        + _packed(8, [strings("")])
+        + _packed(9, [100], signed=True)
+        + _packed(10, [1])
+    )
+    return _primitive_block(strings, _bytes(4, relation))
+
+
+def _header_block() -> bytes:
+    return (
+        _bytes(4, b"OsmSchema-V0.6")
+        + _bytes(4, b"DenseNodes")
+        + _bytes(16, b"make_tiny_extract")
+    )
+
+
+def _file_block(blob_type: str, data: bytes, compress: bool = True) -> bytes:
+    if compress:
+        blob = _uint(2, len(data)) + _bytes(3, zlib.compress(data))
+    else:
+        blob = _bytes(1, data)
+    header = _bytes(1, blob_type.encode("utf-8")) + _uint(3, len(blob))
+    return struct.pack(">I", len(header)) + header + blob
+
+
+def build() -> bytes:
+    """Encode the whole extract."""
+    return (
+        _file_block("OSMHeader", _header_block(), compress=False)
+        + _file_block("OSMData", _dense_block())
+        + _file_block("OSMData", _plain_node_block())
+        + _file_block("OSMData", _way_block())
+        + _file_block("OSMData", _relation_block())
+    )
+
+
+if __name__ == "__main__":
+    with open(OUTPUT, "wb") as f:
+        f.write(build())
+    print(f"Wrote {OUTPUT}")
@@ -12,7 +12,7 @@ import os
 from datetime import datetime, timedelta
 from unittest.mock import patch
 
-from api.providers.cache import UnifiedCache, CacheKey, CacheEntry
+from api.providers.cache import UnifiedCache, CacheKey, CacheEntry, MemoryCacheTier
 from api.providers.base import ProviderType
 from api.providers.models import GeoLocation, POI, POICategory
 
@@ -292,6 +292,7 @@ class TestCacheTTLandExpiration:
         assert cache.ttl_config["geocode"] == 3600  # From mock env
         assert cache.ttl_config["route"] == 1800
         assert cache.ttl_config["poi_search"] == 900
+        assert cache.ttl_config["poi_tile"] == 900
     
     @pytest.mark.asyncio
     async def test_cache_entry_expiration(self, clean_cache):
@@ -498,6 +499,290 @@ class TestCacheSpatialMatching:
         assert distance_same == 0
 
 
+class TestCacheLookupIndexing:
+    """Test suite for the indexed columns backing the cache fallbacks."""
+
+    def test_index_columns_for_poi_search(self, clean_cache):
+        """POI searches should be indexed by the grid cell of their center."""
+        geo_cell, tokens = clean_cache._index_columns(
+            "poi_search", {"latitude": -23.551, "longitude": -46.633, "radius": 3000}
+        )
+
+        assert geo_cell == clean_cache._poi_grid_cell(-23.551, -46.633)
+        assert tokens is None
+
+    def test_index_columns_for_geocode(self, clean_cache):
+        """Geocoding entries should be indexed by normalized address tokens."""
+        geo_cell, tokens = clean_cache._index_columns(
+            "geocode", {"address": "avenida paulista, são paulo"}
+        )
+
+        assert geo_cell is None
+        assert tokens == ["av", "paulista", "paulo", "sao"]
+
+    def test_index_columns_for_other_operations(self, clean_cache):
+        """Other operations should not populate index columns."""
+        assert clean_cache._index_columns("route", {"origin_lat": -23.5}) == (None, None)
+
+    def test_grid_cells_around_cover_radius(self, clean_cache):
+        """Every point within the radius should fall in one of the returned cells."""
+        import math
+
+        lat, lon, radius = -23.5505, -46.6333, 3000
+        cells = set(clean_cache._poi_grid_cells_around(lat, lon, radius))
+
+        for bearing in range(0, 360, 15):
+            dlat = (radius * 0.99 * math.cos(math.radians(bearing))) / 111000
+            dlon = (radius * 0.99 * math.sin(math.radians(bearing))) / (
+                111000 * math.cos(math.radians(lat))
+            )
+            assert clean_cache._poi_grid_cell(lat + dlat, lon + dlon) in cells
+
+        # A small radius should stay within a handful of cells
+        assert len(cells) <= 9
+
+    def test_geocode_candidate_filter_keeps_similar_addresses(self, clean_cache):
+        """The DB filter must never exclude an address the similarity check accepts."""
+        import itertools
+
+        target = clean_cache._address_tokens("Avenida Paulista 1000 Bela Vista Sao Paulo SP")
+        probes, min_count, max_count = clean_cache._geocode_candidate_filter(target)
+        vocabulary = target + ["brasil", "centro", "rua"]
+
+        for size in range(1, len(vocabulary) + 1):
+            for combo in itertools.combinations(vocabulary, size):
+                candidate = sorted(combo)
+                if clean_cache._addresses_similar(" ".join(target), " ".join(candidate)):
+                    assert set(candidate) & set(probes)
+                    assert min_count <= len(candidate) <= max_count
+
+
+    @pytest.mark.asyncio
+    async def test_spatial_match_reads_cells_of_larger_cached_radius(self, clean_cache):
+        """A cached search with a larger radius is found beyond the target radius."""
+        import json
+        from unittest.mock import AsyncMock, MagicMock
+
+        lat, lon, radius = -23.585, -46.6333, 3000
+        cached = {
+            "latitude": lat + 4400 / 111000,  # 4.4 km north
+            "longitude": lon,
+            "radius": 6000,
+            "categories": ["gas_station"],
+        }
+        # Matches (4.4 km < (3 + 6) / 2 km) but lies outside the target circle's cells
+        cached_cell = clean_cache._poi_grid_cell(cached["latitude"], cached["longitude"])
+        assert cached_cell not in clean_cache._poi_grid_cells_around(lat, lon, radius)
+
+        async def fetch(query, cells, categories, max_radius):
+            if cached_cell in cells and cached["radius"] <= max_radius:
+                return [{"key": "cached", "params": json.dumps(cached)}]
+            return []
+
+        conn = MagicMock()
+        conn.fetch = AsyncMock(side_effect=fetch)
+        conn.fetchrow = AsyncMock(return_value={"key": "cached", "data": "[]", "params": "{}"})
+        acquire = MagicMock()
+        acquire.__aenter__.return_value = conn
+        acquire.__aexit__.return_value = False
+        pool = MagicMock()
+        pool.acquire.return_value = acquire
+
+        with patch.object(clean_cache, "_get_pool", AsyncMock(return_value=pool)):
+            match = await clean_cache._find_spatial_poi_match({
+                "latitude": lat, "longitude": lon, "radius": radius,
+                "categories": ["gas_station"],
+            })
+            assert match is not None and match["key"] == "cached"
+
+            # Cached radii beyond POI_MATCH_MAX_RADIUS_RATIO are not reused
+            cached["radius"] = 6001
+            assert await clean_cache._find_spatial_poi_match({
+                "latitude": lat, "longitude": lon, "radius": radius,
+                "categories": ["gas_station"],
+            }) is None
+
+
+class TestMemoryCacheTier:
+    """Test suite for the in-process L1 cache tier."""
+
+    def test_get_returns_stored_value(self):
+        """It should return stored values, including empty results."""
+        tier = MemoryCacheTier(max_entries=10, max_bytes=1000)
+        tier.set("a", [], 2, ttl_seconds=60)
+
+        assert tier.get("a") == (True, [])
+        assert tier.get("missing") == (False, None)
+
+    def test_entries_expire_after_ttl(self):
+        """It should treat entries past their TTL as misses."""
+        tier = MemoryCacheTier(max_entries=10, max_bytes=1000)
+        with patch("api.providers.cache.time.monotonic", return_value=100.0):
+            tier.set("a", "value", 5, ttl_seconds=10)
+        with patch("api.providers.cache.time.monotonic", return_value=111.0):
+            assert tier.get("a") == (False, None)
+
+        assert tier.get_stats()["entries"] == 0
+
+    def test_evicts_least_recently_used_by_entry_count(self):
+        """It should evict the least recently used entry when full."""
+        tier = MemoryCacheTier(max_entries=2, max_bytes=1000)
+        tier.set("a", 1, 1, ttl_seconds=60)
+        tier.set("b", 2, 1, ttl_seconds=60)
+        tier.get("a")  # "b" becomes least recently used
+        tier.set("c", 3, 1, ttl_seconds=60)
+
+        assert tier.get("b") == (False, None)
+        assert tier.get("a") == (True, 1)
+        assert tier.get("c") == (True, 3)
+        assert tier.get_stats()["evictions"] == 1
+
+    def test_evicts_by_size(self):
+        """It should keep the estimated size within max_bytes."""
+        tier = MemoryCacheTier(max_entries=10, max_bytes=100)
+        tier.set("a", "x", 60, ttl_seconds=60)
+        tier.set("b", "y", 60, ttl_seconds=60)
+        tier.set("too_big", "z", 101, ttl_seconds=60)
+
+        stats = tier.get_stats()
+        assert stats["entries"] == 1
+        assert stats["size_bytes"] == 60
+        assert tier.get("b") == (True, "y")
+        assert tier.get("too_big") == (False, None)
+
+    def test_invalidate_pattern(self):
+        """It should remove only keys matching the fnmatch pattern."""
+        tier = MemoryCacheTier(max_entries=10, max_bytes=1000)
+        tier.set("osm:geocode:1", 1, 1, ttl_seconds=60)
+        tier.set("osm:route:2", 2, 1, ttl_seconds=60)
+        tier.set("here:geocode:3", 3, 1, ttl_seconds=60)
+
+        assert tier.invalidate_pattern("osm:*") == 2
+        assert tier.get("here:geocode:3") == (True, 3)
+        assert tier.get_stats()["size_bytes"] == 1
+
+    def test_disabled_when_max_entries_is_zero(self):
+        """It should store nothing when disabled."""
+        tier = MemoryCacheTier(max_entries=0, max_bytes=1000)
+        tier.set("a", 1, 1, ttl_seconds=60)
+
+        assert tier.get("a") == (False, None)
+
+
+class TestUnifiedCacheL1Tier:
+    """Test suite for the L1 tier as used by UnifiedCache."""
+
+    @pytest.mark.asyncio
+    async def test_l1_hit_skips_database(self, clean_cache):
+        """A value held in L1 should be returned without acquiring a pool."""
+        key = CacheKey(
+            provider=ProviderType.OSM, operation="geocode", params={"address": "Rua A"}
+        ).generate_key()
+        location = GeoLocation(latitude=-23.5, longitude=-46.6)
+        clean_cache._l1.set(key, location, 50, ttl_seconds=60)
+
+        with patch.object(clean_cache, "_get_pool", side_effect=AssertionError("DB used")):
+            result = await clean_cache.get(ProviderType.OSM, "geocode", {"address": "Rua A"})
+
+        assert result is location
+        stats = clean_cache._l1.get_stats()
+        assert stats["hits"] == 1
+
+    def test_load_into_l1_reconstructs_models(self, clean_cache):
+        """Rows loaded from PostgreSQL should be reconstructed once and kept in L1."""
+        raw = '[{"id": "p1", "name": "Posto", "category": "gas_station", "location": {"latitude": -23.5, "longitude": -46.6}}]'
+
+        result = clean_cache._load_into_l1("osm:poi_search:x", "poi_search", raw, ttl_remaining=30)
+
+        assert isinstance(result[0], POI)
+        found, cached = clean_cache._l1.get("osm:poi_search:x")
+        assert found
+        assert cached[0] is result[0]
+        # Callers get their own list, not the cached one
+        assert cached is not result
+
+    def test_reconstructs_poi_tiles(self, clean_cache):
+        """POI tiles should be reconstructed as lists of POIs."""
+        data = [{"id": "node/1", "name": "Posto", "category": "gas_station",
+                 "location": {"latitude": -23.5, "longitude": -46.6}}]
+
+        result = clean_cache._reconstruct_data(data, "poi_tile")
+
+        assert isinstance(result[0], POI)
+        assert result[0].id == "node/1"
+
+    def test_l1_ttl_is_capped(self, clean_cache):
+        """L1 TTL should never exceed the operation TTL or the L1 cap."""
+        clean_cache.ttl_config["short"] = 5
+        clean_cache._l1_max_ttl = 60
+
+        assert clean_cache._l1_ttl("short") == 5
+        assert clean_cache._l1_ttl("route") == 60
+
+
+class TestCacheBatchOperations:
+    """Test suite for get_many/set_many."""
+
+    @staticmethod
+    def _mock_pool(conn):
+        """Pool whose acquire() yields the given connection."""
+        from unittest.mock import MagicMock
+
+        acquire = MagicMock()
+        acquire.__aenter__.return_value = conn
+        acquire.__aexit__.return_value = False
+        pool = MagicMock()
+        pool.acquire.return_value = acquire
+        return pool
+
+    @pytest.mark.asyncio
+    async def test_get_many_uses_single_query(self, clean_cache):
+        """It should resolve all keys with one query and keep input order."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        params = [{"key": "a"}, {"key": "b"}, {"key": "a"}]
+        key_a = CacheKey(ProviderType.OSM, "test_batch", params[0]).generate_key()
+        conn = MagicMock()
+        conn.fetch = AsyncMock(return_value=[
+            {"key": key_a, "data": '{"value": 1}', "ttl_remaining": 60.0}
+        ])
+
+        with patch.object(clean_cache, "_get_pool", AsyncMock(return_value=self._mock_pool(conn))):
+            results = await clean_cache.get_many(ProviderType.OSM, "test_batch", params)
+
+        assert results == [{"value": 1}, None, {"value": 1}]
+        assert conn.fetch.await_count == 1
+        queried_keys = conn.fetch.await_args.args[1]
+        assert len(queried_keys) == 2
+        assert clean_cache._stats["hits"] == 2
+        assert clean_cache._stats["misses"] == 1
+
+        # Second call is served from L1 without touching the database
+        with patch.object(clean_cache, "_get_pool", side_effect=AssertionError("DB used")):
+            results = await clean_cache.get_many(ProviderType.OSM, "test_batch", [params[0]])
+        assert results == [{"value": 1}]
+
+    @pytest.mark.asyncio
+    async def test_set_many_uses_single_executemany(self, clean_cache):
+        """It should upsert all entries in one executemany and fill L1."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        conn = MagicMock()
+        conn.executemany = AsyncMock()
+        items = [({"key": "a"}, {"value": 1}), ({"key": "b"}, {"value": 2}), ({"key": "a"}, {"value": 3})]
+
+        with patch.object(clean_cache, "_get_pool", AsyncMock(return_value=self._mock_pool(conn))):
+            await clean_cache.set_many(ProviderType.OSM, "test_batch", items)
+
+        assert conn.executemany.await_count == 1
+        records = conn.executemany.await_args.args[1]
+        assert len(records) == 2
+        assert clean_cache._stats["sets"] == 2
+
+        key_a = CacheKey(ProviderType.OSM, "test_batch", {"key": "a"}).generate_key()
+        assert clean_cache._l1.get(key_a) == (True, {"value": 3})
+
+
 class TestCacheStatistics:
     """Test suite for cache statistics and metrics."""
     
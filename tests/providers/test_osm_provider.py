@@ -6,6 +6,12 @@ verifying that it correctly implements the GeoProvider interface
 and maintains compatibility with the existing OSM functionality.
 """
 
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import numpy as np
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 from typing import List, Optional
@@ -14,6 +20,37 @@ from api.providers.osm.provider import OSMProvider
 from api.providers.base import ProviderType
 from api.providers.models import GeoLocation, Route, POI, POICategory
 from api.providers.cache import UnifiedCache
+from api.providers.settings import get_settings
+from api.utils.geo_utils import tile_bounds
+
+
+class _DictCache:
+    """In-memory stand-in for the batched UnifiedCache API."""
+
+    def __init__(self):
+        self.entries = {}
+        self.get_many_calls = 0
+        self.set_many_calls = 0
+
+    async def get_many(self, provider, operation, params_list):
+        self.get_many_calls += 1
+        return [
+            self.entries.get((operation, json.dumps(params, sort_keys=True)))
+            for params in params_list
+        ]
+
+    async def set_many(self, provider, operation, items):
+        self.set_many_calls += 1
+        for params, data in items:
+            self.entries[(operation, json.dumps(params, sort_keys=True))] = data
+
+
+def _fuel_element(osm_id, lat, lon):
+    """Overpass JSON node of a gas station."""
+    return {
+        'type': 'node', 'id': osm_id, 'lat': lat, 'lon': lon,
+        'tags': {'amenity': 'fuel', 'name': f'Posto {osm_id}'}
+    }
 
 
 class TestOSMProviderBasics:
@@ -222,6 +259,143 @@ class TestOSMProviderRouting:
             assert len(call_args) >= 4  # origin, destination, waypoints, avoid
 
 
+class _OSRMStubHandler(BaseHTTPRequestHandler):
+    """Minimal OSRM /route stub: one straight step per leg between waypoints."""
+
+    requests: List[str] = []
+
+    def do_GET(self):
+        type(self).requests.append(self.path)
+        coords_part = urlsplit(self.path).path.rsplit("/", 1)[-1]
+        coords = [
+            [float(value) for value in pair.split(",")]
+            for pair in coords_part.split(";")
+        ]
+        legs = []
+        for start, end in zip(coords, coords[1:]):
+            midpoint = [(start[0] + end[0]) / 2, (start[1] + end[1]) / 2]
+            legs.append({
+                "distance": 1000.0,
+                "duration": 60.0,
+                "steps": [
+                    {
+                        "distance": 500.0, "duration": 30.0, "name": "Rua A",
+                        "geometry": {"coordinates": [start, midpoint]},
+                        "maneuver": {"type": "depart", "location": start},
+                    },
+                    {
+                        "distance": 500.0, "duration": 30.0, "name": "Rua B",
+                        "geometry": {"coordinates": [midpoint, end]},
+                        "maneuver": {"type": "turn", "modifier": "left", "location": midpoint},
+                    },
+                ],
+            })
+        body = json.dumps({"code": "Ok", "routes": [{"legs": legs}]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def osrm_stub_server():
+    """Run the OSRM stub on a local port for the duration of a test."""
+    _OSRMStubHandler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OSRMStubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}", _OSRMStubHandler.requests
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class TestOSMProviderBatchRouting:
+    """Test batched one-to-many routing against a local OSRM stub."""
+
+    @pytest.mark.asyncio
+    async def test_calculate_routes_many_uses_one_request(self, osrm_stub_server):
+        """It should route all destinations with one OSRM request and split the legs."""
+        base_url, requests = osrm_stub_server
+        cache = Mock()
+        cache.get_many = AsyncMock(return_value=[None, None, None])
+        cache.set_many = AsyncMock()
+        provider = OSMProvider(cache=cache)
+        provider._osrm_endpoint = base_url
+
+        origin = GeoLocation(latitude=-23.50, longitude=-46.60)
+        destinations = [
+            GeoLocation(latitude=-23.52, longitude=-46.58),
+            GeoLocation(latitude=-23.54, longitude=-46.62),
+            GeoLocation(latitude=-23.48, longitude=-46.64),
+        ]
+
+        with patch('api.providers.osm.provider.api_call_logger.log_call', AsyncMock()):
+            routes = await provider.calculate_routes_many(origin, destinations)
+
+        assert len(requests) == 1
+        assert "continue_straight=false" in requests[0]
+        for route, destination in zip(routes, destinations):
+            # Each route runs from the shared origin to its own destination
+            assert route.geometry[0] == (origin.latitude, origin.longitude)
+            assert route.geometry[-1] == (destination.latitude, destination.longitude)
+            assert len(route.geometry) == 3
+            assert route.total_distance == 1.0
+            assert len(route.steps) == 2
+        assert len(cache.set_many.await_args.kwargs["items"]) == 3
+
+    @pytest.mark.asyncio
+    async def test_calculate_routes_many_splits_batches_and_skips_cached(
+        self, osrm_stub_server
+    ):
+        """It should only request cache misses, in batches of the configured size."""
+        base_url, requests = osrm_stub_server
+        origin = GeoLocation(latitude=-23.50, longitude=-46.60)
+        destinations = [
+            GeoLocation(latitude=-23.50 - i * 0.01, longitude=-46.58) for i in range(1, 6)
+        ]
+        cached_route = Route(
+            origin=origin,
+            destination=destinations[0],
+            total_distance=2.0,
+            total_duration=3.0,
+            geometry=[(-23.50, -46.60), (-23.51, -46.58)],
+        )
+        cache = Mock()
+        cache.get_many = AsyncMock(return_value=[cached_route, None, None, None, None])
+        cache.set_many = AsyncMock()
+        provider = OSMProvider(cache=cache)
+        provider._osrm_endpoint = base_url
+        provider._osrm_batch_max_destinations = 2
+
+        with patch('api.providers.osm.provider.api_call_logger.log_call', AsyncMock()):
+            routes = await provider.calculate_routes_many(origin, destinations)
+
+        assert routes[0] is cached_route
+        assert all(route is not None for route in routes)
+        # 4 misses in batches of 2
+        assert len(requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_calculate_routes_many_failure_yields_none(self):
+        """It should return None for every destination when the request fails."""
+        provider = OSMProvider(cache=None)
+        provider._osrm_endpoint = "http://127.0.0.1:9"  # Nothing listens here
+
+        with patch('api.providers.osm.provider.api_call_logger.log_call', AsyncMock()):
+            routes = await provider.calculate_routes_many(
+                GeoLocation(latitude=-23.5, longitude=-46.6),
+                [GeoLocation(latitude=-23.6, longitude=-46.7)],
+            )
+
+        assert routes == [None]
+
+
 class TestOSMProviderPOISearch:
     """Test POI search functionality of OSM Provider."""
     
@@ -344,6 +518,178 @@ class TestOSMProviderPOISearch:
             assert result.phone == "+55 11 1234-5678"
             assert result.website == "https://shell.com.br"
 
+    @pytest.mark.asyncio
+    async def test_nearby_searches_share_tiles(self):
+        """A search 200 m from an earlier one should be answered from its tiles."""
+        cache = _DictCache()
+        provider = OSMProvider(cache=cache)
+        overpass_data = {'elements': [
+            _fuel_element(1, -23.500, -46.600),
+            _fuel_element(2, -23.509, -46.600),
+            _fuel_element(3, -23.530, -46.600),  # outside both windows
+        ]}
+
+        with patch.object(
+            provider, '_make_overpass_request', AsyncMock(return_value=overpass_data)
+        ) as mock_overpass:
+            first = await provider.search_pois(
+                GeoLocation(latitude=-23.502, longitude=-46.600), 1000, [POICategory.GAS_STATION]
+            )
+            second = await provider.search_pois(
+                GeoLocation(latitude=-23.504, longitude=-46.600), 1000, [POICategory.GAS_STATION]
+            )
+
+        assert mock_overpass.await_count == 1
+        assert [poi.id for poi in first] == ["node/1", "node/2"]
+        assert [poi.id for poi in second] == ["node/1", "node/2"]
+        assert {operation for operation, _ in cache.entries} == {"poi_tile"}
+
+    @pytest.mark.asyncio
+    async def test_search_pois_windows_order_and_limit(self):
+        """Results should match a bbox query: 3x window for towns, Overpass order, limit."""
+        provider = OSMProvider(cache=_DictCache())
+        overpass_data = {'elements': [
+            _fuel_element(30, -23.500, -46.600),
+            _fuel_element(10, -23.505, -46.605),
+            _fuel_element(20, -23.520, -46.600),  # outside the 1 km window
+            {
+                'type': 'node', 'id': 5, 'lat': -23.522, 'lon': -46.600,
+                'tags': {'place': 'town', 'name': 'Vila'}
+            },
+        ]}
+        location = GeoLocation(latitude=-23.5, longitude=-46.6)
+
+        with patch.object(
+            provider, '_make_overpass_request', AsyncMock(return_value=overpass_data)
+        ):
+            pois = await provider.search_pois(
+                location, 1000, [POICategory.GAS_STATION, POICategory.TOWN]
+            )
+            capped = await provider.search_pois(location, 1000, [POICategory.GAS_STATION], limit=1)
+
+        assert [poi.id for poi in pois] == ["node/5", "node/10", "node/30"]
+        assert [poi.id for poi in capped] == ["node/10"]
+
+    def test_search_results_mask(self):
+        """The mask should apply the search_pois windows and limit per location."""
+        provider = OSMProvider(cache=None)
+        pois = [
+            provider._parse_osm_element_to_poi(element) for element in [
+                _fuel_element(30, -23.500, -46.600),
+                _fuel_element(10, -23.505, -46.605),
+                {
+                    'type': 'node', 'id': 5, 'lat': -23.522, 'lon': -46.600,
+                    'tags': {'place': 'town', 'name': 'Vila'}
+                },
+            ]
+        ]
+        locations = np.array([[-23.5, -46.6], [-23.53, -46.6]])
+
+        with_places = provider.search_results_mask(
+            locations, pois, 1000, [POICategory.GAS_STATION, POICategory.TOWN]
+        )
+        without_places = provider.search_results_mask(locations, pois, 1000, [POICategory.GAS_STATION])
+        capped = provider.search_results_mask(
+            locations, pois, 1000, [POICategory.GAS_STATION], limit=1
+        )
+
+        assert with_places.tolist() == [[True, False], [True, False], [True, True]]
+        assert without_places.tolist() == [[True, False], [True, False], [False, True]]
+        # Overpass order: node 10 goes before node 30
+        assert capped.tolist() == [[False, False], [True, False], [False, True]]
+
+    @pytest.mark.asyncio
+    async def test_search_pois_many_batches_cache_io(self):
+        """Locations should share one get_many, tile queries and one set_many."""
+        cache = _DictCache()
+        provider = OSMProvider(cache=cache)
+        locations = [
+            GeoLocation(latitude=-23.5 - i * 0.01, longitude=-46.6) for i in range(10)
+        ]
+
+        with patch.object(
+            provider, '_make_overpass_request',
+            AsyncMock(return_value={'elements': [_fuel_element(1, -23.55, -46.6)]})
+        ) as mock_overpass:
+            results = await provider.search_pois_many(
+                locations, 1200, [POICategory.GAS_STATION], limit=10
+            )
+
+        assert [len(pois) for pois in results] == [0, 0, 0, 0, 1, 1, 1, 0, 0, 0]
+        assert cache.get_many_calls == 1
+        assert cache.set_many_calls == 1
+        assert mock_overpass.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_tiles_yield_empty_results_and_are_not_cached(self):
+        """A failed tile query should give empty results and cache nothing."""
+        cache = _DictCache()
+        provider = OSMProvider(cache=cache)
+
+        with patch.object(
+            provider, '_make_overpass_request', AsyncMock(side_effect=Exception("timeout"))
+        ):
+            results = await provider.search_pois_many(
+                [GeoLocation(latitude=-23.5, longitude=-46.6)], 1000, [POICategory.GAS_STATION]
+            )
+
+        assert results == [[]]
+        assert cache.entries == {}
+
+    @pytest.mark.asyncio
+    async def test_search_pois_along_route_fills_tiles_reused_by_point_searches(self):
+        """Corridor tiles should be fetched in ordered batches and serve later searches."""
+        cache = _DictCache()
+        provider = OSMProvider(cache=cache)
+        # ~130 km zig-zag route, one point every ~1 km
+        route = [
+            GeoLocation(latitude=-23.5 - i * 0.009, longitude=-46.6 + (0.003 if i % 2 else 0.0))
+            for i in range(131)
+        ]
+        elements = [_fuel_element(1, -23.6, -46.6), _fuel_element(2, -24.4, -46.62)]
+
+        with patch.object(
+            provider, '_make_overpass_request', AsyncMock(return_value={'elements': elements})
+        ) as mock_overpass:
+            pois = await provider.search_pois_along_route(route, 3000, [POICategory.GAS_STATION])
+            queries = mock_overpass.await_count
+            again = await provider.search_pois_along_route(route, 3000, [POICategory.GAS_STATION])
+            point = await provider.search_pois(route[100], 3000, [POICategory.GAS_STATION])
+
+        assert sorted(poi.id for poi in pois) == ["node/1", "node/2"]
+        assert sorted(poi.id for poi in again) == ["node/1", "node/2"]
+        assert [poi.id for poi in point] == ["node/2"]
+        max_per_query = get_settings().poi_tile_max_per_query
+        assert queries == -(-len(cache.entries) // max_per_query)
+        assert mock_overpass.await_count == queries
+
+        # Batches follow the route: the first query covers its start
+        first_query = mock_overpass.await_args_list[0].args[0]
+        assert '[out:json][timeout:' in first_query
+        assert '"amenity"~"^(fuel)$"' in first_query
+
+    @pytest.mark.asyncio
+    async def test_search_pois_along_route_raises_when_a_query_fails(self):
+        """A failed tile query should raise after caching the batches that succeeded."""
+        cache = _DictCache()
+        provider = OSMProvider(cache=cache)
+        route = [GeoLocation(latitude=-23.5 - i * 0.05, longitude=-46.6) for i in range(41)]
+        responses = iter([{'elements': []}, Exception("timeout")])
+
+        async def overpass(query, timeout=None):
+            response = next(responses, {'elements': []})
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        with patch.object(provider, '_make_overpass_request', side_effect=overpass) as mock_overpass:
+            with pytest.raises(RuntimeError):
+                await provider.search_pois_along_route(route, 3000, [POICategory.GAS_STATION])
+
+        assert mock_overpass.call_count >= 3
+        assert cache.entries
+        assert len(cache.entries) < mock_overpass.call_count * get_settings().poi_tile_max_per_query
+
 
 class TestOSMProviderIntegration:
     """Integration tests for OSM Provider with the original OSMService."""
@@ -393,18 +739,29 @@ class TestOSMProviderInternalMethods:
         assert osm_provider._map_osm_amenity_to_category('hospital') == POICategory.HOSPITAL
         assert osm_provider._map_osm_amenity_to_category('pharmacy') == POICategory.PHARMACY
     
-    def test_generate_overpass_query(self, osm_provider):
-        """It should generate correct Overpass queries for POI search."""
-        location = GeoLocation(latitude=-23.5505, longitude=-46.6333)
-        categories = [POICategory.GAS_STATION, POICategory.RESTAURANT]
-        
-        query = osm_provider._generate_overpass_query(location, 1000, categories)
-        
-        assert '[out:json]' in query
-        assert '"amenity"="fuel"' in query
-        assert '"amenity"="restaurant"' in query
+    def test_generate_overpass_tiles_query(self, osm_provider):
+        """It should merge adjacent tiles needing the same categories into one bbox."""
+        zoom = osm_provider._tile_zoom
+        batch = {
+            (3034, 4647): [POICategory.GAS_STATION, POICategory.CITY],
+            (3035, 4647): [POICategory.GAS_STATION, POICategory.CITY],
+            (3034, 4648): [POICategory.GAS_STATION],
+        }
+
+        query = osm_provider._generate_overpass_tiles_query(batch)
+
+        assert query.startswith('[out:json][timeout:')
+        assert query.count('node["amenity"~"^(fuel)$"]') == 2
+        assert query.count('node["place"~"^(city|town|village)$"]') == 1
         assert 'out meta;' in query
-    
+
+        south, west, _, _ = tile_bounds(3034, 4647, zoom)
+        _, _, north, east = tile_bounds(3035, 4647, zoom)
+        merged = next(line for line in query.splitlines() if '"place"' in line)
+        box = [float(v) for v in merged[merged.rindex('(') + 1:merged.rindex(')')].split(',')]
+        assert box[0] < south and box[1] < west and box[2] > north and box[3] > east
+        assert box[0] == pytest.approx(south) and box[3] == pytest.approx(east)
+
     def test_parse_osm_element_to_poi(self, osm_provider):
         """It should correctly parse OSM elements to POI objects."""
         osm_element = {
@@ -0,0 +1,235 @@
+"""
+Tests for the offline OSM PBF provider.
+
+Runs against tests/providers/data/tiny.osm.pbf (see make_tiny_extract.py):
+- PBFReader (dense and plain nodes, ways, packed varints)
+- POIIndex / build_poi_index
+- OSMPBFProvider search_pois, search_pois_many and get_poi_details
+"""
+
+import os
+import random
+
+import numpy as np
+import pytest
+
+from api.providers.base import ProviderType
+from api.providers.manager import GeoProviderManager, _register_built_in_providers
+from api.providers.models import GeoLocation, POICategory
+from api.providers.pbf.provider import OSMPBFProvider
+from api.providers.pbf.reader import PBFError, PBFReader, _packed_uvarints, _read_varint
+from tests.providers.data import make_tiny_extract
+
+TINY_EXTRACT = os.path.join(os.path.dirname(__file__), "data", "tiny.osm.pbf")
+
+
+@pytest.fixture
+def provider(tmp_path):
+    """Provider over the tiny extract, with its index in a temporary directory."""
+    return OSMPBFProvider(
+        pbf_path=TINY_EXTRACT,
+        index_path=str(tmp_path / "poi_index"),
+    )
+
+
+class TestPBFReader:
+    """Tests for PBFReader."""
+
+    def test_reads_dense_and_plain_nodes(self):
+        """It should decode ids, coordinates and tags of both node encodings."""
+        groups = list(PBFReader(TINY_EXTRACT).iter_nodes())
+
+        ids = np.concatenate([g.ids for g in groups])
+        assert ids.tolist() == [n[0] for n in make_tiny_extract.DENSE_NODES] + [20]
+
+        dense = groups[0]
+        assert dense.lats[0] == pytest.approx(-23.5)
+        assert dense.lons[1] == pytest.approx(-46.605)
+        assert dense.tags[0]["name"] == "Posto Shell"
+        assert 2 not in dense.tags  # untagged node
+
+        plain = groups[1]
+        assert plain.tags == {0: {"amenity": "pharmacy", "name": "Drogaria Central"}}
+        assert (plain.lats[0], plain.lons[0]) == pytest.approx((-23.502, -46.602))
+
+    def test_reads_ways_and_filters_before_decoding_refs(self):
+        """It should decode delta-coded refs, only for ways the predicate keeps."""
+        ways = list(PBFReader(TINY_EXTRACT).iter_ways())
+        assert [w.id for w in ways] == [100, 101, 102]
+        assert ways[0].refs.tolist() == [10, 11, 12, 13, 10]
+
+        fuel = list(PBFReader(TINY_EXTRACT).iter_ways(lambda tags: tags.get("amenity") == "fuel"))
+        assert [w.id for w in fuel] == [100]
+
+    def test_packed_varints_match_scalar_decoding(self):
+        """Vectorized varint decoding should agree with the scalar decoder."""
+        rng = random.Random(1)
+        values = [0, 1, 127, 128, 300, 2**32, 2**63 - 1, 2**64 - 1]
+        values += [rng.getrandbits(rng.randint(1, 64)) for _ in range(500)]
+        data = memoryview(b"".join(make_tiny_extract._varint(v) for v in values))
+
+        scalar = []
+        pos = 0
+        while pos < len(data):
+            value, pos = _read_varint(data, pos)
+            scalar.append(value)
+
+        assert scalar == values
+        assert _packed_uvarints(data).tolist() == values
+
+    def test_rejects_unsupported_required_features(self, tmp_path):
+        """Files needing features the reader lacks should be refused."""
+        header = make_tiny_extract._bytes(4, b"HistoricalInformation")
+        path = tmp_path / "history.osm.pbf"
+        path.write_bytes(make_tiny_extract._file_block("OSMHeader", header))
+
+        with pytest.raises(PBFError):
+            list(PBFReader(str(path)).iter_nodes())
+
+
+class TestPOIIndex:
+    """Tests for the index built by OSMPBFProvider."""
+
+    def test_indexes_only_poi_elements(self, provider):
+        """POI nodes and ways are indexed; roads, shops and clipped ways are not."""
+        index = provider.build_index()
+
+        assert len(index) == 6
+        for osm_type, osm_id in [("node", 1), ("node", 4), ("node", 7), ("node", 20), ("way", 100)]:
+            assert index.find(osm_type, osm_id) is not None
+        for osm_type, osm_id in [("node", 3), ("node", 5), ("way", 101), ("way", 102), ("node", 100)]:
+            assert index.find(osm_type, osm_id) is None
+
+    def test_ways_get_bounding_box_center(self, provider):
+        """Ways should be returned like Overpass 'out center' elements."""
+        index = provider.build_index()
+
+        element = index.element(index.find("way", 100))
+
+        assert element["type"] == "way"
+        assert element["id"] == 100
+        assert element["center"]["lat"] == pytest.approx(-23.5205)
+        assert element["center"]["lon"] == pytest.approx(-46.6205)
+        assert element["tags"]["name"] == "Posto Ipiranga"
+
+    def test_query_bbox(self, provider):
+        """Only rows inside the box should be returned."""
+        index = provider.build_index()
+
+        rows = index.query_bbox(-23.51, -46.61, -23.49, -46.59)
+
+        names = sorted(index.tags(int(row))["name"] for row in rows)
+        assert names == ["Drogaria Central", "Posto Shell", "Restaurante Bom Prato"]
+
+
+class TestOSMPBFProvider:
+    """Tests for OSMPBFProvider."""
+
+    def test_provider_type(self, provider):
+        """It should identify itself as the OSM PBF provider."""
+        assert provider.provider_type == ProviderType.OSM_PBF
+        assert provider.supports_corridor_search is False
+
+    def test_registered_in_manager(self):
+        """The manager should know the osm_pbf provider type."""
+        manager = GeoProviderManager(cache=object())
+        _register_built_in_providers(manager)
+
+        assert manager._provider_classes[ProviderType.OSM_PBF] is OSMPBFProvider
+
+    @pytest.mark.asyncio
+    async def test_search_pois_closest_first(self, provider):
+        """It should return matching POIs in the square window, closest first."""
+        location = GeoLocation(latitude=-23.5, longitude=-46.6)
+
+        pois = await provider.search_pois(location, 3000, [POICategory.GAS_STATION])
+
+        assert [poi.id for poi in pois] == ["node/1", "way/100"]
+        shell = pois[0]
+        assert shell.category == POICategory.GAS_STATION
+        assert "24h" in shell.amenities
+        assert shell.provider_data["quality_score"] > 0
+
+    @pytest.mark.asyncio
+    async def test_returns_ways_that_overpass_output_drops(self, provider):
+        """Ways are found at their center; the Overpass 'out meta' shape has none."""
+        location = GeoLocation(latitude=-23.5, longitude=-46.6)
+        index = provider.build_index()
+        way = index.element(index.find("way", 100))
+        overpass_way = {key: value for key, value in way.items() if key != "center"}
+
+        pois = await provider.search_pois(location, 3000, [POICategory.GAS_STATION])
+
+        assert "way/100" in [poi.id for poi in pois]
+        assert provider._parse_osm_element_to_poi(overpass_way) is None
+
+    @pytest.mark.asyncio
+    async def test_search_pois_respects_radius_and_limit(self, provider):
+        """Small windows exclude far POIs and limit caps the results."""
+        location = GeoLocation(latitude=-23.5, longitude=-46.6)
+        categories = [POICategory.GAS_STATION, POICategory.RESTAURANT, POICategory.PHARMACY]
+
+        near = await provider.search_pois(location, 1000, categories)
+        capped = await provider.search_pois(location, 3000, categories, limit=2)
+
+        assert [poi.id for poi in near] == ["node/1", "node/20", "node/2"]
+        assert [poi.id for poi in capped] == ["node/1", "node/20"]
+
+    @pytest.mark.asyncio
+    async def test_towns_use_three_times_the_radius(self, provider):
+        """Cities and towns should be found within 3x the search radius."""
+        location = GeoLocation(latitude=-23.5, longitude=-46.6)
+
+        within_3x = await provider.search_pois(location, 2500, [POICategory.TOWN])
+        too_far = await provider.search_pois(location, 1500, [POICategory.TOWN])
+
+        assert [poi.name for poi in within_3x] == ["Vila Nova"]
+        assert within_3x[0].category == POICategory.TOWN
+        assert too_far == []
+
+    @pytest.mark.asyncio
+    async def test_search_pois_many(self, provider):
+        """It should answer one result list per location."""
+        locations = [
+            GeoLocation(latitude=-23.5, longitude=-46.6),
+            GeoLocation(latitude=-23.9, longitude=-46.9),
+        ]
+
+        results = await provider.search_pois_many(locations, 1000, [POICategory.HOTEL])
+
+        assert [[poi.name for poi in pois] for pois in results] == [[], ["Hotel Litoral"]]
+
+    @pytest.mark.asyncio
+    async def test_get_poi_details(self, provider):
+        """It should look POIs up by their 'type/id' identifier."""
+        poi = await provider.get_poi_details("way/100")
+
+        assert poi.name == "Posto Ipiranga"
+        assert poi.location.latitude == pytest.approx(-23.5205)
+        assert await provider.get_poi_details("node/3") is None
+        assert await provider.get_poi_details("invalid") is None
+
+    @pytest.mark.asyncio
+    async def test_reuses_current_index_and_rebuilds_stale_one(self, provider, tmp_path):
+        """The index is built once, and rebuilt when its tag filters change."""
+        await provider.search_pois(GeoLocation(latitude=-23.5, longitude=-46.6), 1000, [POICategory.GAS_STATION])
+        index_path = str(tmp_path / "poi_index")
+        built_at = os.path.getmtime(os.path.join(index_path, "meta.json"))
+
+        fresh = OSMPBFProvider(pbf_path=TINY_EXTRACT, index_path=index_path)
+        assert fresh._load_index().meta["elements"] == 6
+        assert os.path.getmtime(os.path.join(index_path, "meta.json")) == built_at
+
+        changed = OSMPBFProvider(pbf_path=TINY_EXTRACT, index_path=index_path)
+        changed._index_filters["amenity"].remove("fuel")
+        assert changed._load_index().meta["elements"] == 4
+
+    def test_missing_extract(self, tmp_path):
+        """Without index nor extract, loading should fail clearly."""
+        provider = OSMPBFProvider(
+            pbf_path=str(tmp_path / "missing.osm.pbf"),
+            index_path=str(tmp_path / "poi_index"),
+        )
+
+        with pytest.raises(FileNotFoundError):
+            provider._load_index()
@@ -128,6 +128,11 @@ class TestProviderSettingsCacheTTL:
         settings = ProviderSettings()
         assert settings.get_cache_ttl("poi_search") == settings.geo_cache_ttl_poi
 
+    def test_get_cache_ttl_poi_tile(self):
+        """POI tiles should share the POI search TTL."""
+        settings = ProviderSettings()
+        assert settings.get_cache_ttl("poi_tile") == settings.geo_cache_ttl_poi
+
     def test_get_cache_ttl_unknown_operation(self):
         """It should return default TTL for unknown operations."""
         settings = ProviderSettings()
@@ -0,0 +1,62 @@
+"""
+Unit tests for api/database/repositories/google_places_cache.py
+
+Tests for:
+- get_by_osm_ids
+"""
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from unittest.mock import AsyncMock, MagicMock
+
+from api.database.repositories.google_places_cache import GooglePlacesCacheRepository
+
+
+def _result(entries):
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = entries
+    return result
+
+
+@pytest.fixture
+def session():
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=_result([]))
+    return session
+
+
+class TestGetByOsmIds:
+    """Tests for get_by_osm_ids method."""
+
+    @pytest.mark.asyncio
+    async def test_single_query_for_all_ids(self, session):
+        """Should resolve every ID with one SELECT ... IN, skipping expired entries."""
+        entry = MagicMock(osm_poi_id="node/1")
+        session.execute.return_value = _result([entry])
+
+        entries = await GooglePlacesCacheRepository(session).get_by_osm_ids(
+            ["node/1", "node/2", "node/1"]
+        )
+
+        assert entries == {"node/1": entry}
+        session.execute.assert_awaited_once()
+        compiled = session.execute.call_args[0][0].compile(dialect=postgresql.dialect())
+        assert "google_places_cache.osm_poi_id IN" in str(compiled)
+        assert "google_places_cache.expires_at >" in str(compiled)
+        ids = [v for v in compiled.params.values() if isinstance(v, list)]
+        assert ids == [["node/1", "node/2"]]
+
+    @pytest.mark.asyncio
+    async def test_large_batches_are_chunked(self, session):
+        """Should split very large ID lists into several queries."""
+        await GooglePlacesCacheRepository(session).get_by_osm_ids(
+            [f"node/{i}" for i in range(2500)]
+        )
+
+        assert session.execute.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_empty_input_skips_database(self, session):
+        """Should not query when no IDs are given."""
+        assert await GooglePlacesCacheRepository(session).get_by_osm_ids([]) == {}
+        session.execute.assert_not_called()
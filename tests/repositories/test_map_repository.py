@@ -0,0 +1,82 @@
+"""
+Unit tests for map listing queries in api/database/repositories/map.py
+"""
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from unittest.mock import AsyncMock, MagicMock
+
+from api.database.repositories.map import MapRepository
+
+
+def _result(keys, rows):
+    result = MagicMock()
+    result.keys.return_value = keys
+    result.all.return_value = rows
+    return result
+
+
+class TestMapsForListing:
+    """Tests for get_maps_for_listing and get_user_maps_for_listing."""
+
+    @pytest.fixture
+    def session(self):
+        session = MagicMock()
+        session.execute = AsyncMock()
+        return session
+
+    @pytest.mark.asyncio
+    async def test_counts_come_from_the_same_query(self, session):
+        """Should select POI counts alongside each map, and user counts only on request."""
+        db_map = MagicMock()
+        session.execute.return_value = _result(["Map", "poi_count"], [(db_map, 12)])
+
+        rows = await MapRepository(session).get_maps_for_listing(limit=10)
+
+        assert rows == [{"map": db_map, "poi_count": 12}]
+        session.execute.assert_awaited_once()
+        sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "count(map_pois.id)" in sql
+        assert "user_maps" not in sql
+        assert "origin_lat" not in sql
+
+    @pytest.mark.asyncio
+    async def test_with_user_count(self, session):
+        """Should add the user count subquery when asked for it."""
+        db_map = MagicMock()
+        session.execute.return_value = _result(
+            ["Map", "poi_count", "user_count"], [(db_map, 12, 2)]
+        )
+
+        rows = await MapRepository(session).get_maps_for_listing(with_user_count=True)
+
+        assert rows == [{"map": db_map, "poi_count": 12, "user_count": 2}]
+        sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "count(user_maps.id)" in sql
+
+    @pytest.mark.asyncio
+    async def test_with_origin_and_location_filter(self, session):
+        """Should add origin coordinates and the origin/destination search."""
+        session.execute.return_value = _result([], [])
+
+        await MapRepository(session).get_maps_for_listing(
+            location="Campinas", with_origin=True
+        )
+
+        sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "AS origin_lat" in sql
+        assert "AS origin_lon" in sql
+        assert "ILIKE" in sql.upper()
+
+    @pytest.mark.asyncio
+    async def test_user_maps_filtered_by_user(self, session):
+        """Should join user_maps and order by added_at."""
+        session.execute.return_value = _result([], [])
+
+        await MapRepository(session).get_user_maps_for_listing(uuid4())
+
+        sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "JOIN user_maps ON user_maps.map_id = maps.id" in sql
+        assert "ORDER BY user_maps.added_at DESC" in sql
@@ -0,0 +1,162 @@
+"""
+Unit tests for api/database/repositories/map_response_cache.py
+
+Tests for:
+- get_current
+- get_version
+- upsert
+- delete_for_pois
+"""
+
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from unittest.mock import AsyncMock, MagicMock
+
+from api.database.repositories.map_response_cache import MapResponseCacheRepository
+from api.database.repositories.poi import POIRepository
+
+
+def _compile(stmt):
+    compiled = stmt.compile(dialect=postgresql.dialect())
+    return str(compiled), compiled.params
+
+
+@pytest.fixture
+def session():
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=MagicMock())
+    session.flush = AsyncMock()
+    return session
+
+
+class TestGetCurrent:
+    """Tests for get_current method."""
+
+    @pytest.mark.asyncio
+    async def test_matches_current_map_version(self, session):
+        """Should only return entries built from the map's current version."""
+        await MapResponseCacheRepository(session).get_current(uuid4(), "coordinates")
+
+        session.execute.assert_awaited_once()
+        sql, _ = _compile(session.execute.call_args[0][0])
+        assert "map_response_cache.map_version = maps.updated_at" in sql
+        # A single-column check, no aggregate over the map's POIs
+        assert "map_pois" not in sql
+        assert "max(" not in sql
+        assert "user_maps" not in sql
+
+    @pytest.mark.asyncio
+    async def test_checks_access_in_same_query(self, session):
+        """Should check the user's collection in the same statement."""
+        user_id = uuid4()
+
+        await MapResponseCacheRepository(session).get_current(
+            uuid4(), "polyline6", user_id=user_id
+        )
+
+        session.execute.assert_awaited_once()
+        sql, params = _compile(session.execute.call_args[0][0])
+        assert "EXISTS" in sql
+        assert "user_maps" in sql
+        assert user_id in params.values()
+
+
+class TestGetVersion:
+    """Tests for get_version method."""
+
+    @pytest.mark.asyncio
+    async def test_reads_map_updated_at(self, session):
+        """Should read the column get_current compares against."""
+        version = datetime(2026, 1, 2)
+        session.execute.return_value = MagicMock(
+            scalar_one_or_none=MagicMock(return_value=version)
+        )
+
+        result = await MapResponseCacheRepository(session).get_version(uuid4())
+
+        assert result == version
+        sql, _ = _compile(session.execute.call_args[0][0])
+        assert sql.startswith("SELECT maps.updated_at")
+        assert "map_pois" not in sql
+
+
+class TestSharedPOIChanges:
+    """Enriching another map's POIs must invalidate this map's entries."""
+
+    @pytest.mark.asyncio
+    async def test_enriching_map_b_invalidates_map_a(self, session):
+        """
+        A POI shared by maps A and B, enriched while B is generated, bumps
+        the updated_at of every map showing it, A included; A's entry was
+        built from its previous updated_at, so it no longer matches.
+        """
+        session.execute.return_value = MagicMock(rowcount=1)
+        session.execute.return_value.scalars.return_value.all.return_value = []
+        shared_poi = uuid4()
+
+        await POIRepository(session).bulk_update_google_places(
+            [{"id": shared_poi, "rating": 4.5, "rating_count": 10, "google_maps_uri": "uri"}]
+        )
+        await POIRepository(session).bulk_update_here_data(
+            [{
+                "id": shared_poi, "here_id": "here:1", "here_data": {},
+                "phone": "1", "website": None, "opening_hours": None,
+            }]
+        )
+        touches = [
+            _compile(call[0][0])
+            for call in session.execute.call_args_list
+            if _compile(call[0][0])[0].startswith("UPDATE maps")
+        ]
+
+        await MapResponseCacheRepository(session).get_current(uuid4(), "coordinates")
+        lookup_sql, _ = _compile(session.execute.call_args[0][0])
+
+        # Google Places bumps the maps of the POI; HERE returned no updated rows
+        assert len(touches) == 1
+        google_touch = touches[0]
+        assert google_touch[0].startswith("UPDATE maps SET updated_at=now()")
+        assert "SELECT map_pois.map_id" in google_touch[0]
+        assert [shared_poi] in google_touch[1].values()
+        assert "map_response_cache.map_version = maps.updated_at" in lookup_sql
+
+
+class TestUpsert:
+    """Tests for upsert method."""
+
+    @pytest.mark.asyncio
+    async def test_replaces_existing_entry(self, session):
+        """Should upsert on (map_id, geometry_format)."""
+        await MapResponseCacheRepository(session).upsert(
+            uuid4(), "coordinates", datetime(2026, 1, 1), '"abc"', "{}"
+        )
+
+        sql, _ = _compile(session.execute.call_args[0][0])
+        assert "ON CONFLICT (map_id, geometry_format) DO UPDATE" in sql
+        assert "payload = excluded.payload" in sql
+        assert "etag = excluded.etag" in sql
+
+
+class TestDeleteForPois:
+    """Tests for delete_for_pois method."""
+
+    @pytest.mark.asyncio
+    async def test_deletes_maps_containing_pois(self, session):
+        """Should delete the entries of maps linked to the POIs."""
+        session.execute.return_value = MagicMock(rowcount=2)
+
+        deleted = await MapResponseCacheRepository(session).delete_for_pois([uuid4()])
+
+        assert deleted == 2
+        sql, _ = _compile(session.execute.call_args[0][0])
+        assert "DELETE FROM map_response_cache" in sql
+        assert "FROM map_pois" in sql
+
+    @pytest.mark.asyncio
+    async def test_empty_input_skips_database(self, session):
+        """Should not query when no POI IDs are given."""
+        assert await MapResponseCacheRepository(session).delete_for_pois([]) == 0
+        session.execute.assert_not_called()
@@ -0,0 +1,238 @@
+"""
+Unit tests for api/database/repositories/poi.py
+
+Tests for the set-based POI writes (and the map versions they bump):
+- bulk_upsert_by_osm_ids
+- bulk_update_google_places
+- bulk_update_here_data
+"""
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from unittest.mock import AsyncMock, MagicMock
+
+from api.database.repositories.poi import POIRepository
+
+
+def _poi_data(osm_id, **overrides):
+    data = {
+        "osm_id": osm_id,
+        "name": f"Posto {osm_id}",
+        "type": "gas_station",
+        "latitude": -23.55,
+        "longitude": -46.63,
+        "city": None,
+        "rating": None,
+        "rating_count": None,
+    }
+    data.update(overrides)
+    return data
+
+
+class TestBulkUpsertByOsmIds:
+    """Tests for bulk_upsert_by_osm_ids method."""
+
+    @pytest.fixture
+    def statements(self):
+        return []
+
+    @pytest.fixture
+    def repo(self, statements):
+        """Repository whose session records statements and echoes back IDs."""
+        session = MagicMock()
+
+        async def execute(stmt):
+            statements.append(stmt)
+            params = stmt.compile(dialect=postgresql.dialect()).params
+            osm_ids = [v for k, v in params.items() if k.startswith("osm_id")]
+            result = MagicMock()
+            result.all.return_value = [(uuid4(), osm_id) for osm_id in osm_ids]
+            return result
+
+        session.execute = execute
+        return POIRepository(session)
+
+    @pytest.mark.asyncio
+    async def test_empty_input_skips_database(self, repo, statements):
+        """Should not execute anything when there is nothing to upsert."""
+        assert await repo.bulk_upsert_by_osm_ids([]) == {}
+        assert await repo.bulk_upsert_by_osm_ids([{"name": "no osm id"}]) == {}
+        assert statements == []
+
+    @pytest.mark.asyncio
+    async def test_single_statement_with_on_conflict(self, repo, statements):
+        """Should upsert all POIs with one INSERT ... ON CONFLICT ... RETURNING."""
+        ids = await repo.bulk_upsert_by_osm_ids(
+            [_poi_data("node/1"), _poi_data("node/2"), _poi_data("node/3")]
+        )
+
+        assert set(ids) == {"node/1", "node/2", "node/3"}
+        assert len(statements) == 2
+        sql = str(statements[0].compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (osm_id) DO UPDATE" in sql
+        assert "RETURNING pois.id, pois.osm_id" in sql
+
+    @pytest.mark.asyncio
+    async def test_touches_maps_of_filled_pois(self, repo, statements):
+        """Maps showing a POI that got a field filled in get a new version."""
+        ids = await repo.bulk_upsert_by_osm_ids([_poi_data("node/1")])
+
+        compiled = statements[1].compile(dialect=postgresql.dialect())
+        sql = str(compiled)
+        assert sql.startswith("UPDATE maps SET updated_at=now()")
+        assert "SELECT map_pois.map_id" in sql
+        assert "pois.updated_at = now()" in sql
+        assert [ids["node/1"]] in compiled.params.values()
+
+    @pytest.mark.asyncio
+    async def test_update_only_fills_missing_fields(self, repo, statements):
+        """Conflicting rows should only fill rating/city/google_maps_uri when missing."""
+        await repo.bulk_upsert_by_osm_ids([_poi_data("node/1")])
+
+        sql = str(statements[0].compile(dialect=postgresql.dialect()))
+        update_clause = sql.split("DO UPDATE SET")[1].split("RETURNING")[0]
+        assert "rating = coalesce(pois.rating, excluded.rating)" in update_clause
+        assert "rating_count = coalesce(pois.rating_count, excluded.rating_count)" in update_clause
+        assert "city = coalesce(nullif(pois.city" in update_clause
+        assert "google_maps_uri = coalesce(nullif(pois.google_maps_uri" in update_clause
+        assert "name =" not in update_clause
+
+    @pytest.mark.asyncio
+    async def test_duplicate_osm_ids_are_merged(self, repo, statements):
+        """First entry wins; later duplicates only fill its missing fields."""
+        await repo.bulk_upsert_by_osm_ids([
+            _poi_data("node/1", name="First"),
+            _poi_data("node/1", name="Second", city="Registro", rating=4.5),
+        ])
+
+        params = statements[0].compile(dialect=postgresql.dialect()).params
+        assert [v for k, v in params.items() if k.startswith("osm_id")] == ["node/1"]
+        assert params["name_m0"] == "First"
+        assert params["city_m0"] == "Registro"
+        assert params["rating_m0"] == 4.5
+
+    @pytest.mark.asyncio
+    async def test_large_batches_are_chunked(self, repo, statements):
+        """Should split very large batches into several statements."""
+        ids = await repo.bulk_upsert_by_osm_ids(
+            [_poi_data(f"node/{i}") for i in range(2500)]
+        )
+
+        assert len(ids) == 2500
+        # One upsert and one map touch per chunk
+        assert len(statements) == 6
+
+
+@pytest.fixture
+def session():
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=MagicMock(rowcount=1))
+    session.flush = AsyncMock()
+    return session
+
+
+def _here_update(here_id, **overrides):
+    data = {
+        "id": uuid4(),
+        "here_id": here_id,
+        "here_data": {"address": {}},
+        "phone": "+55 11 1234-5678",
+        "website": None,
+        "opening_hours": None,
+    }
+    data.update(overrides)
+    return data
+
+
+class TestBulkUpdateGooglePlaces:
+    """Tests for bulk_update_google_places method."""
+
+    @pytest.mark.asyncio
+    async def test_single_update_from_values_list(self, session):
+        """Should update all POIs with one UPDATE ... FROM (VALUES ...)."""
+        updates = [
+            {"id": uuid4(), "rating": 4.5, "rating_count": 10, "google_maps_uri": "u1"},
+            {"id": uuid4(), "rating": 3.9, "rating_count": 2, "google_maps_uri": None},
+        ]
+
+        await POIRepository(session).bulk_update_google_places(updates)
+
+        update_pois, touch_maps = [call[0][0] for call in session.execute.call_args_list]
+        sql = str(update_pois.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("UPDATE pois SET")
+        assert "FROM (VALUES" in sql
+        assert "WHERE pois.id = google_results.id" in sql
+        touched = touch_maps.compile(dialect=postgresql.dialect())
+        assert str(touched).startswith("UPDATE maps SET updated_at=now()")
+        assert [update["id"] for update in updates] in touched.params.values()
+
+    @pytest.mark.asyncio
+    async def test_marks_enrichment_in_sql(self, session):
+        """enriched_by should be merged by the database, not overwritten."""
+        await POIRepository(session).bulk_update_google_places(
+            [{"id": uuid4(), "rating": 4.5, "rating_count": 10, "google_maps_uri": "u"}]
+        )
+
+        sql = str(session.execute.call_args_list[0][0][0].compile(dialect=postgresql.dialect()))
+        assert "pois.enriched_by @>" in sql
+        assert "coalesce(pois.enriched_by" in sql
+
+    @pytest.mark.asyncio
+    async def test_empty_input_skips_database(self, session):
+        """Should not execute anything when there is nothing to update."""
+        assert await POIRepository(session).bulk_update_google_places([]) == 0
+        session.execute.assert_not_called()
+
+
+class TestBulkUpdateHereData:
+    """Tests for bulk_update_here_data method."""
+
+    @pytest.mark.asyncio
+    async def test_contact_info_only_fills_missing_fields(self, session):
+        """Existing phone/website/opening hours should be kept."""
+        await POIRepository(session).bulk_update_here_data([_here_update("here_1")])
+
+        sql = str(session.execute.call_args_list[0][0][0].compile(dialect=postgresql.dialect()))
+        assert "phone=coalesce(nullif(pois.phone" in sql
+        assert "website=coalesce(nullif(pois.website" in sql
+        assert "opening_hours=coalesce(nullif(pois.opening_hours" in sql
+
+    @pytest.mark.asyncio
+    async def test_skips_here_ids_owned_by_other_pois(self, session):
+        """Should not steal a here_id that another POI already has."""
+        await POIRepository(session).bulk_update_here_data([_here_update("here_1")])
+
+        sql = str(session.execute.call_args_list[0][0][0].compile(dialect=postgresql.dialect()))
+        assert "NOT (EXISTS" in sql
+        assert "pois_1.id != pois.id" in sql
+
+    @pytest.mark.asyncio
+    async def test_repeated_here_ids_are_written_once(self, session):
+        """Only the first POI matched to a HERE place gets its here_id."""
+        first, duplicate = _here_update("here_1"), _here_update("here_1")
+
+        await POIRepository(session).bulk_update_here_data(
+            [first, duplicate, _here_update("here_2")]
+        )
+
+        params = session.execute.call_args_list[0][0][0].compile(dialect=postgresql.dialect()).params
+        assert first["id"] in params.values()
+        assert duplicate["id"] not in params.values()
+        assert list(params.values()).count("here_1") == 1
+
+    @pytest.mark.asyncio
+    async def test_touches_maps_of_updated_pois(self, session):
+        """Only the POIs the UPDATE returned bump their maps."""
+        written, skipped = _here_update("here_1"), _here_update("here_2")
+        session.execute.return_value.scalars.return_value.all.return_value = [written["id"]]
+
+        updated = await POIRepository(session).bulk_update_here_data([written, skipped])
+
+        assert updated == 1
+        update_pois, touch_maps = [call[0][0] for call in session.execute.call_args_list]
+        assert "RETURNING pois.id" in str(update_pois.compile(dialect=postgresql.dialect()))
+        touched = touch_maps.compile(dialect=postgresql.dialect())
+        assert str(touched).startswith("UPDATE maps SET updated_at=now()")
+        assert [written["id"]] in touched.params.values()
@@ -0,0 +1,88 @@
+"""
+Unit tests for api/database/repositories/route_segment.py
+
+Tests for bulk segment writes:
+- bulk_create_missing
+- bulk_increment_usage
+"""
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from unittest.mock import AsyncMock, MagicMock
+
+from api.database.repositories.route_segment import RouteSegmentRepository
+
+
+def _compile(stmt):
+    compiled = stmt.compile(dialect=postgresql.dialect())
+    return str(compiled), compiled.params
+
+
+@pytest.fixture
+def session():
+    session = MagicMock()
+    session.execute = AsyncMock()
+    session.flush = AsyncMock()
+    return session
+
+
+class TestBulkCreateMissing:
+    """Tests for bulk_create_missing method."""
+
+    @pytest.mark.asyncio
+    async def test_inserts_with_on_conflict_do_nothing(self, session):
+        """Should insert all rows in one statement, ignoring existing hashes."""
+        created = MagicMock(segment_hash="h1")
+        result = MagicMock()
+        result.all.return_value = [created]
+        session.scalars = AsyncMock(return_value=result)
+        rows = [
+            {
+                "segment_hash": h,
+                "start_lat": 0, "start_lon": 0, "end_lat": 0, "end_lon": 0,
+                "length_km": 1, "geometry": [], "usage_count": 1,
+            }
+            for h in ("h1", "h2")
+        ]
+
+        segments = await RouteSegmentRepository(session).bulk_create_missing(rows)
+
+        assert segments == {"h1": created}
+        session.scalars.assert_awaited_once()
+        sql, _ = _compile(session.scalars.await_args.args[0])
+        assert "ON CONFLICT (segment_hash) DO NOTHING" in sql
+        assert "RETURNING" in sql
+
+    @pytest.mark.asyncio
+    async def test_empty_input_skips_database(self, session):
+        """Should not execute anything when there is nothing to insert."""
+        session.scalars = AsyncMock()
+
+        assert await RouteSegmentRepository(session).bulk_create_missing([]) == {}
+        session.scalars.assert_not_called()
+
+
+class TestBulkIncrementUsage:
+    """Tests for bulk_increment_usage method."""
+
+    @pytest.mark.asyncio
+    async def test_single_update_for_distinct_ids(self, session):
+        """Distinct IDs should be incremented by one UPDATE."""
+        await RouteSegmentRepository(session).bulk_increment_usage([uuid4(), uuid4()])
+
+        assert session.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_repeated_ids_increment_per_occurrence(self, session):
+        """An ID listed twice should be incremented by two."""
+        twice = uuid4()
+
+        await RouteSegmentRepository(session).bulk_increment_usage([twice, uuid4(), twice])
+
+        increments = sorted(
+            _compile(call.args[0])[1]["usage_count_1"]
+            for call in session.execute.await_args_list
+        )
+        assert increments == [1, 2]
@@ -0,0 +1,47 @@
+"""
+Unit tests for api/database/repositories/segment_poi.py
+
+Tests for the bulk loader:
+- get_by_segments_with_pois
+"""
+
+from uuid import uuid4
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from api.database.repositories.segment_poi import SegmentPOIRepository
+
+
+class TestGetBySegmentsWithPois:
+    """Tests for get_by_segments_with_pois method."""
+
+    @pytest.mark.asyncio
+    async def test_groups_results_by_segment_in_one_query(self):
+        """Should run one query and group SegmentPOIs per segment."""
+        first, second, empty = uuid4(), uuid4(), uuid4()
+        rows = [
+            MagicMock(segment_id=first, search_point_index=0),
+            MagicMock(segment_id=first, search_point_index=2),
+            MagicMock(segment_id=second, search_point_index=1),
+        ]
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = rows
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=result)
+
+        by_segment = await SegmentPOIRepository(session).get_by_segments_with_pois(
+            [first, second, empty]
+        )
+
+        session.execute.assert_awaited_once()
+        assert by_segment == {first: rows[:2], second: rows[2:], empty: []}
+
+    @pytest.mark.asyncio
+    async def test_empty_input_skips_database(self):
+        """Should not query when no segment IDs are given."""
+        session = MagicMock()
+        session.execute = AsyncMock()
+
+        assert await SegmentPOIRepository(session).get_by_segments_with_pois([]) == {}
+        session.execute.assert_not_called()
@@ -0,0 +1,267 @@
+"""
+Tests for the background worker pool in api/services/async_service.py.
+"""
+
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+from api.database.connection import get_worker_engine
+from api.models.road_models import AsyncOperationResponse
+from api.services.async_service import AsyncService, JobPriority, _WorkerPool
+
+
+def _run_jobs(pool: _WorkerPool, jobs):
+    """Submit jobs and wait until all of them ran."""
+    done = threading.Semaphore(0)
+
+    def _wrap(job):
+        def _job():
+            try:
+                job()
+            finally:
+                done.release()
+        return _job
+
+    for job in jobs:
+        pool.submit(_wrap(job))
+    for _ in jobs:
+        assert done.acquire(timeout=10)
+
+
+class TestWorkerPool:
+    """Tests for _WorkerPool."""
+
+    @pytest.fixture
+    def single_worker_pool(self):
+        with patch("api.providers.settings.get_settings") as mock_settings:
+            mock_settings.return_value.async_worker_threads = 1
+            pool = _WorkerPool()
+            pool._ensure_started()
+        return pool
+
+    def test_reuses_thread_loop_and_engine_across_jobs(self, single_worker_pool):
+        """Consecutive jobs on a worker share its event loop and engine."""
+        seen = []
+
+        def job():
+            loop = asyncio.get_event_loop()
+
+            async def _engine():
+                return get_worker_engine()
+
+            seen.append((threading.get_ident(), loop, loop.run_until_complete(_engine())))
+
+        _run_jobs(single_worker_pool, [job, job])
+
+        assert len(seen) == 2
+        assert seen[0][0] == seen[1][0]
+        assert seen[0][1] is seen[1][1]
+        assert seen[0][2] is not None
+        assert seen[0][2] is seen[1][2]
+
+    def test_engine_not_used_from_another_loop(self, single_worker_pool):
+        """The worker engine is only handed out on the loop it was created on."""
+        seen = []
+
+        def job():
+            async def _engine():
+                return get_worker_engine()
+
+            seen.append(asyncio.run(_engine()))
+
+        _run_jobs(single_worker_pool, [job])
+
+        assert seen == [None]
+
+    def test_failing_job_does_not_stop_worker(self, single_worker_pool):
+        """A job raising an exception leaves the worker able to run the next one."""
+        ran = []
+
+        def failing_job():
+            raise RuntimeError("boom")
+
+        _run_jobs(single_worker_pool, [failing_job, lambda: ran.append(True)])
+
+        assert ran == [True]
+
+    def test_worker_outside_pool_has_no_engine(self):
+        """Threads that are not pool workers get no worker engine."""
+        async def _engine():
+            return get_worker_engine()
+
+        assert asyncio.run(_engine()) is None
+
+
+def _blocking_job(started: threading.Event, release: threading.Event):
+    """Job that signals it started, then waits until released."""
+    def _job():
+        started.set()
+        assert release.wait(timeout=10)
+    return _job
+
+
+class TestWorkerPoolScheduling:
+    """Tests for the priority queue, queue status and drain of _WorkerPool."""
+
+    @pytest.fixture
+    def busy_pool(self):
+        """Single-worker pool whose worker is held by a blocking job."""
+        with patch("api.providers.settings.get_settings") as mock_settings:
+            mock_settings.return_value.async_worker_threads = 1
+            pool = _WorkerPool()
+            pool._ensure_started()
+        started, release = threading.Event(), threading.Event()
+        pool.submit(_blocking_job(started, release), key="running")
+        assert started.wait(timeout=10)
+        yield pool, release
+        release.set()
+
+    def test_interactive_jobs_run_before_regenerations(self, busy_pool):
+        """Queued interactive jobs overtake regenerations, FIFO within a priority."""
+        pool, release = busy_pool
+        ran = []
+        for name, priority in [
+            ("regen-1", JobPriority.REGENERATION),
+            ("map-1", JobPriority.INTERACTIVE),
+            ("regen-2", JobPriority.REGENERATION),
+            ("map-2", JobPriority.INTERACTIVE),
+        ]:
+            pool.submit(lambda name=name: ran.append(name), key=name, priority=priority)
+
+        release.set()
+        assert pool.shutdown(timeout=10) == 0
+
+        assert ran == ["map-1", "map-2", "regen-1", "regen-2"]
+
+    def test_queue_status(self, busy_pool):
+        """Queued jobs report their position and a start estimate per worker round."""
+        pool, _ = busy_pool
+        pool._average_duration_s = 60.0
+        pool.submit(lambda: None, key="regen", priority=JobPriority.REGENERATION)
+        pool.submit(lambda: None, key="map", priority=JobPriority.INTERACTIVE)
+
+        now = datetime.now()
+        first = pool.queue_status("map")
+        second = pool.queue_status("regen")
+
+        assert first.position == 1
+        assert second.position == 2
+        assert first.estimated_start - now == pytest.approx(timedelta(seconds=60), abs=timedelta(seconds=5))
+        assert second.estimated_start - now == pytest.approx(timedelta(seconds=120), abs=timedelta(seconds=5))
+        assert pool.queue_status("running") is None
+        assert pool.queue_status("unknown") is None
+
+    def test_has_capacity_limits_queued_jobs(self, busy_pool):
+        """Only waiting jobs count against ASYNC_QUEUE_MAX_SIZE."""
+        pool, _ = busy_pool
+        with patch("api.providers.settings.get_settings") as mock_settings:
+            mock_settings.return_value.async_queue_max_size = 1
+            assert pool.has_capacity()
+
+            pool.submit(lambda: None, key="queued")
+            assert not pool.has_capacity()
+
+            mock_settings.return_value.async_queue_max_size = 0
+            assert pool.has_capacity()
+
+    def test_shutdown_drains_queued_and_running_jobs(self, busy_pool):
+        """Shutdown waits for the running job and the queue before returning."""
+        pool, release = busy_pool
+        ran = []
+        pool.submit(lambda: ran.append("queued"), key="queued")
+
+        threading.Timer(0.2, release.set).start()
+        dropped = pool.shutdown(timeout=10)
+
+        assert dropped == 0
+        assert ran == ["queued"]
+
+    def test_shutdown_timeout_drops_queued_jobs(self, busy_pool):
+        """Jobs still queued at the timeout are dropped, and the pool can restart."""
+        pool, release = busy_pool
+        ran = []
+        pool.submit(lambda: ran.append("queued"), key="queued")
+
+        assert pool.shutdown(timeout=0.1) == 1
+        release.set()
+
+        with patch("api.providers.settings.get_settings") as mock_settings:
+            mock_settings.return_value.async_worker_threads = 1
+            _run_jobs(pool, [lambda: ran.append("after restart")])
+        assert ran == ["after restart"]
+
+    def test_operation_submitted_during_shutdown_is_failed(self, busy_pool):
+        """An operation the draining pool refuses is marked as failed, not left in progress."""
+        pool, release = busy_pool
+        draining = threading.Thread(target=pool.shutdown, args=(10,))
+        draining.start()
+        while pool.has_capacity():
+            draining.join(timeout=0.01)
+
+        @asynccontextmanager
+        async def _session():
+            yield None
+
+        with patch("api.services.async_service._worker_pool", pool), patch(
+            "api.services.async_service.get_session", _session
+        ), patch("api.services.async_service.AsyncOperationRepository") as mock_repo:
+            mock_repo.return_value.fail_operation = AsyncMock()
+            AsyncService.run_async("op-late", lambda progress_callback: {})
+
+        release.set()
+        draining.join(timeout=10)
+
+        mock_repo.return_value.fail_operation.assert_awaited_once()
+        kwargs = mock_repo.return_value.fail_operation.await_args.kwargs
+        assert kwargs["operation_id"] == "op-late"
+        assert "encerramento" in kwargs["error"]
+
+
+class TestGetOperationQueueStatus:
+    """Tests for the queue fields filled in by AsyncService.get_operation."""
+
+    @pytest.mark.asyncio
+    async def test_queued_operation_gets_position_and_eta(self):
+        """A queued operation reports its position, start and completion estimates."""
+        operation = AsyncOperationResponse(operation_id="op-1", type="linear_map")
+        pool = _WorkerPool()
+        pool._average_duration_s = 100.0
+        with patch("api.providers.settings.get_settings") as mock_settings:
+            mock_settings.return_value.async_worker_threads = 1
+            started, release = threading.Event(), threading.Event()
+            pool.submit(_blocking_job(started, release), key="running")
+            assert started.wait(timeout=10)
+            pool.submit(lambda: None, key="op-1")
+
+        try:
+            with patch("api.services.async_service._worker_pool", pool), patch.object(
+                AsyncService, "_get_operation_async", AsyncMock(return_value=operation)
+            ):
+                response = await AsyncService.get_operation("op-1")
+        finally:
+            release.set()
+            pool.shutdown(timeout=10)
+
+        assert response.queue_position == 1
+        assert response.estimated_completion - response.estimated_start == pytest.approx(
+            timedelta(seconds=100), abs=timedelta(seconds=30)
+        )
+        assert operation.queue_position is None  # cached operation left untouched
+
+    @pytest.mark.asyncio
+    async def test_running_operation_has_no_queue_position(self):
+        """Operations already on a worker are returned unchanged."""
+        operation = AsyncOperationResponse(operation_id="op-2", type="linear_map")
+
+        with patch.object(
+            AsyncService, "_get_operation_async", AsyncMock(return_value=operation)
+        ):
+            response = await AsyncService.get_operation("op-2")
+
+        assert response is operation
+        assert response.queue_position is None
@@ -0,0 +1,184 @@
+"""
+Tests for the Google Places enrichment in api/services/google_places_service.py.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from api.models.road_models import MilestoneType
+from api.services.google_places_service import (
+    GooglePlaceData,
+    GooglePlacesService,
+    PlaceQuery,
+    enrich_map_pois_with_google_places,
+)
+
+
+def _place(place_id, rating=4.5):
+    return GooglePlaceData(
+        google_place_id=place_id,
+        rating=rating,
+        rating_count=10,
+        google_maps_uri=f"https://maps.google.com/?cid={place_id}",
+        matched_name="Restaurante",
+        match_distance_meters=12.0,
+    )
+
+
+def _query(osm_id):
+    return PlaceQuery(osm_id, f"Restaurante {osm_id}", -23.5, -46.6, MilestoneType.RESTAURANT)
+
+
+@pytest.fixture
+def settings():
+    return SimpleNamespace(
+        google_places_enabled=True,
+        google_places_api_key="test_key",
+        google_places_cache_ttl=3600,
+        enrichment_max_concurrency=4,
+    )
+
+
+@pytest.fixture
+def service(settings):
+    session = MagicMock()
+    with patch("api.services.google_places_service.get_settings", return_value=settings):
+        service = GooglePlacesService(session)
+    service.cache_repo = MagicMock()
+    service.cache_repo.get_by_osm_ids = AsyncMock(return_value={})
+    service.cache_repo.upsert = AsyncMock()
+    return service
+
+
+class TestGetPlacesData:
+    """Tests for GooglePlacesService.get_places_data."""
+
+    @pytest.mark.asyncio
+    async def test_cached_pois_skip_the_api(self, service):
+        cached = MagicMock(
+            google_place_id="cached",
+            rating=4.0,
+            user_rating_count=3,
+            google_maps_uri=None,
+            matched_name="Cached",
+            match_distance_meters=None,
+        )
+        service.cache_repo.get_by_osm_ids = AsyncMock(return_value={"node/1": cached})
+        service._search_nearby = AsyncMock(return_value=_place("fresh"))
+
+        results = await service.get_places_data([_query("node/1"), _query("node/2")])
+
+        service.cache_repo.get_by_osm_ids.assert_awaited_once_with(["node/1", "node/2"])
+        assert results["node/1"].google_place_id == "cached"
+        assert results["node/2"].google_place_id == "fresh"
+        service._search_nearby.assert_awaited_once()
+        service.cache_repo.upsert.assert_awaited_once()
+        assert service.cache_repo.upsert.call_args.kwargs["osm_poi_id"] == "node/2"
+
+    @pytest.mark.asyncio
+    async def test_fully_cached_batch_makes_no_api_calls(self, service):
+        cached = MagicMock(
+            google_place_id="cached",
+            rating=4.0,
+            user_rating_count=3,
+            google_maps_uri=None,
+            matched_name="Cached",
+            match_distance_meters=None,
+        )
+        service.cache_repo.get_by_osm_ids = AsyncMock(
+            return_value={f"node/{i}": cached for i in range(50)}
+        )
+        service._search_nearby = AsyncMock()
+
+        results = await service.get_places_data([_query(f"node/{i}") for i in range(50)])
+
+        assert len(results) == 50
+        service.cache_repo.get_by_osm_ids.assert_awaited_once()
+        service._search_nearby.assert_not_called()
+        service.cache_repo.upsert.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_misses_are_searched_concurrently(self, service, settings):
+        in_flight = 0
+        peak = 0
+
+        async def search_nearby(name, latitude, longitude, poi_type):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _place(name)
+
+        service._search_nearby = search_nearby
+
+        results = await service.get_places_data([_query(f"node/{i}") for i in range(10)])
+
+        assert len(results) == 10
+        assert peak == settings.enrichment_max_concurrency
+
+    @pytest.mark.asyncio
+    async def test_repeated_pois_are_searched_once(self, service):
+        service._search_nearby = AsyncMock(return_value=_place("p"))
+
+        results = await service.get_places_data([_query("node/1"), _query("node/1")])
+
+        assert list(results) == ["node/1"]
+        service._search_nearby.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_search_is_left_out(self, service):
+        service._search_nearby = AsyncMock(side_effect=[RuntimeError("boom"), _place("ok")])
+
+        results = await service.get_places_data([_query("node/1"), _query("node/2")])
+
+        assert list(results) == ["node/2"]
+
+
+class TestEnrichMapPoisWithGooglePlaces:
+    """Tests for enrich_map_pois_with_google_places."""
+
+    @pytest.mark.asyncio
+    async def test_writes_ratings_with_one_bulk_update(self, settings):
+        rated = SimpleNamespace(
+            id=uuid4(), osm_id="node/1", type="restaurant", name="A",
+            latitude=-23.5, longitude=-46.6, rating=None,
+        )
+        unmatched = SimpleNamespace(
+            id=uuid4(), osm_id="node/2", type="hotel", name="B",
+            latitude=-23.5, longitude=-46.6, rating=None,
+        )
+        gas_station = SimpleNamespace(
+            id=uuid4(), osm_id="node/3", type="gas_station", name="C",
+            latitude=-23.5, longitude=-46.6, rating=None,
+        )
+        map_pois = [SimpleNamespace(poi=p) for p in (rated, unmatched, gas_station)]
+
+        with patch(
+            "api.services.google_places_service.get_settings", return_value=settings
+        ), patch(
+            "api.database.repositories.map_poi.MapPOIRepository.get_pois_for_map",
+            new_callable=AsyncMock, return_value=map_pois,
+        ), patch.object(
+            GooglePlacesService, "get_places_data",
+            new_callable=AsyncMock, return_value={"node/1": _place("p1")},
+        ) as mock_get_places, patch(
+            "api.database.repositories.poi.POIRepository.bulk_update_google_places",
+            new_callable=AsyncMock, return_value=1,
+        ) as mock_bulk_update:
+            count = await enrich_map_pois_with_google_places(MagicMock(), str(uuid4()))
+
+        assert count == 1
+        queries = mock_get_places.call_args[0][0]
+        assert [q.osm_poi_id for q in queries] == ["node/1", "node/2"]
+        mock_bulk_update.assert_awaited_once()
+        assert mock_bulk_update.call_args[0][0] == [{
+            "id": rated.id,
+            "rating": 4.5,
+            "rating_count": 10,
+            "google_maps_uri": "https://maps.google.com/?cid=p1",
+        }]
@@ -413,11 +413,49 @@ class TestEnrichPois:
             mock_here_provider.search_pois = AsyncMock(return_value=[])
             service._here_provider = mock_here_provider
 
-            results = await service.enrich_pois(pois, delay_between_requests=0)
+            results = await service.enrich_pois(pois, max_concurrency=2)
 
             # Should only process enrichable POIs
             assert len(results) == 2
 
+    @pytest.mark.asyncio
+    async def test_enrich_pois_stores_matches_with_one_bulk_update(self):
+        """It should write all matches at once instead of per POI."""
+        with patch.dict('os.environ', {'HERE_API_KEY': 'test_key'}):
+            from api.providers.settings import reset_settings
+            reset_settings()
+
+            service = HereEnrichmentService(Mock())
+            service.poi_repo = Mock()
+            service.poi_repo.bulk_update_here_data = AsyncMock(return_value=1)
+
+            here_poi = POI(
+                id="here_123",
+                name="Posto Shell",
+                location=GeoLocation(latitude=-23.5505, longitude=-46.6333),
+                category=POICategory.GAS_STATION,
+                phone="+55 11 1234-5678",
+                provider_data={"here_id": "here_123"}
+            )
+            mock_here_provider = AsyncMock()
+            mock_here_provider.search_pois = AsyncMock(side_effect=[[here_poi], []])
+            service._here_provider = mock_here_provider
+
+            pois = [
+                MockDBPoi(id="1", name="Posto Shell"),
+                MockDBPoi(id="2", name="Posto Ipiranga"),
+            ]
+
+            results = await service.enrich_pois(pois)
+
+            assert [r.matched for r in results] == [True, False]
+            service.poi_repo.bulk_update_here_data.assert_awaited_once()
+            updates = service.poi_repo.bulk_update_here_data.call_args[0][0]
+            assert len(updates) == 1
+            assert updates[0]["id"] == "1"
+            assert updates[0]["here_id"] == "here_123"
+            assert updates[0]["phone"] == "+55 11 1234-5678"
+
 
 class TestHereEnrichmentResult:
     """Test HereEnrichmentResult dataclass."""
@@ -7,11 +7,13 @@ Tests the junction calculation service including:
 - Calculating junction coordinates and side
 """
 
+import asyncio
 import pytest
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
+from api.providers.models import GeoLocation, Route
 from api.services.junction_calculation_service import (
     GlobalSearchPoint,
     JunctionCalculationService,
@@ -662,3 +664,154 @@ class TestCalculateJunction:
         assert -180 <= result.junction_lon <= 180
         assert result.junction_distance_km >= 0
         assert result.side in ["left", "right", "center"]
+
+
+class TestRouteIndexReuse:
+    """Tests for route index reuse across junction queries."""
+
+    @pytest.fixture
+    def junction_service(self):
+        return JunctionCalculationService()
+
+    def test_index_built_once_per_geometry(self, junction_service):
+        """Queries against the same geometry share one RouteIndex."""
+        route_geometry = [
+            (-23.5000, -46.6000),
+            (-23.5500, -46.6500),
+            (-23.6000, -46.7000),
+        ]
+
+        first = junction_service.get_route_index(route_geometry)
+        junction_service._find_closest_route_point(-23.55, -46.65, route_geometry)
+        junction_service._calculate_distance_along_route(
+            (-23.55, -46.65), route_geometry, 20.0
+        )
+
+        assert junction_service.get_route_index(route_geometry) is first
+        assert junction_service.get_route_index(list(route_geometry)) is not first
+
+    def test_find_route_intersection_returns_last_overlap(self, junction_service):
+        """Intersection is the last main route point the access route overlaps."""
+        main_geometry = [(-23.5 - i * 0.001, -46.6) for i in range(20)]
+        # Follows the main route for 5 points, then turns east
+        access_geometry = main_geometry[3:8] + [
+            (main_geometry[7][0], -46.6 + i * 0.001) for i in range(1, 5)
+        ]
+
+        point, distance_km = junction_service._find_route_intersection(
+            access_geometry, main_geometry, 2.0
+        )
+
+        assert point == main_geometry[7]
+        assert distance_km == pytest.approx(
+            junction_service.get_route_index(main_geometry).cumulative_km[7]
+        )
+
+
+class TestAccessRouteDeduplication:
+    """Tests for access route reuse across junction calculations."""
+
+    @pytest.mark.asyncio
+    async def test_same_lookback_and_poi_fetches_route_once(self):
+        """Concurrent calculations for the same pair share one routing request."""
+        route = Route(
+            origin=GeoLocation(latitude=-23.50, longitude=-46.60),
+            destination=GeoLocation(latitude=-23.52, longitude=-46.58),
+            total_distance=3.0,
+            total_duration=5.0,
+            geometry=[(-23.50, -46.60), (-23.51, -46.60), (-23.52, -46.58)],
+            road_names=[],
+        )
+
+        async def calculate_route(origin, destination):
+            await asyncio.sleep(0.01)
+            return route
+
+        geo_provider = MagicMock()
+        geo_provider.calculate_route = AsyncMock(side_effect=calculate_route)
+        junction_service = JunctionCalculationService(geo_provider)
+        main_geometry = [(-23.50 - i * 0.001, -46.60) for i in range(20)]
+
+        results = await asyncio.gather(
+            *(
+                junction_service._calculate_junction_with_routing(
+                    -23.52, -46.58, (-23.50, -46.60), main_geometry, 2.0
+                )
+                for _ in range(3)
+            ),
+            junction_service._calculate_junction_with_routing(
+                -23.53, -46.58, (-23.50, -46.60), main_geometry, 2.0
+            ),
+        )
+
+        assert all(result is not None for result in results)
+        assert geo_provider.calculate_route.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_prefetch_groups_pois_by_lookback_point(self):
+        """POIs sharing a lookback point are routed with one batched call."""
+        segment_id = uuid4()
+        global_sps = [
+            GlobalSearchPoint(
+                lat=-23.50 - i * 0.01, lon=-46.60, segment_id=segment_id,
+                segment_sp_index=i, distance_from_map_origin_km=float(i),
+            )
+            for i in range(30)
+        ]
+        map_segment = MagicMock()
+        map_segment.distance_from_origin_km = Decimal("0.0")
+
+        def _distant_poi(sp_index):
+            segment_poi = MagicMock()
+            segment_poi.segment_id = segment_id
+            segment_poi.search_point_index = sp_index
+            segment_poi.straight_line_distance_m = 2000
+            return segment_poi
+
+        # Three POIs discovered near km 20 share the km-10 lookback; one near km 25
+        # uses another; a nearby POI needs no access route
+        nearby = _distant_poi(20)
+        nearby.straight_line_distance_m = 100
+        pois = [
+            (-23.70, -46.58, _distant_poi(20), map_segment),
+            (-23.71, -46.58, _distant_poi(20), map_segment),
+            (-23.70, -46.58, _distant_poi(20), map_segment),
+            (-23.75, -46.58, _distant_poi(25), map_segment),
+            (-23.70, -46.60, nearby, map_segment),
+        ]
+
+        def _route(origin, destination):
+            return Route(
+                origin=origin,
+                destination=destination,
+                total_distance=3.0,
+                total_duration=5.0,
+                geometry=[
+                    (origin.latitude, origin.longitude),
+                    (destination.latitude, destination.longitude),
+                ],
+            )
+
+        geo_provider = MagicMock()
+        geo_provider.calculate_routes_many = AsyncMock(
+            side_effect=lambda origin, destinations: [
+                _route(origin, destination) for destination in destinations
+            ]
+        )
+        geo_provider.calculate_route = AsyncMock()
+        junction_service = JunctionCalculationService(geo_provider)
+
+        fetched = await junction_service.prefetch_access_routes(pois, global_sps)
+
+        assert fetched == 3
+        assert geo_provider.calculate_routes_many.await_count == 2
+        group_sizes = sorted(
+            len(call.args[1]) for call in geo_provider.calculate_routes_many.await_args_list
+        )
+        assert group_sizes == [1, 2]
+
+        # Junction calculation reuses the prefetched route
+        route = await junction_service._get_access_route((-23.60, -46.60), -23.71, -46.58)
+        assert route.destination.latitude == -23.71
+        geo_provider.calculate_route.assert_not_awaited()
+
@@ -7,6 +7,7 @@ Tests the map assembly service including:
 - POI deduplication across segments
 """
 
+import asyncio
 import pytest
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -632,6 +633,85 @@ class TestCreateMapPOIs:
         assert str(poi_disabled.id) not in poi_to_map_poi  # Filtered by disabled
 
 
+class TestCalculateJunctions:
+    """Tests for the _calculate_junctions method."""
+
+    @pytest.fixture
+    def assembly_service(self):
+        return MapAssemblyService(MagicMock())
+
+    @staticmethod
+    def _make_pairs(count):
+        pairs = []
+        for i in range(count):
+            segment_poi = MagicMock()
+            segment_poi.poi.latitude = -23.5 - i * 0.01
+            segment_poi.poi.longitude = -46.6
+            pairs.append((segment_poi, MagicMock()))
+        return pairs
+
+    @pytest.mark.asyncio
+    async def test_bounded_concurrency_and_input_order(self, assembly_service):
+        """Runs at most max_concurrency calculations and keeps input order."""
+        in_flight = 0
+        peak = 0
+
+        pairs = self._make_pairs(6)
+        # Earlier POIs finish last
+        delays = {
+            segment_poi.poi.latitude: 0.002 * (len(pairs) - i)
+            for i, (segment_poi, _) in enumerate(pairs)
+        }
+
+        async def calculate_junction(poi_lat, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(delays[poi_lat])
+            in_flight -= 1
+            return poi_lat
+
+        assembly_service.junction_service.calculate_junction = calculate_junction
+
+        results = await assembly_service._calculate_junctions(
+            pairs, [], 10.0, [], max_concurrency=2
+        )
+
+        assert peak == 2
+        assert results == [segment_poi.poi.latitude for segment_poi, _ in pairs]
+
+
+class TestEnrichPoisWithCity:
+    """Tests for the _enrich_pois_with_city method."""
+
+    @pytest.mark.asyncio
+    async def test_reverse_geocodes_only_gazetteer_misses(self, monkeypatch):
+        """POIs placed by the gazetteer are not reverse geocoded."""
+        geo_provider = MagicMock()
+        geo_provider.reverse_geocode = AsyncMock(return_value=MagicMock(city="Ilhabela"))
+        service = MapAssemblyService(MagicMock(), geo_provider=geo_provider)
+        service.poi_repo.touch_maps = AsyncMock()
+
+        gazetteer = MagicMock()
+        gazetteer.lookup_city = AsyncMock(side_effect=["Campinas", None])
+        monkeypatch.setattr(
+            "api.services.map_assembly_service.get_municipality_gazetteer",
+            lambda: gazetteer,
+        )
+        inland = POI(id=uuid4(), name="Posto", latitude=-22.9, longitude=-47.06)
+        offshore = POI(id=uuid4(), name="Marina", latitude=-23.8, longitude=-45.3)
+
+        await service._enrich_pois_with_city([inland, offshore])
+
+        assert inland.city == "Campinas"
+        assert offshore.city == "Ilhabela"
+        geo_provider.reverse_geocode.assert_awaited_once_with(
+            -23.8, -45.3, poi_name="Marina"
+        )
+        # Other maps showing these POIs get a new version
+        service.poi_repo.touch_maps.assert_awaited_once_with([inland.id, offshore.id])
+
+
 class TestAssembleMap:
     """Tests for the main assemble_map method."""
 
@@ -646,7 +726,9 @@ class TestAssembleMap:
         service = MapAssemblyService(mock_session)
         service.map_segment_repo.bulk_create = AsyncMock()
         service.map_poi_repo.bulk_create = AsyncMock()
-        service.segment_poi_repo.get_by_segment_with_pois = AsyncMock(return_value=[])
+        service.segment_poi_repo.get_by_segments_with_pois = AsyncMock(
+            side_effect=lambda segment_ids: {sid: [] for sid in segment_ids}
+        )
         return service
 
     @pytest.fixture
@@ -684,6 +766,51 @@ class TestAssembleMap:
         assert num_pois == 0  # No POIs in this test
         assert poi_to_map_poi == {}
 
+    @pytest.mark.asyncio
+    async def test_assemble_map_reuses_preloaded_segment_pois(
+        self, assembly_service, mock_session, sample_segments, sample_route_geometry
+    ):
+        """Preloaded SegmentPOIs are merged into the session instead of refetched."""
+        loaded = MagicMock(poi=None)
+        merged = MagicMock(poi=None)
+        mock_session.merge = AsyncMock(return_value=merged)
+        missing_segment = MagicMock(id=uuid4(), length_km=Decimal("1.0"), search_points=[])
+
+        await assembly_service.assemble_map(
+            map_id=uuid4(),
+            segments=sample_segments + [missing_segment],
+            route_geometry=sample_route_geometry,
+            route_total_km=10.0,
+            segment_pois_by_segment={sample_segments[0].id: [loaded]},
+        )
+
+        mock_session.merge.assert_awaited_once_with(loaded, load=False)
+        # Only the segment that was not preloaded is queried, in one call
+        assembly_service.segment_poi_repo.get_by_segments_with_pois.assert_awaited_once_with(
+            [missing_segment.id]
+        )
+
+    @pytest.mark.asyncio
+    async def test_assemble_map_loads_segment_pois_in_one_query(
+        self, assembly_service, sample_route_geometry
+    ):
+        """Without preloaded data, all segments are loaded with one bulk query."""
+        segments = [
+            MagicMock(id=uuid4(), length_km=Decimal("1.0"), search_points=[])
+            for _ in range(4)
+        ]
+
+        await assembly_service.assemble_map(
+            map_id=uuid4(),
+            segments=segments,
+            route_geometry=sample_route_geometry,
+            route_total_km=4.0,
+        )
+
+        assembly_service.segment_poi_repo.get_by_segments_with_pois.assert_awaited_once_with(
+            [s.id for s in segments]
+        )
+
     @pytest.mark.asyncio
     async def test_assemble_map_creates_map_segments(
         self, assembly_service, sample_segments, sample_route_geometry
@@ -825,3 +952,63 @@ class TestGetMapStatistics:
         assert result["pois_by_type"]["restaurant"] == 1
         assert result["pois_by_side"]["left"] == 2
         assert result["pois_by_side"]["right"] == 1
+
+
+class TestGetSegmentsForResponse:
+    """Tests for get_segments_for_response geometry formats."""
+
+    GEOMETRY = [[-23.55, -46.63], [-23.56, -46.64], [-23.57, -46.66]]
+
+    @pytest.fixture
+    def assembly_service(self):
+        return MapAssemblyService(MagicMock())
+
+    def _map_segment(self, geometry):
+        segment = MagicMock(
+            id=uuid4(),
+            length_km=Decimal("2.5"),
+            geometry=geometry,
+            road_name="BR-116",
+            start_lat=Decimal("-23.55"),
+            start_lon=Decimal("-46.63"),
+            end_lat=Decimal("-23.57"),
+            end_lon=Decimal("-46.66"),
+        )
+        return MagicMock(segment=segment, sequence_order=0, distance_from_origin_km=Decimal("0"))
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("stored_as_polyline", [False, True])
+    async def test_legacy_coordinates(self, assembly_service, stored_as_polyline):
+        """Default response keeps the list-of-coordinates shape for both storage formats."""
+        from api.utils.polyline import encode_polyline
+
+        geometry = encode_polyline(self.GEOMETRY) if stored_as_polyline else self.GEOMETRY
+        assembly_service.map_segment_repo.get_by_map_with_segments = AsyncMock(
+            return_value=[self._map_segment(geometry)]
+        )
+
+        segments = await assembly_service.get_segments_for_response(uuid4())
+
+        assert segments[0].geometry_format == "coordinates"
+        assert [(c.latitude, c.longitude) for c in segments[0].geometry] == pytest.approx(
+            [tuple(p) for p in self.GEOMETRY]
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("stored_as_polyline", [False, True])
+    async def test_polyline_format(self, assembly_service, stored_as_polyline):
+        """polyline6 responses carry one encoded string per segment."""
+        from api.utils.polyline import encode_polyline
+
+        encoded = encode_polyline(self.GEOMETRY)
+        geometry = encoded if stored_as_polyline else self.GEOMETRY
+        assembly_service.map_segment_repo.get_by_map_with_segments = AsyncMock(
+            return_value=[self._map_segment(geometry)]
+        )
+
+        segments = await assembly_service.get_segments_for_response(
+            uuid4(), geometry_format="polyline6"
+        )
+
+        assert segments[0].geometry_format == "polyline6"
+        assert segments[0].geometry == encoded
@@ -0,0 +1,188 @@
+"""
+Unit tests for map listings and cached map responses in
+api/services/map_storage_service_db.py
+
+Tests for:
+- list_user_maps
+- list_available_maps
+- get_suggested_maps
+- get_map_response
+- delete_map_permanently (response cache invalidation)
+"""
+
+import hashlib
+import json
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from api.services.map_storage_service_db import MapStorageServiceDB
+
+
+def _make_map(origin="São Paulo, SP", destination="Rio de Janeiro, RJ"):
+    db_map = MagicMock()
+    db_map.id = uuid4()
+    db_map.origin = origin
+    db_map.destination = destination
+    db_map.total_length_km = 430.0
+    db_map.created_at = datetime(2025, 1, 1)
+    db_map.metadata_ = {"road_refs": ["BR-116"]}
+    db_map.road_id = None
+    db_map.updated_at = datetime(2025, 1, 2)
+    return db_map
+
+
+@pytest.fixture
+def storage():
+    service = MapStorageServiceDB(MagicMock())
+    service.map_poi_repo.get_pois_for_map = AsyncMock()
+    service.user_map_repo.get_map_user_count = AsyncMock()
+    service.response_cache_repo.get_current = AsyncMock(return_value=None)
+    service.response_cache_repo.get_version = AsyncMock(return_value=datetime(2025, 1, 3))
+    service.response_cache_repo.upsert = AsyncMock()
+    return service
+
+
+class TestMapListings:
+    """Listings are served by one aggregate query, without loading MapPOIs."""
+
+    @pytest.mark.asyncio
+    async def test_list_user_maps_uses_poi_counts(self, storage):
+        """Should take milestone_count from the aggregate query."""
+        db_map = _make_map()
+        storage.map_repo.get_user_maps_for_listing = AsyncMock(
+            return_value=[{"map": db_map, "poi_count": 42}]
+        )
+        user_id = uuid4()
+
+        maps = await storage.list_user_maps(user_id)
+
+        assert len(maps) == 1
+        assert maps[0].id == str(db_map.id)
+        assert maps[0].milestone_count == 42
+        assert maps[0].road_refs == ["BR-116"]
+        storage.map_repo.get_user_maps_for_listing.assert_awaited_once_with(user_id, limit=100)
+        storage.map_poi_repo.get_pois_for_map.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_list_available_maps_single_query(self, storage):
+        """Should not query POIs or user counts per map."""
+        storage.map_repo.get_maps_for_listing = AsyncMock(
+            return_value=[
+                {"map": _make_map(), "poi_count": i} for i in range(5)
+            ]
+        )
+
+        maps = await storage.list_available_maps(limit=5, origin="Paulo")
+
+        assert [m.milestone_count for m in maps] == [0, 1, 2, 3, 4]
+        storage.map_repo.get_maps_for_listing.assert_awaited_once_with(
+            skip=0, limit=5, location="Paulo"
+        )
+        storage.map_poi_repo.get_pois_for_map.assert_not_called()
+        storage.user_map_repo.get_map_user_count.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_suggested_maps_sorted_by_origin_distance(self, storage):
+        """Should sort by distance to the origin coordinates from the query."""
+        far = _make_map(origin="Manaus, AM")
+        near = _make_map(origin="Campinas, SP")
+        unknown = _make_map(origin="Sem segmentos")
+        storage.map_repo.get_maps_for_listing = AsyncMock(
+            return_value=[
+                {"map": far, "poi_count": 1,
+                 "origin_lat": -3.1, "origin_lon": -60.0},
+                {"map": unknown, "poi_count": 1,
+                 "origin_lat": None, "origin_lon": None},
+                {"map": near, "poi_count": 1,
+                 "origin_lat": -22.9, "origin_lon": -47.06},
+            ]
+        )
+
+        maps = await storage.get_suggested_maps(limit=3, user_lat=-23.55, user_lon=-46.63)
+
+        assert [m.origin for m in maps] == ["Campinas, SP", "Manaus, AM", "Sem segmentos"]
+        storage.map_repo.get_maps_for_listing.assert_awaited_once_with(
+            skip=0, limit=9, with_origin=True
+        )
+
+
+class TestMapResponseCache:
+    """Saved maps are served from the pre-serialized response cache."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_assembly(self, storage):
+        """A cached response is returned without loading the map."""
+        cached = MagicMock(etag='"abc"', payload="{}")
+        storage.response_cache_repo.get_current.return_value = cached
+        storage.map_repo.get_by_id = AsyncMock()
+        storage.user_map_repo.user_has_map = AsyncMock()
+        map_id, user_id = uuid4(), uuid4()
+
+        result = await storage.get_map_response(str(map_id), user_id=user_id)
+
+        assert result is cached
+        storage.response_cache_repo.get_current.assert_awaited_once_with(
+            map_id, "coordinates", user_id=user_id
+        )
+        storage.map_repo.get_by_id.assert_not_called()
+        storage.user_map_repo.user_has_map.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_assembles_and_stores(self, storage, monkeypatch):
+        """A miss assembles the map once and stores payload and etag."""
+        db_map = _make_map()
+        storage.map_repo.get_by_id = AsyncMock(return_value=db_map)
+        storage.map_poi_repo.get_pois_for_map.return_value = []
+        assembly = MagicMock()
+        assembly.get_segments_for_response = AsyncMock(return_value=[])
+        monkeypatch.setattr(
+            "api.services.map_storage_service_db.MapAssemblyService",
+            MagicMock(return_value=assembly),
+        )
+
+        result = await storage.get_map_response(
+            str(db_map.id), geometry_format="polyline6"
+        )
+
+        assert json.loads(result.payload)["id"] == str(db_map.id)
+        expected_etag = f'"{hashlib.sha256(result.payload.encode()).hexdigest()}"'
+        assert result.etag == expected_etag
+        assembly.get_segments_for_response.assert_awaited_once_with(
+            db_map.id, geometry_format="polyline6"
+        )
+        storage.response_cache_repo.upsert.assert_awaited_once_with(
+            db_map.id,
+            "polyline6",
+            map_version=datetime(2025, 1, 3),
+            etag=expected_etag,
+            payload=result.payload,
+        )
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_without_access(self, storage):
+        """Users without the map in their collection get nothing cached."""
+        storage.user_map_repo.user_has_map = AsyncMock(return_value=False)
+        storage.map_repo.get_by_id = AsyncMock()
+
+        result = await storage.get_map_response(str(uuid4()), user_id=uuid4())
+
+        assert result is None
+        storage.map_repo.get_by_id.assert_not_called()
+        storage.response_cache_repo.upsert.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_delete_map_permanently_invalidates_cache(self, storage):
+        """Deleting a map drops its cached responses."""
+        map_id = uuid4()
+        storage._map_segment_repo = MagicMock()
+        storage._map_segment_repo.get_segment_ids_for_map = AsyncMock(return_value=[])
+        storage.response_cache_repo.delete_for_map = AsyncMock(return_value=1)
+        storage.map_repo.delete_by_id = AsyncMock(return_value=True)
+        storage.session.execute = AsyncMock(return_value=MagicMock(rowcount=0))
+        storage.session.flush = AsyncMock()
+
+        assert await storage.delete_map_permanently(str(map_id)) is True
+        storage.response_cache_repo.delete_for_map.assert_awaited_once_with(map_id)
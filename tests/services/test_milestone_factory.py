@@ -481,3 +481,21 @@ class TestMilestoneFactoryEnrichWithCities:
 
         # Should not raise
         await factory.enrich_with_cities(sample_milestones)
+
+    @pytest.mark.asyncio
+    async def test_gazetteer_hits_skip_reverse_geocoding(
+        self, factory_with_provider, sample_milestones, monkeypatch
+    ):
+        """Cities found offline should not trigger reverse geocoding."""
+        gazetteer = MagicMock()
+        gazetteer.lookup_city = AsyncMock(return_value="Sao Paulo")
+        monkeypatch.setattr(
+            "api.services.milestone_factory.get_municipality_gazetteer",
+            lambda: gazetteer,
+        )
+
+        await factory_with_provider.enrich_with_cities(sample_milestones)
+
+        assert sample_milestones[0].city == "Sao Paulo"
+        gazetteer.lookup_city.assert_awaited_once_with(-23.55, -46.63)
+        factory_with_provider.geo_provider.reverse_geocode.assert_not_called()
@@ -0,0 +1,318 @@
+"""
+Tests for the offline municipality gazetteer in
+api/services/municipality_gazetteer.py.
+"""
+
+import hashlib
+import json
+import threading
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from api.models.municipality_models import Municipality
+from api.services.municipality_gazetteer import (
+    GAZETTEER_DATA_VERSION,
+    UF_CODES,
+    MunicipalityGazetteer,
+    _download_seats,
+    _read_bundled_seats,
+    add_municipality_seats,
+    build_gazetteer_data,
+    parse_city_uf,
+    parse_ibge_municipalities,
+    parse_municipality_seats,
+    parse_seat_municipalities,
+)
+
+
+def _square(min_lon, min_lat, max_lon, max_lat):
+    return [
+        [min_lon, min_lat],
+        [max_lon, min_lat],
+        [max_lon, max_lat],
+        [min_lon, max_lat],
+        [min_lon, min_lat],
+    ]
+
+
+DATASET = {
+    "municipalities": [
+        {
+            "id": 3509502,
+            "nome": "Campinas",
+            "uf": "SP",
+            "rings": [_square(-47.2, -23.0, -46.9, -22.7)],
+        }
+    ]
+}
+
+
+DATASET_WITH_SEATS = {
+    "municipalities": [dict(DATASET["municipalities"][0], seat=[-47.0659, -22.9053])],
+    "version": GAZETTEER_DATA_VERSION,
+}
+
+SEATS_CSV = (
+    "codigo_ibge,nome,latitude,longitude,capital,codigo_uf\n"
+    "3509502,Campinas,-22.9053,-47.0659,0,35\n"
+    "3550308,São Paulo,-23.5329,-46.6395,1,35\n"
+    "invalid,Sem código,,,0,35\n"
+)
+
+SEATS_COMMIT = "0123456789abcdef0123456789abcdef01234567"
+
+
+class TestParseIbgeMunicipalities:
+    """Tests for parse_ibge_municipalities."""
+
+    def test_extracts_uf_and_skips_incomplete_entries(self):
+        data = [
+            {
+                "id": 3509502,
+                "nome": "Campinas",
+                "microrregiao": {"mesorregiao": {"UF": {"sigla": "SP"}}},
+            },
+            {"id": 1, "nome": "Sem UF", "microrregiao": None},
+        ]
+
+        assert parse_ibge_municipalities(data) == [
+            Municipality(id=3509502, nome="Campinas", uf="SP")
+        ]
+
+
+class TestBuildGazetteerData:
+    """Tests for build_gazetteer_data."""
+
+    def test_joins_boundaries_with_municipality_list(self):
+        municipalities = [Municipality(id=3509502, nome="Campinas", uf="SP")]
+        boundaries = {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "properties": {"codarea": "3509502"},
+                    "geometry": {
+                        "type": "MultiPolygon",
+                        "coordinates": [[_square(-47.2, -23.0, -46.9, -22.7)]],
+                    },
+                },
+                # Unknown municipality code
+                {
+                    "type": "Feature",
+                    "properties": {"codarea": "9999999"},
+                    "geometry": {
+                        "type": "Polygon",
+                        "coordinates": [_square(0, 0, 1, 1)],
+                    },
+                },
+            ],
+        }
+
+        assert build_gazetteer_data(municipalities, boundaries) == DATASET
+
+
+class TestMunicipalitySeats:
+    """Tests for the seats tables, add_municipality_seats and parse_city_uf."""
+
+    def test_parses_seats_and_adds_them_to_the_dataset(self):
+        seats = parse_municipality_seats(SEATS_CSV)
+
+        assert seats == {3509502: (-22.9053, -47.0659), 3550308: (-23.5329, -46.6395)}
+        assert add_municipality_seats(json.loads(json.dumps(DATASET)), seats) == DATASET_WITH_SEATS
+
+    def test_parses_seats_with_name_and_uf(self):
+        seats = parse_seat_municipalities(SEATS_CSV)
+
+        assert [(s.municipality.code, s.municipality.name, s.municipality.uf) for s in seats] == [
+            (3509502, "Campinas", "SP"),
+            (3550308, "São Paulo", "SP"),
+        ]
+        assert (seats[0].latitude, seats[0].longitude) == (-22.9053, -47.0659)
+
+    def test_shipped_seats_table_covers_every_uf(self):
+        text = _read_bundled_seats()
+        seats = parse_seat_municipalities(text)
+
+        # Every row is valid, and every UF has at least its capital
+        assert len(seats) == len(text.strip().splitlines()) - 1
+        assert {seat.municipality.uf for seat in seats} == UF_CODES
+        assert set(parse_municipality_seats(text)) == {seat.municipality.code for seat in seats}
+
+    def test_seats_download_is_pinned_and_verified(self):
+        commit = SEATS_COMMIT
+        client = MagicMock()
+        client.__enter__.return_value = client
+        client.get.return_value.content = SEATS_CSV.encode("utf-8")
+        sha256 = hashlib.sha256(SEATS_CSV.encode("utf-8")).hexdigest()
+
+        with patch("api.services.municipality_gazetteer.httpx.Client", return_value=client):
+            seats = _download_seats(commit, sha256)
+            with pytest.raises(ValueError):
+                _download_seats(commit, "0" * 64)
+            with pytest.raises(ValueError):
+                _download_seats("main", sha256)
+
+        assert seats == parse_municipality_seats(SEATS_CSV)
+        assert f"/{commit}/" in client.get.call_args_list[0].args[0]
+        # An unpinned download is refused before any request
+        assert client.get.call_count == 2
+
+    def test_parse_city_uf(self):
+        assert parse_city_uf("Campinas, SP") == ("Campinas", "SP")
+        assert parse_city_uf("Campinas - sp") == ("Campinas", "SP")
+        assert parse_city_uf("Campinas/SP, Brasil") == ("Campinas", "SP")
+        assert parse_city_uf(" Campinas ") == ("Campinas", None)
+        assert parse_city_uf("Av. Paulista, 1000, São Paulo") is None
+        assert parse_city_uf("Rua das Flores, Campinas") is None
+
+
+def _warmed_up(gazetteer: MunicipalityGazetteer) -> MunicipalityGazetteer:
+    """Load the gazetteer like the startup warm-up, waiting for it."""
+    gazetteer.load_in_background()
+    gazetteer._loader.join(timeout=10)
+    return gazetteer
+
+
+class TestMunicipalityGazetteer:
+    """Tests for MunicipalityGazetteer."""
+
+    @pytest.mark.asyncio
+    async def test_resolves_city_from_local_file(self, tmp_path):
+        path = tmp_path / "municipalities.json"
+        path.write_text(json.dumps(DATASET_WITH_SEATS))
+        gazetteer = _warmed_up(MunicipalityGazetteer(str(path)))
+
+        assert await gazetteer.lookup_city(-22.9, -47.06) == "Campinas"
+        assert await gazetteer.lookup_city(-10.0, -50.0) is None
+
+    @pytest.mark.asyncio
+    async def test_geocodes_city_uf_to_the_seat(self, tmp_path):
+        path = tmp_path / "municipalities.json"
+        path.write_text(json.dumps(DATASET_WITH_SEATS))
+        gazetteer = _warmed_up(MunicipalityGazetteer(str(path)))
+
+        location = await gazetteer.geocode("campinas, sp")
+
+        assert (location.latitude, location.longitude) == (-22.9053, -47.0659)
+        assert location.city == "Campinas"
+        assert location.state == "SP"
+        assert await gazetteer.geocode("Campinas, MG") is None
+        assert await gazetteer.geocode("Rua X, 10, Campinas, SP") is None
+
+    @pytest.mark.asyncio
+    async def test_adds_seats_to_dataset_without_them(self, tmp_path):
+        path = tmp_path / "municipalities.json"
+        path.write_text(json.dumps(DATASET))
+
+        with patch(
+            "api.services.municipality_gazetteer._download_seats",
+            return_value=parse_municipality_seats(SEATS_CSV),
+        ) as mock_download:
+            gazetteer = _warmed_up(MunicipalityGazetteer(
+                str(path), seats_commit=SEATS_COMMIT, seats_sha256="0" * 64
+            ))
+
+        location = await gazetteer.geocode("Campinas, SP")
+
+        mock_download.assert_called_once()
+        assert location.latitude == -22.9053
+        assert json.loads(path.read_text()) == DATASET_WITH_SEATS
+
+    @pytest.mark.asyncio
+    async def test_failed_seats_download_keeps_the_shipped_seats(self, tmp_path):
+        path = tmp_path / "municipalities.json"
+        path.write_text(json.dumps(DATASET))
+
+        with patch(
+            "api.services.municipality_gazetteer._download_seats",
+            side_effect=RuntimeError("offline"),
+        ) as mock_download:
+            gazetteer = _warmed_up(MunicipalityGazetteer(
+                str(path), seats_commit=SEATS_COMMIT, seats_sha256="0" * 64
+            ))
+
+        mock_download.assert_called_once()
+        assert (await gazetteer.geocode("Campinas, SP")).latitude == -22.9053
+        assert await gazetteer.lookup_city(-22.9, -47.06) == "Campinas"
+        assert json.loads(path.read_text()) == DATASET_WITH_SEATS
+
+    @pytest.mark.asyncio
+    async def test_default_gazetteer_geocodes_without_downloads(self, tmp_path):
+        gazetteer = MunicipalityGazetteer(str(tmp_path / "municipalities.json"))
+
+        with patch(
+            "api.services.municipality_gazetteer._download_data",
+            side_effect=RuntimeError("offline"),
+        ), patch("api.services.municipality_gazetteer._download_seats") as mock_seats:
+            location = await gazetteer.geocode("Belo Horizonte, MG")
+            gazetteer._loader.join(5)
+
+        # The unpinned seats table is never downloaded
+        mock_seats.assert_not_called()
+        assert (location.latitude, location.longitude) == (-19.9102, -43.9266)
+        assert location.address == "Belo Horizonte, MG, Brasil"
+        assert await gazetteer.geocode("Belo Horizonte, SP") is None
+
+    @pytest.mark.asyncio
+    async def test_downloads_and_stores_missing_dataset_once(self, tmp_path):
+        path = tmp_path / "data" / "municipalities.json"
+        gazetteer = MunicipalityGazetteer(str(path))
+
+        with patch(
+            "api.services.municipality_gazetteer._download_data", return_value=DATASET_WITH_SEATS
+        ) as mock_download:
+            _warmed_up(gazetteer)
+            _warmed_up(gazetteer)
+
+        mock_download.assert_called_once()
+        assert json.loads(path.read_text()) == DATASET_WITH_SEATS
+        assert await gazetteer.lookup_city(-22.9, -47.06) == "Campinas"
+
+    @pytest.mark.asyncio
+    async def test_failed_download_is_not_retried_immediately(self, tmp_path):
+        gazetteer = MunicipalityGazetteer(str(tmp_path / "municipalities.json"))
+
+        with patch(
+            "api.services.municipality_gazetteer._download_data",
+            side_effect=RuntimeError("offline"),
+        ) as mock_download:
+            assert await _warmed_up(gazetteer).lookup_city(-22.9, -47.06) is None
+            assert await _warmed_up(gazetteer).lookup_city(-22.9, -47.06) is None
+
+        mock_download.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_lookups_do_not_wait_for_the_download(self, tmp_path):
+        path = tmp_path / "municipalities.json"
+        gazetteer = MunicipalityGazetteer(str(path))
+        release = threading.Event()
+
+        def _slow_download(*args):
+            release.wait(5)
+            return DATASET_WITH_SEATS
+
+        with patch(
+            "api.services.municipality_gazetteer._download_data", side_effect=_slow_download
+        ) as mock_download:
+            # Callers fall back to the network (or the shipped seats) while
+            # the dataset is built in the background
+            assert (await gazetteer.geocode("Campinas, SP")).city == "Campinas"
+            assert await gazetteer.lookup_city(-22.9, -47.06) is None
+            assert await gazetteer.lookup_city(-22.9, -47.06) is None
+            release.set()
+            gazetteer._loader.join(5)
+
+        mock_download.assert_called_once()
+        assert (await gazetteer.geocode("Campinas, SP")).city == "Campinas"
+        assert await gazetteer.lookup_city(-22.9, -47.06) == "Campinas"
+
+    @pytest.mark.asyncio
+    async def test_disabled_gazetteer_never_loads(self, tmp_path):
+        gazetteer = MunicipalityGazetteer(str(tmp_path / "x.json"), enabled=False)
+
+        with patch("api.services.municipality_gazetteer._download_data") as mock_download:
+            assert await gazetteer.lookup_city(-22.9, -47.06) is None
+            gazetteer.load_in_background()
+
+        mock_download.assert_not_called()
@@ -5,31 +5,35 @@ This module tests the centralized POI enrichment service that coordinates
 enrichment from multiple sources (Google Places, HERE Maps).
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 
 
-class TestCreateAsyncEngineAndSession:
-    """Test database connection helper."""
+class TestRunWithSession:
+    """Test database session helper."""
 
-    def test_creates_engine_with_correct_url(self):
-        """It should create an async engine with the correct database URL."""
-        with patch.dict('os.environ', {
-            'POSTGRES_USER': 'test_user',
-            'POSTGRES_PASSWORD': 'test_pass',
-            'POSTGRES_HOST': 'localhost',
-            'POSTGRES_PORT': '5432',
-            'POSTGRES_DATABASE': 'test_db',
-        }):
-            from api.providers.settings import reset_settings
-            reset_settings()
+    @pytest.mark.asyncio
+    async def test_runs_function_with_background_session(self):
+        """It should pass a background session to the function and return its result."""
+        from contextlib import asynccontextmanager
+
+        session = Mock()
+
+        @asynccontextmanager
+        async def fake_background_session():
+            yield session
 
-            from api.services.poi_enrichment_service import _create_async_engine_and_session
+        with patch(
+            'api.services.poi_enrichment_service.get_background_session',
+            fake_background_session,
+        ):
+            from api.services.poi_enrichment_service import _run_with_session
 
-            engine, session_maker = _create_async_engine_and_session()
+            result = await _run_with_session(AsyncMock(return_value=7))
 
-            assert engine is not None
-            assert session_maker is not None
+        assert result == 7
 
 
 class TestEnrichMapWithGooglePlacesSync:
@@ -81,7 +85,7 @@ class TestEnrichMapWithGooglePlacesSync:
             with patch('api.services.poi_enrichment_service._run_with_session') as mock_run:
                 mock_run.return_value = 5
 
-                with patch('asyncio.run', return_value=5):
+                with patch('api.services.poi_enrichment_service.run_async_safe', return_value=5):
                     from api.services.poi_enrichment_service import enrich_map_with_google_places_sync
 
                     result = enrich_map_with_google_places_sync("test-map-id")
@@ -142,7 +146,7 @@ class TestEnrichMapWithHereSync:
             mock_settings.return_value.postgres_database = "db"
 
             # Test that function runs without error (actual enrichment is mocked)
-            with patch('asyncio.run', return_value=3):
+            with patch('api.services.poi_enrichment_service.run_async_safe', return_value=3):
                 from api.services.poi_enrichment_service import enrich_map_with_here_sync
 
                 result = enrich_map_with_here_sync("test-map-id")
@@ -155,8 +159,8 @@ class TestEnrichMapPois:
 
     def test_returns_dict_with_all_counts(self):
         """It should return dict with counts from all enrichment sources."""
-        with patch('api.services.poi_enrichment_service.enrich_map_with_google_places_sync') as mock_google:
-            with patch('api.services.poi_enrichment_service.enrich_map_with_here_sync') as mock_here:
+        with patch('api.services.poi_enrichment_service.enrich_map_with_google_places_async', new_callable=AsyncMock) as mock_google:
+            with patch('api.services.poi_enrichment_service.enrich_map_with_here_async', new_callable=AsyncMock) as mock_here:
                 mock_google.return_value = 10
                 mock_here.return_value = 5
 
@@ -172,8 +176,8 @@ class TestEnrichMapPois:
 
     def test_calls_both_enrichment_services(self):
         """It should call both Google Places and HERE enrichment."""
-        with patch('api.services.poi_enrichment_service.enrich_map_with_google_places_sync') as mock_google:
-            with patch('api.services.poi_enrichment_service.enrich_map_with_here_sync') as mock_here:
+        with patch('api.services.poi_enrichment_service.enrich_map_with_google_places_async', new_callable=AsyncMock) as mock_google:
+            with patch('api.services.poi_enrichment_service.enrich_map_with_here_async', new_callable=AsyncMock) as mock_here:
                 mock_google.return_value = 0
                 mock_here.return_value = 0
 
@@ -181,13 +185,40 @@ class TestEnrichMapPois:
 
                 enrich_map_pois("test-map-id")
 
-                mock_google.assert_called_once_with("test-map-id")
-                mock_here.assert_called_once_with("test-map-id")
+                mock_google.assert_awaited_once_with("test-map-id")
+                mock_here.assert_awaited_once_with("test-map-id")
+
+    @pytest.mark.asyncio
+    async def test_runs_providers_in_parallel(self):
+        """HERE enrichment should not wait for Google Places to finish."""
+        events = []
+
+        def _provider(name):
+            async def _enrich(map_id):
+                events.append(f"{name} start")
+                await asyncio.sleep(0.01)
+                events.append(f"{name} end")
+                return 1
+            return _enrich
+
+        with patch(
+            'api.services.poi_enrichment_service.enrich_map_with_google_places_async',
+            side_effect=_provider("google"),
+        ), patch(
+            'api.services.poi_enrichment_service.enrich_map_with_here_async',
+            side_effect=_provider("here"),
+        ):
+            from api.services.poi_enrichment_service import enrich_map_pois_async
+
+            result = await enrich_map_pois_async("test-map-id")
+
+        assert result["total_enriched"] == 2
+        assert events[:2] == ["google start", "here start"]
 
     def test_handles_zero_enrichment(self):
         """It should handle case when no POIs are enriched."""
-        with patch('api.services.poi_enrichment_service.enrich_map_with_google_places_sync') as mock_google:
-            with patch('api.services.poi_enrichment_service.enrich_map_with_here_sync') as mock_here:
+        with patch('api.services.poi_enrichment_service.enrich_map_with_google_places_async', new_callable=AsyncMock) as mock_google:
+            with patch('api.services.poi_enrichment_service.enrich_map_with_here_async', new_callable=AsyncMock) as mock_here:
                 mock_google.return_value = 0
                 mock_here.return_value = 0
 
@@ -203,8 +234,8 @@ class TestEnrichMapPoisIntegration:
 
     def test_google_places_enrichment_error_handling(self):
         """It should handle errors gracefully and continue with HERE."""
-        with patch('api.services.poi_enrichment_service.enrich_map_with_google_places_sync') as mock_google:
-            with patch('api.services.poi_enrichment_service.enrich_map_with_here_sync') as mock_here:
+        with patch('api.services.poi_enrichment_service.enrich_map_with_google_places_async', new_callable=AsyncMock) as mock_google:
+            with patch('api.services.poi_enrichment_service.enrich_map_with_here_async', new_callable=AsyncMock) as mock_here:
                 # Google Places fails
                 mock_google.side_effect = Exception("API error")
                 mock_here.return_value = 3
@@ -220,8 +251,8 @@ class TestEnrichMapPoisIntegration:
 
     def test_here_enrichment_error_handling(self):
         """It should handle HERE errors gracefully."""
-        with patch('api.services.poi_enrichment_service.enrich_map_with_google_places_sync') as mock_google:
-            with patch('api.services.poi_enrichment_service.enrich_map_with_here_sync') as mock_here:
+        with patch('api.services.poi_enrichment_service.enrich_map_with_google_places_async', new_callable=AsyncMock) as mock_google:
+            with patch('api.services.poi_enrichment_service.enrich_map_with_here_async', new_callable=AsyncMock) as mock_here:
                 mock_google.return_value = 5
                 # HERE fails
                 mock_here.side_effect = Exception("API error")
@@ -3,15 +3,32 @@ Unit tests for api/services/poi_search_service.py
 
 Tests for POI search algorithm:
 - search_pois_for_segment
+- search_pois_for_segments (bounded concurrent search)
+- corridor search mode (runs, local assignment, fallback)
 """
 
+import asyncio
+import random
+from functools import partial
+
+import numpy as np
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
+from api.providers.base import GeoProvider
+from api.providers.osm.provider import OSMProvider
 from api.providers.models import GeoLocation, POI, POICategory
 from api.services.poi_search_service import POISearchService
 
 
+def _mock_provider():
+    """Mock POI provider whose search_pois_many uses the base implementation."""
+    provider = MagicMock()
+    provider.supports_corridor_search = False
+    provider.search_pois_many = partial(GeoProvider.search_pois_many, provider)
+    return provider
+
+
 class TestSearchPoisForSegment:
     """Tests for search_pois_for_segment method."""
 
@@ -23,7 +40,7 @@ class TestSearchPoisForSegment:
     @pytest.fixture
     def mock_poi_provider(self):
         """Create mock POI provider."""
-        provider = MagicMock()
+        provider = _mock_provider()
         provider.search_pois = AsyncMock()
         return provider
 
@@ -176,3 +193,321 @@ class TestSearchPoisForSegment:
         assert len(result) == 1
         poi, _, _ = result[0]
         assert poi.id == "poi_1"
+
+
+class TestSearchPoisForSegments:
+    """Tests for search_pois_for_segments method."""
+
+    @staticmethod
+    def _make_segment(segment_id, points):
+        segment = MagicMock()
+        segment.id = segment_id
+        segment.search_points = [
+            {"index": i, "lat": lat, "lon": lon} for i, (lat, lon) in enumerate(points)
+        ]
+        return segment
+
+    @staticmethod
+    def _make_poi(poi_id, lat, lon):
+        return POI(
+            id=poi_id,
+            name=f"POI {poi_id}",
+            category=POICategory.GAS_STATION,
+            location=GeoLocation(latitude=lat, longitude=lon),
+            provider_data={},
+        )
+
+    @pytest.mark.asyncio
+    async def test_respects_max_concurrency(self):
+        """Should never have more searches in flight than max_concurrency."""
+        in_flight = 0
+        peak = 0
+
+        async def search_pois(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return []
+
+        provider = _mock_provider()
+        provider.search_pois = search_pois
+        segments = [
+            self._make_segment(f"seg_{i}", [(-23.5, -46.6), (-23.51, -46.61)])
+            for i in range(5)
+        ]
+
+        service = POISearchService(MagicMock(), provider)
+        await service.search_pois_for_segments(
+            segments, [POICategory.GAS_STATION], max_concurrency=3
+        )
+
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_results_follow_segment_order(self):
+        """Should return one result list per segment, in input order."""
+        async def search_pois(location, **kwargs):
+            # Later segments answer first
+            await asyncio.sleep(0.02 if location.latitude > -23.55 else 0.0)
+            return [self._make_poi(f"poi_{location.latitude}", location.latitude, location.longitude)]
+
+        provider = _mock_provider()
+        provider.search_pois = search_pois
+        segments = [
+            self._make_segment("first", [(-23.50, -46.6)]),
+            self._make_segment("second", [(-23.60, -46.6)]),
+        ]
+
+        service = POISearchService(MagicMock(), provider)
+        results = await service.search_pois_for_segments(
+            segments, [POICategory.GAS_STATION], max_concurrency=4
+        )
+
+        assert [r[0][0].id for r in results] == ["poi_-23.5", "poi_-23.6"]
+
+    @pytest.mark.asyncio
+    async def test_keeps_closest_discovery_across_search_points(self):
+        """Should keep the closest search point regardless of completion order."""
+        poi = self._make_poi("shared", -23.511, -46.611)
+
+        async def search_pois(location, **kwargs):
+            # The closest search point (index 1) answers last
+            await asyncio.sleep(0.02 if location.latitude == -23.51 else 0.0)
+            return [poi]
+
+        provider = _mock_provider()
+        provider.search_pois = search_pois
+        segment = self._make_segment("seg", [(-23.50, -46.60), (-23.51, -46.61)])
+
+        service = POISearchService(MagicMock(), provider)
+        results = await service.search_pois_for_segments(
+            [segment], [POICategory.GAS_STATION], max_concurrency=2
+        )
+
+        assert len(results[0]) == 1
+        _, sp_index, _ = results[0][0]
+        assert sp_index == 1
+
+    @pytest.mark.asyncio
+    async def test_reports_segment_completion(self):
+        """Should call on_segment_done once per segment."""
+        provider = _mock_provider()
+        provider.search_pois = AsyncMock(return_value=[])
+        segments = [
+            self._make_segment("a", [(-23.5, -46.6)]),
+            self._make_segment("b", []),
+        ]
+        progress = []
+
+        service = POISearchService(MagicMock(), provider)
+        await service.search_pois_for_segments(
+            segments,
+            [POICategory.GAS_STATION],
+            on_segment_done=lambda done, total: progress.append((done, total)),
+        )
+
+        assert sorted(progress) == [(1, 2), (2, 2)]
+
+    @pytest.mark.asyncio
+    async def test_batches_search_points_per_segment(self):
+        """Should issue one search_pois_many call per segment with all its points."""
+        provider = MagicMock()
+        provider.supports_corridor_search = False
+        provider.search_pois_many = AsyncMock(side_effect=lambda locations, **kwargs: [[] for _ in locations])
+        segments = [
+            self._make_segment("a", [(-23.5, -46.6), (-23.51, -46.61), (-23.52, -46.62)]),
+            self._make_segment("b", [(-23.6, -46.7)]),
+        ]
+
+        service = POISearchService(MagicMock(), provider)
+        await service.search_pois_for_segments(segments, [POICategory.GAS_STATION])
+
+        assert provider.search_pois_many.await_count == 2
+        batch_sizes = sorted(
+            len(call.kwargs["locations"]) for call in provider.search_pois_many.await_args_list
+        )
+        assert batch_sizes == [1, 3]
+
+
+class _FakeOverpassProvider(OSMProvider):
+    """
+    OSMProvider answering both search modes from one in-memory POI list.
+
+    Per-point searches and corridor assignment go through the provider's
+    own window rules (search_results_mask).
+    """
+
+    def __init__(self, pois):
+        super().__init__(cache=None)
+        self.pois = pois
+        self.point_searches = 0
+        self.corridor_searches = 0
+        self.corridor_radii = []
+
+    async def search_pois_many(self, locations, radius, categories, limit=50):
+        self.point_searches += len(locations)
+        return [
+            self._select_window_pois(location, radius, categories, [self.pois], limit)
+            for location in locations
+        ]
+
+    async def search_pois_along_route(self, route, radius, categories):
+        # A superset of the corridor, like the tiles under it: everything
+        # within 3x the window of any route point
+        self.corridor_searches += 1
+        self.corridor_radii.append(radius)
+        window = 3 * radius / 111000
+        return [
+            poi for poi in self.pois
+            if any(
+                max(
+                    abs(poi.location.latitude - p.latitude),
+                    abs(poi.location.longitude - p.longitude),
+                ) <= window
+                for p in route
+            )
+        ]
+
+
+class TestCorridorSearch:
+    """Tests for the corridor search mode of search_pois_for_segments."""
+
+    @staticmethod
+    def _settings(mode):
+        return MagicMock(poi_search_mode=mode, poi_search_max_concurrency=4)
+
+    @staticmethod
+    def _segments():
+        """Three consecutive segments of 10 search points ~1 km apart, then a distant one."""
+        segments = []
+        for s, start in enumerate([0, 10, 20, 200]):
+            segment = MagicMock()
+            segment.id = f"seg_{s}"
+            segment.search_points = [
+                {"index": i, "lat": -23.5 - (start + i) * 0.009, "lon": -46.6 + (start + i) * 0.002}
+                for i in range(10)
+            ]
+            segments.append(segment)
+        return segments
+
+    @staticmethod
+    def _pois(segments, count=60):
+        rng = random.Random(7)
+        points = [sp for segment in segments for sp in segment.search_points]
+        pois = []
+        for i in range(count):
+            sp = rng.choice(points)
+            category = POICategory.TOWN if i % 10 == 0 else POICategory.GAS_STATION
+            pois.append(POI(
+                id=f"node/{i}",
+                name=f"POI {i}",
+                category=category,
+                location=GeoLocation(
+                    latitude=sp["lat"] + rng.uniform(-0.06, 0.06),
+                    longitude=sp["lon"] + rng.uniform(-0.06, 0.06),
+                ),
+                provider_data={
+                    "is_abandoned": i % 25 == 0,
+                    "element_type": "node",
+                    "osm_id": i,
+                    "osm_tags": (
+                        {"place": "town"} if category == POICategory.TOWN else {"amenity": "fuel"}
+                    ),
+                },
+            ))
+        return pois
+
+    async def _search(self, provider, segments, mode, **kwargs):
+        with patch(
+            "api.services.poi_search_service.get_settings",
+            return_value=self._settings(mode),
+        ):
+            service = POISearchService(MagicMock(), provider)
+            return await service.search_pois_for_segments(
+                segments, [POICategory.GAS_STATION, POICategory.TOWN], **kwargs
+            )
+
+    @pytest.mark.asyncio
+    async def test_corridor_matches_per_point_search(self):
+        """Corridor mode should yield the same discoveries as per-point search."""
+        segments = self._segments()
+        provider = _FakeOverpassProvider(self._pois(segments))
+
+        by_points = await self._search(provider, segments, "points")
+        by_corridor = await self._search(provider, segments, "corridor")
+
+        def _as_sets(results):
+            return [{(poi.id, sp, d) for poi, sp, d in r} for r in results]
+
+        assert _as_sets(by_corridor) == _as_sets(by_points)
+        assert any(by_corridor)
+        # 40 point searches vs one corridor search per continuous run
+        assert provider.point_searches == 40
+        assert provider.corridor_searches == 2
+        # The corridor is as wide as the per-point windows, not more
+        assert provider.corridor_radii == [3000, 3000]
+
+    @pytest.mark.asyncio
+    async def test_corridor_applies_per_point_limit(self):
+        """With crowded windows, corridor mode should keep the same capped POIs."""
+        segments = self._segments()[:2]
+        pois = self._pois(segments, count=400)
+        provider = _FakeOverpassProvider(pois)
+
+        by_points = await self._search(provider, segments, "points")
+        by_corridor = await self._search(provider, segments, "corridor")
+
+        def _as_sets(results):
+            return [{(poi.id, sp, d) for poi, sp, d in r} for r in results]
+
+        assert _as_sets(by_corridor) == _as_sets(by_points)
+        # The cap matters: some search point has more POIs in its window
+        search_points = np.array([
+            (sp["lat"], sp["lon"]) for segment in segments for sp in segment.search_points
+        ])
+        in_window = provider.search_results_mask(
+            search_points, pois, 3000, [POICategory.GAS_STATION, POICategory.TOWN]
+        )
+        assert in_window.sum(axis=0).max() > 20
+
+    def test_runs_break_at_gaps(self):
+        """Segments far from the previous one start a new run; empty ones are separate."""
+        segments = self._segments()
+        empty = MagicMock()
+        empty.search_points = []
+        segments.insert(1, empty)
+
+        runs, empty_indices = POISearchService._corridor_runs(segments)
+
+        assert runs == [[0, 2, 3], [4]]
+        assert empty_indices == [1]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_points_when_corridor_fails(self):
+        """A failed corridor search should fall back to per-point search for its run."""
+        segments = self._segments()[:2]
+        provider = _FakeOverpassProvider(self._pois(segments))
+        provider.search_pois_along_route = AsyncMock(side_effect=RuntimeError("timeout"))
+        progress = []
+
+        results = await self._search(
+            provider, segments, "corridor",
+            on_segment_done=lambda done, total: progress.append((done, total)),
+        )
+
+        assert provider.point_searches == 20
+        assert len(results) == 2 and any(results)
+        assert progress == [(1, 2), (2, 2)]
+
+    @pytest.mark.asyncio
+    async def test_points_mode_skips_corridor(self):
+        """POI_SEARCH_MODE=points should never call search_pois_along_route."""
+        segments = self._segments()[:1]
+        provider = _FakeOverpassProvider([])
+        provider.search_pois_along_route = AsyncMock()
+
+        await self._search(provider, segments, "points")
+
+        provider.search_pois_along_route.assert_not_called()
@@ -10,6 +10,7 @@ import math
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from typing import List, Tuple
 
+from api.services.municipality_gazetteer import MunicipalityGazetteer
 from api.services.road_service import RoadService
 from api.providers.base import GeoProvider, ProviderType
 from api.providers.models import GeoLocation, Route, POI, POICategory
@@ -298,10 +299,11 @@ class TestInterpolateCoordinateAtDistance:
 class TestGenerateLinearMap:
     """Test generate_linear_map main method."""
 
-    @patch('api.services.road_service._is_debug_enabled_sync', return_value=False)
-    @patch('api.services.map_storage_service_db.save_map_sync', return_value="test-map-id")
+    @patch('api.services.road_service._is_debug_enabled', new_callable=AsyncMock, return_value=False)
+    @patch('api.services.map_storage_service_db.cache_map_response_async', new_callable=AsyncMock, return_value=True)
+    @patch('api.services.map_storage_service_db.save_map_async', new_callable=AsyncMock, return_value="test-map-id")
     def test_generates_map_successfully(
-        self, mock_save, mock_debug,
+        self, mock_save, mock_cache_response, mock_debug,
         road_service, mock_geo_provider, mock_poi_provider,
         sample_origin_location, sample_destination_location, sample_route, sample_pois
     ):
@@ -315,9 +317,13 @@ class TestGenerateLinearMap:
         mock_poi_provider.search_pois.return_value = sample_pois
 
         # Mock the segment processing method
-        with patch.object(road_service, '_process_steps_into_segments') as mock_segments:
+        with patch.object(
+            road_service, '_process_steps_into_segments_async', new_callable=AsyncMock
+        ) as mock_segments, patch.object(
+            road_service, '_enrich_map_pois_async', new_callable=AsyncMock
+        ):
             # Return empty segments and POIs for this unit test
-            mock_segments.return_value = ([], [])
+            mock_segments.return_value = ([], [], {})
 
             result = road_service.generate_linear_map(
                 origin="São Paulo, SP",
@@ -328,11 +334,57 @@ class TestGenerateLinearMap:
         assert result.origin == "São Paulo, SP"
         assert result.destination == "Rio de Janeiro, RJ"
         assert result.total_length_km == sample_route.total_distance
+        # The finished map's response is cached once enrichment is done
+        mock_cache_response.assert_awaited_once_with("test-map-id")
         # Segments are now populated when loading from database, not at creation time
         # So we just verify the segments field exists (empty list at creation)
         assert result.segments is not None
 
-    @patch('api.services.road_service._is_debug_enabled_sync', return_value=False)
+    @patch('api.services.road_service._is_debug_enabled', new_callable=AsyncMock, return_value=False)
+    def test_runs_pipeline_on_single_event_loop(
+        self, mock_debug,
+        road_service, mock_geo_provider,
+        sample_origin_location, sample_destination_location, sample_route
+    ):
+        """Geocoding, routing, segment processing and saving share one event loop."""
+        import asyncio
+
+        loops = []
+
+        def _recording(result):
+            async def _step(*args, **kwargs):
+                loops.append(asyncio.get_running_loop())
+                return result
+            return _step
+
+        mock_geo_provider.geocode.side_effect = [
+            sample_origin_location,
+            sample_destination_location
+        ]
+        mock_geo_provider.calculate_route.side_effect = _recording(sample_route)
+
+        with patch.object(
+            road_service, '_process_steps_into_segments_async',
+            side_effect=_recording(([], [], {}))
+        ), patch(
+            'api.services.map_storage_service_db.save_map_async',
+            side_effect=_recording("test-map-id")
+        ), patch.object(
+            road_service, '_enrich_map_pois_async', side_effect=_recording(None)
+        ), patch(
+            'api.services.map_storage_service_db.cache_map_response_async',
+            side_effect=_recording(True)
+        ):
+            result = road_service.generate_linear_map(
+                origin="São Paulo, SP",
+                destination="Rio de Janeiro, RJ"
+            )
+
+        assert result.id == "test-map-id"
+        assert len(loops) == 5
+        assert all(loop is loops[0] for loop in loops)
+
+    @patch('api.services.road_service._is_debug_enabled', new_callable=AsyncMock, return_value=False)
     def test_raises_error_for_invalid_origin(
         self, mock_debug,
         road_service, mock_geo_provider
@@ -346,7 +398,7 @@ class TestGenerateLinearMap:
                 destination="Rio de Janeiro, RJ"
             )
 
-    @patch('api.services.road_service._is_debug_enabled_sync', return_value=False)
+    @patch('api.services.road_service._is_debug_enabled', new_callable=AsyncMock, return_value=False)
     def test_raises_error_for_invalid_destination(
         self, mock_debug,
         road_service, mock_geo_provider, sample_origin_location
@@ -360,7 +412,7 @@ class TestGenerateLinearMap:
                 destination="Invalid Place"
             )
 
-    @patch('api.services.road_service._is_debug_enabled_sync', return_value=False)
+    @patch('api.services.road_service._is_debug_enabled', new_callable=AsyncMock, return_value=False)
     def test_raises_error_if_route_not_found(
         self, mock_debug,
         road_service, mock_geo_provider,
@@ -402,6 +454,41 @@ class TestGeocodeAndValidate:
         with pytest.raises(ValueError, match="Could not geocode"):
             road_service._geocode_and_validate("Invalid Place", "origem")
 
+    def test_municipalities_are_geocoded_by_the_gazetteer(
+        self, road_service, mock_geo_provider, sample_origin_location
+    ):
+        """Known "City, UF" inputs should never reach the geo provider."""
+        gazetteer = Mock()
+        gazetteer.geocode = AsyncMock(side_effect=[sample_origin_location, None])
+        mock_geo_provider.geocode.return_value = GeoLocation(latitude=-23.56, longitude=-46.65)
+
+        with patch("api.services.road_service.get_municipality_gazetteer", return_value=gazetteer):
+            city = road_service._geocode_and_validate("São Paulo, SP", "origem")
+            street = road_service._geocode_and_validate("Av. Paulista, 1000, São Paulo", "destino")
+
+        assert city == sample_origin_location
+        assert street.latitude == -23.56
+        mock_geo_provider.geocode.assert_awaited_once_with("Av. Paulista, 1000, São Paulo")
+
+    def test_default_gazetteer_resolves_capitals_without_the_geo_provider(
+        self, road_service, mock_geo_provider, tmp_path
+    ):
+        """A default-configured gazetteer should answer capitals with no download."""
+        gazetteer = MunicipalityGazetteer(str(tmp_path / "municipalities.json"))
+
+        with patch(
+            "api.services.road_service.get_municipality_gazetteer", return_value=gazetteer
+        ), patch(
+            "api.services.municipality_gazetteer._download_data",
+            side_effect=RuntimeError("offline"),
+        ):
+            location = road_service._geocode_and_validate("Belo Horizonte, MG", "origem")
+            gazetteer._loader.join(5)
+
+        assert (location.latitude, location.longitude) == (-19.9102, -43.9266)
+        assert location.city == "Belo Horizonte"
+        mock_geo_provider.geocode.assert_not_awaited()
+
 
 # =============================================================================
 # TEST: ASYNC METHODS
@@ -470,6 +470,39 @@ class TestSegmentPOIAssociation:
         segment_service.segment_repo.mark_pois_fetched.assert_called_once_with(segment.id)
 
 
+class TestPersistPOIsForSegments:
+    """Tests for persisting POIs of a batch of segments."""
+
+    @pytest.mark.asyncio
+    async def test_single_bulk_upsert_for_all_pois(self):
+        """Should persist every POI with one bulk upsert and map provider IDs to DB IDs."""
+        service = RoadService(geo_provider=MagicMock(), poi_provider=MagicMock())
+        pois = [
+            POI(
+                id=f"node/{i}",
+                name=f"Posto {i}",
+                category=POICategory.GAS_STATION,
+                location=GeoLocation(latitude=-23.55, longitude=-46.63),
+                provider_data={"addr:city": "Registro"} if i == 0 else {},
+            )
+            for i in range(3)
+        ]
+        db_ids = {f"node/{i}": uuid4() for i in range(3)}
+
+        with patch(
+            "api.database.repositories.poi.POIRepository.bulk_upsert_by_osm_ids",
+            new_callable=AsyncMock,
+            return_value=db_ids,
+        ) as mock_upsert:
+            poi_id_map = await service._persist_pois_for_segments(MagicMock(), pois)
+
+        mock_upsert.assert_awaited_once()
+        rows = mock_upsert.await_args.args[0]
+        assert [row["osm_id"] for row in rows] == ["node/0", "node/1", "node/2"]
+        assert rows[0]["city"] == "Registro"
+        assert poi_id_map == db_ids
+
+
 class TestRouteStepExtraction:
     """Tests for RouteStep extraction from OSRM response."""
 
@@ -559,8 +592,10 @@ class TestBulkSegmentOperations:
     async def test_bulk_get_or_create_all_new(self, segment_service, sample_steps):
         """Test bulk creation when all segments are new."""
         segment_service.segment_repo.bulk_get_by_hashes = AsyncMock(return_value={})
-        segment_service.segment_repo.get_by_hash = AsyncMock(return_value=None)
-        segment_service.segment_repo.create = AsyncMock(return_value=MagicMock(id=uuid4()))
+        segment_service.segment_repo.bulk_create_missing = AsyncMock(
+            side_effect=lambda rows: {r["segment_hash"]: MagicMock(id=uuid4()) for r in rows}
+        )
+        segment_service.segment_repo.bulk_increment_usage = AsyncMock()
 
         results = await segment_service.bulk_get_or_create_segments(sample_steps)
 
@@ -584,9 +619,10 @@ class TestBulkSegmentOperations:
         segment_service.segment_repo.bulk_get_by_hashes = AsyncMock(
             return_value={step1_hash: existing_segment}
         )
-        segment_service.segment_repo.increment_usage_count = AsyncMock()
-        segment_service.segment_repo.get_by_hash = AsyncMock(return_value=None)
-        segment_service.segment_repo.create = AsyncMock(return_value=MagicMock(id=uuid4()))
+        segment_service.segment_repo.bulk_create_missing = AsyncMock(
+            side_effect=lambda rows: {r["segment_hash"]: MagicMock(id=uuid4()) for r in rows}
+        )
+        segment_service.segment_repo.bulk_increment_usage = AsyncMock()
 
         results = await segment_service.bulk_get_or_create_segments(sample_steps)
 
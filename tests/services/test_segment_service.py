@@ -18,6 +18,19 @@ from api.services.segment_service import SegmentService
 from api.providers.models import RouteStep
 
 
+def _fake_bulk_create_missing(created_rows=None, existing_hashes=()):
+    """bulk_create_missing mock that creates every row except existing_hashes."""
+    async def bulk_create_missing(rows):
+        created = {}
+        for row in rows:
+            if created_rows is not None:
+                created_rows.append(row)
+            if row["segment_hash"] not in existing_hashes:
+                created[row["segment_hash"]] = MagicMock(id=uuid4(), **row)
+        return created
+    return AsyncMock(side_effect=bulk_create_missing)
+
+
 class TestCalculateSegmentHash:
     """Tests for the calculate_segment_hash static method."""
 
@@ -519,13 +532,15 @@ class TestBulkGetOrCreateSegments:
     async def test_bulk_creates_all_new_segments(self, segment_service, sample_steps):
         """Test bulk creation when no segments exist."""
         segment_service.segment_repo.bulk_get_by_hashes = AsyncMock(return_value={})
-        segment_service.segment_repo.get_by_hash = AsyncMock(return_value=None)
-        segment_service.segment_repo.create = AsyncMock(return_value=MagicMock(id=uuid4()))
+        segment_service.segment_repo.bulk_create_missing = _fake_bulk_create_missing()
+        segment_service.segment_repo.bulk_increment_usage = AsyncMock()
 
         results = await segment_service.bulk_get_or_create_segments(sample_steps)
 
         assert len(results) == 2
         assert all(is_new for _, is_new in results)
+        segment_service.segment_repo.bulk_create_missing.assert_awaited_once()
+        segment_service.segment_repo.bulk_increment_usage.assert_awaited_once_with([])
 
     @pytest.mark.asyncio
     async def test_bulk_returns_existing_segments(self, segment_service, sample_steps):
@@ -543,9 +558,8 @@ class TestBulkGetOrCreateSegments:
         segment_service.segment_repo.bulk_get_by_hashes = AsyncMock(
             return_value={hash1: existing_segment}
         )
-        segment_service.segment_repo.increment_usage_count = AsyncMock()
-        segment_service.segment_repo.get_by_hash = AsyncMock(return_value=None)
-        segment_service.segment_repo.create = AsyncMock(return_value=MagicMock(id=uuid4()))
+        segment_service.segment_repo.bulk_create_missing = _fake_bulk_create_missing()
+        segment_service.segment_repo.bulk_increment_usage = AsyncMock()
 
         results = await segment_service.bulk_get_or_create_segments(sample_steps)
 
@@ -554,6 +568,9 @@ class TestBulkGetOrCreateSegments:
         assert results[0][1] is False
         # Second should be new (is_new=True)
         assert results[1][1] is True
+        segment_service.segment_repo.bulk_increment_usage.assert_awaited_once_with(
+            [existing_segment.id]
+        )
 
     @pytest.mark.asyncio
     async def test_bulk_force_new_creates_all_new_segments(
@@ -574,9 +591,8 @@ class TestBulkGetOrCreateSegments:
         segment_service.segment_repo.bulk_get_by_hashes = AsyncMock(
             return_value={hash1: existing_segment}
         )
-        segment_service.segment_repo.create = AsyncMock(
-            side_effect=lambda s: s  # Return the segment passed in
-        )
+        segment_service.segment_repo.bulk_create_missing = _fake_bulk_create_missing()
+        segment_service.segment_repo.bulk_increment_usage = AsyncMock()
 
         results = await segment_service.bulk_get_or_create_segments(
             sample_steps, force_new=True
@@ -595,22 +611,20 @@ class TestBulkGetOrCreateSegments:
         """Test that force_new=True generates unique versioned hashes."""
         created_segments = []
 
-        async def capture_create(segment):
-            created_segments.append(segment)
-            return segment
-
         segment_service.segment_repo.bulk_get_by_hashes = AsyncMock(return_value={})
-        segment_service.segment_repo.get_by_hash = AsyncMock(return_value=None)
-        segment_service.segment_repo.create = AsyncMock(side_effect=capture_create)
+        segment_service.segment_repo.bulk_create_missing = _fake_bulk_create_missing(
+            created_segments
+        )
+        segment_service.segment_repo.bulk_increment_usage = AsyncMock()
 
         # First call without force_new
         await segment_service.bulk_get_or_create_segments(sample_steps, force_new=False)
-        hashes_without_version = [s.segment_hash for s in created_segments]
+        hashes_without_version = [s["segment_hash"] for s in created_segments]
         created_segments.clear()
 
         # Second call with force_new - should generate different hashes
         await segment_service.bulk_get_or_create_segments(sample_steps, force_new=True)
-        hashes_with_version = [s.segment_hash for s in created_segments]
+        hashes_with_version = [s["segment_hash"] for s in created_segments]
 
         # Hashes should be different due to version suffix
         for h1, h2 in zip(hashes_without_version, hashes_with_version):
@@ -620,9 +634,8 @@ class TestBulkGetOrCreateSegments:
     async def test_bulk_force_new_skips_lookup(self, segment_service, sample_steps):
         """Test that force_new=True skips the database lookup entirely."""
         segment_service.segment_repo.bulk_get_by_hashes = AsyncMock(return_value={})
-        segment_service.segment_repo.create = AsyncMock(
-            side_effect=lambda s: s
-        )
+        segment_service.segment_repo.bulk_create_missing = _fake_bulk_create_missing()
+        segment_service.segment_repo.bulk_increment_usage = AsyncMock()
 
         await segment_service.bulk_get_or_create_segments(
             sample_steps, force_new=True
@@ -630,5 +643,76 @@ class TestBulkGetOrCreateSegments:
 
         # Should NOT call bulk_get_by_hashes when force_new=True
         segment_service.segment_repo.bulk_get_by_hashes.assert_not_called()
-        # Should still create segments
-        assert segment_service.segment_repo.create.call_count == 2
+        # Should still create segments, in a single bulk insert
+        segment_service.segment_repo.bulk_create_missing.assert_awaited_once()
+        rows = segment_service.segment_repo.bulk_create_missing.await_args.args[0]
+        assert len(rows) == 2
+
+    @pytest.mark.asyncio
+    async def test_bulk_fetches_segments_created_concurrently(
+        self, segment_service, sample_steps
+    ):
+        """Hashes skipped by ON CONFLICT are fetched and counted as reused."""
+        step = sample_steps[1]
+        raced_hash = SegmentService.calculate_segment_hash(
+            step.start_coords[0], step.start_coords[1],
+            step.end_coords[0], step.end_coords[1]
+        )
+        raced_segment = MagicMock(id=uuid4())
+
+        segment_service.segment_repo.bulk_get_by_hashes = AsyncMock(
+            side_effect=[{}, {raced_hash: raced_segment}]
+        )
+        segment_service.segment_repo.bulk_create_missing = _fake_bulk_create_missing(
+            existing_hashes={raced_hash}
+        )
+        segment_service.segment_repo.bulk_increment_usage = AsyncMock()
+
+        results = await segment_service.bulk_get_or_create_segments(sample_steps)
+
+        assert results[0][1] is True
+        assert results[1] == (raced_segment, False)
+        segment_service.segment_repo.bulk_get_by_hashes.assert_awaited_with([raced_hash])
+        segment_service.segment_repo.bulk_increment_usage.assert_awaited_once_with(
+            [raced_segment.id]
+        )
+
+    @pytest.mark.asyncio
+    async def test_bulk_duplicate_steps_create_once(self, segment_service, sample_steps):
+        """A step repeated in the route is created once and then reused."""
+        steps = [sample_steps[0], sample_steps[1], sample_steps[0]]
+
+        segment_service.segment_repo.bulk_get_by_hashes = AsyncMock(return_value={})
+        segment_service.segment_repo.bulk_create_missing = _fake_bulk_create_missing()
+        segment_service.segment_repo.bulk_increment_usage = AsyncMock()
+
+        results = await segment_service.bulk_get_or_create_segments(steps)
+
+        assert [is_new for _, is_new in results] == [True, True, False]
+        assert results[2][0] is results[0][0]
+        rows = segment_service.segment_repo.bulk_create_missing.await_args.args[0]
+        assert len(rows) == 2
+        segment_service.segment_repo.bulk_increment_usage.assert_awaited_once_with(
+            [results[0][0].id]
+        )
+
+    @pytest.mark.asyncio
+    async def test_bulk_stores_polyline_geometry_when_configured(
+        self, segment_service, sample_steps
+    ):
+        """New segments store an encoded polyline in polyline6 storage mode."""
+        from api.utils.polyline import decode_polyline
+
+        created_rows = []
+        segment_service.geometry_storage_format = "polyline6"
+        segment_service.segment_repo.bulk_get_by_hashes = AsyncMock(return_value={})
+        segment_service.segment_repo.bulk_create_missing = _fake_bulk_create_missing(
+            created_rows
+        )
+        segment_service.segment_repo.bulk_increment_usage = AsyncMock()
+
+        await segment_service.bulk_get_or_create_segments(sample_steps)
+
+        geometry = created_rows[0]["geometry"]
+        assert isinstance(geometry, str)
+        assert decode_polyline(geometry) == pytest.approx(sample_steps[0].geometry)
@@ -3,12 +3,16 @@ Unit tests for api/utils/async_utils.py
 
 Tests for async utility functions:
 - run_async_safe (safe execution of coroutines)
+- AsyncRateLimiter (request pacing shared across event loops)
 """
 
 import asyncio
+import threading
+import time
+
 import pytest
 
-from api.utils.async_utils import run_async_safe
+from api.utils.async_utils import AsyncRateLimiter, run_async_safe
 
 
 class TestRunAsyncSafe:
@@ -107,3 +111,65 @@ class TestRunAsyncSafe:
             result = await loop.run_in_executor(executor, sync_wrapper)
 
         assert result == "from async"
+
+
+class TestAsyncRateLimiter:
+    """Tests for AsyncRateLimiter class."""
+
+    @pytest.mark.asyncio
+    async def test_spaces_acquisitions_by_interval(self):
+        """Concurrent acquisitions should be spread by 1/rate seconds."""
+        limiter = AsyncRateLimiter(20.0)  # 50ms interval
+
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire() for _ in range(4)))
+        elapsed = time.monotonic() - start
+
+        # First slot is immediate, the other three wait 50ms each
+        assert elapsed >= 0.14
+
+    @pytest.mark.asyncio
+    async def test_zero_rate_disables_limiting(self):
+        """A non-positive rate should never wait."""
+        limiter = AsyncRateLimiter(0)
+
+        start = time.monotonic()
+        for _ in range(100):
+            await limiter.acquire()
+
+        assert limiter.interval == 0.0
+        assert time.monotonic() - start < 0.05
+
+    def test_shared_across_event_loops(self):
+        """The same limiter should work from loops running in different threads."""
+        limiter = AsyncRateLimiter(20.0)
+        errors = []
+
+        def worker():
+            try:
+                asyncio.run(limiter.acquire())
+            except Exception as e:  # pragma: no cover - failure path
+                errors.append(e)
+
+        start = time.monotonic()
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert time.monotonic() - start >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_burst_starts_immediately_then_paces(self):
+        """The first `burst` acquisitions should not wait; later ones keep the rate."""
+        limiter = AsyncRateLimiter(20.0, burst=3)  # 50ms interval
+
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire() for _ in range(3)))
+        assert time.monotonic() - start < 0.04
+
+        # Bucket is empty: the next two wait one interval each
+        await asyncio.gather(*(limiter.acquire() for _ in range(2)))
+        assert time.monotonic() - start >= 0.09
@@ -8,18 +8,34 @@ Tests for pure mathematical functions:
 - interpolate_coordinate_at_distance
 - find_closest_point_index
 - find_closest_segment_index
+- array kernels (compared against plain-loop reference implementations)
+- slippy map tiles (tile_indices, tile_bounds, tiles_in_bbox)
 """
 
 import math
+import random
+
+import numpy as np
 import pytest
 
 from api.utils.geo_utils import (
+    as_route_array,
     calculate_distance_meters,
     calculate_distance_along_route,
     calculate_distance_from_point_to_end,
+    closest_point_indices,
+    closest_segment_indices,
+    cumulative_distances_m,
+    distances_along_route_km,
+    distances_to_route_end_km,
+    haversine_distances_m,
     interpolate_coordinate_at_distance,
+    interpolate_coordinates_at_distances,
     find_closest_point_index,
     find_closest_segment_index,
+    tile_bounds,
+    tile_indices,
+    tiles_in_bbox,
 )
 
 
@@ -296,3 +312,187 @@ class TestFindClosestSegmentIndex:
         for point in geometry:
             result = find_closest_segment_index(geometry, point)
             assert 0 <= result <= len(geometry) - 2
+
+
+def _reference_closest_point_index(geometry, point):
+    """Plain-loop closest route point (planar distance in degrees)."""
+    best, best_idx = float("inf"), 0
+    for i, (lat, lon) in enumerate(geometry):
+        dist = ((lat - point[0]) ** 2 + (lon - point[1]) ** 2) ** 0.5
+        if dist < best:
+            best, best_idx = dist, i
+    return best_idx
+
+
+def _reference_closest_segment_index(geometry, point):
+    """Plain-loop closest segment, by haversine distance to its midpoint."""
+    best, best_idx = float("inf"), 0
+    for i in range(len(geometry) - 1):
+        mid_lat = (geometry[i][0] + geometry[i + 1][0]) / 2
+        mid_lon = (geometry[i][1] + geometry[i + 1][1]) / 2
+        dist = calculate_distance_meters(point[0], point[1], mid_lat, mid_lon)
+        if dist < best:
+            best, best_idx = dist, i
+    return best_idx
+
+
+def _reference_segment_length_m(geometry, i):
+    a, b = geometry[i], geometry[i + 1]
+    return calculate_distance_meters(a[0], a[1], b[0], b[1])
+
+
+def _reference_distance_along_route_km(geometry, point):
+    """Plain-loop route length up to the start of the closest segment."""
+    segment = _reference_closest_segment_index(geometry, point)
+    return sum(_reference_segment_length_m(geometry, i) for i in range(segment)) / 1000.0
+
+
+def _reference_distance_to_end_km(geometry, point):
+    """Plain-loop distance to the end of the closest segment, then along the route."""
+    segment = _reference_closest_segment_index(geometry, point)
+    end = geometry[segment + 1]
+    meters = calculate_distance_meters(point[0], point[1], end[0], end[1])
+    meters += sum(
+        _reference_segment_length_m(geometry, i)
+        for i in range(segment + 1, len(geometry) - 1)
+    )
+    return meters / 1000.0
+
+
+class TestArrayKernels:
+    """Tests for the vectorized kernels against plain-loop references."""
+
+    @pytest.fixture
+    def geometry(self):
+        """A random-walk route of 500 points."""
+        rng = random.Random(3)
+        lat, lon = -23.5, -46.6
+        points = []
+        for _ in range(500):
+            lat += rng.uniform(-0.001, 0.003)
+            lon += rng.uniform(-0.002, 0.002)
+            points.append((lat, lon))
+        return points
+
+    @pytest.fixture
+    def query_points(self):
+        rng = random.Random(5)
+        return [
+            (rng.uniform(-23.6, -22.9), rng.uniform(-46.8, -46.4)) for _ in range(50)
+        ]
+
+    def test_as_route_array_shape(self):
+        """Geometry lists become (N, 2) float64 arrays, including empty ones."""
+        assert as_route_array([(-23.5, -46.6), (-23.6, -46.7)]).shape == (2, 2)
+        assert as_route_array([]).shape == (0, 2)
+        assert as_route_array([(1, 2)]).dtype == np.float64
+
+    def test_haversine_matches_scalar(self, geometry, query_points):
+        """Vectorized haversine matches calculate_distance_meters."""
+        route = as_route_array(geometry)
+        lat, lon = query_points[0]
+        distances = haversine_distances_m(lat, lon, route[:, 0], route[:, 1])
+
+        expected = [calculate_distance_meters(lat, lon, p[0], p[1]) for p in geometry]
+        np.testing.assert_allclose(distances, expected, rtol=1e-9, atol=1e-6)
+
+    def test_cumulative_distances(self, geometry):
+        """Cumulative distances start at zero and sum the segment lengths."""
+        cumulative = cumulative_distances_m(as_route_array(geometry))
+
+        expected = [0.0]
+        for a, b in zip(geometry, geometry[1:]):
+            expected.append(expected[-1] + calculate_distance_meters(a[0], a[1], b[0], b[1]))
+        np.testing.assert_allclose(cumulative, expected, rtol=1e-9)
+        assert len(cumulative_distances_m(as_route_array([]))) == 0
+
+    def test_batch_results_match_reference_loops(self, geometry, query_points):
+        """Each batch kernel and its scalar wrapper agree with a plain loop."""
+        route = as_route_array(geometry)
+        points = as_route_array(query_points)
+
+        point_idx = closest_point_indices(route, points)
+        segment_idx = closest_segment_indices(route, points)
+        along_km = distances_along_route_km(route, points)
+        to_end_km = distances_to_route_end_km(route, points)
+
+        for i, point in enumerate(query_points):
+            expected_point = _reference_closest_point_index(geometry, point)
+            expected_segment = _reference_closest_segment_index(geometry, point)
+            expected_along = _reference_distance_along_route_km(geometry, point)
+            expected_to_end = _reference_distance_to_end_km(geometry, point)
+
+            assert point_idx[i] == expected_point
+            assert segment_idx[i] == expected_segment
+            assert along_km[i] == pytest.approx(expected_along)
+            assert to_end_km[i] == pytest.approx(expected_to_end)
+
+            assert find_closest_point_index(geometry, point) == expected_point
+            assert find_closest_segment_index(geometry, point) == expected_segment
+            assert calculate_distance_along_route(geometry, point) == pytest.approx(expected_along)
+            assert calculate_distance_from_point_to_end(geometry, point) == pytest.approx(
+                expected_to_end
+            )
+
+    def test_chunked_argmin_matches_unchunked(self, geometry, query_points, monkeypatch):
+        """Chunking the pairwise matrix does not change the result."""
+        route = as_route_array(geometry)
+        points = as_route_array(query_points)
+        expected = closest_segment_indices(route, points)
+
+        monkeypatch.setattr("api.utils.geo_utils._MAX_PAIRWISE_ELEMENTS", 1000)
+        np.testing.assert_array_equal(closest_segment_indices(route, points), expected)
+
+    def test_batch_interpolation(self, geometry):
+        """Batch interpolation handles ends and interior distances."""
+        route = as_route_array(geometry)
+        total_km = 100.0
+        targets = [-1.0, 0.0, 12.5, 50.0, 99.9, 100.0, 150.0]
+
+        result = interpolate_coordinates_at_distances(route, targets, total_km)
+
+        assert result.shape == (len(targets), 2)
+        for row, target in zip(result, targets):
+            expected = interpolate_coordinate_at_distance(geometry, target, total_km)
+            assert tuple(row) == pytest.approx(expected)
+
+
+class TestSlippyTiles:
+    """Tests for tile_indices, tile_bounds and tiles_in_bbox."""
+
+    def test_known_tile(self):
+        """São Paulo at zoom 13 should fall in the usual OSM tile."""
+        x, y = tile_indices(-23.5505, -46.6333, 13)
+
+        assert (int(x), int(y)) == (3034, 4647)
+
+    def test_bounds_contain_points_of_their_tile(self):
+        """Random points lie inside the bounds of the tile computed for them."""
+        rng = random.Random(5)
+        lats = [rng.uniform(-34, 5) for _ in range(200)]
+        lons = [rng.uniform(-74, -34) for _ in range(200)]
+
+        xs, ys = tile_indices(lats, lons, 13)
+
+        for lat, lon, x, y in zip(lats, lons, xs.tolist(), ys.tolist()):
+            south, west, north, east = tile_bounds(x, y, 13)
+            assert south <= lat <= north
+            assert west <= lon <= east
+
+    def test_tiles_in_bbox(self):
+        """Every tile overlapping the box is returned, row by row."""
+        tiles = tiles_in_bbox(-23.56, -46.64, -23.54, -46.62, 14)
+        x0, y0 = (int(v) for v in tile_indices(-23.54, -46.64, 14))
+
+        assert tiles[0] == (x0, y0)
+        assert len(tiles) == len(set(tiles))
+        for x, y in tiles:
+            south, west, north, east = tile_bounds(x, y, 14)
+            assert south <= -23.54 and north >= -23.56
+            assert west <= -46.62 and east >= -46.64
+
+    def test_polar_latitudes_are_clamped(self):
+        """Latitudes beyond the Web Mercator limit map to the edge rows."""
+        _, ys = tile_indices([89.9, -89.9], [0.0, 0.0], 4)
+
+        assert ys.tolist() == [0, 15]
@@ -0,0 +1,104 @@
+"""
+Unit tests for api/utils/http_client.py
+
+Tests for:
+- PooledHttpClient (one keep-alive client per event loop)
+- close_http_clients (shutdown hook)
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from api.utils.http_client import PooledHttpClient, close_http_clients
+
+
+class TestPooledHttpClient:
+    """Tests for PooledHttpClient class."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_client_within_loop(self):
+        """Requests on the same loop should share one client (and its pool)."""
+        pooled = PooledHttpClient(headers={"User-Agent": "test"})
+
+        first = pooled.client
+        assert pooled.client is first
+        assert first.headers["User-Agent"] == "test"
+
+        await pooled.aclose()
+
+    def test_separate_client_per_event_loop(self):
+        """Each worker thread's loop should get its own client."""
+        pooled = PooledHttpClient()
+        clients = []
+
+        async def _grab():
+            clients.append(pooled.client)
+
+        threads = [threading.Thread(target=asyncio.run, args=(_grab(),)) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(clients) == 2
+        assert clients[0] is not clients[1]
+
+    def test_forgets_clients_of_closed_loops(self):
+        """Clients of finished asyncio.run loops should not accumulate."""
+        pooled = PooledHttpClient()
+
+        async def _grab():
+            return pooled.client
+
+        for _ in range(3):
+            asyncio.run(_grab())
+
+        assert len(pooled._clients) == 1  # only the last loop, pruned on next use
+        asyncio.run(_grab())
+        assert len(pooled._clients) == 1
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_and_recreates(self):
+        """After aclose the next access should get a fresh client."""
+        pooled = PooledHttpClient()
+        client = pooled.client
+
+        await pooled.aclose()
+
+        assert client.is_closed
+        assert pooled.client is not client
+        await pooled.aclose()
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_clients_of_running_loops_in_other_threads(self):
+        """Clients of loops running in other threads should be closed there."""
+        pooled = PooledHttpClient()
+        other_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=other_loop.run_forever)
+        thread.start()
+        try:
+            async def _grab():
+                return pooled.client
+
+            other_client = asyncio.run_coroutine_threadsafe(_grab(), other_loop).result()
+
+            await pooled.aclose()
+
+            assert other_client.is_closed
+        finally:
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            thread.join()
+            other_loop.close()
+
+    @pytest.mark.asyncio
+    async def test_close_http_clients_closes_every_pooled_client(self):
+        """The shutdown hook should close all provider clients."""
+        first = PooledHttpClient()
+        second = PooledHttpClient()
+        clients = [first.client, second.client]
+
+        await close_http_clients()
+
+        assert all(client.is_closed for client in clients)
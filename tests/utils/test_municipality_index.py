@@ -0,0 +1,124 @@
+"""
+Tests for the municipality indexes in api/utils/municipality_index.py.
+"""
+
+from api.utils.municipality_index import (
+    IndexedMunicipality,
+    MunicipalityIndex,
+    MunicipalityNameIndex,
+    MunicipalitySeat,
+    normalize_name,
+)
+
+
+def _square(min_lon, min_lat, max_lon, max_lat):
+    """Closed GeoJSON ring of an axis-aligned rectangle."""
+    return [
+        [min_lon, min_lat],
+        [max_lon, min_lat],
+        [max_lon, max_lat],
+        [min_lon, max_lat],
+        [min_lon, min_lat],
+    ]
+
+
+CAMPINAS = IndexedMunicipality(3509502, "Campinas", "SP")
+VALINHOS = IndexedMunicipality(3556206, "Valinhos", "SP")
+ILHABELA = IndexedMunicipality(3520400, "Ilhabela", "SP")
+
+
+class TestMunicipalityIndex:
+    """Tests for MunicipalityIndex.lookup."""
+
+    def test_finds_containing_municipality(self):
+        index = MunicipalityIndex([
+            (CAMPINAS, [_square(-47.2, -23.0, -46.9, -22.7)]),
+            (VALINHOS, [_square(-47.1, -23.1, -46.9, -23.0)]),
+        ])
+
+        assert index.lookup(-22.9, -47.06) == CAMPINAS
+        assert index.lookup(-23.05, -47.0) == VALINHOS
+
+    def test_point_outside_every_boundary(self):
+        index = MunicipalityIndex([(CAMPINAS, [_square(-47.2, -23.0, -46.9, -22.7)])])
+
+        assert index.lookup(-22.0, -47.0) is None
+        assert index.lookup(-22.9, -46.5) is None
+
+    def test_hole_is_outside(self):
+        """A point inside an inner ring (enclave) does not belong to the municipality."""
+        outer = _square(-47.0, -23.0, -46.0, -22.0)
+        hole = _square(-46.6, -22.6, -46.4, -22.4)
+        index = MunicipalityIndex([
+            (CAMPINAS, [outer, hole]),
+            (VALINHOS, [hole]),
+        ])
+
+        assert index.lookup(-22.8, -46.8) == CAMPINAS
+        assert index.lookup(-22.5, -46.5) == VALINHOS
+
+    def test_multi_part_municipality(self):
+        """Every polygon of a municipality (e.g. islands) is matched."""
+        index = MunicipalityIndex([
+            (ILHABELA, [
+                _square(-45.4, -23.9, -45.2, -23.7),
+                _square(-45.1, -24.0, -45.0, -23.9),
+            ]),
+        ])
+
+        assert index.lookup(-23.8, -45.3) == ILHABELA
+        assert index.lookup(-23.95, -45.05) == ILHABELA
+        assert index.lookup(-23.95, -45.15) is None
+
+    def test_municipality_spanning_grid_cells(self):
+        """Large municipalities are found from every grid cell they cover."""
+        index = MunicipalityIndex(
+            [(CAMPINAS, [_square(-48.0, -24.0, -46.0, -22.0)])], cell_size_deg=0.25
+        )
+
+        assert index.lookup(-23.99, -47.99) == CAMPINAS
+        assert index.lookup(-22.01, -46.01) == CAMPINAS
+        assert index.lookup(-23.0, -47.0) == CAMPINAS
+
+    def test_skips_degenerate_rings(self):
+        index = MunicipalityIndex([
+            (CAMPINAS, [[[-47.0, -23.0], [-46.9, -23.0]]]),
+            (VALINHOS, [_square(-47.1, -23.1, -46.9, -23.0)]),
+        ])
+
+        assert len(index) == 1
+        assert index.lookup(-23.05, -47.0) == VALINHOS
+
+
+class TestMunicipalityNameIndex:
+    """Tests for MunicipalityNameIndex.find."""
+
+    def _index(self):
+        return MunicipalityNameIndex([
+            MunicipalitySeat(CAMPINAS, -22.9053, -47.0659),
+            MunicipalitySeat(IndexedMunicipality(3106200, "Belo Horizonte", "MG"), -19.9102, -43.9266),
+            MunicipalitySeat(IndexedMunicipality(2201606, "Bom Jesus", "PI"), -9.0712, -44.3590),
+            MunicipalitySeat(IndexedMunicipality(4302808, "Bom Jesus", "RS"), -28.6697, -50.4295),
+            MunicipalitySeat(IndexedMunicipality(3515103, "Embu-Guaçu", "SP"), -23.8297, -46.8136),
+        ])
+
+    def test_ignores_accents_case_and_punctuation(self):
+        index = self._index()
+
+        assert index.find("campinas", "sp").latitude == -22.9053
+        assert index.find("EMBU GUACU", "SP").municipality.code == 3515103
+        assert normalize_name("  São João d'Aliança ") == "sao joao d alianca"
+
+    def test_uf_disambiguates_repeated_names(self):
+        index = self._index()
+
+        assert index.find("Bom Jesus", "RS").municipality.uf == "RS"
+        assert index.find("Bom Jesus") is None
+        assert index.find("Belo Horizonte") is not None
+
+    def test_unknown_names_and_wrong_uf(self):
+        index = self._index()
+
+        assert index.find("Campinas", "MG") is None
+        assert index.find("Atlantida") is None
+        assert len(index) == 5
@@ -0,0 +1,88 @@
+"""
+Unit tests for api/utils/polyline.py
+
+Tests for encoded polyline geometries:
+- encode_polyline / decode_polyline
+- geometry_to_coordinates / geometry_to_polyline (both storage formats)
+- geometry_for_storage
+"""
+
+import pytest
+
+from api.utils.polyline import (
+    GEOMETRY_FORMAT_COORDINATES,
+    GEOMETRY_FORMAT_POLYLINE,
+    decode_polyline,
+    encode_polyline,
+    geometry_for_storage,
+    geometry_to_coordinates,
+    geometry_to_polyline,
+)
+
+ROUTE = [(-23.550520, -46.633308), (-23.561414, -46.655881), (-22.906847, -43.172896)]
+
+
+class TestPolylineCodec:
+    """Tests for encode_polyline and decode_polyline."""
+
+    def test_matches_reference_example(self):
+        """Should match the reference example of the polyline algorithm (precision 5)."""
+        points = [(38.5, -120.2), (40.7, -120.95), (43.252, -126.453)]
+
+        encoded = encode_polyline(points, precision=5)
+
+        assert encoded == "_p~iF~ps|U_ulLnnqC_mqNvxq`@"
+        assert decode_polyline(encoded, precision=5) == points
+
+    def test_round_trip_keeps_six_decimals(self):
+        """Default precision should keep coordinates to 1e-6 degrees."""
+        decoded = decode_polyline(encode_polyline(ROUTE))
+
+        assert len(decoded) == len(ROUTE)
+        for (lat, lon), (exp_lat, exp_lon) in zip(decoded, ROUTE):
+            assert lat == pytest.approx(exp_lat, abs=1e-6)
+            assert lon == pytest.approx(exp_lon, abs=1e-6)
+
+    def test_empty_geometry(self):
+        assert encode_polyline([]) == ""
+        assert decode_polyline("") == []
+
+    def test_truncated_polyline_raises(self):
+        """A polyline cut in the middle of a value should be rejected."""
+        encoded = encode_polyline(ROUTE)
+
+        with pytest.raises(ValueError):
+            decode_polyline(encoded[:-1])
+
+    def test_is_much_smaller_than_json(self):
+        """The encoded geometry should be far smaller than the JSON coordinates."""
+        import json
+
+        route = [(-23.5 + i * 1e-4, -46.6 - i * 1e-4) for i in range(1000)]
+
+        assert len(encode_polyline(route)) * 3 < len(json.dumps(route))
+
+
+class TestStoredGeometries:
+    """Reading and writing both RouteSegment.geometry formats."""
+
+    def test_coordinates_from_either_format(self):
+        as_list = [list(p) for p in ROUTE]
+        as_polyline = encode_polyline(ROUTE)
+
+        assert geometry_to_coordinates(as_list) == ROUTE
+        assert geometry_to_coordinates(as_polyline) == pytest.approx(ROUTE)
+        assert geometry_to_coordinates(None) == []
+
+    def test_skips_malformed_points(self):
+        assert geometry_to_coordinates([[1.0, 2.0], [3.0], "x"]) == [(1.0, 2.0)]
+
+    def test_polyline_is_passed_through(self):
+        encoded = encode_polyline(ROUTE)
+
+        assert geometry_to_polyline(encoded) is encoded
+        assert geometry_to_polyline([list(p) for p in ROUTE]) == encoded
+
+    def test_geometry_for_storage(self):
+        assert geometry_for_storage(ROUTE, GEOMETRY_FORMAT_COORDINATES) == ROUTE
+        assert geometry_for_storage(ROUTE, GEOMETRY_FORMAT_POLYLINE) == encode_polyline(ROUTE)
@@ -0,0 +1,101 @@
+"""
+Unit tests for api/utils/route_index.py
+
+Tests for RouteIndex:
+- nearest_index / nearest (compared against a linear haversine scan)
+- cumulative_km
+"""
+
+import random
+
+import pytest
+
+from api.utils.geo_utils import calculate_distance_meters
+from api.utils.route_index import RouteIndex
+
+
+def _linear_nearest(geometry, lat, lon):
+    """Reference implementation: first point with the smallest haversine distance."""
+    best_idx = 0
+    best_dist = float("inf")
+    for i, (p_lat, p_lon) in enumerate(geometry):
+        dist = calculate_distance_meters(lat, lon, p_lat, p_lon)
+        if dist < best_dist:
+            best_dist = dist
+            best_idx = i
+    return best_idx, best_dist
+
+
+@pytest.fixture
+def winding_route():
+    """A random-walk route of 2,000 points heading roughly north."""
+    rng = random.Random(42)
+    lat, lon = -23.5, -46.6
+    geometry = []
+    for _ in range(2000):
+        lat += rng.uniform(-0.001, 0.003)
+        lon += rng.uniform(-0.002, 0.002)
+        geometry.append((lat, lon))
+    return geometry
+
+
+class TestNearestIndex:
+    """Tests for RouteIndex.nearest_index and RouteIndex.nearest."""
+
+    def test_empty_geometry(self):
+        """Empty geometry has no nearest point."""
+        index = RouteIndex([])
+        assert index.nearest_index(-23.5, -46.6) == -1
+        assert index.nearest(-23.5, -46.6) == (-1, float("inf"))
+
+    def test_single_point(self):
+        """Single point is always the nearest."""
+        index = RouteIndex([(-23.5, -46.6)])
+        assert index.nearest_index(10.0, 10.0) == 0
+
+    def test_exact_match(self):
+        """Query on a route point returns that point with zero distance."""
+        geometry = [(-23.5, -46.6), (-23.6, -46.7), (-23.7, -46.8)]
+        index = RouteIndex(geometry)
+        assert index.nearest(-23.6, -46.7) == (1, 0.0)
+
+    def test_duplicate_points_return_first(self):
+        """Ties are broken by the lowest index, like a linear scan."""
+        geometry = [(-23.5, -46.6), (-23.6, -46.7), (-23.5, -46.6)]
+        index = RouteIndex(geometry)
+        assert index.nearest_index(-23.5, -46.6) == 0
+
+    def test_matches_linear_scan(self, winding_route):
+        """Nearest point matches a brute-force haversine scan."""
+        index = RouteIndex(winding_route)
+        rng = random.Random(7)
+
+        for _ in range(100):
+            lat = rng.uniform(-23.6, -22.0)
+            lon = rng.uniform(-46.9, -46.3)
+            expected_idx, expected_dist = _linear_nearest(winding_route, lat, lon)
+            idx, dist = index.nearest(lat, lon)
+            assert dist == pytest.approx(expected_dist)
+            assert idx == expected_idx
+
+
+class TestCumulativeKm:
+    """Tests for RouteIndex.cumulative_km."""
+
+    def test_starts_at_zero_and_increases(self, winding_route):
+        """Cumulative distance starts at zero and never decreases."""
+        index = RouteIndex(winding_route)
+        assert index.cumulative_km[0] == 0.0
+        assert all(
+            a <= b for a, b in zip(index.cumulative_km, index.cumulative_km[1:])
+        )
+
+    def test_matches_segment_sum(self):
+        """Last cumulative distance equals the sum of segment lengths."""
+        geometry = [(-23.5, -46.6), (-23.6, -46.7), (-23.7, -46.8)]
+        index = RouteIndex(geometry)
+        expected = sum(
+            calculate_distance_meters(a[0], a[1], b[0], b[1])
+            for a, b in zip(geometry, geometry[1:])
+        ) / 1000.0
+        assert index.cumulative_km[-1] == pytest.approx(expected)